@@ -4,6 +4,11 @@
 import collections
 import math
 
+try:
+  import numpy
+except ModuleNotFoundError:
+  numpy = None
+
 from plaso.analyzers.hashers import interface
 from plaso.analyzers.hashers import manager
 
@@ -15,12 +20,36 @@ class EntropyHasher(interface.BaseHasher):
   ATTRIBUTE_NAME = 'file_entropy'
   DESCRIPTION = 'Calculates the byte entropy of input data.'
 
-  def __init__(self):
-    """Initializes the entropy hasher."""
+  def __init__(self, use_numpy=True):
+    """Initializes the entropy hasher.
+
+    Args:
+      use_numpy (Optional[bool]): True if NumPy should be used to count the
+          byte values when it is available.
+    """
     super(EntropyHasher, self).__init__()
-    self._byte_frequency_counter = collections.Counter()
+    self._byte_frequency_counter = None
+    self._byte_frequencies = None
     self._file_length = 0
 
+    if use_numpy and numpy:
+      self._byte_frequencies = numpy.zeros(256, dtype=numpy.int64)
+    else:
+      self._byte_frequency_counter = collections.Counter()
+
+  def _GetByteFrequencies(self):
+    """Retrieves the number of occurrences of every byte value.
+
+    Returns:
+      list[int]: number of occurrences of every byte value, in byte value
+          order.
+    """
+    if self._byte_frequencies is not None:
+      return self._byte_frequencies.tolist()
+
+    return [self._byte_frequency_counter[byte_value]
+            for byte_value in range(256)]
+
   def GetStringDigest(self):
     """Calculates the byte entropy value.
 
@@ -34,8 +63,10 @@ class EntropyHasher(interface.BaseHasher):
     if self._file_length == 0:
       return '0.000000'
 
+    # The byte frequencies are summed in byte value order so that the result
+    # does not depend on how the byte values were counted.
     entropy = 0.0
-    for byte_frequency in self._byte_frequency_counter.values():
+    for byte_frequency in self._GetByteFrequencies():
       byte_probability = byte_frequency / self._file_length
       if byte_probability:
         entropy += - byte_probability * math.log(byte_probability, 2)
@@ -51,9 +82,17 @@ class EntropyHasher(interface.BaseHasher):
       data(bytes): block of data with which to update the context of the entropy
           calculator.
     """
-    # The call to update() determines the number of occurrences of a byte value
-    # within data.
-    self._byte_frequency_counter.update(data)
+    if self._byte_frequencies is not None:
+      # Counting the byte values of a read-only view of the data with NumPy
+      # is considerably faster than counting them in Python.
+      self._byte_frequencies += numpy.bincount(
+          numpy.frombuffer(data, dtype=numpy.uint8), minlength=256)
+
+    else:
+      # The call to update() determines the number of occurrences of a byte
+      # value within data.
+      self._byte_frequency_counter.update(data)
+
     self._file_length += len(data)
 
 
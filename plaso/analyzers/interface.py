@@ -15,6 +15,8 @@ class BaseAnalyzer(object):
   # Processing status hint used by the worker.
   PROCESSING_STATUS_HINT = definitions.STATUS_INDICATOR_ANALYZING
 
+  # True if the analyzer can analyze a file by path, see AnalyzeFile.
+  FILE_ANALYZER = False
   INCREMENTAL_ANALYZER = False
   SIZE_LIMIT = 32 * 1024 * 1024
 
@@ -26,6 +28,28 @@ class BaseAnalyzer(object):
       data(bytes): block of data to process.
     """
 
+  def AnalyzeFile(self, path):
+    """Analyzes a file, updating the state of the analyzer.
+
+    Only supported by analyzers that define FILE_ANALYZER as True.
+
+    Args:
+      path (str): path of the file to process.
+
+    Raises:
+      NotImplementedError: if the analyzer does not support analyzing a file.
+    """
+    raise NotImplementedError(
+        f'Analyzer: {self.NAME:s} does not support analyzing a file.')
+
+  def GetReadSize(self):
+    """Retrieves the size of the blocks of data to pass to Analyze.
+
+    Returns:
+      int: size of the blocks of data in bytes.
+    """
+    return self.SIZE_LIMIT
+
   # pylint: disable=redundant-returns-doc
   @abc.abstractmethod
   def GetResults(self):
@@ -21,7 +21,14 @@ from plaso.lib import definitions
 
 
 class YaraAnalyzer(interface.BaseAnalyzer):
-  """Analyzer that matches Yara rules."""
+  """Analyzer that matches Yara rules.
+
+  Data is matched in windows, where every window is preceded by the last
+  bytes of the previous window, the window overlap, so that data that spans
+  the boundary of 2 windows can be matched. Matches are merged across the
+  windows of a data stream. Note that conditions that depend on the offset
+  or the size of the data, such as "at" or "filesize", apply to the window.
+  """
 
   # pylint: disable=no-member
 
@@ -30,35 +37,93 @@ class YaraAnalyzer(interface.BaseAnalyzer):
 
   PROCESSING_STATUS_HINT = definitions.STATUS_INDICATOR_YARA_SCAN
 
-  INCREMENTAL_ANALYZER = False
+  FILE_ANALYZER = True
+  INCREMENTAL_ANALYZER = True
 
   _ATTRIBUTE_NAME = 'yara_match'
   _MATCH_TIMEOUT = 60
 
+  _DEFAULT_WINDOW_OVERLAP = 1024 * 1024
+  _DEFAULT_WINDOW_SIZE = interface.BaseAnalyzer.SIZE_LIMIT
+
   def __init__(self):
     """Initializes the Yara analyzer."""
     super(YaraAnalyzer, self).__init__()
-    self._matches = []
+    self._matched_rules = []
     self._rules = None
+    self._window_overlap = self._DEFAULT_WINDOW_OVERLAP
+    self._window_overlap_data = b''
+    self._window_size = self._DEFAULT_WINDOW_SIZE
 
-  def Analyze(self, data):
-    """Analyzes a block of data, attempting to match Yara rules to it.
+  def _Match(self, data=None, path=None):
+    """Matches Yara rules to data or a file.
 
     Args:
-      data(bytes): a block of data.
+      data (Optional[bytes]): data to match.
+      path (Optional[str]): path of the file to match.
     """
-    if not self._rules:
-      return
-
     try:
-      self._matches = self._rules.match(data=data, timeout=self._MATCH_TIMEOUT)
+      if path:
+        matches = self._rules.match(filepath=path, timeout=self._MATCH_TIMEOUT)
+      else:
+        matches = self._rules.match(data=data, timeout=self._MATCH_TIMEOUT)
 
     except YaraTimeoutError:
       logger.error(
           f'Could not process file within timeout: {self._MATCH_TIMEOUT:d}')
+      return
 
     except YaraError as exception:
       logger.error(f'Error processing file with Yara: {exception!s}.')
+      return
+
+    for match in matches:
+      if match.rule not in self._matched_rules:
+        self._matched_rules.append(match.rule)
+
+  def Analyze(self, data):
+    """Analyzes a block of data, attempting to match Yara rules to it.
+
+    Repeated calls continue the windows of the previous call.
+
+    Args:
+      data(bytes): a block of data.
+    """
+    if not self._rules:
+      return
+
+    for window_offset in range(0, len(data), self._window_size):
+      window_data = data[window_offset:window_offset + self._window_size]
+      if self._window_overlap_data:
+        window_data = b''.join([self._window_overlap_data, window_data])
+
+      self._Match(data=window_data)
+
+      if self._window_overlap:
+        self._window_overlap_data = window_data[-self._window_overlap:]
+
+  def AnalyzeFile(self, path):
+    """Analyzes a file, attempting to match Yara rules to it.
+
+    Yara maps the file into memory, hence the file is matched as a whole
+    without being read into memory.
+
+    Args:
+      path (str): path of the file.
+    """
+    if self._rules:
+      self._Match(path=path)
+
+  def GetReadSize(self):
+    """Retrieves the size of the blocks of data to pass to Analyze.
+
+    The blocks of data are at least the size of a window, since a window
+    cannot span multiple calls to Analyze.
+
+    Returns:
+      int: size of the blocks of data in bytes.
+    """
+    return max(self.SIZE_LIMIT, self._window_size)
 
   def GetResults(self):
     """Retrieves results of the most recent analysis.
@@ -69,12 +134,13 @@ class YaraAnalyzer(interface.BaseAnalyzer):
     result = analyzer_result.AnalyzerResult()
     result.analyzer_name = self.NAME
     result.attribute_name = self._ATTRIBUTE_NAME
-    result.attribute_value = [match.rule for match in self._matches]
+    result.attribute_value = list(self._matched_rules)
     return [result]
 
   def Reset(self):
     """Resets the internal state of the analyzer."""
-    self._matches = []
+    self._matched_rules = []
+    self._window_overlap_data = b''
 
   def SetRules(self, rules_string):
     """Sets the rules that the Yara analyzer will use.
@@ -84,5 +150,33 @@ class YaraAnalyzer(interface.BaseAnalyzer):
     """
     self._rules = yara.compile(source=rules_string)
 
+  def SetWindow(self, window_size, window_overlap):
+    """Sets the size and overlap of the windows in which data is matched.
+
+    Args:
+      window_size (int): size of a window in bytes, where None represents
+          the default.
+      window_overlap (int): number of bytes of the previous window that
+          precede a window, where None represents the default.
+
+    Raises:
+      ValueError: if the window size or overlap is invalid.
+    """
+    if window_size is None:
+      window_size = self._DEFAULT_WINDOW_SIZE
+    if window_overlap is None:
+      window_overlap = min(self._DEFAULT_WINDOW_OVERLAP, window_size // 2)
+
+    if window_size <= 0:
+      raise ValueError('Invalid window size value must be larger than 0.')
+
+    if window_overlap < 0 or window_overlap >= window_size:
+      raise ValueError((
+          'Invalid window overlap value must be 0 or larger and smaller than '
+          'the window size.'))
+
+    self._window_overlap = window_overlap
+    self._window_size = window_size
+
 
 manager.AnalyzersManager.RegisterAnalyzer(YaraAnalyzer)
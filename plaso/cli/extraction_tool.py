@@ -16,9 +16,7 @@ from dfvfs.resolver import context as dfvfs_context
 # The following import makes sure the analyzers are registered.
 from plaso import analyzers  # pylint: disable=unused-import
 
-# The following import makes sure the parsers are registered.
-from plaso import parsers  # pylint: disable=unused-import
-
+from plaso.analyzers.hashers import manager as hashers_manager
 from plaso.cli import logger
 from plaso.cli import status_view
 from plaso.cli import storage_media_tool
@@ -26,6 +24,7 @@ from plaso.cli import tool_options
 from plaso.cli import views
 from plaso.cli.helpers import manager as helpers_manager
 from plaso.containers import artifacts
+from plaso.containers import counts
 from plaso.engine import configurations
 from plaso.engine import engine
 from plaso.single_process import extraction_engine as single_extraction_engine
@@ -85,11 +84,16 @@ class ExtractionTool(
     self._artifacts_registry = None
     self._buffer_size = 0
     self._command_line_arguments = None
+    self._compression_format = definitions.COMPRESSION_FORMAT_ZLIB
     self._enable_sigsegv_handler = False
     self._expanded_parser_filter_expression = None
     self._extract_winevt_resources = True
     self._extract_winreg_binary = True
+    self._incremental_extraction = False
+    self._incremental_extraction_digest = False
+    self._number_of_analyzer_threads = 0
     self._number_of_extraction_workers = 0
+    self._parse_cache_path = None
     self._parser_filter_expression = None
     self._preferred_codepage = None
     self._preferred_language = None
@@ -100,19 +104,25 @@ class ExtractionTool(
     self._process_compressed_streams = True
     self._process_memory_limit = None
     self._queue_size = self._DEFAULT_QUEUE_SIZE
+    self._record_range_data_size = definitions.DEFAULT_RECORD_RANGE_DATA_SIZE
     self._resolver_context = dfvfs_context.Context()
+    self._serialization_format = definitions.SERIALIZER_FORMAT_JSON
     self._single_process_mode = False
+    self._spool_data_streams = False
     self._status_view = status_view.StatusView(self._output_writer, self.NAME)
     self._status_view_file = 'status.info'
     self._status_view_interval = 0.5
     self._status_view_mode = status_view.StatusView.MODE_WINDOW
     self._storage_file_path = None
     self._storage_format = definitions.STORAGE_FORMAT_SQLITE
+    self._task_batch_size = 1
     self._task_storage_format = definitions.STORAGE_FORMAT_SQLITE
     self._temporary_directory = None
     self._worker_memory_limit = None
     self._worker_timeout = None
     self._yara_rules_string = None
+    self._yara_window_overlap = None
+    self._yara_window_size = None
 
     self.list_language_tags = False
     self.list_time_zones = False
@@ -168,6 +178,7 @@ class ExtractionTool(
       extraction_engine = multi_extraction_engine.ExtractionMultiProcessEngine(
           number_of_worker_processes=self._number_of_extraction_workers,
           status_update_callback=status_update_callback,
+          task_batch_size=self._task_batch_size,
           worker_memory_limit=self._worker_memory_limit,
           worker_timeout=self._worker_timeout)
 
@@ -195,10 +206,21 @@ class ExtractionTool(
         self._extract_winevt_resources)
     configuration.extraction.extract_winreg_binary = self._extract_winreg_binary
     configuration.extraction.hasher_names_string = self._hasher_names_string
+    configuration.extraction.number_of_analyzer_threads = (
+        self._number_of_analyzer_threads)
+    configuration.extraction.parse_cache_path = self._parse_cache_path
     configuration.extraction.process_compressed_streams = (
         self._process_compressed_streams)
+    configuration.extraction.record_range_data_size = (
+        self._record_range_data_size)
+    configuration.extraction.spool_data_streams = self._spool_data_streams
     configuration.extraction.yara_rules_string = self._yara_rules_string
+    configuration.extraction.yara_window_overlap = self._yara_window_overlap
+    configuration.extraction.yara_window_size = self._yara_window_size
     configuration.filter_file = self._filter_file
+    configuration.incremental_extraction = self._incremental_extraction
+    configuration.incremental_extraction_digest = (
+        self._incremental_extraction_digest)
     configuration.log_filename = self._log_file
     configuration.parser_filter_expression = (
         self._expanded_parser_filter_expression)
@@ -209,9 +231,20 @@ class ExtractionTool(
     configuration.profiling.directory = self._profiling_directory
     configuration.profiling.sample_rate = self._profiling_sample_rate
     configuration.profiling.profilers = self._profilers
+    configuration.task_compression_format = self._compression_format
+    configuration.task_serialization_format = self._serialization_format
     configuration.task_storage_format = self._task_storage_format
     configuration.temporary_directory = self._temporary_directory
 
+    if self._incremental_extraction_digest:
+      # The digest of a file entry fingerprint is taken from the SHA-256 hash
+      # calculated by the extraction worker.
+      hasher_names = hashers_manager.HashersManager.GetHasherNamesFromString(
+          self._hasher_names_string)
+      if 'sha256' not in hasher_names:
+        hasher_names.append('sha256')
+        configuration.extraction.hasher_names_string = ','.join(hasher_names)
+
     return configuration
 
   def _GenerateStorageFileName(self):
@@ -554,6 +587,17 @@ class ExtractionTool(
       session.completion_time = int(time.time() * 1000000)
       storage_writer.UpdateAttributeContainer(session)
 
+      incremental_extraction_status = getattr(
+          processing_status, 'incremental_extraction_status', None)
+      if incremental_extraction_status:
+        incremental_extraction_count = counts.IncrementalExtractionCount(
+            number_of_parsed_file_entries=(
+                incremental_extraction_status.number_of_parsed_file_entries),
+            number_of_skipped_file_entries=(
+                incremental_extraction_status.number_of_skipped_file_entries),
+            session_identifier=session.identifier)
+        storage_writer.AddAttributeContainer(incremental_extraction_count)
+
     return processing_status
 
   def _ReadParserPresetsFromFile(self):
@@ -739,7 +783,10 @@ class ExtractionTool(
           f'Unsupported storage format: {self._storage_format:s}')
 
     try:
-      storage_writer.Open(path=self._storage_file_path)
+      storage_writer.Open(
+          path=self._storage_file_path,
+          compression_format=self._compression_format,
+          serialization_format=self._serialization_format)
     except IOError as exception:
       raise IOError(f'Unable to open storage with error: {exception!s}')
 
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """The extraction CLI arguments helper."""
 
+import os
+
 from plaso.cli import tools
 from plaso.cli.helpers import interface
 from plaso.cli.helpers import manager
@@ -30,6 +32,37 @@ class ExtractionArgumentsHelper(interface.ArgumentsHelper):
             'Extract binary Windows Registry values. WARNING: This can make '
             'processing significantly slower.'))
 
+    argument_group.add_argument(
+        '--incremental_extraction', '--incremental-extraction',
+        dest='incremental_extraction', action='store_true', default=False,
+        help=(
+            'Skip file entries of which the size, modification time and inode '
+            'number are unchanged since a previous extraction session in the '
+            'same storage file. New and changed file entries are parsed. '
+            'WARNING: The events of a previous session are not removed when a '
+            'changed file entry is parsed again, hence for example every '
+            'record of a log file that was appended to is stored again.'))
+
+    argument_group.add_argument(
+        '--incremental_extraction_digest', '--incremental-extraction-digest',
+        dest='incremental_extraction_digest', action='store_true',
+        default=False, help=(
+            'Also compare a SHA-256 digest of the content of the file entries '
+            'to determine if they are unchanged. This implies '
+            '--incremental_extraction and the sha256 hasher. WARNING: This '
+            'requires the content of every file entry of which the size, '
+            'modification time and inode number are unchanged to be read. '
+            'File entries larger than the hasher file size limit have no '
+            'digest.'))
+
+    argument_group.add_argument(
+        '--parse_cache', '--parse-cache', dest='parse_cache', type=str,
+        action='store', default=None, metavar='PATH', help=(
+            'Path of a parse cache database file. Event data extracted from '
+            'a data stream is stored in the parse cache and reused for data '
+            'streams with identical content and name, including in '
+            'subsequent runs. The file is created if it does not exist.'))
+
     argument_group.add_argument(
         '--preferred_year', '--preferred-year', dest='preferred_year',
         type=int, action='store', default=None, metavar='YEAR', help=(
@@ -44,6 +77,15 @@ class ExtractionArgumentsHelper(interface.ArgumentsHelper):
             'Skip processing file content within compressed streams, such as '
             'syslog.gz and syslog.bz2.'))
 
+    argument_group.add_argument(
+        '--spool_data_streams', '--spool-data-streams',
+        dest='spool_data_streams', action='store_true', default=False, help=(
+            'Read the content of a data stream once into a spool, in memory '
+            'or in a temporary file for larger data streams, that is shared '
+            'by the analyzers, the format scanners and the parsers. This can '
+            'make processing of compressed or nested storage media images '
+            'faster.'))
+
   @classmethod
   def ParseOptions(cls, options, configuration_object):
     """Parses and validates options.
@@ -55,22 +97,44 @@ class ExtractionArgumentsHelper(interface.ArgumentsHelper):
 
     Raises:
       BadConfigObject: when the configuration object is of the wrong type.
+      BadConfigOption: if the directory of the parse cache does not exist.
     """
     if not isinstance(configuration_object, tools.CLITool):
       raise errors.BadConfigObject(
           'Configuration object is not an instance of CLITool')
 
+    parse_cache_path = cls._ParseStringOption(options, 'parse_cache')
+    if parse_cache_path:
+      parse_cache_path = os.path.abspath(parse_cache_path)
+      parse_cache_directory = os.path.dirname(parse_cache_path)
+      if not os.path.isdir(parse_cache_directory):
+        raise errors.BadConfigOption((
+            f'No such directory: {parse_cache_directory:s} for parse cache: '
+            f'{parse_cache_path:s}'))
+
     preferred_year = cls._ParseNumericOption(options, 'preferred_year')
 
     extract_winreg_binary = getattr(options, 'extract_winreg_binary', False)
+    incremental_extraction_digest = getattr(
+        options, 'incremental_extraction_digest', False)
+    incremental_extraction = getattr(
+        options, 'incremental_extraction', False) or (
+            incremental_extraction_digest)
     process_compressed_streams = getattr(
         options, 'process_compressed_streams', True)
+    spool_data_streams = getattr(options, 'spool_data_streams', False)
 
     setattr(configuration_object, '_extract_winreg_binary',
             extract_winreg_binary)
+    setattr(configuration_object, '_incremental_extraction',
+            incremental_extraction)
+    setattr(configuration_object, '_incremental_extraction_digest',
+            incremental_extraction_digest)
+    setattr(configuration_object, '_parse_cache_path', parse_cache_path)
     setattr(configuration_object, '_preferred_year', preferred_year)
     setattr(configuration_object, '_process_compressed_streams',
             process_compressed_streams)
+    setattr(configuration_object, '_spool_data_streams', spool_data_streams)
 
 
 manager.ArgumentHelperManager.RegisterHelper(ExtractionArgumentsHelper)
@@ -7,6 +7,21 @@ from plaso.cli.helpers import manager
 from plaso.lib import definitions
 from plaso.lib import errors
 
+try:
+  import lz4
+except ModuleNotFoundError:
+  lz4 = None
+
+try:
+  import zstandard
+except ModuleNotFoundError:
+  zstandard = None
+
+try:
+  from plaso.serializer import msgpack_serializer
+except ModuleNotFoundError:
+  msgpack_serializer = None
+
 
 class StorageFormatArgumentsHelper(interface.ArgumentsHelper):
   """Storage format CLI arguments helper."""
@@ -25,9 +40,31 @@ class StorageFormatArgumentsHelper(interface.ArgumentsHelper):
       argument_group (argparse._ArgumentGroup|argparse.ArgumentParser):
           argparse group.
     """
+    compression_formats = sorted(definitions.COMPRESSION_FORMATS)
+    serialization_formats = sorted(definitions.SERIALIZER_FORMATS)
     session_storage_formats = sorted(definitions.SESSION_STORAGE_FORMATS)
     task_storage_formats = sorted(definitions.TASK_STORAGE_FORMATS)
 
+    compression_formats_string = ', '.join(compression_formats)
+    argument_group.add_argument(
+        '--compression_format', '--compression-format', action='store',
+        choices=compression_formats, dest='compression_format', type=str,
+        metavar='FORMAT', default=definitions.COMPRESSION_FORMAT_ZLIB, help=(
+            f'Format used to compress attribute containers in SQLite '
+            f'storage files, the default is: '
+            f'{definitions.COMPRESSION_FORMAT_ZLIB:s}. Supported options: '
+            f'{compression_formats_string:s}'))
+
+    serialization_formats_string = ', '.join(serialization_formats)
+    argument_group.add_argument(
+        '--serialization_format', '--serialization-format', action='store',
+        choices=serialization_formats, dest='serialization_format', type=str,
+        metavar='FORMAT', default=definitions.SERIALIZER_FORMAT_JSON, help=(
+            f'Format used to serialize attribute containers in SQLite '
+            f'storage files, the default is: '
+            f'{definitions.SERIALIZER_FORMAT_JSON:s}. Supported options: '
+            f'{serialization_formats_string:s}'))
+
     storage_formats_string = ', '.join(session_storage_formats)
     argument_group.add_argument(
         '--storage_format', '--storage-format', action='store',
@@ -57,8 +94,8 @@ class StorageFormatArgumentsHelper(interface.ArgumentsHelper):
 
     Raises:
       BadConfigObject: when the configuration object is of the wrong type.
-      BadConfigOption: if the storage format or task storage is not defined
-          or supported.
+      BadConfigOption: if the storage format, task storage, serialization
+          or compression format is not defined or supported.
     """
     if not isinstance(configuration_object, tools.CLITool):
       raise errors.BadConfigObject(
@@ -84,5 +121,42 @@ class StorageFormatArgumentsHelper(interface.ArgumentsHelper):
 
     setattr(configuration_object, '_task_storage_format', task_storage_format)
 
+    serialization_format = cls._ParseStringOption(
+        options, 'serialization_format',
+        default_value=definitions.SERIALIZER_FORMAT_JSON)
+
+    if serialization_format not in definitions.SERIALIZER_FORMATS:
+      raise errors.BadConfigOption(
+          f'Unsupported serialization format: {serialization_format:s}')
+
+    if (serialization_format == definitions.SERIALIZER_FORMAT_MSGPACK and
+        not msgpack_serializer):
+      raise errors.BadConfigOption((
+          f'Unsupported serialization format: {serialization_format:s} '
+          f'missing msgpack support.'))
+
+    setattr(configuration_object, '_serialization_format', serialization_format)
+
+    compression_format = cls._ParseStringOption(
+        options, 'compression_format',
+        default_value=definitions.COMPRESSION_FORMAT_ZLIB)
+
+    if compression_format not in definitions.COMPRESSION_FORMATS:
+      raise errors.BadConfigOption(
+          f'Unsupported compression format: {compression_format:s}')
+
+    if compression_format == definitions.COMPRESSION_FORMAT_LZ4 and not lz4:
+      raise errors.BadConfigOption((
+          f'Unsupported compression format: {compression_format:s} missing '
+          f'lz4 support.'))
+
+    if (compression_format == definitions.COMPRESSION_FORMAT_ZSTD and
+        not zstandard):
+      raise errors.BadConfigOption((
+          f'Unsupported compression format: {compression_format:s} missing '
+          f'zstandard support.'))
+
+    setattr(configuration_object, '_compression_format', compression_format)
+
 
 manager.ArgumentHelperManager.RegisterHelper(StorageFormatArgumentsHelper)
@@ -4,6 +4,7 @@
 from plaso.cli import tools
 from plaso.cli.helpers import interface
 from plaso.cli.helpers import manager
+from plaso.lib import definitions
 from plaso.lib import errors
 
 
@@ -24,6 +25,32 @@ class WorkersArgumentsHelper(interface.ArgumentsHelper):
       argument_group (argparse._ArgumentGroup|argparse.ArgumentParser):
           argparse group.
     """
+    argument_group.add_argument(
+        '--analyzer_threads', '--analyzer-threads', dest='analyzer_threads',
+        action='store', type=int, metavar='NUMBER', help=(
+            'Number of threads per worker process that run the analyzers, '
+            'such as the hashers and Yara, concurrently with parsing. The '
+            'default is 0, which runs the analyzers before parsing.'))
+
+    argument_group.add_argument(
+        '--record_range_size', '--record-range-size',
+        dest='record_range_size', action='store', type=int, metavar='SIZE',
+        help=(
+            'Approximate size in bytes of the record ranges into which large '
+            'Windows XML EventLog (EVTX), ESE database and NTFS $MFT files '
+            'are split, so that these are parsed by multiple worker '
+            'processes, where 0 represents files are not split. The default '
+            'is 268435456 (256 MiB).'))
+
+    argument_group.add_argument(
+        '--task_batch_size', '--task-batch-size', dest='task_batch_size',
+        action='store', type=int, metavar='NUMBER', help=(
+            'Maximum number of small files that are processed by a worker '
+            'process as a single task. The default is 1, which processes '
+            'every file as a separate task. Batching small files reduces '
+            'the overhead per task, such as on sources with many tiny '
+            'files.'))
+
     argument_group.add_argument(
         '--worker_memory_limit', '--worker-memory-limit',
         dest='worker_memory_limit', action='store', type=int,
@@ -84,9 +111,38 @@ class WorkersArgumentsHelper(interface.ArgumentsHelper):
       raise errors.BadConfigOption(
           'Invalid worker timeout value must be larger than 0.0 minutes.')
 
+    task_batch_size = cls._ParseNumericOption(
+        options, 'task_batch_size', default_value=1)
+
+    if task_batch_size < 1:
+      raise errors.BadConfigOption(
+          'Invalid task batch size value cannot be less than 1.')
+
+    number_of_analyzer_threads = cls._ParseNumericOption(
+        options, 'analyzer_threads', default_value=0)
+
+    if number_of_analyzer_threads < 0:
+      raise errors.BadConfigOption(
+          'Invalid number of analyzer threads value cannot be less than 0.')
+
+    record_range_data_size = cls._ParseNumericOption(
+        options, 'record_range_size',
+        default_value=definitions.DEFAULT_RECORD_RANGE_DATA_SIZE)
+
+    if record_range_data_size < 0:
+      raise errors.BadConfigOption(
+          'Invalid record range size value cannot be less than 0.')
+
+    setattr(
+        configuration_object, '_number_of_analyzer_threads',
+        number_of_analyzer_threads)
     setattr(
         configuration_object, '_number_of_extraction_workers',
         number_of_extraction_workers)
+    setattr(
+        configuration_object, '_record_range_data_size',
+        record_range_data_size)
+    setattr(configuration_object, '_task_batch_size', task_batch_size)
     setattr(configuration_object, '_worker_memory_limit', worker_memory_limit)
     setattr(configuration_object, '_worker_timeout', worker_timeout)
 
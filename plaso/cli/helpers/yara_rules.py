@@ -5,6 +5,7 @@ import io
 
 import yara
 
+from plaso.analyzers import yara_analyzer
 from plaso.cli import tools
 from plaso.cli.helpers import interface
 from plaso.cli.helpers import manager
@@ -33,6 +34,24 @@ class YaraRulesArgumentsHelper(interface.ArgumentsHelper):
         type=str, metavar='PATH', action='store', help=(
             'Path to a file containing Yara rules definitions.'))
 
+    argument_group.add_argument(
+        '--yara_window_overlap', '--yara-window-overlap',
+        dest='yara_window_overlap', type=int, metavar='SIZE', action='store',
+        help=(
+            'Number of bytes of the previous window that precede a window in '
+            'which Yara rules are matched, so that matches that span window '
+            'boundaries are found. The default is 1048576 (1 MiB).'))
+
+    argument_group.add_argument(
+        '--yara_window_size', '--yara-window-size', dest='yara_window_size',
+        type=int, metavar='SIZE', action='store', help=(
+            'Size of the windows in which Yara rules are matched, which '
+            'allows large files to be matched without reading them into '
+            'memory as a whole. Note that conditions that depend on offsets '
+            'or the file size apply to a window and that data is read in '
+            'blocks of at least the window size. The default is 33554432 '
+            '(32 MiB).'))
+
   @classmethod
   def ParseOptions(cls, options, configuration_object):
     """Parses and validates options.
@@ -44,7 +63,8 @@ class YaraRulesArgumentsHelper(interface.ArgumentsHelper):
 
     Raises:
       BadConfigObject: when the configuration object is of the wrong type.
-      BadConfigOption: when the Yara rules file cannot be read or parsed.
+      BadConfigOption: when the Yara rules file cannot be read or parsed or
+          the window size or overlap is invalid.
     """
     if not isinstance(configuration_object, tools.CLITool):
       raise errors.BadConfigObject(
@@ -74,7 +94,27 @@ class YaraRulesArgumentsHelper(interface.ArgumentsHelper):
             f'Unable to parse Yara rules in: {path:s} with error: '
             f'{exception!s}'))
 
+    yara_window_size = cls._ParseNumericOption(options, 'yara_window_size')
+    if yara_window_size is not None and yara_window_size <= 0:
+      raise errors.BadConfigOption(
+          'Invalid Yara window size value must be larger than 0.')
+
+    yara_window_overlap = cls._ParseNumericOption(
+        options, 'yara_window_overlap')
+    if yara_window_overlap is not None:
+      if yara_window_overlap < 0:
+        raise errors.BadConfigOption(
+            'Invalid Yara window overlap value cannot be less than 0.')
+
+      if yara_window_overlap >= (
+          yara_window_size or yara_analyzer.YaraAnalyzer.SIZE_LIMIT):
+        raise errors.BadConfigOption(
+            'Invalid Yara window overlap value must be smaller than the '
+            'window size.')
+
     setattr(configuration_object, '_yara_rules_string', yara_rules_string)
+    setattr(configuration_object, '_yara_window_overlap', yara_window_overlap)
+    setattr(configuration_object, '_yara_window_size', yara_window_size)
 
 
 manager.ArgumentHelperManager.RegisterHelper(YaraRulesArgumentsHelper)
@@ -885,12 +885,16 @@ class PinfoTool(tools.CLITool, tool_options.StorageFileOptions):
             session))
     self._output_writer.Write(f'"session": {json_string:s}')
 
-  def _PrintSessionDetailsAsTable(self, session, session_identifier):
+  def _PrintSessionDetailsAsTable(
+      self, session, session_identifier, incremental_extraction_count=None):
     """Prints the details of a session as a table.
 
     Args:
       session (Session): session.
       session_identifier (str): session identifier, formatted as a UUID.
+      incremental_extraction_count (Optional[IncrementalExtractionCount]):
+          incremental extraction count of the session, where None represents
+          the session did not use incremental extraction.
     """
     start_time = 'N/A'
     if session.start_time is not None:
@@ -935,6 +939,14 @@ class PinfoTool(tools.CLITool, tool_options.StorageFileOptions):
     table_view.AddRow(['Artifact filters', artifact_filters_string])
     table_view.AddRow(['Filter file', filter_file])
 
+    if incremental_extraction_count:
+      table_view.AddRow([
+          'Incremental extraction parsed file entries',
+          incremental_extraction_count.number_of_parsed_file_entries])
+      table_view.AddRow([
+          'Incremental extraction skipped file entries',
+          incremental_extraction_count.number_of_skipped_file_entries])
+
     table_view.Write(self._output_writer)
 
   def _PrintSessionsDetails(self, storage_reader):
@@ -943,6 +955,15 @@ class PinfoTool(tools.CLITool, tool_options.StorageFileOptions):
     Args:
       storage_reader (BaseStore): storage.
     """
+    incremental_extraction_counts = {}
+    if storage_reader.HasAttributeContainers('incremental_extraction_count'):
+      incremental_extraction_counts = {
+          incremental_extraction_count.session_identifier: (
+              incremental_extraction_count)
+          for incremental_extraction_count in (
+              storage_reader.GetAttributeContainers(
+                  'incremental_extraction_count'))}
+
     if self._output_format == 'json':
       self._output_writer.Write('"sessions": {')
 
@@ -956,7 +977,11 @@ class PinfoTool(tools.CLITool, tool_options.StorageFileOptions):
         self._PrintSessionDetailsAsJSON(session)
 
       elif self._output_format in ('markdown', 'text'):
-        self._PrintSessionDetailsAsTable(session, session_identifier)
+        incremental_extraction_count = incremental_extraction_counts.get(
+            session.identifier, None)
+        self._PrintSessionDetailsAsTable(
+            session, session_identifier,
+            incremental_extraction_count=incremental_extraction_count)
 
       if self._verbose:
         system_configuration = storage_reader.GetAttributeContainerByIndex(
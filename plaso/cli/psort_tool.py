@@ -60,6 +60,7 @@ class PsortTool(
     super(PsortTool, self).__init__(
         input_reader=input_reader, output_writer=output_writer)
     self._deduplicate_events = True
+    self._number_of_output_workers = 0
     self._preferred_language = None
     self._process_memory_limit = None
     self._status_view = status_view.StatusView(self._output_writer, self.NAME)
@@ -225,6 +226,13 @@ class PsortTool(
     helpers_manager.ArgumentHelperManager.ParseOptions(
         options, self, names=argument_helper_names)
 
+    number_of_output_workers = getattr(options, 'output_workers', None) or 0
+
+    if number_of_output_workers < 0:
+      raise errors.BadConfigOption((
+          f'Invalid number of output workers: {number_of_output_workers:d}, '
+          f'value must be 0 or greater.'))
+
     worker_memory_limit = getattr(options, 'worker_memory_limit', None)
 
     if worker_memory_limit and worker_memory_limit < 0:
@@ -239,6 +247,7 @@ class PsortTool(
           f'Invalid worker timeout: {worker_timeout:f}, value must be greater '
           f'than 0.0 minutes.'))
 
+    self._number_of_output_workers = number_of_output_workers
     self._worker_memory_limit = worker_memory_limit
     self._worker_timeout = worker_timeout
 
@@ -254,6 +263,14 @@ class PsortTool(
     helpers_manager.ArgumentHelperManager.AddCommandLineArguments(
         argument_group, names=argument_helper_names)
 
+    argument_group.add_argument(
+        '--output_workers', '--output-workers', dest='output_workers',
+        action='store', type=int, metavar='NUMBER', help=(
+            'Number of worker processes used to format the events for output, '
+            'where 0 represents formatting the events in the main (foreman) '
+            'process. The default is 0. The events are written in the same '
+            'order regardless of the number of worker processes.'))
+
     argument_group.add_argument(
         '--worker_memory_limit', '--worker-memory-limit',
         dest='worker_memory_limit', action='store', type=int,
@@ -510,7 +527,9 @@ class PsortTool(
           storage_reader, self._output_module, configuration,
           deduplicate_events=self._deduplicate_events,
           event_filter=self._event_filter,
+          number_of_worker_processes=self._number_of_output_workers,
           status_update_callback=status_update_callback,
+          storage_file_path=self._storage_file_path,
           time_slice=self._time_slice, use_time_slicer=self._use_time_slicer)
 
       self._output_module.Close()
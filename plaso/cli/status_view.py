@@ -272,7 +272,9 @@ class StatusView(object):
             f'time slice: {events_status.number_of_events_from_time_slice:d} '
             f'Duplicates: {events_status.number_of_duplicate_events:d} MACB '
             f'grouped: {events_status.number_of_macb_grouped_events:d} Total: '
-            f'{events_status.total_number_of_events:d}\n'))
+            f'{events_status.total_number_of_events:d} Formatting cache: '
+            f'Hits: {events_status.number_of_formatting_cache_hits:d} '
+            f'Misses: {events_status.number_of_formatting_cache_misses:d}\n'))
 
   def _PrintAnalysisStatusUpdateLinear(self, processing_status):
     """Prints an analysis status update in linear mode.
@@ -450,6 +452,46 @@ class StatusView(object):
       self._output_writer.Write('\n')
       table_view.Write(self._output_writer)
 
+      if (events_status.number_of_formatting_cache_hits or
+          events_status.number_of_formatting_cache_misses):
+        table_view = views.CLITabularTableView(
+            column_names=['Formatting:', 'Cache hits', 'Cache misses'],
+            column_sizes=[15, 15, 0])
+
+        table_view.AddRow([
+            '', events_status.number_of_formatting_cache_hits,
+            events_status.number_of_formatting_cache_misses])
+
+        table_view.Write(self._output_writer)
+
+  def _PrintParseCacheStatus(self, processing_status):
+    """Prints the status of the parse cache.
+
+    Args:
+      processing_status (ProcessingStatus): processing status.
+    """
+    if processing_status and processing_status.parse_cache_status:
+      parse_cache_status = processing_status.parse_cache_status
+
+      number_of_lookups = (
+          parse_cache_status.number_of_hits +
+          parse_cache_status.number_of_misses)
+      if number_of_lookups:
+        hit_ratio = (
+            100.0 * parse_cache_status.number_of_hits) / number_of_lookups
+
+        table_view = views.CLITabularTableView(
+            column_names=['Parse cache:', 'Hits', 'Misses', 'Hit ratio',
+                          'Time saved'],
+            column_sizes=[15, 7, 15, 15, 0])
+
+        table_view.AddRow([
+            '', parse_cache_status.number_of_hits,
+            parse_cache_status.number_of_misses, f'{hit_ratio:.1f}%',
+            f'{parse_cache_status.time_saved:.1f}s'])
+
+        table_view.Write(self._output_writer)
+
   def _PrintTasksStatus(self, processing_status):
     """Prints the status of the tasks.
 
@@ -474,6 +516,19 @@ class StatusView(object):
       self._output_writer.Write('\n')
       table_view.Write(self._output_writer)
 
+      if tasks_status.number_of_queued_event_sources:
+        data_size = self._FormatSizeInUnitsOf1024(
+            tasks_status.queued_event_sources_data_size)
+
+        table_view = views.CLITabularTableView(
+            column_names=['Remaining:', 'Sources', 'Data size'],
+            column_sizes=[15, 7, 0])
+
+        table_view.AddRow([
+            '', tasks_status.number_of_queued_event_sources, data_size])
+
+        table_view.Write(self._output_writer)
+
   def GetAnalysisStatusUpdateCallback(self):
     """Retrieves the analysis status update callback function.
 
@@ -528,6 +583,7 @@ class StatusView(object):
     self._output_writer.Write(f'Processing time\t\t: {processing_time:s}\n')
 
     self._PrintTasksStatus(processing_status)
+    self._PrintParseCacheStatus(processing_status)
     self._output_writer.Write('\n')
 
   def PrintExtractionSummary(
@@ -548,6 +604,27 @@ class StatusView(object):
       else:
         self._output_writer.Write('Processing completed.\n')
 
+      parse_cache_status = processing_status.parse_cache_status
+      if parse_cache_status and (
+          parse_cache_status.number_of_hits or
+          parse_cache_status.number_of_misses):
+        self._output_writer.Write((
+            f'\nParse cache hits: {parse_cache_status.number_of_hits:d}, '
+            f'misses: {parse_cache_status.number_of_misses:d}, time saved: '
+            f'{parse_cache_status.time_saved:.1f} seconds.\n'))
+
+      incremental_extraction_status = (
+          processing_status.incremental_extraction_status)
+      if incremental_extraction_status:
+        number_of_parsed_file_entries = (
+            incremental_extraction_status.number_of_parsed_file_entries)
+        number_of_skipped_file_entries = (
+            incremental_extraction_status.number_of_skipped_file_entries)
+        self._output_writer.Write((
+            f'\nIncremental extraction parsed file entries: '
+            f'{number_of_parsed_file_entries:d}, skipped unchanged file '
+            f'entries: {number_of_skipped_file_entries:d}.\n'))
+
       if number_of_extraction_warnings:
         output_text = '\n'.join([
             '',
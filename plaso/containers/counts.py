@@ -32,6 +32,42 @@ class EventLabelCount(interface.AttributeContainer):
     self.number_of_events = number_of_events
 
 
+class IncrementalExtractionCount(interface.AttributeContainer):
+  """Incremental extraction count attribute container.
+
+  Attributes:
+    number_of_parsed_file_entries (int): number of file entries that were new
+        or changed since a previous session and were parsed.
+    number_of_skipped_file_entries (int): number of file entries that were
+        unchanged since a previous session and were skipped.
+    session_identifier (str): identifier of the session.
+  """
+
+  CONTAINER_TYPE = 'incremental_extraction_count'
+
+  SCHEMA = {
+      'number_of_parsed_file_entries': 'int',
+      'number_of_skipped_file_entries': 'int',
+      'session_identifier': 'str'}
+
+  def __init__(
+      self, number_of_parsed_file_entries=None,
+      number_of_skipped_file_entries=None, session_identifier=None):
+    """Initializes an incremental extraction count attribute container.
+
+    Args:
+      number_of_parsed_file_entries (Optional[int]): number of file entries
+          that were new or changed since a previous session and were parsed.
+      number_of_skipped_file_entries (Optional[int]): number of file entries
+          that were unchanged since a previous session and were skipped.
+      session_identifier (Optional[str]): identifier of the session.
+    """
+    super(IncrementalExtractionCount, self).__init__()
+    self.number_of_parsed_file_entries = number_of_parsed_file_entries
+    self.number_of_skipped_file_entries = number_of_skipped_file_entries
+    self.session_identifier = session_identifier
+
+
 class ParserCount(interface.AttributeContainer):
   """Parser count attribute container.
 
@@ -61,4 +97,4 @@ class ParserCount(interface.AttributeContainer):
 
 
 manager.AttributeContainersManager.RegisterAttributeContainers([
-    EventLabelCount, ParserCount])
+    EventLabelCount, IncrementalExtractionCount, ParserCount])
@@ -50,6 +50,44 @@ class EventSource(interface.AttributeContainer):
     return self.path_spec.comparable < other.path_spec.comparable
 
 
+class FileEntryFingerprint(interface.AttributeContainer):
+  """File entry fingerprint attribute container.
+
+  The file entry fingerprint is used to determine if a file entry was changed
+  since a previous extraction session.
+
+  Attributes:
+    inode (int): inode number of the file entry.
+    modification_time (str): modification date and time of the file entry,
+        formatted as an ISO 8601 date and time string.
+    path_spec (dfvfs.PathSpec): path specification.
+    sha256_hash (str): SHA-256 hash of the content of the default data stream
+        of the file entry.
+    size (int): size of the default data stream of the file entry.
+  """
+  CONTAINER_TYPE = 'file_entry_fingerprint'
+
+  SCHEMA = {
+      'inode': 'int',
+      'modification_time': 'str',
+      'path_spec': 'dfvfs.PathSpec',
+      'sha256_hash': 'str',
+      'size': 'int'}
+
+  def __init__(self, path_spec=None):
+    """Initializes a file entry fingerprint.
+
+    Args:
+      path_spec (Optional[dfvfs.PathSpec]): path specification.
+    """
+    super(FileEntryFingerprint, self).__init__()
+    self.inode = None
+    self.modification_time = None
+    self.path_spec = path_spec
+    self.sha256_hash = None
+    self.size = None
+
+
 class FileEntryEventSource(EventSource):
   """File entry event source.
 
@@ -59,4 +97,53 @@ class FileEntryEventSource(EventSource):
   DATA_TYPE = 'file_entry'
 
 
-manager.AttributeContainersManager.RegisterAttributeContainer(EventSource)
+class RecordRangeEventSource(EventSource):
+  """Record range event source.
+
+  The record range event source is an event source that represents a range of
+  records of a data stream, such as the event records of a Windows XML
+  EventLog (EVTX) file, that can be parsed independently of the other records
+  of the data stream.
+
+  Attributes:
+    data_type (str): attribute container type indicator.
+    file_entry_type (str): dfVFS file entry type.
+    first_record_index (int): index of the first record in the range.
+    number_of_records (int): number of records in the range.
+    parser_name (str): name of the parser that parses the records.
+    path_spec (dfvfs.PathSpec): path specification of the data stream.
+  """
+  CONTAINER_TYPE = 'record_range_event_source'
+  DATA_TYPE = 'record_range'
+
+  SCHEMA = {
+      'data_type': 'str',
+      'file_entry_type': 'str',
+      'first_record_index': 'int',
+      'number_of_records': 'int',
+      'parser_name': 'str',
+      'path_spec': 'dfvfs.PathSpec'}
+
+  def __init__(
+      self, file_entry_type=None, first_record_index=None,
+      number_of_records=None, parser_name=None, path_spec=None):
+    """Initializes a record range event source.
+
+    Args:
+      file_entry_type (Optional[str]): dfVFS file entry type.
+      first_record_index (Optional[int]): index of the first record in
+          the range.
+      number_of_records (Optional[int]): number of records in the range.
+      parser_name (Optional[str]): name of the parser that parses the records.
+      path_spec (Optional[dfvfs.PathSpec]): path specification of the data
+          stream.
+    """
+    super(RecordRangeEventSource, self).__init__(
+        file_entry_type=file_entry_type, path_spec=path_spec)
+    self.first_record_index = first_record_index
+    self.number_of_records = number_of_records
+    self.parser_name = parser_name
+
+
+manager.AttributeContainersManager.RegisterAttributeContainers([
+    EventSource, FileEntryFingerprint, RecordRangeEventSource])
@@ -10,26 +10,35 @@ from acstore.containers import manager
 from dfdatetime import interface as dfdatetime_interface
 
 
-def CalculateEventValuesHash(event_data, event_data_stream):
+def CalculateEventValuesHash(
+    event_data, event_data_stream, event_data_stream_values_string=None):
   """Calculates a digest hash of the event values.
 
+  The digest hash is a 64-bit BLAKE2b digest of the event data values, other
+  than date and time values, and the event data stream values.
+
   Args:
     event_data (EventData): event data.
     event_data_stream (EventDataStream): an event data stream or None if not
         available.
+    event_data_stream_values_string (Optional[str]): comparable string of
+        the event data stream values, as returned by
+        GetEventDataStreamValuesString, where None represents the string
+        is determined from the event data stream.
 
   Returns:
-    str: digest hash of the event values content.
+    int: digest hash of the event values content.
 
   Raises:
     RuntimeError: if the event values hash cannot be determined.
   """
-  attributes = ['data_type: {0:s}'.format(event_data.data_type)]
+  attributes = [f'data_type: {event_data.data_type:s}']
 
-  for attribute_name, attribute_value in sorted(event_data.GetAttributes()):
-    if attribute_value is None or attribute_name in (
-        '_event_data_stream_identifier', '_event_values_hash', '_parser_chain',
-        'data_type'):
+  # Not using GetAttributes to improve performance. Note that the protected
+  # attributes of event data are not part of the event values.
+  for attribute_name, attribute_value in sorted(event_data.__dict__.items()):
+    if (attribute_value is None or attribute_name[0] == '_' or
+        attribute_name == 'data_type'):
       continue
 
     # Ignore date and time values.
@@ -46,40 +55,56 @@ def CalculateEventValuesHash(event_data, event_data_stream):
           'Unsupported attribute: {0:s} value type: {1!s}'.format(
               attribute_name, type(attribute_value)))
 
-    try:
-      attribute_string = '{0:s}: {1!s}'.format(
-          attribute_name, attribute_value)
-      attributes.append(attribute_string)
-    except UnicodeDecodeError:
-      raise RuntimeError(
-          'Failed to decode attribute {0:s}'.format(attribute_name))
-
-  if event_data_stream:
-    for attribute_name, attribute_value in sorted(
-        event_data_stream.GetAttributes()):
-
-      if attribute_name == 'path_spec':
-        attribute_value = attribute_value.comparable
+    attributes.append(f'{attribute_name:s}: {attribute_value!s}')
 
-      elif not isinstance(attribute_value, (bool, float, int, list, str)):
-        raise RuntimeError(
-            'Unsupported attribute: {0:s} value type: {1!s}'.format(
-                attribute_name, type(attribute_value)))
+  if event_data_stream_values_string is None and event_data_stream:
+    event_data_stream_values_string = GetEventDataStreamValuesString(
+        event_data_stream)
 
-      try:
-        attribute_string = '{0:s}: {1!s}'.format(
-            attribute_name, attribute_value)
-        attributes.append(attribute_string)
-      except UnicodeDecodeError:
-        raise RuntimeError(
-            'Failed to decode attribute {0:s}'.format(attribute_name))
+  if event_data_stream_values_string:
+    attributes.append(event_data_stream_values_string)
 
   content = ', '.join(attributes)
   content_data = content.encode('utf-8')
 
-  md5_context = hashlib.md5(content_data)
+  blake2b_context = hashlib.blake2b(content_data, digest_size=8)
+
+  return int.from_bytes(blake2b_context.digest(), 'big')
+
+
+def GetEventDataStreamValuesString(event_data_stream):
+  """Retrieves a comparable string of the event data stream values.
+
+  Since an event data stream is typically shared by multiple event data,
+  the string can be determined once and passed to CalculateEventValuesHash.
+
+  Args:
+    event_data_stream (EventDataStream): an event data stream.
+
+  Returns:
+    str: comparable string of the event data stream values.
+
+  Raises:
+    RuntimeError: if the event data stream values string cannot be determined.
+  """
+  attributes = []
+
+  for attribute_name, attribute_value in sorted(
+      event_data_stream.__dict__.items()):
+    if attribute_value is None or attribute_name[0] == '_':
+      continue
+
+    if attribute_name == 'path_spec':
+      attribute_value = attribute_value.comparable
+
+    elif not isinstance(attribute_value, (bool, float, int, list, str)):
+      raise RuntimeError(
+          'Unsupported attribute: {0:s} value type: {1!s}'.format(
+              attribute_name, type(attribute_value)))
+
+    attributes.append(f'{attribute_name:s}: {attribute_value!s}')
 
-  return md5_context.hexdigest()
+  return ', '.join(attributes)
 
 
 class DateLessLogHelper(interface.AttributeContainer):
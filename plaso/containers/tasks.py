@@ -22,6 +22,9 @@ class Task(interface.AttributeContainer):
         number of micro seconds since January 1, 1970, 00:00:00 UTC.
     file_entry_type (str): dfVFS type of the file entry the path specification
         is referencing.
+    first_record_index (int): index of the first record of the record range
+        that is processed by the task, or None if the task does not process
+        a record range.
     has_retry (bool): True if the task was previously abandoned and a retry
         task was created, False otherwise.
     identifier (str): unique identifier of the task.
@@ -29,7 +32,14 @@ class Task(interface.AttributeContainer):
         processed as number of milliseconds since January 1, 1970, 00:00:00 UTC.
     merge_priority (int): priority used for the task storage file merge, where
         a lower value indicates a higher priority to merge.
+    number_of_records (int): number of records of the record range that is
+        processed by the task.
+    parser_name (str): name of the parser that parses the record range that
+        is processed by the task.
     path_spec (dfvfs.PathSpec): path specification.
+    path_specs (list[dfvfs.PathSpec]): path specifications of a batch of
+        event sources that are processed by the task, or None if the task
+        only processes the path specification in path_spec.
     session_identifier (str): the identifier of the session the task is part of.
     start_time (int): time that the task was started. Contains the number
         of micro seconds since January 1, 1970, 00:00:00 UTC.
@@ -43,11 +53,15 @@ class Task(interface.AttributeContainer):
       'aborted': 'bool',
       'completion_time': 'int',
       'file_entry_type': 'str',
+      'first_record_index': 'int',
       'has_retry': 'bool',
       'identifier': 'str',
       'last_processing_time': 'int',
       'merge_priority': 'int',
+      'number_of_records': 'int',
+      'parser_name': 'str',
       'path_spec': 'dfvfs.PathSpec',
+      'path_specs': 'List[dfvfs.PathSpec]',
       'session_identifier': 'str',
       'start_time': 'int',
       'storage_file_size': 'int',
@@ -64,11 +78,15 @@ class Task(interface.AttributeContainer):
     self.aborted = False
     self.completion_time = None
     self.file_entry_type = None
+    self.first_record_index = None
     self.has_retry = False
     self.identifier = '{0:s}'.format(uuid.uuid4().hex)
     self.last_processing_time = None
     self.merge_priority = None
+    self.number_of_records = None
+    self.parser_name = None
     self.path_spec = None
+    self.path_specs = None
     self.session_identifier = session_identifier
     self.start_time = int(time.time() * definitions.MICROSECONDS_PER_SECOND)
     self.storage_file_size = None
@@ -97,8 +115,12 @@ class Task(interface.AttributeContainer):
     """
     retry_task = Task(session_identifier=self.session_identifier)
     retry_task.file_entry_type = self.file_entry_type
+    retry_task.first_record_index = self.first_record_index
     retry_task.merge_priority = self.merge_priority
+    retry_task.number_of_records = self.number_of_records
+    retry_task.parser_name = self.parser_name
     retry_task.path_spec = self.path_spec
+    retry_task.path_specs = self.path_specs
     retry_task.storage_file_size = self.storage_file_size
     retry_task.storage_format = self.storage_format
 
@@ -28,6 +28,8 @@ PYTHON_DEPENDENCIES = {
     'dtfabric': ('__version__', '20230518', None, True),
     'flor': ('__version__', '1.1.3', None, False),
     'lz4': ('__version__', '0.10.0', None, True),
+    'msgpack': ('__version__', '1.0.0', None, False),
+    'numpy': ('__version__', '1.17.0', None, False),
     'opensearchpy': ('__versionstr__', '', None, False),
     'pefile': ('__version__', '2023.2.7', None, True),
     'psutil': ('__version__', '5.4.3', None, True),
@@ -78,6 +80,7 @@ PYTHON_DEPENDENCIES = {
     'yaml': ('__version__', '3.10', None, True),
     'yara': ('YARA_VERSION', '3.4.0', None, True),
     'zmq': ('__version__', '2.1.11', None, True),
+    'zstandard': ('__version__', '0.15.0', None, False),
     'zstd': ('version()', '1.3.0.2', None, True)}
 
 _VERSION_SPLIT_REGEX = re.compile(r'\.|\-')
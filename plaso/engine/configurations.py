@@ -62,9 +62,26 @@ class ExtractionConfiguration(interface.AttributeContainer):
         should process, where 0 or None represents unlimited.
     hasher_names_string (str): comma separated names of hashers to use during
         processing.
+    number_of_analyzer_threads (int): number of threads per worker that run
+        the analyzers, such as the hashers and Yara, concurrently with
+        parsing, where 0 represents the analyzers run before parsing.
+    parse_cache_path (str): path of the parse cache database file, where None
+        represents the parse cache is disabled.
     process_compressed_streams (bool): True if file content in compressed
         streams should be processed.
+    record_range_data_size (int): approximate size of the data, in bytes, of
+        the record ranges into which large data streams are split, so that
+        these are parsed by multiple worker processes, where 0 represents
+        data streams are not split.
+    spool_data_streams (bool): True if the content of a data stream should be
+        read once into a spool that is shared by the analyzers, the format
+        scanners and the parsers.
     yara_rules_string (str): Yara rule definitions.
+    yara_window_overlap (int): number of bytes of the previous window that
+        precede a window in which Yara rules are matched, where None
+        represents the default.
+    yara_window_size (int): size of the windows in which Yara rules are
+        matched, where None represents the default.
   """
   CONTAINER_TYPE = 'extraction_configuration'
 
@@ -76,8 +93,14 @@ class ExtractionConfiguration(interface.AttributeContainer):
     self.extract_winreg_binary = False
     self.hasher_file_size_limit = None
     self.hasher_names_string = None
+    self.number_of_analyzer_threads = 0
+    self.parse_cache_path = None
     self.process_compressed_streams = True
+    self.record_range_data_size = 0
+    self.spool_data_streams = False
     self.yara_rules_string = None
+    self.yara_window_overlap = None
+    self.yara_window_size = None
 
 
 class ProfilingConfiguration(interface.AttributeContainer):
@@ -205,6 +228,10 @@ class ProcessingConfiguration(interface.AttributeContainer):
     filter_file (str): path to a file with find specifications.
     force_parser (bool): True if a specified parser should be forced to be used
         to extract events.
+    incremental_extraction (bool): True if file entries that are unchanged
+        since a previous session in the same storage should be skipped.
+    incremental_extraction_digest (bool): True if the fingerprints used by
+        incremental extraction should include a digest of the content.
     log_filename (str): name of the log file.
     parser_filter_expression (str): parser filter expression,
         where None represents all parsers and plugins.
@@ -215,6 +242,10 @@ class ProcessingConfiguration(interface.AttributeContainer):
     preferred_year (int): preferred initial year value for year-less date and
         time values.
     profiling (ProfilingConfiguration): profiling configuration.
+    task_compression_format (str): format to use for compressing attribute
+        containers in task results.
+    task_serialization_format (str): format to use for serializing attribute
+        containers in task results.
     task_storage_format (str): format to use for storing task results.
     task_storage_path (str): path of the directory containing SQLite task
         storage files.
@@ -238,6 +269,8 @@ class ProcessingConfiguration(interface.AttributeContainer):
     self.extraction = ExtractionConfiguration()
     self.filter_file = None
     self.force_parser = None
+    self.incremental_extraction = False
+    self.incremental_extraction_digest = False
     self.log_filename = None
     self.parser_filter_expression = None
     self.preferred_codepage = None
@@ -246,6 +279,8 @@ class ProcessingConfiguration(interface.AttributeContainer):
     self.preferred_time_zone = None
     self.preferred_year = None
     self.profiling = ProfilingConfiguration()
+    self.task_compression_format = None
+    self.task_serialization_format = None
     self.task_storage_format = None
     self.task_storage_path = None
     self.temporary_directory = None
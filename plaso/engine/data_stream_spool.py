@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+"""Data stream spool file-like object.
+
+The data stream spool reads the content of a data stream once and provides
+the same content to the analyzers, the format scanners and the parsers. This
+prevents the data stream from being read and decoded multiple times by
+dfVFS, which can be expensive for data streams in compressed or nested
+storage media images.
+"""
+
+import os
+import tempfile
+
+
+class DataStreamSpool(object):
+  """Seekable file-like object of a data stream that is read only once.
+
+  The content of the data stream is kept in memory when it does not exceed
+  the maximum in-memory size and is written to a temporary file otherwise.
+  """
+
+  _READ_BUFFER_SIZE = 1024 * 1024
+
+  def __init__(self, maximum_in_memory_size, temporary_directory=None):
+    """Initializes a data stream spool.
+
+    Args:
+      maximum_in_memory_size (int): maximum size of content that is kept in
+          memory, in bytes.
+      temporary_directory (Optional[str]): path of the directory for the
+          temporary file, where None represents the default temporary
+          directory.
+    """
+    super(DataStreamSpool, self).__init__()
+    self._maximum_in_memory_size = maximum_in_memory_size
+    self._size = 0
+    self._spooled_file = None
+    self._temporary_directory = temporary_directory
+
+  @property
+  def in_memory(self):
+    """bool: True if the content is kept in memory."""
+    return bool(
+        self._spooled_file and self._size <= self._maximum_in_memory_size)
+
+  def Open(self, file_object):
+    """Reads the content of a data stream into the spool.
+
+    Args:
+      file_object (dfvfs.FileIO): file-like object of the data stream.
+
+    Raises:
+      IOError: if the spool is already opened or the data stream cannot be
+          read.
+      OSError: if the spool is already opened or the data stream cannot be
+          read.
+    """
+    if self._spooled_file:
+      raise IOError('Spool already opened.')
+
+    # The spooled temporary file is kept in memory until its size exceeds
+    # the maximum size, after which it is written to a temporary file.
+    spooled_file = tempfile.SpooledTemporaryFile(
+        max_size=self._maximum_in_memory_size,
+        dir=self._temporary_directory)
+
+    size = 0
+    try:
+      file_object.seek(0, os.SEEK_SET)
+
+      data = file_object.read(self._READ_BUFFER_SIZE)
+      while data:
+        spooled_file.write(data)
+        size += len(data)
+        data = file_object.read(self._READ_BUFFER_SIZE)
+
+      spooled_file.seek(0, os.SEEK_SET)
+
+    except Exception:
+      # The spooled temporary file is closed on any error, such as a dfVFS
+      # back-end error, to remove the temporary file.
+      spooled_file.close()
+      raise
+
+    self._size = size
+    self._spooled_file = spooled_file
+
+  # Note: that the following functions do not follow the style guide
+  # because they are part of the file-like object interface.
+  # pylint: disable=invalid-name
+
+  def close(self):
+    """Closes the spool and releases the spooled content."""
+    if self._spooled_file:
+      self._spooled_file.close()
+      self._spooled_file = None
+
+    self._size = 0
+
+  def get_offset(self):
+    """Retrieves the current offset into the spool.
+
+    Returns:
+      int: current offset into the spool.
+
+    Raises:
+      IOError: if the spool is not opened.
+      OSError: if the spool is not opened.
+    """
+    if not self._spooled_file:
+      raise IOError('Spool not opened.')
+
+    return self._spooled_file.tell()
+
+  def get_size(self):
+    """Retrieves the size of the spooled data stream.
+
+    Returns:
+      int: size of the spooled data stream.
+
+    Raises:
+      IOError: if the spool is not opened.
+      OSError: if the spool is not opened.
+    """
+    if not self._spooled_file:
+      raise IOError('Spool not opened.')
+
+    return self._size
+
+  def read(self, size=None):
+    """Reads a byte string from the spool.
+
+    Args:
+      size (Optional[int]): number of bytes to read, where None is all
+          remaining data.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the spool is not opened or the read size is invalid.
+      OSError: if the spool is not opened or the read size is invalid.
+    """
+    if not self._spooled_file:
+      raise IOError('Spool not opened.')
+
+    if size is not None and size < 0:
+      raise IOError('Invalid size value smaller than zero.')
+
+    if size is None:
+      return self._spooled_file.read()
+
+    return self._spooled_file.read(size)
+
+  def readline(self, size=None):
+    """Reads a line from the spool.
+
+    Args:
+      size (Optional[int]): maximum number of bytes to read, where None
+          represents no maximum.
+
+    Returns:
+      bytes: line read, including the end-of-line character.
+
+    Raises:
+      IOError: if the spool is not opened.
+      OSError: if the spool is not opened.
+    """
+    if not self._spooled_file:
+      raise IOError('Spool not opened.')
+
+    if size is None:
+      size = -1
+
+    return self._spooled_file.readline(size)
+
+  def seek(self, offset, whence=os.SEEK_SET):
+    """Seeks to an offset within the spool.
+
+    Args:
+      offset (int): offset to seek to.
+      whence (Optional(int)): value that indicates whether offset is an
+          absolute or relative position within the spool.
+
+    Raises:
+      IOError: if the spool is not opened or the seek failed.
+      OSError: if the spool is not opened or the seek failed.
+    """
+    if not self._spooled_file:
+      raise IOError('Spool not opened.')
+
+    if whence == os.SEEK_CUR:
+      offset += self._spooled_file.tell()
+    elif whence == os.SEEK_END:
+      offset += self._size
+    elif whence != os.SEEK_SET:
+      raise IOError('Unsupported whence.')
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    self._spooled_file.seek(offset, os.SEEK_SET)
+
+  def tell(self):
+    """Retrieves the current offset into the spool.
+
+    Returns:
+      int: current offset into the spool.
+
+    Raises:
+      IOError: if the spool is not opened.
+      OSError: if the spool is not opened.
+    """
+    return self.get_offset()
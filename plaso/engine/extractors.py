@@ -256,7 +256,8 @@ class EventDataExtractor(object):
 
     return parse_results
 
-  def ParseDataStream(self, parser_mediator, file_entry, data_stream_name):
+  def ParseDataStream(
+      self, parser_mediator, file_entry, data_stream_name, file_object=None):
     """Parses a data stream of a file entry with the enabled parsers.
 
     Args:
@@ -264,11 +265,15 @@ class EventDataExtractor(object):
           and other components, such as storage and dfVFS.
       file_entry (dfvfs.FileEntry): file entry.
       data_stream_name (str): data stream name.
+      file_object (Optional[DataStreamSpool]): file-like object of the data
+          stream, where None represents the file-like object should be
+          retrieved from the file entry.
 
     Raises:
       RuntimeError: if the file-like object or the parser object is missing.
     """
-    file_object = file_entry.GetFileObject(data_stream_name=data_stream_name)
+    if not file_object:
+      file_object = file_entry.GetFileObject(data_stream_name=data_stream_name)
     if not file_object:
       raise RuntimeError(
           'Unable to retrieve file-like object from file entry.')
@@ -299,6 +304,38 @@ class EventDataExtractor(object):
           parser_mediator, self._usnjrnl_parser, file_entry,
           file_object=file_object)
 
+  def ParseDataStreamWithParser(
+      self, parser_mediator, file_entry, data_stream_name, parser_name,
+      file_object=None):
+    """Parses a data stream of a file entry with a specific parser.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfVFS.
+      file_entry (dfvfs.FileEntry): file entry.
+      data_stream_name (str): data stream name.
+      parser_name (str): name of the parser.
+      file_object (Optional[DataStreamSpool]): file-like object of the data
+          stream, where None represents the file-like object should be
+          retrieved from the file entry.
+
+    Raises:
+      RuntimeError: if the file-like object or the parser object is missing.
+    """
+    parser = self._parsers.get(parser_name, None)
+    if not parser:
+      raise RuntimeError(
+          'Parser object missing for parser: {0:s}'.format(parser_name))
+
+    if not file_object:
+      file_object = file_entry.GetFileObject(data_stream_name=data_stream_name)
+    if not file_object:
+      raise RuntimeError(
+          'Unable to retrieve file-like object from file entry.')
+
+    self._ParseFileEntryWithParser(
+        parser_mediator, parser, file_entry, file_object=file_object)
+
   def ParseFileEntryMetadata(self, parser_mediator, file_entry):
     """Parses the file entry metadata such as file system data.
 
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""File entry fingerprints for incremental extraction.
+
+Incremental extraction records a fingerprint of every file entry that was
+parsed successfully, consisting of the size, the modification time, the inode
+number and optionally a digest of the content. When the same storage file is
+used by a subsequent extraction session, file entries of which the
+fingerprint is unchanged are skipped.
+
+The digest of a new or changed file entry is taken from the SHA-256 hash of
+its event data stream, which the extraction worker already calculates. Only
+file entries of which the size, modification time and inode number are
+unchanged are read to calculate a digest.
+
+Note that the event data of a previous session is not removed when a changed
+file entry is parsed again, hence for example the records of a log file that
+was appended to are stored once per session.
+"""
+
+import hashlib
+
+from dfvfs.lib import definitions as dfvfs_definitions
+
+from plaso.containers import event_sources
+
+
+class FileEntryFingerprinter(object):
+  """Determines if file entries changed since a previous extraction session.
+
+  Attributes:
+    number_of_parsed_file_entries (int): number of file entries that were new
+        or changed since a previous session and were parsed successfully.
+    number_of_skipped_file_entries (int): number of file entries that were
+        unchanged since a previous session.
+  """
+
+  _CONTAINER_TYPE_FILE_ENTRY_FINGERPRINT = (
+      event_sources.FileEntryFingerprint.CONTAINER_TYPE)
+
+  _READ_BUFFER_SIZE = 16 * 1024 * 1024
+
+  def __init__(self, calculate_digest=False):
+    """Initializes a file entry fingerprinter.
+
+    Args:
+      calculate_digest (Optional[bool]): True if the fingerprint should
+          include a SHA-256 digest of the content of the file entry.
+    """
+    super(FileEntryFingerprinter, self).__init__()
+    self._calculate_digest = calculate_digest
+    self._fingerprints = {}
+    self._number_of_pending_parts = {}
+    self._pending_fingerprints = {}
+
+    self.number_of_parsed_file_entries = 0
+    self.number_of_skipped_file_entries = 0
+
+  def _CalculateDigest(self, file_entry):
+    """Calculates the SHA-256 digest of the default data stream.
+
+    Args:
+      file_entry (dfvfs.FileEntry): file entry.
+
+    Returns:
+      str: hexadecimal SHA-256 digest or None if the file entry has no default
+          data stream.
+    """
+    file_object = file_entry.GetFileObject()
+    if not file_object:
+      return None
+
+    hash_context = hashlib.sha256()
+
+    data = file_object.read(self._READ_BUFFER_SIZE)
+    while data:
+      hash_context.update(data)
+      data = file_object.read(self._READ_BUFFER_SIZE)
+
+    return hash_context.hexdigest()
+
+  def _GetFingerprint(self, file_entry):
+    """Retrieves the fingerprint of a file entry.
+
+    Args:
+      file_entry (dfvfs.FileEntry): file entry.
+
+    Returns:
+      FileEntryFingerprint: file entry fingerprint.
+    """
+    fingerprint = event_sources.FileEntryFingerprint(
+        path_spec=file_entry.path_spec)
+    fingerprint.size = file_entry.size
+
+    stat_attribute = file_entry.GetStatAttribute()
+    if stat_attribute:
+      fingerprint.inode = stat_attribute.inode_number
+
+    if file_entry.modification_time:
+      fingerprint.modification_time = (
+          file_entry.modification_time.CopyToDateTimeStringISO8601())
+
+    return fingerprint
+
+  def AddPendingRecordRange(self, path_spec):
+    """Adds a record range that needs to be parsed before recording.
+
+    The fingerprint of a file entry that is split into record ranges is only
+    recorded after all its record ranges were parsed successfully.
+
+    Args:
+      path_spec (dfvfs.PathSpec): path specification of the file entry.
+    """
+    lookup_key = path_spec.comparable
+    if lookup_key in self._pending_fingerprints:
+      self._number_of_pending_parts[lookup_key] += 1
+
+  def CheckFileEntry(self, file_entry):
+    """Determines if a file entry is unchanged since a previous session.
+
+    The fingerprint of a file entry that is new or changed is kept pending
+    until RecordFingerprint is called after the file entry was parsed
+    successfully.
+
+    Args:
+      file_entry (dfvfs.FileEntry): file entry.
+
+    Returns:
+      bool: True if the file entry is unchanged and can be skipped.
+    """
+    # Directories are always processed since a change of the files they
+    # contain does not necessarily change the directory.
+    if file_entry.entry_type != dfvfs_definitions.FILE_ENTRY_TYPE_FILE:
+      return False
+
+    fingerprint = self._GetFingerprint(file_entry)
+    lookup_key = fingerprint.path_spec.comparable
+
+    previous_fingerprint = self._fingerprints.get(lookup_key, None)
+    if previous_fingerprint and (
+        fingerprint.inode == previous_fingerprint.inode and
+        fingerprint.modification_time == (
+            previous_fingerprint.modification_time) and
+        fingerprint.size == previous_fingerprint.size):
+      # The digest is only calculated when the other values are unchanged and
+      # only compared when the previous fingerprint has one, so that
+      # fingerprints of sessions without digests remain usable.
+      if self._calculate_digest and previous_fingerprint.sha256_hash:
+        fingerprint.sha256_hash = self._CalculateDigest(file_entry)
+
+      if (fingerprint.sha256_hash is None or
+          fingerprint.sha256_hash == previous_fingerprint.sha256_hash):
+        self.number_of_skipped_file_entries += 1
+        return True
+
+    self._number_of_pending_parts[lookup_key] = 1
+    self._pending_fingerprints[lookup_key] = fingerprint
+
+    return False
+
+  def DiscardFingerprint(self, path_spec):
+    """Discards the pending fingerprint of a file entry that failed to parse.
+
+    Args:
+      path_spec (dfvfs.PathSpec): path specification of the file entry.
+    """
+    lookup_key = path_spec.comparable
+    self._number_of_pending_parts.pop(lookup_key, None)
+    self._pending_fingerprints.pop(lookup_key, None)
+
+  def ReadFingerprints(self, storage_writer):
+    """Reads the fingerprints of previous sessions from the storage.
+
+    Args:
+      storage_writer (StorageWriter): storage writer for a session storage.
+    """
+    for fingerprint in storage_writer.GetAttributeContainers(
+        self._CONTAINER_TYPE_FILE_ENTRY_FINGERPRINT):
+      # Fingerprints of later sessions supersede those of earlier sessions.
+      self._fingerprints[fingerprint.path_spec.comparable] = fingerprint
+
+  def RecordFingerprint(self, storage_writer, path_spec):
+    """Records the fingerprint of a file entry that was parsed successfully.
+
+    The fingerprint is written to the storage, so that the file entry can be
+    skipped by a subsequent session. The fingerprint of a file entry that was
+    split into record ranges is written once all its parts were parsed.
+
+    Args:
+      storage_writer (StorageWriter): storage writer for a session storage.
+      path_spec (dfvfs.PathSpec): path specification of the file entry.
+    """
+    lookup_key = path_spec.comparable
+    if lookup_key not in self._pending_fingerprints:
+      return
+
+    self._number_of_pending_parts[lookup_key] -= 1
+    if self._number_of_pending_parts[lookup_key] > 0:
+      return
+
+    del self._number_of_pending_parts[lookup_key]
+    fingerprint = self._pending_fingerprints.pop(lookup_key)
+
+    storage_writer.AddAttributeContainer(fingerprint)
+
+    self._fingerprints[lookup_key] = fingerprint
+    self.number_of_parsed_file_entries += 1
+
+  def SetDigest(self, event_data_stream):
+    """Sets the digest of a pending fingerprint from an event data stream.
+
+    Args:
+      event_data_stream (EventDataStream): event data stream of the file
+          entry, of which the SHA-256 hash was calculated by the extraction
+          worker.
+    """
+    if not self._calculate_digest or not event_data_stream.sha256_hash:
+      return
+
+    lookup_key = getattr(event_data_stream.path_spec, 'comparable', None)
+    fingerprint = self._pending_fingerprints.get(lookup_key, None)
+    if fingerprint and not fingerprint.sha256_hash:
+      fingerprint.sha256_hash = event_data_stream.sha256_hash
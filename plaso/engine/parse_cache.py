@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""Content-addressed cache of parse results.
+
+The parse cache stores the event data that was extracted from a data stream
+keyed by a digest of the content of the data stream and the extraction
+context. It is stored in a SQLite database file so that it can be shared
+between worker processes and between extraction runs.
+"""
+
+import json
+import sqlite3
+import zlib
+
+from plaso.serializer import json_serializer
+
+
+class ParseCache(object):
+  """Content-addressed cache of parse results."""
+
+  _CREATE_TABLE_QUERY = (
+      'CREATE TABLE IF NOT EXISTS parse_result ('
+      'lookup_key TEXT PRIMARY KEY, parse_time REAL, '
+      'number_of_event_data INTEGER, event_data BLOB)')
+
+  _INSERT_QUERY = (
+      'INSERT OR IGNORE INTO parse_result (lookup_key, parse_time, '
+      'number_of_event_data, event_data) VALUES (?, ?, ?, ?)')
+
+  _SELECT_QUERY = (
+      'SELECT parse_time, event_data FROM parse_result WHERE lookup_key = ?')
+
+  # Number of seconds to wait for a lock held by another process.
+  _LOCK_TIMEOUT = 60.0
+
+  _SERIALIZER = json_serializer.JSONAttributeContainerSerializer
+
+  def __init__(self):
+    """Initializes a parse cache."""
+    super(ParseCache, self).__init__()
+    self._connection = None
+    self._path = None
+
+  def Close(self):
+    """Closes the parse cache.
+
+    Raises:
+      IOError: if the parse cache is not opened.
+      OSError: if the parse cache is not opened.
+    """
+    if not self._connection:
+      raise IOError('Parse cache not opened.')
+
+    self._connection.close()
+    self._connection = None
+    self._path = None
+
+  def GetParseResult(self, lookup_key):
+    """Retrieves a parse result.
+
+    Args:
+      lookup_key (str): lookup key of the parse result.
+
+    Returns:
+      tuple[list[EventData], float]: event data and the number of seconds it
+          originally took to parse the data stream, or (None, None) if not
+          available.
+
+    Raises:
+      IOError: if the parse cache is not opened or cannot be read.
+      OSError: if the parse cache is not opened or cannot be read.
+    """
+    if not self._connection:
+      raise IOError('Parse cache not opened.')
+
+    try:
+      cursor = self._connection.execute(self._SELECT_QUERY, (lookup_key, ))
+      row = cursor.fetchone()
+    except sqlite3.Error as exception:
+      raise IOError(
+          f'Unable to read from parse cache with error: {exception!s}')
+
+    if not row:
+      return None, None
+
+    parse_time, compressed_data = row
+
+    try:
+      json_list = json.loads(zlib.decompress(compressed_data))
+    except (ValueError, zlib.error) as exception:
+      raise IOError(
+          f'Unable to decode parse result with error: {exception!s}')
+
+    event_data = [
+        self._SERIALIZER.ReadSerializedDict(json_dict)
+        for json_dict in json_list]
+
+    return event_data, parse_time
+
+  def Open(self, path):
+    """Opens the parse cache.
+
+    The parse cache is created if it does not exist.
+
+    Args:
+      path (str): path of the parse cache database file.
+
+    Raises:
+      IOError: if the parse cache is already opened or cannot be opened.
+      OSError: if the parse cache is already opened or cannot be opened.
+    """
+    if self._connection:
+      raise IOError('Parse cache already opened.')
+
+    try:
+      connection = sqlite3.connect(
+          path, isolation_level=None, timeout=self._LOCK_TIMEOUT)
+
+      # Write-ahead logging allows readers in other processes to continue
+      # while a worker adds a parse result.
+      connection.execute('PRAGMA journal_mode=WAL')
+      connection.execute('PRAGMA synchronous=NORMAL')
+      connection.execute(self._CREATE_TABLE_QUERY)
+
+    except sqlite3.Error as exception:
+      raise IOError(
+          f'Unable to open parse cache: {path:s} with error: {exception!s}')
+
+    self._connection = connection
+    self._path = path
+
+  def WriteParseResult(self, lookup_key, event_data, parse_time):
+    """Writes a parse result.
+
+    A parse result that is already stored, for example by another worker
+    process, is not overwritten.
+
+    Args:
+      lookup_key (str): lookup key of the parse result.
+      event_data (list[EventData]): event data extracted from the data stream.
+      parse_time (float): number of seconds it took to parse the data stream.
+
+    Raises:
+      IOError: if the parse cache is not opened or cannot be written.
+      OSError: if the parse cache is not opened or cannot be written.
+    """
+    if not self._connection:
+      raise IOError('Parse cache not opened.')
+
+    json_list = []
+    for event_data_item in event_data:
+      json_dict = self._SERIALIZER.WriteSerializedDict(event_data_item)
+
+      # The event data stream is specific to the data stream that was parsed
+      # and is set by the parser mediator when the parse result is reused.
+      json_dict.pop('_event_data_stream_identifier', None)
+
+      json_list.append(json_dict)
+
+    try:
+      json_string = json.dumps(json_list)
+    except (TypeError, ValueError) as exception:
+      raise IOError(
+          f'Unable to serialize parse result with error: {exception!s}')
+
+    compressed_data = zlib.compress(json_string.encode('utf-8'))
+
+    try:
+      self._connection.execute(self._INSERT_QUERY, (
+          lookup_key, parse_time, len(event_data), compressed_data))
+    except sqlite3.Error as exception:
+      raise IOError(
+          f'Unable to write to parse cache with error: {exception!s}')
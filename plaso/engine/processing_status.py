@@ -257,6 +257,10 @@ class ProcessingStatus(object):
         caused critical errors during processing.
     events_status (EventsStatus): status information about events.
     foreman_status (ProcessingStatus): foreman processing status.
+    incremental_extraction_status (IncrementalExtractionStatus): status
+        information about incremental extraction.
+    parse_cache_status (ParseCacheStatus): status information about the parse
+        cache.
     start_time (float): time that the processing was started. Contains the
         number of micro seconds since January 1, 1970, 00:00:00 UTC.
     tasks_status (TasksStatus): status information about tasks.
@@ -271,6 +275,8 @@ class ProcessingStatus(object):
     self.error_path_specs = []
     self.events_status = None
     self.foreman_status = None
+    self.incremental_extraction_status = None
+    self.parse_cache_status = None
     self.start_time = time.time()
     self.tasks_status = None
 
@@ -401,6 +407,24 @@ class ProcessingStatus(object):
     """
     self.events_status = events_status
 
+  def UpdateIncrementalExtractionStatus(self, incremental_extraction_status):
+    """Updates the incremental extraction status.
+
+    Args:
+      incremental_extraction_status (IncrementalExtractionStatus): status
+          information about incremental extraction.
+    """
+    self.incremental_extraction_status = incremental_extraction_status
+
+  def UpdateParseCacheStatus(self, parse_cache_status):
+    """Updates the parse cache status.
+
+    Args:
+      parse_cache_status (ParseCacheStatus): status information about the parse
+          cache.
+    """
+    self.parse_cache_status = parse_cache_status
+
   def UpdateTasksStatus(self, tasks_status):
     """Updates the tasks status.
 
@@ -470,6 +494,10 @@ class EventsStatus(object):
     number_of_events_from_time_slice (int): number of events from time slice.
     number_of_filtered_events (int): number of events excluded by the event
         filter.
+    number_of_formatting_cache_hits (int): number of times formatted event
+        values were retrieved from the output formatting cache.
+    number_of_formatting_cache_misses (int): number of times formatted event
+        values were not available in the output formatting cache.
     number_of_macb_grouped_events (int): number of events grouped based on MACB.
     total_number_of_events (int): total number of events in the storage file.
   """
@@ -480,18 +508,61 @@ class EventsStatus(object):
     self.number_of_duplicate_events = 0
     self.number_of_events_from_time_slice = 0
     self.number_of_filtered_events = 0
+    self.number_of_formatting_cache_hits = 0
+    self.number_of_formatting_cache_misses = 0
     self.number_of_macb_grouped_events = 0
     self.total_number_of_events = 0
 
 
+class IncrementalExtractionStatus(object):
+  """The status of incremental extraction.
+
+  Attributes:
+    number_of_parsed_file_entries (int): number of file entries that were new
+        or changed since a previous session and were parsed.
+    number_of_skipped_file_entries (int): number of file entries that were
+        unchanged since a previous session and were skipped.
+  """
+
+  def __init__(self):
+    """Initializes an incremental extraction status."""
+    super(IncrementalExtractionStatus, self).__init__()
+    self.number_of_parsed_file_entries = 0
+    self.number_of_skipped_file_entries = 0
+
+
+class ParseCacheStatus(object):
+  """The status of the parse cache.
+
+  Attributes:
+    number_of_hits (int): number of data streams of which the event data was
+        retrieved from the parse cache.
+    number_of_misses (int): number of data streams that were parsed and of
+        which the event data was written to the parse cache.
+    time_saved (float): number of seconds of parsing that were saved by
+        the parse cache.
+  """
+
+  def __init__(self):
+    """Initializes a parse cache status."""
+    super(ParseCacheStatus, self).__init__()
+    self.number_of_hits = 0
+    self.number_of_misses = 0
+    self.time_saved = 0.0
+
+
 class TasksStatus(object):
   """The status of the tasks.
 
   Attributes:
     number_of_abandoned_tasks (int): number of abandoned tasks.
+    number_of_queued_event_sources (int): number of event sources that are
+        waiting for a task to be created.
     number_of_queued_tasks (int): number of active tasks.
     number_of_tasks_pending_merge (int): number of tasks pending merge.
     number_of_tasks_processing (int): number of tasks processing.
+    queued_event_sources_data_size (int): estimated size of the data of
+        the event sources that are waiting for a task to be created, in bytes.
     total_number_of_tasks (int): total number of tasks.
   """
 
@@ -499,7 +570,9 @@ class TasksStatus(object):
     """Initializes a tasks status."""
     super(TasksStatus, self).__init__()
     self.number_of_abandoned_tasks = 0
+    self.number_of_queued_event_sources = 0
     self.number_of_queued_tasks = 0
     self.number_of_tasks_pending_merge = 0
     self.number_of_tasks_processing = 0
+    self.queued_event_sources_data_size = 0
     self.total_number_of_tasks = 0
@@ -4,6 +4,7 @@
 import codecs
 import gzip
 import os
+import threading
 import time
 
 
@@ -148,10 +149,43 @@ class MemoryProfiler(SampleFileProfiler):
 
 
 class AnalyzersProfiler(CPUTimeProfiler):
-  """The analyzers profiler."""
+  """The analyzers profiler.
+
+  Analyzers can run on multiple threads concurrently, hence timing is
+  serialized by a lock.
+  """
 
   _FILENAME_PREFIX = 'analyzers'
 
+  def __init__(self, identifier, configuration):
+    """Initializes an analyzers profiler.
+
+    Args:
+      identifier (str): identifier of the profiling session used to create
+          the sample filename.
+      configuration (ProfilingConfiguration): profiling configuration.
+    """
+    super(AnalyzersProfiler, self).__init__(identifier, configuration)
+    self._lock = threading.Lock()
+
+  def StartTiming(self, profile_name):
+    """Starts timing CPU time.
+
+    Args:
+      profile_name (str): name of the profile to sample.
+    """
+    with self._lock:
+      super(AnalyzersProfiler, self).StartTiming(profile_name)
+
+  def StopTiming(self, profile_name):
+    """Stops timing CPU time.
+
+    Args:
+      profile_name (str): name of the profile to sample.
+    """
+    with self._lock:
+      super(AnalyzersProfiler, self).StopTiming(profile_name)
+
 
 class ProcessingProfiler(CPUTimeProfiler):
   """The processing profiler."""
@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 """The event extraction worker."""
 
+import concurrent.futures
 import copy
+import hashlib
 import os
 import re
 import time
@@ -15,14 +17,19 @@ from dfvfs.lib import errors as dfvfs_errors
 from dfvfs.path import factory as path_spec_factory
 from dfvfs.resolver import resolver as path_spec_resolver
 
+import plaso
+
 from plaso.analyzers import hashing_analyzer
 from plaso.analyzers import manager as analyzers_manager
 from plaso.containers import event_sources
 from plaso.containers import events
+from plaso.engine import data_stream_spool
 from plaso.engine import extractors
 from plaso.engine import logger
+from plaso.engine import parse_cache
 from plaso.lib import definitions
 from plaso.lib import errors
+from plaso.parsers import manager as parsers_manager
 
 
 class EventExtractionWorkerVolumeScanner(dfvfs_volume_scanner.VolumeScanner):
@@ -69,6 +76,12 @@ class EventExtractionWorker(object):
   Attributes:
     last_activity_timestamp (int): timestamp received that indicates the last
         time activity was observed.
+    number_of_parse_cache_hits (int): number of data streams of which the
+        event data was retrieved from the parse cache.
+    number_of_parse_cache_misses (int): number of data streams that were
+        parsed and of which the event data was written to the parse cache.
+    parse_cache_time_saved (float): number of seconds of parsing that were
+        saved by the parse cache.
     processing_status (str): human readable status indication such as:
         'Extracting', 'Hashing'.
   """
@@ -129,6 +142,23 @@ class EventExtractionWorker(object):
   _TYPES_WITH_ROOT_METADATA = frozenset([
       dfvfs_definitions.TYPE_INDICATOR_GZIP])
 
+  # Maximum size of a data stream that is analyzed on the analyzer threads,
+  # larger data streams are analyzed on the worker thread.
+  _ANALYZER_THREADS_MAXIMUM_DATA_SIZE = 64 * 1024 * 1024
+
+  # Maximum size of a data stream that is read into a data stream spool.
+  _DATA_STREAM_SPOOL_MAXIMUM_SIZE = 1024 * 1024 * 1024
+
+  # Maximum size of a data stream spool that is kept in memory, larger data
+  # streams are spooled to a temporary file.
+  _DATA_STREAM_SPOOL_MAXIMUM_IN_MEMORY_SIZE = 32 * 1024 * 1024
+
+  # Maximum size of a data stream that is looked up in the parse cache, since
+  # the data stream needs to be read to calculate its digest.
+  _PARSE_CACHE_MAXIMUM_DATA_SIZE = 128 * 1024 * 1024
+
+  _PARSE_CACHE_READ_BUFFER_SIZE = 1024 * 1024
+
   def __init__(self, force_parser=False, parser_filter_expression=None):
     """Initializes an event extraction worker.
 
@@ -147,6 +177,7 @@ class EventExtractionWorker(object):
     """
     super(EventExtractionWorker, self).__init__()
     self._abort = False
+    self._analyzer_thread_pool = None
     self._analyzers = []
     self._analyzers_profiler = None
     self._achive_type_scanner = self._CreateArchiveTypeScanner([])
@@ -156,15 +187,23 @@ class EventExtractionWorker(object):
         parser_filter_expression=parser_filter_expression)
     self._force_parser = force_parser
     self._hasher_file_size_limit = None
+    self._parse_cache = None
+    self._parse_cache_parser_names = set()
+    self._parser_filter_expression = parser_filter_expression
     self._path_spec_extractor = extractors.PathSpecExtractor()
     self._process_compressed_streams = None
     self._processing_profiler = None
+    self._spool_data_streams = False
 
     self.last_activity_timestamp = 0.0
+    self.number_of_parse_cache_hits = 0
+    self.number_of_parse_cache_misses = 0
+    self.parse_cache_time_saved = 0.0
     self.processing_status = definitions.STATUS_INDICATOR_IDLE
 
   def _AnalyzeDataStream(
-      self, file_entry, data_stream_name, display_name, event_data_stream):
+      self, file_entry, data_stream_name, display_name, event_data_stream,
+      file_object=None):
     """Analyzes the contents of a specific data stream of a file entry.
 
     The results of the analyzers are set in the event data stream as
@@ -179,6 +218,14 @@ class EventExtractionWorker(object):
           currently being analyzed.
       event_data_stream (EventDataStream): event data stream attribute
            container.
+      file_object (Optional[DataStreamSpool]): file-like object of the data
+          stream, where None represents the file-like object should be
+          retrieved from the file entry.
+
+    Returns:
+      list[concurrent.futures.Future]: futures of the analyzers running on the
+          analyzer threads, which need to be passed to _WaitForAnalyzers, or
+          None if the analysis has completed.
 
     Raises:
       RuntimeError: if the file-like object cannot be retrieved from
@@ -191,22 +238,43 @@ class EventExtractionWorker(object):
       self._processing_profiler.StartTiming('analyzing')
 
     try:
-      file_object = file_entry.GetFileObject(data_stream_name=data_stream_name)
+      if not file_object:
+        file_object = file_entry.GetFileObject(
+            data_stream_name=data_stream_name)
       if not file_object:
         raise RuntimeError((
             'Unable to retrieve file-like object for file entry: '
             '{0:s}.').format(display_name))
 
-      self._AnalyzeFileObject(file_object, display_name, event_data_stream)
+      # Analyzers that support it can analyze a data stream that is backed
+      # by an operating system file directly, such as Yara that maps the
+      # file into memory.
+      file_path = None
+      if (file_entry.type_indicator == dfvfs_definitions.TYPE_INDICATOR_OS and
+          not data_stream_name):
+        file_path = getattr(file_entry.path_spec, 'location', None)
+
+      analyzer_futures = None
+      if self._analyzer_thread_pool:
+        analyzer_futures = self._StartAnalyzeFileObject(file_object)
+
+      if analyzer_futures is None:
+        self._AnalyzeFileObject(
+            file_object, display_name, event_data_stream, file_path=file_path)
 
     finally:
       if self._processing_profiler:
         self._processing_profiler.StopTiming('analyzing')
 
-    logger.debug('[AnalyzeDataStream] completed analyzing file: {0:s}'.format(
-        display_name))
+    if analyzer_futures is None:
+      logger.debug(
+          '[AnalyzeDataStream] completed analyzing file: {0:s}'.format(
+              display_name))
 
-  def _AnalyzeFileObject(self, file_object, display_name, event_data_stream):
+    return analyzer_futures
+
+  def _AnalyzeFileObject(
+      self, file_object, display_name, event_data_stream, file_path=None):
     """Processes a file-like object with analyzers.
 
     Args:
@@ -215,9 +283,12 @@ class EventExtractionWorker(object):
           currently being analyzed.
       event_data_stream (EventDataStream): event data stream attribute
            container.
+      file_path (Optional[str]): path of the operating system file that backs
+          the file-like object, where None represents the file-like object
+          is not backed by an operating system file.
     """
     maximum_read_size = max(
-        analyzer_object.SIZE_LIMIT for analyzer_object in self._analyzers)
+        analyzer_object.GetReadSize() for analyzer_object in self._analyzers)
 
     hashers_only = True
     for analyzer_object in self._analyzers:
@@ -231,52 +302,45 @@ class EventExtractionWorker(object):
         file_size > self._hasher_file_size_limit):
       return
 
-    file_object.seek(0, os.SEEK_SET)
+    file_analyzers = []
+    if file_path:
+      file_analyzers = [
+          analyzer_object for analyzer_object in self._analyzers
+          if analyzer_object.FILE_ANALYZER and
+          file_size > analyzer_object.SIZE_LIMIT]
 
-    data = file_object.read(maximum_read_size)
-    while data:
+    for analyzer_object in file_analyzers:
       if self._abort:
         break
 
-      for analyzer_object in self._analyzers:
-        if self._abort:
-          break
-
-        if (not analyzer_object.INCREMENTAL_ANALYZER and
-            file_size > analyzer_object.SIZE_LIMIT):
-          continue
+      self.processing_status = analyzer_object.PROCESSING_STATUS_HINT
 
-        if (isinstance(analyzer_object, hashing_analyzer.HashingAnalyzer) and
-            self._hasher_file_size_limit and
-            file_size > self._hasher_file_size_limit):
-          continue
+      self._RunAnalyzer(analyzer_object, path=file_path)
 
-        self.processing_status = analyzer_object.PROCESSING_STATUS_HINT
+    data_analyzers = [
+        analyzer_object for analyzer_object in self._analyzers
+        if analyzer_object not in file_analyzers and
+        not self._CanSkipAnalyzer(analyzer_object, file_size)]
 
-        if self._analyzers_profiler:
-          self._analyzers_profiler.StartTiming(analyzer_object.NAME)
+    if data_analyzers:
+      file_object.seek(0, os.SEEK_SET)
 
-        try:
-          analyzer_object.Analyze(data)
-        finally:
-          if self._analyzers_profiler:
-            self._analyzers_profiler.StopTiming(analyzer_object.NAME)
+      data = file_object.read(maximum_read_size)
+      while data:
+        if self._abort:
+          break
 
-        self.last_activity_timestamp = time.time()
+        for analyzer_object in data_analyzers:
+          if self._abort:
+            break
 
-      data = file_object.read(maximum_read_size)
+          self.processing_status = analyzer_object.PROCESSING_STATUS_HINT
 
-    for analyzer_object in self._analyzers:
-      for result in analyzer_object.GetResults():
-        logger.debug((
-            '[AnalyzeFileObject] attribute {0:s}:{1!s} calculated for '
-            'file: {2:s}.').format(
-                result.attribute_name, result.attribute_value, display_name))
+          self._RunAnalyzer(analyzer_object, data=data)
 
-        setattr(event_data_stream, result.attribute_name,
-                result.attribute_value)
+        data = file_object.read(maximum_read_size)
 
-      analyzer_object.Reset()
+    self._SetAnalyzerResults(display_name, event_data_stream)
 
     self.processing_status = definitions.STATUS_INDICATOR_RUNNING
 
@@ -301,6 +365,25 @@ class EventExtractionWorker(object):
 
     return False
 
+  def _CanSkipAnalyzer(self, analyzer_object, file_size):
+    """Determines if an analyzer can be skipped for a data stream.
+
+    Args:
+      analyzer_object (BaseAnalyzer): analyzer.
+      file_size (int): size of the data stream.
+
+    Returns:
+      bool: True if the analyzer can be skipped.
+    """
+    if (not analyzer_object.INCREMENTAL_ANALYZER and
+        file_size > analyzer_object.SIZE_LIMIT):
+      return True
+
+    return bool(
+        isinstance(analyzer_object, hashing_analyzer.HashingAnalyzer) and
+        self._hasher_file_size_limit and
+        file_size > self._hasher_file_size_limit)
+
   def _CanSkipContentExtraction(self, file_entry):
     """Determines if content extraction of a file entry can be skipped.
 
@@ -428,7 +511,7 @@ class EventExtractionWorker(object):
     return scanner_object
 
   def _ExtractContentFromDataStream(
-      self, parser_mediator, file_entry, data_stream_name):
+      self, parser_mediator, file_entry, data_stream_name, file_object=None):
     """Extracts content from a data stream.
 
     Args:
@@ -437,14 +520,23 @@ class EventExtractionWorker(object):
       file_entry (dfvfs.FileEntry): file entry to extract its content.
       data_stream_name (str): name of the data stream whose content is to be
           extracted.
+      file_object (Optional[DataStreamSpool]): file-like object of the data
+          stream, where None represents the file-like object should be
+          retrieved from the file entry.
     """
     self.processing_status = definitions.STATUS_INDICATOR_EXTRACTING
 
     if self._processing_profiler:
       self._processing_profiler.StartTiming('extracting')
 
-    self._event_data_extractor.ParseDataStream(
-        parser_mediator, file_entry, data_stream_name)
+    if self._parse_cache:
+      self._ExtractContentFromDataStreamWithParseCache(
+          parser_mediator, file_entry, data_stream_name,
+          file_object=file_object)
+    else:
+      self._event_data_extractor.ParseDataStream(
+          parser_mediator, file_entry, data_stream_name,
+          file_object=file_object)
 
     if self._processing_profiler:
       self._processing_profiler.StopTiming('extracting')
@@ -453,6 +545,210 @@ class EventExtractionWorker(object):
 
     self.last_activity_timestamp = time.time()
 
+  def _ExtractContentFromDataStreamWithParseCache(
+      self, parser_mediator, file_entry, data_stream_name, file_object=None):
+    """Extracts content from a data stream using the parse cache.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfVFS.
+      file_entry (dfvfs.FileEntry): file entry to extract its content.
+      data_stream_name (str): name of the data stream whose content is to be
+          extracted.
+      file_object (Optional[DataStreamSpool]): file-like object of the data
+          stream, where None represents the file-like object should be
+          retrieved from the file entry.
+    """
+    lookup_key = None
+    try:
+      lookup_key = self._GetParseCacheLookupKey(
+          parser_mediator, file_entry, data_stream_name,
+          file_object=file_object)
+      if lookup_key:
+        cached_event_data, parse_time = self._parse_cache.GetParseResult(
+            lookup_key)
+        if cached_event_data is not None:
+          replay_start_time = time.time()
+
+          for event_data in cached_event_data:
+            # The event values hash and event data stream identifier are
+            # determined by the parser mediator.
+            event_data.SetEventDataStreamIdentifier(None)
+            parser_mediator.ProduceEventData(event_data)
+
+          replay_time = time.time() - replay_start_time
+
+          self.number_of_parse_cache_hits += 1
+          self.parse_cache_time_saved += max(parse_time - replay_time, 0.0)
+          return
+
+    except (IOError, OSError) as exception:
+      display_name = parser_mediator.GetDisplayName()
+      logger.warning((
+          'Unable to look up parse result of: {0:s} in parse cache with '
+          'error: {1!s}').format(display_name, exception))
+      lookup_key = None
+
+    if not lookup_key:
+      self._event_data_extractor.ParseDataStream(
+          parser_mediator, file_entry, data_stream_name,
+          file_object=file_object)
+      return
+
+    parse_start_time = time.time()
+    parser_mediator.StartRecordingAttributeContainers()
+    try:
+      self._event_data_extractor.ParseDataStream(
+          parser_mediator, file_entry, data_stream_name,
+          file_object=file_object)
+    finally:
+      attribute_containers = (
+          parser_mediator.StopRecordingAttributeContainers())
+
+    parse_time = time.time() - parse_start_time
+
+    if self._abort or parser_mediator.abort:
+      return
+
+    for attribute_container in attribute_containers:
+      # Parse results that contain other attribute containers than event
+      # data, such as extraction warnings, are not cached.
+      if attribute_container.CONTAINER_TYPE != 'event_data':
+        return
+
+      # Only parse results of which all parsers and plugins in the parser
+      # chain only depend on the content and name of the data stream are
+      # cached.
+      parser_chain = getattr(attribute_container, '_parser_chain', None) or ''
+      parser_names = set(parser_chain.split('/'))
+      if not parser_names.issubset(self._parse_cache_parser_names):
+        return
+
+    try:
+      self._parse_cache.WriteParseResult(
+          lookup_key, attribute_containers, parse_time)
+      self.number_of_parse_cache_misses += 1
+
+    except (IOError, OSError) as exception:
+      display_name = parser_mediator.GetDisplayName()
+      logger.warning((
+          'Unable to write parse result of: {0:s} to parse cache with '
+          'error: {1!s}').format(display_name, exception))
+
+  def _ExtractFromFileEntryDataStream(
+      self, parser_mediator, file_entry, data_stream, file_object=None,
+      parser_name=None):
+    """Extracts metadata and content from a data stream of a file entry.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfVFS.
+      file_entry (dfvfs.FileEntry): file entry containing the data stream.
+      data_stream (dfvfs.DataStream): data stream or None if the file entry
+          has no data stream.
+      file_object (Optional[DataStreamSpool]): file-like object of the data
+          stream, where None represents the file-like object should be
+          retrieved from the file entry.
+      parser_name (Optional[str]): name of the parser that parses a record
+          range of the data stream, where None represents the data stream
+          is processed as a whole.
+    """
+    data_stream_name = getattr(data_stream, 'name', '') or ''
+
+    # A record range is only parsed by the parser that split the data stream
+    # into record ranges, since the metadata and other content of the data
+    # stream are extracted when the first record range is parsed.
+    if parser_name:
+      self.processing_status = definitions.STATUS_INDICATOR_EXTRACTING
+
+      self._event_data_extractor.ParseDataStreamWithParser(
+          parser_mediator, file_entry, data_stream_name, parser_name,
+          file_object=file_object)
+
+      self.processing_status = definitions.STATUS_INDICATOR_RUNNING
+      return
+
+    self._ExtractMetadataFromFileEntry(parser_mediator, file_entry, data_stream)
+
+    # Not every file entry has a data stream. In such cases we want to
+    # extract the metadata only.
+    if not data_stream:
+      return
+
+    # Determine if the content of the file entry should not be extracted.
+    skip_content_extraction = self._CanSkipContentExtraction(file_entry)
+    if skip_content_extraction:
+      display_name = parser_mediator.GetDisplayName()
+      logger.debug('Skipping content extraction of: {0:s}'.format(display_name))
+      self.processing_status = definitions.STATUS_INDICATOR_IDLE
+      return
+
+    # TODO: merge with previous deepcopy
+    path_spec = copy.deepcopy(file_entry.path_spec)
+    if data_stream and not data_stream.IsDefault():
+      path_spec.data_stream = data_stream.name
+
+    compressed_stream_types = []
+    if self._process_compressed_streams:
+      compressed_stream_types = self._GetCompressedStreamTypes(
+          parser_mediator, path_spec)
+
+    if compressed_stream_types:
+      self._ProcessCompressedStreamTypes(
+          parser_mediator, path_spec, compressed_stream_types)
+
+    else:
+      results = []
+      try:
+        if not file_object:
+          file_object = file_entry.GetFileObject(
+              data_stream_name=data_stream_name)
+        if file_object:
+          scan_state = pysigscan.scan_state()
+          self._achive_type_scanner.scan_file_object(scan_state, file_object)
+          results = [scan_result.identifier
+                     for scan_result in iter(scan_state.scan_results)]
+
+      except IOError:
+        pass
+
+      if results == ['iso9660']:
+        self._ProcessStorageMediaImageType(
+            parser_mediator, path_spec, dfvfs_definitions.TYPE_INDICATOR_TSK)
+
+      elif results in (['modi_sparseimage'], ['modi_udif']):
+        self._ProcessStorageMediaImageType(
+            parser_mediator, path_spec, dfvfs_definitions.TYPE_INDICATOR_MODI)
+
+      elif results in (['tar'], ['tar_old']):
+        self._ProcessArchiveType(
+            parser_mediator, path_spec, dfvfs_definitions.TYPE_INDICATOR_TAR)
+
+      elif results in (['vhd'], ['vhdx']):
+        self._ProcessStorageMediaImageType(
+            parser_mediator, path_spec, dfvfs_definitions.TYPE_INDICATOR_VHDI)
+
+      elif results == ['zip']:
+        if 'zip' in self._archive_types:
+          self._ProcessArchiveType(
+              parser_mediator, path_spec, dfvfs_definitions.TYPE_INDICATOR_ZIP)
+
+        # Note that ZIP is also a compound format.
+        self._ExtractContentFromDataStream(
+            parser_mediator, file_entry, data_stream.name,
+            file_object=file_object)
+
+      else:
+        if len(results) > 1:
+          display_name = parser_mediator.GetDisplayName()
+          logger.debug((
+              'Found multiple format type indicators: {0!s} for archive file: '
+              '{1:s}').format(results, display_name))
+
+        self._ExtractContentFromDataStream(
+            parser_mediator, file_entry, data_stream.name,
+            file_object=file_object)
+
   def _ExtractMetadataFromFileEntry(
       self, parser_mediator, file_entry, data_stream):
     """Extracts metadata from a file entry.
@@ -546,6 +842,69 @@ class EventExtractionWorker(object):
 
     return type_indicators
 
+  def _GetParseCacheLookupKey(
+      self, parser_mediator, file_entry, data_stream_name, file_object=None):
+    """Determines the parse cache lookup key of a data stream.
+
+    The lookup key is a digest of the extraction context, such as the parser
+    filter expression and the name of the file entry, and the content of
+    the data stream.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfVFS.
+      file_entry (dfvfs.FileEntry): file entry.
+      data_stream_name (str): name of the data stream.
+      file_object (Optional[DataStreamSpool]): file-like object of the data
+          stream, where None represents the file-like object should be
+          retrieved from the file entry.
+
+    Returns:
+      str: lookup key or None if the parse result of the data stream should
+          not be cached.
+
+    Raises:
+      IOError: if the data stream cannot be read.
+      OSError: if the data stream cannot be read.
+    """
+    # Windows Registry find specifications can differ per run and are not
+    # part of the lookup key.
+    if parser_mediator.registry_find_specs:
+      return None
+
+    if not file_object:
+      file_object = file_entry.GetFileObject(data_stream_name=data_stream_name)
+    if not file_object:
+      return None
+
+    data_size = file_object.get_size()
+    if data_size > self._PARSE_CACHE_MAXIMUM_DATA_SIZE:
+      return None
+
+    context_values = [
+        plaso.__version__,
+        self._parser_filter_expression or '',
+        '1' if self._force_parser else '0',
+        file_entry.name or '',
+        data_stream_name or '',
+        parser_mediator.GetCodePage(),
+        parser_mediator.GetLanguageTag(),
+        '1' if parser_mediator.extract_winevt_resources else '0',
+        '1' if parser_mediator.extract_winreg_binary_values else '0',
+        f'{data_size:d}']
+
+    hash_context = hashlib.blake2b(digest_size=16)
+    hash_context.update('\x00'.join(context_values).encode('utf-8'))
+    hash_context.update(b'\x00')
+
+    file_object.seek(0, os.SEEK_SET)
+    data = file_object.read(self._PARSE_CACHE_READ_BUFFER_SIZE)
+    while data:
+      hash_context.update(data)
+      data = file_object.read(self._PARSE_CACHE_READ_BUFFER_SIZE)
+
+    return hash_context.hexdigest()
+
   def _IsMetadataFile(self, file_entry):
     """Determines if the file entry is a metadata file.
 
@@ -565,6 +924,53 @@ class EventExtractionWorker(object):
 
     return False
 
+  def _OpenDataStreamSpool(self, parser_mediator, file_entry, data_stream_name):
+    """Opens a data stream spool.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfVFS.
+      file_entry (dfvfs.FileEntry): file entry containing the data stream.
+      data_stream_name (str): name of the data stream.
+
+    Returns:
+      DataStreamSpool: data stream spool or None if the data stream should
+          not or could not be spooled.
+    """
+    if not self._spool_data_streams:
+      return None
+
+    try:
+      file_object = file_entry.GetFileObject(data_stream_name=data_stream_name)
+      if not file_object:
+        return None
+
+      if file_object.get_size() > self._DATA_STREAM_SPOOL_MAXIMUM_SIZE:
+        return None
+
+      if self._processing_profiler:
+        self._processing_profiler.StartTiming('spooling')
+
+      try:
+        spool = data_stream_spool.DataStreamSpool(
+            self._DATA_STREAM_SPOOL_MAXIMUM_IN_MEMORY_SIZE,
+            temporary_directory=parser_mediator.temporary_directory)
+        spool.Open(file_object)
+
+      finally:
+        if self._processing_profiler:
+          self._processing_profiler.StopTiming('spooling')
+
+    except (IOError, OSError, dfvfs_errors.BackEndError) as exception:
+      # The data stream is read by the individual consumers instead.
+      display_name = parser_mediator.GetDisplayName()
+      logger.debug((
+          'Unable to spool data stream of: {0:s} with error: {1!s}').format(
+              display_name, exception))
+      return None
+
+    return spool
+
   def _ProcessArchiveType(self, parser_mediator, path_spec, type_indicator):
     """Processes a data stream containing an archive type such as: TAR or ZIP.
 
@@ -780,8 +1186,18 @@ class EventExtractionWorker(object):
                   data_stream.name, file_entry.type_indicator, display_name))
           continue
 
-        self._ProcessFileEntryDataStream(
-            parser_mediator, file_entry, data_stream)
+        # The data stream spool is read once and shared by the analyzers,
+        # the format scanners and the parsers.
+        file_object = self._OpenDataStreamSpool(
+            parser_mediator, file_entry, data_stream.name)
+
+        try:
+          self._ProcessFileEntryDataStream(
+              parser_mediator, file_entry, data_stream, file_object=file_object)
+
+        finally:
+          if file_object:
+            file_object.close()
 
         file_entry_processed = True
 
@@ -794,7 +1210,8 @@ class EventExtractionWorker(object):
             display_name))
 
   def _ProcessFileEntryDataStream(
-      self, parser_mediator, file_entry, data_stream):
+      self, parser_mediator, file_entry, data_stream, file_object=None,
+      parser_name=None):
     """Processes a specific data stream of a file entry.
 
     Args:
@@ -803,6 +1220,12 @@ class EventExtractionWorker(object):
       file_entry (dfvfs.FileEntry): file entry containing the data stream.
       data_stream (dfvfs.DataStream): data stream or None if the file entry
           has no data stream.
+      file_object (Optional[DataStreamSpool]): file-like object of the data
+          stream, where None represents the file-like object should be
+          retrieved from the file entry.
+      parser_name (Optional[str]): name of the parser that parses a record
+          range of the data stream, where None represents the data stream
+          is processed as a whole.
     """
     display_name = parser_mediator.GetDisplayName()
     data_stream_name = getattr(data_stream, 'name', '') or ''
@@ -810,6 +1233,7 @@ class EventExtractionWorker(object):
         '[ProcessFileEntryDataStream] processing data stream: "{0:s}" of '
         'file entry: {1:s}').format(data_stream_name, display_name))
 
+    analyzer_futures = None
     event_data_stream = None
     if data_stream:
       display_name = parser_mediator.GetDisplayName()
@@ -821,91 +1245,38 @@ class EventExtractionWorker(object):
       event_data_stream = events.EventDataStream()
       event_data_stream.path_spec = path_spec
 
-      if self._analyzers:
+      # The data stream of a record range was already analyzed by the task
+      # that split it into record ranges.
+      if self._analyzers and not parser_name:
         # Since AnalyzeDataStream generates event data stream attributes it
         # needs to be called before producing events.
-        self._AnalyzeDataStream(
-            file_entry, data_stream.name, display_name, event_data_stream)
+        analyzer_futures = self._AnalyzeDataStream(
+            file_entry, data_stream.name, display_name, event_data_stream,
+            file_object=file_object)
 
     parser_mediator.ProduceEventDataStream(event_data_stream)
 
-    self._ExtractMetadataFromFileEntry(parser_mediator, file_entry, data_stream)
-
-    # Not every file entry has a data stream. In such cases we want to
-    # extract the metadata only.
-    if not data_stream:
+    if not analyzer_futures:
+      self._ExtractFromFileEntryDataStream(
+          parser_mediator, file_entry, data_stream, file_object=file_object,
+          parser_name=parser_name)
       return
 
-    # Determine if the content of the file entry should not be extracted.
-    skip_content_extraction = self._CanSkipContentExtraction(file_entry)
-    if skip_content_extraction:
-      display_name = parser_mediator.GetDisplayName()
-      logger.debug('Skipping content extraction of: {0:s}'.format(display_name))
-      self.processing_status = definitions.STATUS_INDICATOR_IDLE
-      return
-
-    # TODO: merge with previous deepcopy
-    path_spec = copy.deepcopy(file_entry.path_spec)
-    if data_stream and not data_stream.IsDefault():
-      path_spec.data_stream = data_stream.name
-
-    compressed_stream_types = []
-    if self._process_compressed_streams:
-      compressed_stream_types = self._GetCompressedStreamTypes(
-          parser_mediator, path_spec)
-
-    if compressed_stream_types:
-      self._ProcessCompressedStreamTypes(
-          parser_mediator, path_spec, compressed_stream_types)
-
-    else:
-      results = []
+    # The analyzer results are part of the event values hash of event data,
+    # hence event data is deferred until the analyzers, that run concurrently
+    # with extraction, have completed.
+    parser_mediator.StartDeferringEventData()
+    try:
       try:
-        file_object = file_entry.GetFileObject(
-            data_stream_name=data_stream_name)
-        if file_object:
-          scan_state = pysigscan.scan_state()
-          self._achive_type_scanner.scan_file_object(scan_state, file_object)
-          results = [scan_result.identifier
-                     for scan_result in iter(scan_state.scan_results)]
-
-      except IOError:
-        pass
-
-      if results == ['iso9660']:
-        self._ProcessStorageMediaImageType(
-            parser_mediator, path_spec, dfvfs_definitions.TYPE_INDICATOR_TSK)
-
-      elif results in (['modi_sparseimage'], ['modi_udif']):
-        self._ProcessStorageMediaImageType(
-            parser_mediator, path_spec, dfvfs_definitions.TYPE_INDICATOR_MODI)
-
-      elif results in (['tar'], ['tar_old']):
-        self._ProcessArchiveType(
-            parser_mediator, path_spec, dfvfs_definitions.TYPE_INDICATOR_TAR)
-
-      elif results in (['vhd'], ['vhdx']):
-        self._ProcessStorageMediaImageType(
-            parser_mediator, path_spec, dfvfs_definitions.TYPE_INDICATOR_VHDI)
-
-      elif results == ['zip']:
-        if 'zip' in self._archive_types:
-          self._ProcessArchiveType(
-              parser_mediator, path_spec, dfvfs_definitions.TYPE_INDICATOR_ZIP)
+        self._ExtractFromFileEntryDataStream(
+            parser_mediator, file_entry, data_stream, file_object=file_object,
+            parser_name=parser_name)
+      finally:
+        self._WaitForAnalyzers(
+            analyzer_futures, display_name, event_data_stream)
 
-        # Note that ZIP is also a compound format.
-        self._ExtractContentFromDataStream(
-            parser_mediator, file_entry, data_stream.name)
-
-      else:
-        if len(results) > 1:
-          display_name = parser_mediator.GetDisplayName()
-          logger.debug((
-              'Found multiple format type indicators: {0!s} for archive file: '
-              '{1:s}').format(results, display_name))
-
-        self._ExtractContentFromDataStream(
-             parser_mediator, file_entry, data_stream.name)
+    finally:
+      parser_mediator.StopDeferringEventData()
 
   def _ProcessMetadataFile(self, parser_mediator, file_entry):
     """Processes a metadata file.
@@ -937,6 +1308,67 @@ class EventExtractionWorker(object):
       self._event_data_extractor.ParseMetadataFile(
           parser_mediator, file_entry, data_stream.name)
 
+  def _RunAnalyzer(self, analyzer_object, data=None, path=None):
+    """Runs an analyzer on a block of data or a file.
+
+    Args:
+      analyzer_object (BaseAnalyzer): analyzer.
+      data (Optional[bytes]): block of data from the data stream.
+      path (Optional[str]): path of the file, which is analyzed instead of
+          the block of data.
+    """
+    if self._analyzers_profiler:
+      self._analyzers_profiler.StartTiming(analyzer_object.NAME)
+
+    try:
+      if path:
+        analyzer_object.AnalyzeFile(path)
+      else:
+        analyzer_object.Analyze(data)
+    finally:
+      if self._analyzers_profiler:
+        self._analyzers_profiler.StopTiming(analyzer_object.NAME)
+
+    self.last_activity_timestamp = time.time()
+
+  def _SetAnalyzerResults(self, display_name, event_data_stream):
+    """Sets the results of the analyzers in the event data stream.
+
+    The analyzers are reset afterwards.
+
+    Args:
+      display_name (str): human readable representation of the file entry
+          currently being analyzed.
+      event_data_stream (EventDataStream): event data stream attribute
+           container.
+    """
+    for analyzer_object in self._analyzers:
+      for result in analyzer_object.GetResults():
+        logger.debug((
+            '[AnalyzeFileObject] attribute {0:s}:{1!s} calculated for '
+            'file: {2:s}.').format(
+                result.attribute_name, result.attribute_value, display_name))
+
+        setattr(event_data_stream, result.attribute_name,
+                result.attribute_value)
+
+      analyzer_object.Reset()
+
+  def _SetAnalyzerThreads(self, number_of_analyzer_threads):
+    """Sets the number of analyzer threads.
+
+    Args:
+      number_of_analyzer_threads (int): number of threads that run the
+          analyzers concurrently with extraction, where 0 or None represents
+          the analyzers run on the worker thread.
+    """
+    self.StopAnalyzerThreads()
+
+    if number_of_analyzer_threads:
+      self._analyzer_thread_pool = concurrent.futures.ThreadPoolExecutor(
+          max_workers=number_of_analyzer_threads,
+          thread_name_prefix='analyzer')
+
   def _SetArchiveTypes(self, archive_types_string):
     """Sets the archive types.
 
@@ -969,11 +1401,16 @@ class EventExtractionWorker(object):
     analyzer_object.SetHasherNames(hasher_names_string)
     self._analyzers.append(analyzer_object)
 
-  def _SetYaraRules(self, yara_rules_string):
+  def _SetYaraRules(
+      self, yara_rules_string, window_size=None, window_overlap=None):
     """Sets the Yara rules.
 
     Args:
       yara_rules_string (str): unparsed Yara rule definitions.
+      window_size (Optional[int]): size of the windows in which data is
+          matched, where None represents the default.
+      window_overlap (Optional[int]): number of bytes of the previous window
+          that precede a window, where None represents the default.
     """
     if not yara_rules_string:
       return
@@ -981,8 +1418,82 @@ class EventExtractionWorker(object):
     analyzer_object = analyzers_manager.AnalyzersManager.GetAnalyzerInstance(
         'yara')
     analyzer_object.SetRules(yara_rules_string)
+    analyzer_object.SetWindow(window_size, window_overlap)
     self._analyzers.append(analyzer_object)
 
+  def _StartAnalyzeFileObject(self, file_object):
+    """Starts processing a file-like object with analyzers on the threads.
+
+    The content of the file-like object is read on the worker thread, since
+    file-like objects are not thread-safe, and the analyzers that apply run
+    on the analyzer threads concurrently with each other and with content
+    extraction. Hashing and Yara scanning release the global interpreter
+    lock.
+
+    Args:
+      file_object (dfvfs.FileIO): file-like object to process.
+
+    Returns:
+      list[concurrent.futures.Future]: futures of the analyzers or None if
+          the file-like object should be processed on the worker thread.
+    """
+    file_size = file_object.get_size()
+    if file_size > self._ANALYZER_THREADS_MAXIMUM_DATA_SIZE:
+      return None
+
+    analyzer_objects = [
+        analyzer_object for analyzer_object in self._analyzers
+        if not self._CanSkipAnalyzer(analyzer_object, file_size)]
+    if not analyzer_objects:
+      return None
+
+    file_object.seek(0, os.SEEK_SET)
+    data = file_object.read(file_size)
+    if not data:
+      return None
+
+    return [
+        self._analyzer_thread_pool.submit(
+            self._RunAnalyzer, analyzer_object, data=data)
+        for analyzer_object in analyzer_objects]
+
+  def _WaitForAnalyzers(
+      self, analyzer_futures, display_name, event_data_stream):
+    """Waits for the analyzers running on the analyzer threads to complete.
+
+    Args:
+      analyzer_futures (list[concurrent.futures.Future]): futures of the
+          analyzers.
+      display_name (str): human readable representation of the file entry
+          currently being analyzed.
+      event_data_stream (EventDataStream): event data stream attribute
+           container.
+    """
+    if self._processing_profiler:
+      self._processing_profiler.StartTiming('analyzing')
+
+    try:
+      concurrent.futures.wait(analyzer_futures)
+
+      # Raises the exception of an analyzer that failed, if any.
+      for analyzer_future in analyzer_futures:
+        analyzer_future.result()
+
+    finally:
+      if self._processing_profiler:
+        self._processing_profiler.StopTiming('analyzing')
+
+    self._SetAnalyzerResults(display_name, event_data_stream)
+
+    logger.debug('[AnalyzeDataStream] completed analyzing file: {0:s}'.format(
+        display_name))
+
+  def CloseParseCache(self):
+    """Closes the parse cache if it was opened."""
+    if self._parse_cache:
+      self._parse_cache.Close()
+      self._parse_cache = None
+
   def GetAnalyzerNames(self):
     """Gets the names of the active analyzers.
 
@@ -1035,6 +1546,74 @@ class EventExtractionWorker(object):
 
     self.ProcessFileEntry(parser_mediator, file_entry)
 
+  def ProcessRecordRange(
+      self, parser_mediator, path_spec, parser_name, first_record_index,
+      number_of_records):
+    """Processes a record range of a data stream.
+
+    Only the records in the range are parsed by the parser that split the
+    data stream into record ranges. The data stream is not analyzed again,
+    since the event data stream of the record range is replaced by that of
+    the data stream as a whole when the results are merged.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfVFS.
+      path_spec (dfvfs.PathSpec): path specification of the data stream.
+      parser_name (str): name of the parser that parses the records.
+      first_record_index (int): index of the first record in the range.
+      number_of_records (int): number of records in the range.
+    """
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(
+        path_spec, resolver_context=parser_mediator.resolver_context)
+
+    data_stream_name = getattr(path_spec, 'data_stream', None) or ''
+    data_stream = None
+    if file_entry:
+      data_stream = file_entry.GetDataStream(data_stream_name)
+
+    if not data_stream:
+      display_name = parser_mediator.GetDisplayNameForPathSpec(path_spec)
+      logger.warning('Unable to open data stream: {0:s}'.format(display_name))
+      self.processing_status = definitions.STATUS_INDICATOR_IDLE
+      return
+
+    self.last_activity_timestamp = time.time()
+    self.processing_status = definitions.STATUS_INDICATOR_RUNNING
+
+    parser_mediator.SetFileEntry(file_entry)
+    parser_mediator.SetRecordRange(first_record_index, number_of_records)
+
+    try:
+      if self._IsMetadataFile(file_entry):
+        event_data_stream = events.EventDataStream()
+        event_data_stream.path_spec = copy.deepcopy(path_spec)
+
+        parser_mediator.ProduceEventDataStream(event_data_stream)
+
+        self._ExtractFromFileEntryDataStream(
+            parser_mediator, file_entry, data_stream, parser_name=parser_name)
+
+      else:
+        file_object = self._OpenDataStreamSpool(
+            parser_mediator, file_entry, data_stream_name)
+
+        try:
+          self._ProcessFileEntryDataStream(
+              parser_mediator, file_entry, data_stream, file_object=file_object,
+              parser_name=parser_name)
+
+        finally:
+          if file_object:
+            file_object.close()
+
+    finally:
+      parser_mediator.SetRecordRange(None, None)
+      parser_mediator.ResetFileEntry()
+
+      self.last_activity_timestamp = time.time()
+      self.processing_status = definitions.STATUS_INDICATOR_IDLE
+
   # TODO: move the functionality of this method into the constructor.
   def SetExtractionConfiguration(self, configuration):
     """Sets the extraction configuration settings.
@@ -1042,11 +1621,29 @@ class EventExtractionWorker(object):
     Args:
       configuration (ExtractionConfiguration): extraction configuration.
     """
+    self._SetAnalyzerThreads(configuration.number_of_analyzer_threads)
     self._SetArchiveTypes(configuration.archive_types_string)
     self._hasher_file_size_limit = configuration.hasher_file_size_limit
     self._SetHashers(configuration.hasher_names_string)
     self._process_compressed_streams = configuration.process_compressed_streams
-    self._SetYaraRules(configuration.yara_rules_string)
+    self._SetYaraRules(
+        configuration.yara_rules_string,
+        window_size=configuration.yara_window_size,
+        window_overlap=configuration.yara_window_overlap)
+    self._spool_data_streams = configuration.spool_data_streams
+
+    if configuration.parse_cache_path:
+      self._parse_cache_parser_names = (
+          parsers_manager.ParsersManager.GetNamesWithParseCacheSupport())
+      self._parse_cache = parse_cache.ParseCache()
+      try:
+        self._parse_cache.Open(configuration.parse_cache_path)
+      except (IOError, OSError) as exception:
+        logger.warning((
+            'Unable to open parse cache: {0:s} with error: {1!s}, parse '
+            'cache disabled.').format(
+                configuration.parse_cache_path, exception))
+        self._parse_cache = None
 
   def SetAnalyzersProfiler(self, analyzers_profiler):
     """Sets the analyzers profiler.
@@ -1067,3 +1664,9 @@ class EventExtractionWorker(object):
   def SignalAbort(self):
     """Signals the extraction worker to abort."""
     self._abort = True
+
+  def StopAnalyzerThreads(self):
+    """Stops the analyzer threads if they were started."""
+    if self._analyzer_thread_pool:
+      self._analyzer_thread_pool.shutdown(wait=True)
+      self._analyzer_thread_pool = None
@@ -2,16 +2,23 @@
 """The event filter."""
 
 from plaso.filters import expression_parser
+from plaso.storage import time_range as storage_time_range
 
 
 class EventObjectFilter(object):
   """Event filter."""
 
+  # Timestamps used when the storage time range is only constrained on
+  # one side.
+  _MAXIMUM_TIMESTAMP = (1 << 63) - 1
+  _MINIMUM_TIMESTAMP = -(1 << 63)
+
   def __init__(self):
     """Initializes an event filter."""
     super(EventObjectFilter, self).__init__()
     self._event_filter = None
     self._filter_expression = None
+    self._match_function = None
 
   def CompileFilter(self, filter_expression):
     """Compiles the filter expression.
@@ -29,6 +36,47 @@ class EventObjectFilter(object):
 
     self._event_filter = expression.Compile()
     self._filter_expression = filter_expression
+    self._match_function = self._event_filter.CompileMatchFunction()
+
+  def GetStorageFilterValues(self):
+    """Retrieves the part of the filter that can be evaluated by the storage.
+
+    Only the timestamp and data type of the events are evaluated by the
+    storage. The storage filter values select a superset of the events that
+    match the filter, hence Match still needs to be called for the events
+    selected by the storage.
+
+    Returns:
+      tuple: containing:
+
+        TimeRange: time range of the matching events or None if not
+            constrained.
+        list[str]: data types of the event data of matching events or None
+            if not constrained.
+    """
+    if not self._event_filter:
+      return None, None
+
+    start_timestamp, end_timestamp, data_types = (
+        self._event_filter.GetStorageFilterValues())
+
+    time_range = None
+    if start_timestamp is not None or end_timestamp is not None:
+      if start_timestamp is None:
+        start_timestamp = self._MINIMUM_TIMESTAMP
+      if end_timestamp is None:
+        end_timestamp = self._MAXIMUM_TIMESTAMP
+
+      # A filter that cannot match any timestamp still needs a valid time range.
+      end_timestamp = max(start_timestamp, end_timestamp)
+
+      time_range = storage_time_range.TimeRange(
+          start_timestamp, end_timestamp)
+
+    if data_types is not None:
+      data_types = sorted(data_types)
+
+    return time_range, data_types
 
   def Match(self, event, event_data, event_data_stream, event_tag):
     """Determines if an event matches the filter.
@@ -42,8 +90,8 @@ class EventObjectFilter(object):
     Returns:
       bool: True if the event matches the filter, False otherwise.
     """
-    if not self._event_filter:
+    if not self._match_function:
       return True
 
-    return self._event_filter.Matches(
+    return self._match_function(
         event, event_data, event_data_stream, event_tag)
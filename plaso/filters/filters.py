@@ -53,6 +53,37 @@ class Filter(object):
       return codecs.decode(value, 'utf8', 'ignore')
     return value
 
+  def CompileMatchFunction(self):
+    """Compiles the filter into a match function.
+
+    The match function takes the same arguments and returns the same value as
+    Matches, but resolves the attribute lookups and comparisons of the filter
+    once, instead of for every event.
+
+    Returns:
+      function: match function.
+    """
+    return self.Matches
+
+  def GetStorageFilterValues(self):
+    """Retrieves the filter values that can be evaluated by the storage.
+
+    The storage filter values select a superset of the events that match
+    the filter, hence the filter still needs to be matched against the events
+    selected by the storage.
+
+    Returns:
+      tuple: containing:
+
+        int: timestamp that marks the start of the range of matching events
+            or None if not constrained.
+        int: timestamp that marks the end of the range of matching events
+            or None if not constrained.
+        set[str]: data types of the event data of matching events or None if
+            not constrained.
+    """
+    return None, None, None
+
   @abc.abstractmethod
   def Matches(self, event, event_data, event_data_stream, event_tag):
     """Determines if the event, data and tag match the filter.
@@ -74,6 +105,62 @@ class AndFilter(Filter):
   Note that if no conditions are passed, all objects will pass.
   """
 
+  def CompileMatchFunction(self):
+    """Compiles the filter into a match function.
+
+    Returns:
+      function: match function.
+    """
+    match_functions = [
+        sub_filter.CompileMatchFunction() for sub_filter in self.args]
+    if len(match_functions) == 1:
+      return match_functions[0]
+
+    def _Matches(event, event_data, event_data_stream, event_tag):
+      for match_function in match_functions:
+        if not match_function(event, event_data, event_data_stream, event_tag):
+          return False
+      return True
+
+    return _Matches
+
+  def GetStorageFilterValues(self):
+    """Retrieves the filter values that can be evaluated by the storage.
+
+    Returns:
+      tuple: containing:
+
+        int: timestamp that marks the start of the range of matching events
+            or None if not constrained.
+        int: timestamp that marks the end of the range of matching events
+            or None if not constrained.
+        set[str]: data types of the event data of matching events or None if
+            not constrained.
+    """
+    start_timestamp = None
+    end_timestamp = None
+    data_types = None
+
+    for sub_filter in self.args:
+      sub_start_timestamp, sub_end_timestamp, sub_data_types = (
+          sub_filter.GetStorageFilterValues())
+
+      if sub_start_timestamp is not None and (
+          start_timestamp is None or sub_start_timestamp > start_timestamp):
+        start_timestamp = sub_start_timestamp
+
+      if sub_end_timestamp is not None and (
+          end_timestamp is None or sub_end_timestamp < end_timestamp):
+        end_timestamp = sub_end_timestamp
+
+      if sub_data_types is not None:
+        if data_types is None:
+          data_types = set(sub_data_types)
+        else:
+          data_types &= sub_data_types
+
+    return start_timestamp, end_timestamp, data_types
+
   def Matches(self, event, event_data, event_data_stream, event_tag):
     """Determines if the event, data and tag match the filter.
 
@@ -100,6 +187,69 @@ class OrFilter(Filter):
   Note that if no conditions are passed, all objects will pass.
   """
 
+  def CompileMatchFunction(self):
+    """Compiles the filter into a match function.
+
+    Returns:
+      function: match function.
+    """
+    if not self.args:
+      return self.Matches
+
+    match_functions = [
+        sub_filter.CompileMatchFunction() for sub_filter in self.args]
+    if len(match_functions) == 1:
+      return match_functions[0]
+
+    def _Matches(event, event_data, event_data_stream, event_tag):
+      for match_function in match_functions:
+        if match_function(event, event_data, event_data_stream, event_tag):
+          return True
+      return False
+
+    return _Matches
+
+  def GetStorageFilterValues(self):
+    """Retrieves the filter values that can be evaluated by the storage.
+
+    Returns:
+      tuple: containing:
+
+        int: timestamp that marks the start of the range of matching events
+            or None if not constrained.
+        int: timestamp that marks the end of the range of matching events
+            or None if not constrained.
+        set[str]: data types of the event data of matching events or None if
+            not constrained.
+    """
+    if not self.args:
+      return None, None, None
+
+    storage_filter_values = [
+        sub_filter.GetStorageFilterValues() for sub_filter in self.args]
+
+    start_timestamps = [values[0] for values in storage_filter_values]
+    if None in start_timestamps:
+      start_timestamp = None
+    else:
+      start_timestamp = min(start_timestamps)
+
+    end_timestamps = [values[1] for values in storage_filter_values]
+    if None in end_timestamps:
+      end_timestamp = None
+    else:
+      end_timestamp = max(end_timestamps)
+
+    data_types = set()
+    for _, _, sub_data_types in storage_filter_values:
+      if sub_data_types is None:
+        data_types = None
+        break
+
+      data_types.update(sub_data_types)
+
+    return start_timestamp, end_timestamp, data_types
+
   def Matches(self, event, event_data, event_data_stream, event_tag):
     """Determines if the event, data and tag match the filter.
 
@@ -204,6 +354,13 @@ class BinaryOperator(Operator):
 class GenericBinaryOperator(BinaryOperator):
   """Shared functionality for common binary operators."""
 
+  # True if the operator compares values using their order, which allows
+  # timestamp values to be compared as integers.
+  _COMPARES_ORDERED_VALUES = False
+
+  _DATE_TIME_VALUE_TYPES = (
+      dfdatetime_interface.DateTimeValues, value_types.DateTimeValueType)
+
   # Attributes that are stored in the event attribute container.
   _EVENT_ATTRIBUTE_NAMES = frozenset(['timestamp', 'timestamp_desc'])
 
@@ -232,6 +389,111 @@ class GenericBinaryOperator(BinaryOperator):
       bool: True if the values match according to the operator, False otherwise.
     """
 
+  def _CompileCompareFunction(self):
+    """Compiles the comparison of the operator.
+
+    Returns:
+      function: function that compares a value retrieved from the event with
+          the value defined by the filter.
+    """
+    return self._CompareValue
+
+  def _CompileGetValueFunction(self):
+    """Compiles the retrieval of the event, data or tag attribute value.
+
+    Returns:
+      function: function that retrieves the attribute value from the event,
+          event data, event data stream or event tag.
+    """
+    attribute_name = self.left_operand
+
+    if attribute_name == 'timestamp':
+      date_time_value_types = self._DATE_TIME_VALUE_TYPES
+
+      def _GetValue(event, unused_event_data, unused_event_data_stream,
+                    unused_event_tag):
+        attribute_value = getattr(event, 'timestamp', None)
+        if attribute_value is not None and not isinstance(
+            attribute_value, date_time_value_types):
+          attribute_value = value_types.DateTimeValueType(attribute_value)
+        return attribute_value
+
+    elif attribute_name in self._EVENT_ATTRIBUTE_NAMES:
+
+      def _GetValue(event, unused_event_data, unused_event_data_stream,
+                    unused_event_tag):
+        return getattr(event, attribute_name, None)
+
+    elif attribute_name[:1] == '_':
+      # Protected attribute names of the event data stream are not stored in
+      # its instance dictionary.
+
+      def _GetValue(event, event_data, event_data_stream, event_tag):
+        return self._GetValue(
+            attribute_name, event, event_data, event_data_stream, event_tag)
+
+    elif attribute_name == 'tag':
+
+      def _GetValue(unused_event, event_data, event_data_stream, event_tag):
+        if event_data_stream and 'tag' in event_data_stream.__dict__:
+          return event_data_stream.tag
+        return getattr(event_tag, 'labels', None)
+
+    else:
+
+      def _GetValue(unused_event, event_data, event_data_stream,
+                    unused_event_tag):
+        if event_data_stream and attribute_name in event_data_stream.__dict__:
+          return getattr(event_data_stream, attribute_name, None)
+        return getattr(event_data, attribute_name, None)
+
+    return _GetValue
+
+  def _GetFilterDataTypes(self):
+    """Retrieves the data types matched by the operator.
+
+    Returns:
+      set[str]: data types of the event data matched by the operator or None
+          if the operator cannot be expressed as a set of data types.
+    """
+    return None
+
+  def _GetFilterTimestamp(self):
+    """Retrieves the filter value as a timestamp.
+
+    Returns:
+      int: timestamp that contains the number of microseconds since
+          January 1, 1970, 00:00:00 UTC or None if the filter value cannot be
+          represented as a timestamp without loss of precision.
+    """
+    if not isinstance(self.right_operand, dfdatetime_interface.DateTimeValues):
+      return None
+
+    try:
+      timestamp = self.right_operand.GetPlasoTimestamp()
+    except ValueError:
+      return None
+
+    if timestamp is None:
+      return None
+
+    if value_types.DateTimeValueType(timestamp) != self.right_operand:
+      return None
+
+    return timestamp
+
+  def _GetTimestampRange(self, filter_timestamp):
+    """Retrieves the range of timestamps matched by the operator.
+
+    Args:
+      filter_timestamp (int): timestamp defined by the filter.
+
+    Returns:
+      tuple[int, int]: timestamps that mark the start and end of the range,
+          where None represents not constrained.
+    """
+    return None, None
+
   def _GetValue(
       self, attribute_name, event, event_data, event_data_stream, event_tag):
     """Retrieves the value of a specific event, data or tag attribute.
@@ -275,11 +537,80 @@ class GenericBinaryOperator(BinaryOperator):
 
     return attribute_value
 
+  def CompileMatchFunction(self):
+    """Compiles the filter into a match function.
+
+    Returns:
+      function: match function.
+    """
+    if self.left_operand in self._UNSUPPORTED_ATTRIBUTE_NAMES:
+      logger.warning(
+          'Expansion of {0:s} in event filter no longer supported'.format(
+              self.left_operand))
+
+    bool_value = self._bool_value
+    compare_function = self._CompileCompareFunction()
+    filter_value = self.right_operand
+    get_value_function = self._CompileGetValueFunction()
+
+    def _Matches(event, event_data, event_data_stream, event_tag):
+      value = get_value_function(
+          event, event_data, event_data_stream, event_tag)
+      if value and compare_function(value, filter_value):
+        return bool_value
+      return not bool_value
+
+    filter_timestamp = None
+    if self.left_operand == 'timestamp' and self._COMPARES_ORDERED_VALUES:
+      filter_timestamp = self._GetFilterTimestamp()
+
+    if filter_timestamp is None:
+      return _Matches
+
+    # Compare integer timestamps directly instead of converting them into
+    # date time objects first.
+    def _MatchesTimestamp(event, event_data, event_data_stream, event_tag):
+      timestamp = getattr(event, 'timestamp', None)
+      if not isinstance(timestamp, int):
+        return _Matches(event, event_data, event_data_stream, event_tag)
+
+      if compare_function(timestamp, filter_timestamp):
+        return bool_value
+      return not bool_value
+
+    return _MatchesTimestamp
+
   def FlipBool(self):
     """Negates the internal boolean value attribute."""
     logger.debug('Negative matching.')
     self._bool_value = not self._bool_value
 
+  def GetStorageFilterValues(self):
+    """Retrieves the filter values that can be evaluated by the storage.
+
+    Returns:
+      tuple: containing:
+
+        int: timestamp that marks the start of the range of matching events
+            or None if not constrained.
+        int: timestamp that marks the end of the range of matching events
+            or None if not constrained.
+        set[str]: data types of the event data of matching events or None if
+            not constrained.
+    """
+    if self._bool_value:
+      if self.left_operand == 'data_type':
+        return None, None, self._GetFilterDataTypes()
+
+      if self.left_operand == 'timestamp':
+        filter_timestamp = self._GetFilterTimestamp()
+        if filter_timestamp is not None:
+          start_timestamp, end_timestamp = self._GetTimestampRange(
+              filter_timestamp)
+          return start_timestamp, end_timestamp, None
+
+    return None, None, None
+
   def Matches(self, event, event_data, event_data_stream, event_tag):
     """Determines if the event, data and tag match the filter.
 
@@ -303,6 +634,8 @@ class GenericBinaryOperator(BinaryOperator):
 class EqualsOperator(GenericBinaryOperator):
   """Equals (==) operator."""
 
+  _COMPARES_ORDERED_VALUES = True
+
   def _CompareValue(self, event_value, filter_value):
     """Compares if two values are equal.
 
@@ -315,10 +648,36 @@ class EqualsOperator(GenericBinaryOperator):
     """
     return event_value == filter_value
 
+  def _GetFilterDataTypes(self):
+    """Retrieves the data types matched by the operator.
+
+    Returns:
+      set[str]: data types of the event data matched by the operator or None
+          if the operator cannot be expressed as a set of data types.
+    """
+    if not isinstance(self.right_operand, str):
+      return None
+
+    return set([self.right_operand])
+
+  def _GetTimestampRange(self, filter_timestamp):
+    """Retrieves the range of timestamps matched by the operator.
+
+    Args:
+      filter_timestamp (int): timestamp defined by the filter.
+
+    Returns:
+      tuple[int, int]: timestamps that mark the start and end of the range,
+          where None represents not constrained.
+    """
+    return filter_timestamp, filter_timestamp
+
 
 class NotEqualsOperator(GenericBinaryOperator):
   """Not equals (!=) operator."""
 
+  _COMPARES_ORDERED_VALUES = True
+
   def _CompareValue(self, event_value, filter_value):
     """Compares if two values are not equal.
 
@@ -335,6 +694,8 @@ class NotEqualsOperator(GenericBinaryOperator):
 class LessThanOperator(GenericBinaryOperator):
   """Less than (<) operator."""
 
+  _COMPARES_ORDERED_VALUES = True
+
   def _CompareValue(self, event_value, filter_value):
     """Compares if the event value is less than the second.
 
@@ -347,10 +708,24 @@ class LessThanOperator(GenericBinaryOperator):
     """
     return event_value < filter_value
 
+  def _GetTimestampRange(self, filter_timestamp):
+    """Retrieves the range of timestamps matched by the operator.
+
+    Args:
+      filter_timestamp (int): timestamp defined by the filter.
+
+    Returns:
+      tuple[int, int]: timestamps that mark the start and end of the range,
+          where None represents not constrained.
+    """
+    return None, filter_timestamp - 1
+
 
 class LessEqualOperator(GenericBinaryOperator):
   """Less than or equals (<=) operator."""
 
+  _COMPARES_ORDERED_VALUES = True
+
   def _CompareValue(self, event_value, filter_value):
     """Compares if the event value is less than or equals the second.
 
@@ -364,10 +739,24 @@ class LessEqualOperator(GenericBinaryOperator):
     """
     return event_value <= filter_value
 
+  def _GetTimestampRange(self, filter_timestamp):
+    """Retrieves the range of timestamps matched by the operator.
+
+    Args:
+      filter_timestamp (int): timestamp defined by the filter.
+
+    Returns:
+      tuple[int, int]: timestamps that mark the start and end of the range,
+          where None represents not constrained.
+    """
+    return None, filter_timestamp
+
 
 class GreaterThanOperator(GenericBinaryOperator):
   """Greater than (>) operator."""
 
+  _COMPARES_ORDERED_VALUES = True
+
   def _CompareValue(self, event_value, filter_value):
     """Compares if the event value is greater than the second.
 
@@ -380,10 +769,24 @@ class GreaterThanOperator(GenericBinaryOperator):
     """
     return event_value > filter_value
 
+  def _GetTimestampRange(self, filter_timestamp):
+    """Retrieves the range of timestamps matched by the operator.
+
+    Args:
+      filter_timestamp (int): timestamp defined by the filter.
+
+    Returns:
+      tuple[int, int]: timestamps that mark the start and end of the range,
+          where None represents not constrained.
+    """
+    return filter_timestamp + 1, None
+
 
 class GreaterEqualOperator(GenericBinaryOperator):
   """Greater than or equals (>=) operator."""
 
+  _COMPARES_ORDERED_VALUES = True
+
   def _CompareValue(self, event_value, filter_value):
     """Compares if the event value is greater than or equals the second.
 
@@ -397,6 +800,18 @@ class GreaterEqualOperator(GenericBinaryOperator):
     """
     return event_value >= filter_value
 
+  def _GetTimestampRange(self, filter_timestamp):
+    """Retrieves the range of timestamps matched by the operator.
+
+    Args:
+      filter_timestamp (int): timestamp defined by the filter.
+
+    Returns:
+      tuple[int, int]: timestamps that mark the start and end of the range,
+          where None represents not constrained.
+    """
+    return filter_timestamp, None
+
 
 class Contains(GenericBinaryOperator):
   """Operator to determine if a value contains another value."""
@@ -425,6 +840,29 @@ class Contains(GenericBinaryOperator):
     except (AttributeError, TypeError):
       return False
 
+  def _CompileCompareFunction(self):
+    """Compiles the comparison of the operator.
+
+    Returns:
+      function: function that compares a value retrieved from the event with
+          the value defined by the filter.
+    """
+    if not isinstance(self.right_operand, str):
+      return self._CompareValue
+
+    lower_case_filter_value = self.right_operand.lower()
+
+    def _CompareValue(event_value, filter_value):
+      try:
+        if isinstance(event_value, str):
+          return lower_case_filter_value in event_value.lower()
+
+        return filter_value in event_value
+      except (AttributeError, TypeError):
+        return False
+
+    return _CompareValue
+
 
 # TODO: Change to an N-ary Operator?
 class InSet(GenericBinaryOperator):
@@ -459,21 +897,39 @@ class InSet(GenericBinaryOperator):
     except TypeError:
       return False
 
+  def _GetFilterDataTypes(self):
+    """Retrieves the data types matched by the operator.
+
+    Returns:
+      set[str]: data types of the event data matched by the operator or None
+          if the operator cannot be expressed as a set of data types.
+    """
+    # Note that a string filter value matches substrings of the event value.
+    if not isinstance(self.right_operand, (list, set, tuple)):
+      return None
+
+    if not all(isinstance(value, str) for value in self.right_operand):
+      return None
+
+    return set(self.right_operand)
+
 
 # TODO: is GenericBinaryOperator the most suitable super class here?
 # Would BinaryOperator be a better fit?
 class Regexp(GenericBinaryOperator):
   """Operator to determine if a value matches a regular expression.
 
+  This operator uses case sensitive comparison.
+
   Attributes:
-    compiled_re (???): compiled regular expression.
+    compiled_re (re.Pattern): compiled regular expression.
   """
 
+  _REGULAR_EXPRESSION_FLAGS = re.DOTALL
+
   def __init__(self, arguments=None, **kwargs):
     """Initializes a regular expression operator.
 
-    This operator uses case sensitive comparison.
-
     Args:
       arguments (Optional[object]): operands of the filter.
 
@@ -487,7 +943,7 @@ class Regexp(GenericBinaryOperator):
 
     try:
       expression = self._CopyValueToString(self.right_operand)
-      compiled_re = re.compile(expression, re.DOTALL)
+      compiled_re = re.compile(expression, self._REGULAR_EXPRESSION_FLAGS)
     except re.error:
       raise ValueError('Regular expression "{0!s}" is malformed.'.format(
           self.right_operand))
@@ -514,31 +970,32 @@ class Regexp(GenericBinaryOperator):
 
     return False
 
+  def _CompileCompareFunction(self):
+    """Compiles the comparison of the operator.
 
-class RegexpInsensitive(Regexp):
-  """Operator to determine if a value matches a regular expression."""
-
-  def __init__(self, arguments=None, **kwargs):
-    """Initializes a regular expression operator.
+    Returns:
+      function: function that compares a value retrieved from the event with
+          the value defined by the filter.
+    """
+    copy_value_to_string_function = self._CopyValueToString
+    search_function = self.compiled_re.search
+
+    def _CompareValue(event_value, unused_filter_value):
+      if not isinstance(event_value, str):
+        try:
+          event_value = copy_value_to_string_function(event_value)
+        except TypeError:
+          return False
 
-    This operator uses case insensitive comparison.
+      return search_function(event_value) is not None
 
-    Args:
-      arguments (Optional[object]): operands of the filter.
+    return _CompareValue
 
-    Raises:
-      ValueError: if the regular expression is malformed.
-    """
-    super(RegexpInsensitive, self).__init__(arguments=arguments, **kwargs)
 
-    # Note that right_operand is not necessarily a string.
-    logger.debug('Compiled: {0!s}'.format(self.right_operand))
+class RegexpInsensitive(Regexp):
+  """Operator to determine if a value matches a regular expression.
 
-    try:
-      expression = self._CopyValueToString(self.right_operand)
-      compiled_re = re.compile(expression, re.I | re.DOTALL)
-    except re.error:
-      raise ValueError('Regular expression "{0!s}" is malformed.'.format(
-          self.right_operand))
+  This operator uses case insensitive comparison.
+  """
 
-    self.compiled_re = compiled_re
+  _REGULAR_EXPRESSION_FLAGS = re.I | re.DOTALL
@@ -26,12 +26,16 @@ NON_PRINTABLE_CHARACTER_TRANSLATION_TABLE = str.maketrans(
     NON_PRINTABLE_CHARACTERS)
 
 # Compression formats.
+COMPRESSION_FORMAT_LZ4 = 'lz4'
 COMPRESSION_FORMAT_NONE = 'none'
 COMPRESSION_FORMAT_ZLIB = 'zlib'
+COMPRESSION_FORMAT_ZSTD = 'zstd'
 
 COMPRESSION_FORMATS = frozenset([
+    COMPRESSION_FORMAT_LZ4,
     COMPRESSION_FORMAT_NONE,
-    COMPRESSION_FORMAT_ZLIB])
+    COMPRESSION_FORMAT_ZLIB,
+    COMPRESSION_FORMAT_ZSTD])
 
 # Operating system families.
 OPERATING_SYSTEM_FAMILY_LINUX = 'Linux'
@@ -49,8 +53,11 @@ OPERATING_SYSTEM_FAMILIES = frozenset([
 
 # Serialization formats.
 SERIALIZER_FORMAT_JSON = 'json'
+SERIALIZER_FORMAT_MSGPACK = 'msgpack'
 
-SERIALIZER_FORMATS = frozenset([SERIALIZER_FORMAT_JSON])
+SERIALIZER_FORMATS = frozenset([
+    SERIALIZER_FORMAT_JSON,
+    SERIALIZER_FORMAT_MSGPACK])
 
 # Source types.
 SOURCE_TYPE_ARCHIVE = 'archive'
@@ -81,6 +88,9 @@ STORAGE_TYPE_TASK = 'task'
 
 STORAGE_TYPES = frozenset([STORAGE_TYPE_SESSION, STORAGE_TYPE_TASK])
 
+# Default size of the record ranges into which large files are split of 256 MiB.
+DEFAULT_RECORD_RANGE_DATA_SIZE = 256 * 1024 * 1024
+
 # Default worker process memory limit of 2 GiB.
 DEFAULT_WORKER_MEMORY_LIMIT = 2048 * 1024 * 1024
 
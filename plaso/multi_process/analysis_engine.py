@@ -3,6 +3,7 @@
 
 import collections
 import os
+import pickle
 import time
 
 from plaso.containers import counts
@@ -33,6 +34,19 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
   _CONTAINER_TYPE_ANALYSIS_REPORT = reports.AnalysisReport.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_TAG = events.EventTag.CONTAINER_TYPE
 
+  # The number of events that are read from storage together with their
+  # event data, event data stream and event tag at a time.
+  _ANALYZE_EVENTS_BATCH_SIZE = 1024
+
+  # The number of events that are serialized and pushed to the analysis
+  # processes as a single item.
+  _EVENT_BATCH_SIZE = 128
+
+  # The maximum number of event batches that are queued per analysis process,
+  # pushing more event batches blocks until the analysis process consumed
+  # some of them.
+  _EVENT_QUEUE_MAXIMUM_BATCHES = 16
+
   _PROCESS_JOIN_TIMEOUT = 5.0
 
   _QUEUE_TIMEOUT = 10 * 60
@@ -114,20 +128,25 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
     filter_limit = getattr(event_filter, 'limit', None)
 
-    for event in storage_writer.GetSortedEvents():
-      event_data_identifier = event.GetEventDataIdentifier()
-      event_data = storage_writer.GetAttributeContainerByIdentifier(
-          events.EventData.CONTAINER_TYPE, event_data_identifier)
+    storage_data_types = None
+    storage_time_range = None
 
-      event_data_stream_identifier = event_data.GetEventDataStreamIdentifier()
-      if event_data_stream_identifier:
-        event_data_stream = storage_writer.GetAttributeContainerByIdentifier(
-            events.EventDataStream.CONTAINER_TYPE, event_data_stream_identifier)
-      else:
-        event_data_stream = None
+    # Let the storage skip events that cannot match the filter. This is only
+    # done when all events are read, since the filter limit depends on
+    # the events that do not match the filter.
+    if event_filter and not filter_limit:
+      storage_time_range, storage_data_types = (
+          event_filter.GetStorageFilterValues())
+
+    number_of_read_events = 0
 
-      event_identifier = event.GetIdentifier()
-      event_tag = storage_writer.GetEventTagByEventIdentifer(event_identifier)
+    event_batch = []
+
+    for event, event_data, event_data_stream, event_tag in (
+        storage_writer.GetSortedEventsWithData(
+            time_range=storage_time_range, data_types=storage_data_types,
+            batch_size=self._ANALYZE_EVENTS_BATCH_SIZE)):
+      number_of_read_events += 1
 
       if event_filter:
         filter_match = event_filter.Match(
@@ -140,9 +159,10 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
         number_of_filtered_events += 1
         continue
 
-      for event_queue in self._event_queues.values():
-        # TODO: Check for premature exit of analysis plugins.
-        event_queue.PushItem((event, event_data, event_data_stream))
+      event_batch.append((event, event_data, event_data_stream))
+      if len(event_batch) >= self._EVENT_BATCH_SIZE:
+        self._PushEventBatch(event_batch)
+        event_batch = []
 
       self._number_of_consumed_events += 1
 
@@ -150,6 +170,14 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
           filter_limit == self._number_of_consumed_events):
         break
 
+    if event_batch:
+      self._PushEventBatch(event_batch)
+
+    if storage_time_range or storage_data_types is not None:
+      # Account for the events that were skipped by the storage.
+      number_of_events = storage_writer.GetNumberOfAttributeContainers('event')
+      number_of_filtered_events += number_of_events - number_of_read_events
+
     logger.debug('Finished pushing events to analysis plugins.')
     # Signal that we have finished adding events.
     for event_queue in self._event_queues.values():
@@ -328,6 +356,23 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
     return number_of_containers
 
+  def _PushEventBatch(self, event_batch):
+    """Pushes a batch of events to the analysis processes.
+
+    The batch is serialized once and the same serialized data is pushed onto
+    the event queue of every analysis process.
+
+    Args:
+      event_batch (list[tuple[EventObject, EventData, EventDataStream]]):
+          events with their corresponding event data and event data stream.
+    """
+    serialized_event_batch = pickle.dumps(
+        event_batch, protocol=pickle.HIGHEST_PROTOCOL)
+
+    for event_queue in self._event_queues.values():
+      # TODO: Check for premature exit of analysis plugins.
+      event_queue.PushItem(serialized_event_batch)
+
   def _StartAnalysisProcesses(self, analysis_plugins):
     """Starts the analysis processes.
 
@@ -363,7 +408,8 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
     queue_name = '{0:s} output event queue'.format(process_name)
     output_event_queue = zeromq_queue.ZeroMQPushBindQueue(
-        name=queue_name, timeout_seconds=self._QUEUE_TIMEOUT)
+        maximum_items=self._EVENT_QUEUE_MAXIMUM_BATCHES, name=queue_name,
+        timeout_seconds=self._QUEUE_TIMEOUT)
     # Open the queue so it can bind to a random port, and we can get the
     # port number to use in the input queue.
     output_event_queue.Open()
@@ -372,7 +418,8 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
     queue_name = '{0:s} input event queue'.format(process_name)
     input_event_queue = zeromq_queue.ZeroMQPullConnectQueue(
-        name=queue_name, delay_open=True, port=output_event_queue.port,
+        delay_open=True, maximum_items=self._EVENT_QUEUE_MAXIMUM_BATCHES,
+        name=queue_name, port=output_event_queue.port,
         timeout_seconds=self._QUEUE_TIMEOUT)
 
     process = analysis_process.AnalysisProcess(
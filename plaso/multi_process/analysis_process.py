@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """The multi-process analysis worker process."""
 
+import pickle
 import threading
 
 from plaso.analysis import mediator as analysis_mediator
@@ -165,9 +166,7 @@ class AnalysisProcess(task_process.MultiProcessTaskProcess):
           logger.debug('ConsumeItems exiting, dequeued QueueAbort object.')
           break
 
-        self._ProcessEvent(self._analysis_mediator, *queued_object)
-
-        self._number_of_consumed_events += 1
+        self._ProcessEventBatch(self._analysis_mediator, queued_object)
 
       logger.debug(
           '{0!s} (PID: {1:d}) stopped monitoring event queue.'.format(
@@ -250,6 +249,25 @@ class AnalysisProcess(task_process.MultiProcessTaskProcess):
       logger.warning('Unhandled exception while processing event object.')
       logger.exception(exception)
 
+  def _ProcessEventBatch(self, mediator, serialized_event_batch):
+    """Processes a batch of events.
+
+    Args:
+      mediator (AnalysisMediator): mediates interactions between
+          analysis plugins and other components, such as storage and dfvfs.
+      serialized_event_batch (bytes): serialized batch of events with their
+          corresponding event data and event data stream.
+    """
+    event_batch = pickle.loads(serialized_event_batch)
+
+    for event, event_data, event_data_stream in event_batch:
+      if self._abort:
+        break
+
+      self._ProcessEvent(mediator, event, event_data, event_data_stream)
+
+      self._number_of_consumed_events += 1
+
   def SignalAbort(self):
     """Signals the process to abort."""
     self._abort = True
@@ -10,6 +10,7 @@ import time
 import traceback
 
 from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.lib import errors as dfvfs_errors
 from dfvfs.resolver import context
 from dfvfs.resolver import resolver as path_spec_resolver
 
@@ -18,7 +19,9 @@ from plaso.containers import event_sources
 from plaso.containers import events
 from plaso.containers import warnings
 from plaso.engine import extractors
+from plaso.engine import fingerprints
 from plaso.engine import path_helper
+from plaso.engine import processing_status
 from plaso.engine import timeliner
 from plaso.lib import definitions
 from plaso.lib import errors
@@ -33,7 +36,14 @@ from plaso.multi_process import zeromq_queue
 
 
 class _EventSourceHeap(object):
-  """Class that defines an event source heap."""
+  """Class that defines an event source heap.
+
+  Directories are popped first, since these produce additional event sources,
+  followed by the other event sources ordered by the size of their data,
+  largest first. Processing the largest files first prevents a large file
+  that is scheduled last from prolonging the processing time while the other
+  workers are idle.
+  """
 
   def __init__(self, maximum_number_of_items=50000):
     """Initializes an event source heap.
@@ -46,6 +56,13 @@ class _EventSourceHeap(object):
     self._heap = []
     self._maximum_number_of_items = maximum_number_of_items
 
+    self.data_size = 0
+
+  @property
+  def number_of_event_sources(self):
+    """int: number of event sources in the heap."""
+    return len(self._heap)
+
   def IsFull(self):
     """Determines if the heap is full.
 
@@ -54,25 +71,45 @@ class _EventSourceHeap(object):
     """
     return len(self._heap) >= self._maximum_number_of_items
 
+  def PeekEventSource(self):
+    """Retrieves the event source on top of the heap without popping it.
+
+    Returns:
+      tuple[EventSource, int]: event source and size of its data, in bytes,
+          or (None, 0) if no event source is available.
+    """
+    try:
+      _, negative_data_size, _, event_source = self._heap[0]
+
+    except IndexError:
+      return None, 0
+
+    return event_source, -negative_data_size
+
   def PopEventSource(self):
     """Pops an event source from the heap.
 
     Returns:
-      EventSource: an event source or None on if no event source is available.
+      tuple[EventSource, int]: event source and size of its data, in bytes,
+          or (None, 0) if no event source is available.
     """
     try:
-      _, _, event_source = heapq.heappop(self._heap)
+      _, negative_data_size, _, event_source = heapq.heappop(self._heap)
 
     except IndexError:
-      return None
+      return None, 0
+
+    self.data_size += negative_data_size
 
-    return event_source
+    return event_source, -negative_data_size
 
-  def PushEventSource(self, event_source):
+  def PushEventSource(self, event_source, data_size=0):
     """Pushes an event source onto the heap.
 
     Args:
       event_source (EventSource): event source.
+      data_size (Optional[int]): size of the data of the event source, in
+          bytes, that is used as estimate of the processing cost.
     """
     if event_source.file_entry_type == (
         dfvfs_definitions.FILE_ENTRY_TYPE_DIRECTORY):
@@ -80,9 +117,11 @@ class _EventSourceHeap(object):
     else:
       weight = 100
 
-    heap_values = (weight, time.time(), event_source)
+    heap_values = (weight, -data_size, time.time(), event_source)
     heapq.heappush(self._heap, heap_values)
 
+    self.data_size += data_size
+
 
 class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
   """Task-based multi-process extraction engine.
@@ -96,6 +135,8 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
   _CONTAINER_TYPE_EVENT_DATA = events.EventData.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_DATA_STREAM = events.EventDataStream.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_SOURCE = event_sources.EventSource.CONTAINER_TYPE
+  _CONTAINER_TYPE_RECORD_RANGE_EVENT_SOURCE = (
+      event_sources.RecordRangeEventSource.CONTAINER_TYPE)
 
   # Maximum number of dfVFS file system objects to cache in the foreman process.
   _FILE_SYSTEM_CACHE_SIZE = 3
@@ -103,6 +144,9 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
   # Maximum number of concurrent tasks.
   _MAXIMUM_NUMBER_OF_TASKS = 10000
 
+  # Maximum cumulative size of the files processed by a batch task.
+  _MAXIMUM_TASK_BATCH_DATA_SIZE = 4 * 1024 * 1024
+
   _TASK_QUEUE_TIMEOUT_SECONDS = 2
 
   _WORKER_PROCESSES_MINIMUM = 2
@@ -112,7 +156,7 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
   def __init__(
       self, maximum_number_of_tasks=None, number_of_worker_processes=0,
-      status_update_callback=None, worker_memory_limit=None,
+      status_update_callback=None, task_batch_size=1, worker_memory_limit=None,
       worker_timeout=None):
     """Initializes an engine.
 
@@ -122,6 +166,9 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
       number_of_worker_processes (Optional[int]): number of worker processes.
       status_update_callback (Optional[function]): callback function for status
           updates.
+      task_batch_size (Optional[int]): maximum number of event sources of
+          small files that are processed by a single task, where 1 represents
+          a task per event source.
       worker_memory_limit (Optional[int]): maximum amount of memory a worker is
           allowed to consume, where None represents the default memory limit
           and 0 represents no limit.
@@ -166,8 +213,10 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     super(ExtractionMultiProcessEngine, self).__init__()
     self._enable_sigsegv_handler = False
     self._event_data_timeliner = None
+    self._event_source_heap = None
     self._extraction_worker = None
     self._file_system_cache = []
+    self._fingerprinter = None
     self._maximum_number_of_containers = 50
     self._maximum_number_of_tasks = maximum_number_of_tasks
     self._merge_task = None
@@ -178,11 +227,14 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     self._number_of_produced_events = 0
     self._number_of_produced_sources = 0
     self._number_of_worker_processes = number_of_worker_processes
+    self._parse_cache_status_per_pid = {}
     self._path_spec_extractor = extractors.PathSpecExtractor()
+    self._record_range_event_data_streams = {}
     self._resolver_context = context.Context()
     self._status = definitions.STATUS_INDICATOR_IDLE
     self._status_update_callback = status_update_callback
     self._system_configurations = None
+    self._task_batch_size = task_batch_size
     self._task_manager = task_manager.TaskManager()
     self._task_merge_helper = None
     self._task_merge_helper_on_hold = None
@@ -193,6 +245,44 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     self._worker_memory_limit = worker_memory_limit
     self._worker_timeout = worker_timeout
 
+  def _AddEventSourcesToTask(self, event_source_heap, task, data_size):
+    """Adds event sources of small files to a task to make it a batch task.
+
+    Event sources are taken from the top of the heap as long as these are
+    files and the maximum number of event sources and cumulative size of the
+    files of the batch task are not exceeded.
+
+    Args:
+      event_source_heap (_EventSourceHeap): event source heap.
+      task (Task): task.
+      data_size (int): size of the file of the event source of the task.
+    """
+    path_specs = [task.path_spec]
+
+    while len(path_specs) < self._task_batch_size:
+      event_source, event_source_data_size = (
+          event_source_heap.PeekEventSource())
+      if not event_source or event_source.file_entry_type != (
+          dfvfs_definitions.FILE_ENTRY_TYPE_FILE):
+        break
+
+      if event_source.CONTAINER_TYPE == (
+          self._CONTAINER_TYPE_RECORD_RANGE_EVENT_SOURCE):
+        break
+
+      data_size += event_source_data_size
+      if data_size > self._MAXIMUM_TASK_BATCH_DATA_SIZE:
+        break
+
+      path_specs.append(event_source.path_spec)
+
+      event_source_heap.PopEventSource()
+
+      self._number_of_consumed_sources += 1
+
+    if len(path_specs) > 1:
+      task.path_specs = path_specs
+
   def _CacheFileSystem(self, file_system):
     """Caches a dfVFS file system object.
 
@@ -292,41 +382,40 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
             f'unable to process path specification with error: '
             f'{exception!s}'), file_system_path_spec)
 
-  def _CreateTask(self, storage_writer, session_identifier, event_source):
+  def _CreateTask(
+      self, session_identifier, event_source, data_size=0,
+      event_source_heap=None):
     """Creates a task to processes an event source.
 
     Args:
-      storage_writer (StorageWriter): storage writer for a session storage.
       session_identifier (str): the identifier of the session the tasks are
           part of.
       event_source (EventSource): event source.
+      data_size (Optional[int]): size of the data of the event source, in
+          bytes.
+      event_source_heap (Optional[_EventSourceHeap]): event source heap to
+          take additional event sources from, when the event source is a small
+          file that can be processed in a batch task.
 
     Returns:
-      Task: task or None if no task could be created.
+      Task: task.
     """
-    file_entry = path_spec_resolver.Resolver.OpenFileEntry(
-        event_source.path_spec, resolver_context=self._resolver_context)
-    if file_entry is None:
-      self._ProduceExtractionWarning(
-          storage_writer, 'Unable to open file entry', event_source.path_spec)
-      return None
-
-    file_system = file_entry.GetFileSystem()
-
-    if not event_source.path_spec.IsSystemLevel():
-      self._CacheFileSystem(file_system)
-
-    if self._CheckExcludedPathSpec(file_system, event_source.path_spec):
-      display_name = path_helper.PathHelper.GetDisplayNameForPathSpec(
-          event_source.path_spec)
-      logger.debug(f'Excluded from extraction: {display_name:s}.')
-      return None
-
     task = self._task_manager.CreateTask(
         session_identifier, storage_format=self._task_storage_format)
     task.file_entry_type = event_source.file_entry_type
     task.path_spec = event_source.path_spec
 
+    if event_source.CONTAINER_TYPE == (
+        self._CONTAINER_TYPE_RECORD_RANGE_EVENT_SOURCE):
+      task.first_record_index = event_source.first_record_index
+      task.number_of_records = event_source.number_of_records
+      task.parser_name = event_source.parser_name
+
+    elif event_source_heap and self._task_batch_size > 1 and (
+        event_source.file_entry_type == dfvfs_definitions.FILE_ENTRY_TYPE_FILE):
+      if data_size < self._MAXIMUM_TASK_BATCH_DATA_SIZE:
+        self._AddEventSourcesToTask(event_source_heap, task, data_size)
+
     return task
 
   def _FillEventSourceHeap(
@@ -354,7 +443,7 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
       self._processing_profiler.StopTiming('get_event_source')
 
     while event_source:
-      event_source_heap.PushEventSource(event_source)
+      self._PushEventSource(storage_writer, event_source_heap, event_source)
       if event_source_heap.IsFull():
         logger.debug('Event source heap is full.')
         break
@@ -383,112 +472,126 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
         line.translate(definitions.NON_PRINTABLE_CHARACTER_TRANSLATION_TABLE)
         for line in path_spec.comparable.split('\n')])
 
-  def _MergeAttributeContainer(self, storage_writer, merge_helper, container):
-    """Merges an attribute container from a task store into the storage writer.
+  def _MergeAttributeContainerBatch(
+      self, storage_writer, merge_helper, containers):
+    """Merges a batch of attribute containers into the storage writer.
+
+    References to event data streams and Windows EventLog message files are
+    remapped to the corresponding identifiers in the session storage before
+    the batch is added with a single bulk write.
 
     Args:
       storage_writer (StorageWriter): storage writer.
       merge_helper (ExtractionTaskMergeHelper): helper to merge attribute
           containers.
-      container (AttributeContainer): attribute container.
+      containers (list[AttributeContainer]): attribute containers of the same
+          type.
     """
     self._status = definitions.STATUS_INDICATOR_MERGING
 
-    if container.CONTAINER_TYPE in (
+    container_type = containers[0].CONTAINER_TYPE
+
+    if container_type in (
         self._CONTAINER_TYPE_DATE_LESS_LOG_HELPER,
         self._CONTAINER_TYPE_EVENT_DATA):
-      event_data_stream_identifier = container.GetEventDataStreamIdentifier()
-      event_data_stream_lookup_key = None
-      if event_data_stream_identifier:
-        event_data_stream_lookup_key = (
-            event_data_stream_identifier.CopyToString())
-
-        event_data_stream_identifier = (
-            merge_helper.GetAttributeContainerIdentifier(
-                event_data_stream_lookup_key))
-
-      if event_data_stream_identifier:
-        container.SetEventDataStreamIdentifier(event_data_stream_identifier)
-      elif event_data_stream_lookup_key:
-        identifier = container.GetIdentifier()
-        identifier_string = identifier.CopyToString()
-
-        # TODO: store this as a merge warning so this is preserved
-        # in the storage file.
-        logger.error((
-            f'Unable to merge {container.CONTAINER_TYPE:s} attribute '
-            f'container: {identifier_string:s} since corresponding event '
-            f'data stream: {event_data_stream_lookup_key:s} could not be '
-            f'found.'))
-        return
+      containers = [
+          container for container in containers
+          if self._RemapEventDataStreamIdentifier(merge_helper, container)]
 
-    elif container.CONTAINER_TYPE in (
+    elif container_type in (
         'windows_eventlog_message_string', 'windows_wevt_template_event'):
-      message_file_identifier = container.GetMessageFileIdentifier()
-      message_file_lookup_key = message_file_identifier.CopyToString()
+      containers = [
+          container for container in containers
+          if self._RemapMessageFileIdentifier(merge_helper, container)]
 
-      message_file_identifier = merge_helper.GetAttributeContainerIdentifier(
-          message_file_lookup_key)
+    if not containers:
+      self._status = definitions.STATUS_INDICATOR_RUNNING
+      return
 
-      if message_file_identifier:
-        container.SetMessageFileIdentifier(message_file_identifier)
-      else:
-        identifier = container.GetIdentifier()
-        identifier_string = identifier.CopyToString()
+    if container_type == self._CONTAINER_TYPE_RECORD_RANGE_EVENT_SOURCE:
+      # Record ranges are scheduled directly and not stored in the session
+      # storage, since these only represent part of an already stored event
+      # source.
+      for container in containers:
+        if self._event_source_heap:
+          self._PushEventSource(
+              storage_writer, self._event_source_heap, container)
 
-        # TODO: store this as a merge warning so this is preserved
-        # in the storage file.
-        if container.CONTAINER_TYPE == 'windows_eventlog_message_string':
-          description = 'Windows EventLog message string'
-        else:
-          description = 'WEVT_TEMPLATE event definition'
+        if self._fingerprinter:
+          self._fingerprinter.AddPendingRecordRange(container.path_spec)
 
-        logger.error((
-            f'Unable to merge {description:s} attribute container: '
-            f'{identifier_string:s} since corresponding Windows EventLog '
-            f'message file: {message_file_lookup_key:s} could not be found.'))
+        self._record_range_event_data_streams.setdefault(
+            container.path_spec.comparable, None)
+
+      self._number_of_produced_sources += len(containers)
+
+      self._status = definitions.STATUS_INDICATOR_RUNNING
+      return
+
+    if (container_type == self._CONTAINER_TYPE_EVENT_DATA_STREAM and
+        self._record_range_event_data_streams):
+      containers = self._RemapRecordRangeEventDataStreams(
+          merge_helper, containers)
+      if not containers:
+        self._status = definitions.STATUS_INDICATOR_RUNNING
         return
 
-    lookup_key = None
-    if container.CONTAINER_TYPE in (
+    task_identifiers = None
+    if container_type in (
         self._CONTAINER_TYPE_EVENT_DATA,
         self._CONTAINER_TYPE_EVENT_DATA_STREAM,
         'windows_eventlog_message_file'):
-      # Preserve the lookup key before adding it to the attribute container
-      # store.
-      identifier = container.GetIdentifier()
-      lookup_key = identifier.CopyToString()
-
-    storage_writer.AddAttributeContainer(container)
-
-    if lookup_key:
-      identifier = container.GetIdentifier()
-      merge_helper.SetAttributeContainerIdentifier(lookup_key, identifier)
-
-    if container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_DATA:
-      self._number_of_produced_event_data += 1
-
+      # Preserve the task identifiers before adding the containers to
+      # the attribute container store.
+      task_identifiers = [container.GetIdentifier() for container in containers]
+
+    storage_writer.AddAttributeContainers(containers)
+
+    if task_identifiers:
+      merge_helper.SetAttributeContainerIdentifiers(task_identifiers, [
+          container.GetIdentifier() for container in containers])
+
+    if (container_type == self._CONTAINER_TYPE_EVENT_DATA_STREAM and
+        self._record_range_event_data_streams and
+        not self._merge_task.parser_name):
+      for container in containers:
+        lookup_key = getattr(container.path_spec, 'comparable', None)
+        if lookup_key in self._record_range_event_data_streams:
+          self._record_range_event_data_streams[lookup_key] = (
+              container.GetIdentifier())
+
+    if (container_type == self._CONTAINER_TYPE_EVENT_DATA_STREAM and
+        self._fingerprinter):
+      # The digest of a fingerprint is taken from the event data stream, so
+      # that the foreman does not need to read the file entry.
+      for container in containers:
+        self._fingerprinter.SetDigest(container)
+
+    if container_type == self._CONTAINER_TYPE_EVENT_DATA:
       self._status = definitions.STATUS_INDICATOR_TIMELINING
 
-      event_data_stream_identifier = container.GetEventDataStreamIdentifier()
+      for container in containers:
+        self._number_of_produced_event_data += 1
+
+        event_data_stream_identifier = container.GetEventDataStreamIdentifier()
 
-      event_data_stream = None
-      if event_data_stream_identifier:
-        event_data_stream = (
-            self._storage_writer.GetAttributeContainerByIdentifier(
-                self._CONTAINER_TYPE_EVENT_DATA_STREAM,
-                event_data_stream_identifier))
+        event_data_stream = None
+        if event_data_stream_identifier:
+          event_data_stream = (
+              self._storage_writer.GetAttributeContainerByIdentifier(
+                  self._CONTAINER_TYPE_EVENT_DATA_STREAM,
+                  event_data_stream_identifier))
 
-      # Generate events on merge.
-      self._event_data_timeliner.ProcessEventData(
-          storage_writer, container, event_data_stream)
+        # Generate events on merge.
+        self._event_data_timeliner.ProcessEventData(
+            storage_writer, container, event_data_stream)
 
-      self._number_of_consumed_event_data += 1
-      self._number_of_produced_events += (
-          self._event_data_timeliner.number_of_produced_events)
+        self._number_of_consumed_event_data += 1
+        self._number_of_produced_events += (
+            self._event_data_timeliner.number_of_produced_events)
 
-    elif container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_SOURCE:
-      self._number_of_produced_sources += 1
+    elif container_type == self._CONTAINER_TYPE_EVENT_SOURCE:
+      self._number_of_produced_sources += len(containers)
 
     self._status = definitions.STATUS_INDICATOR_RUNNING
 
@@ -508,17 +611,22 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     """
     number_of_containers = 0
 
-    container = merge_helper.GetAttributeContainer()
+    while (maximum_number_of_containers <= 0 or
+           number_of_containers < maximum_number_of_containers):
+      maximum_number_of_batch_containers = 0
+      if maximum_number_of_containers > 0:
+        maximum_number_of_batch_containers = (
+            maximum_number_of_containers - number_of_containers)
 
-    while container:
-      number_of_containers += 1
-
-      self._MergeAttributeContainer(storage_writer, merge_helper, container)
-
-      if 0 < maximum_number_of_containers <= number_of_containers:
+      containers = merge_helper.GetAttributeContainers(
+          maximum_number_of_containers=maximum_number_of_batch_containers)
+      if not containers:
         break
 
-      container = merge_helper.GetAttributeContainer()
+      number_of_containers += len(containers)
+
+      self._MergeAttributeContainerBatch(
+          storage_writer, merge_helper, containers)
 
     return number_of_containers
 
@@ -599,16 +707,26 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
               f'error: {exception!s}'))
           self._task_merge_helper = None
 
+      merge_failed = False
+
       if self._task_merge_helper:
         merge_duration = time.time()
 
-        number_of_containers = self._MergeAttributeContainers(
-            storage_writer, self._task_merge_helper,
-            maximum_number_of_containers=self._maximum_number_of_containers)
+        try:
+          number_of_containers = self._MergeAttributeContainers(
+              storage_writer, self._task_merge_helper,
+              maximum_number_of_containers=self._maximum_number_of_containers)
+
+        except (IOError, OSError) as exception:
+          logger.error((
+              f'Unable to merge results of task: '
+              f'{self._merge_task.identifier:s} with error: {exception!s}'))
+          merge_failed = True
+          number_of_containers = 0
 
         merge_duration = time.time() - merge_duration
 
-        fully_merged = self._task_merge_helper.fully_merged
+        fully_merged = merge_failed or self._task_merge_helper.fully_merged
 
         if merge_duration > 0.0 and number_of_containers > 0:
           # Limit the number of attribute containers from a single task-based
@@ -629,12 +747,35 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
         # retrying the task once that is implemented. For now, we mark the task
         # as fully merged because we can't continue with it.
         fully_merged = True
+        merge_failed = True
 
       if self._processing_profiler:
         self._processing_profiler.StopTiming('merge')
 
       if fully_merged:
-        self._task_merge_helper.Close()
+        if self._task_merge_helper:
+          self._task_merge_helper.Close()
+
+        path_specs = (
+            self._merge_task.path_specs or [self._merge_task.path_spec])
+
+        if merge_failed:
+          # The results of the task can be partially merged, hence the path
+          # specifications of the task are reported as not processed.
+          self._task_manager.SampleTaskStatus(self._merge_task, 'merge_failed')
+
+          for path_spec in path_specs:
+            self._ProduceExtractionWarning(
+                storage_writer, 'unable to merge results of task', path_spec)
+
+            if self._fingerprinter:
+              self._fingerprinter.DiscardFingerprint(path_spec)
+
+        elif self._fingerprinter:
+          # The fingerprint of a file entry is only recorded once the results
+          # of the task that processed it are merged.
+          for path_spec in path_specs:
+            self._fingerprinter.RecordFingerprint(storage_writer, path_spec)
 
         self._RemoveMergeTaskStorage(
             self._task_storage_format, self._merge_task)
@@ -659,6 +800,37 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
           self._task_manager.SampleTaskStatus(self._merge_task, 'merge_resumed')
 
+  def _OpenEventSourceFileEntry(self, storage_writer, event_source):
+    """Opens the file entry of an event source.
+
+    Args:
+      storage_writer (StorageWriter): storage writer for a session storage.
+      event_source (EventSource): event source.
+
+    Returns:
+      dfvfs.FileEntry: file entry or None if the file entry could not be
+          opened or is excluded from extraction.
+    """
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(
+        event_source.path_spec, resolver_context=self._resolver_context)
+    if file_entry is None:
+      self._ProduceExtractionWarning(
+          storage_writer, 'Unable to open file entry', event_source.path_spec)
+      return None
+
+    file_system = file_entry.GetFileSystem()
+
+    if not event_source.path_spec.IsSystemLevel():
+      self._CacheFileSystem(file_system)
+
+    if self._CheckExcludedPathSpec(file_system, event_source.path_spec):
+      display_name = path_helper.PathHelper.GetDisplayNameForPathSpec(
+          event_source.path_spec)
+      logger.debug(f'Excluded from extraction: {display_name:s}.')
+      return None
+
+    return file_entry
+
   def _ProduceExtractionWarning(self, storage_writer, message, path_spec):
     """Produces an extraction warning.
 
@@ -694,11 +866,12 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     # handle abort path.
 
     event_source_heap = _EventSourceHeap()
+    self._event_source_heap = event_source_heap
 
     self._FillEventSourceHeap(
         storage_writer, event_source_heap, start_with_first=True)
 
-    event_source = event_source_heap.PopEventSource()
+    event_source, data_size = event_source_heap.PopEventSource()
 
     task = None
     has_pending_tasks = True
@@ -713,7 +886,8 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
         if not task and event_source:
           task = self._CreateTask(
-              storage_writer, session_identifier, event_source)
+              session_identifier, event_source, data_size=data_size,
+              event_source_heap=event_source_heap)
 
           event_source = None
 
@@ -724,10 +898,17 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
             self._task_manager.SampleTaskStatus(task, 'schedule_attempted')
 
           else:
-            path_spec_string = self._GetPathSpecificationString(task.path_spec)
-            logger.debug((
-                f'Scheduled task: {task.identifier:s} for path specification: '
-                f'{path_spec_string:s}'))
+            if task.path_specs:
+              number_of_path_specs = len(task.path_specs)
+              logger.debug((
+                  f'Scheduled batch task: {task.identifier:s} for '
+                  f'{number_of_path_specs:d} path specifications'))
+            else:
+              path_spec_string = self._GetPathSpecificationString(
+                  task.path_spec)
+              logger.debug((
+                  f'Scheduled task: {task.identifier:s} for path '
+                  f'specification: {path_spec_string:s}'))
 
             self._task_manager.SampleTaskStatus(task, 'scheduled')
 
@@ -741,7 +922,7 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
           self._FillEventSourceHeap(storage_writer, event_source_heap)
 
         if not task and not event_source:
-          event_source = event_source_heap.PopEventSource()
+          event_source, data_size = event_source_heap.PopEventSource()
 
         has_pending_tasks = self._task_manager.HasPendingTasks()
 
@@ -764,10 +945,12 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
         event_source = None
 
     for task in self._task_manager.GetFailedTasks():
-      self._ProduceExtractionWarning(
-          storage_writer, 'Worker failed to process path specification',
-          task.path_spec)
+      for path_spec in task.path_specs or [task.path_spec]:
+        self._ProduceExtractionWarning(
+            storage_writer, 'Worker failed to process path specification',
+            path_spec)
 
+    self._event_source_heap = None
     self._status = definitions.STATUS_INDICATOR_IDLE
 
     if self._abort:
@@ -794,6 +977,7 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     self._number_of_produced_event_data = 0
     self._number_of_produced_events = 0
     self._number_of_produced_sources = 0
+    self._record_range_event_data_streams = {}
 
     stored_parsers_counter = collections.Counter({
         parser_count.name: parser_count
@@ -827,6 +1011,14 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     self._UpdateForemanProcessStatus()
 
     tasks_status = self._task_manager.GetStatusInformation()
+
+    event_source_heap = self._event_source_heap
+    if event_source_heap:
+      tasks_status.number_of_queued_event_sources = (
+          event_source_heap.number_of_event_sources)
+      tasks_status.queued_event_sources_data_size = (
+          event_source_heap.data_size)
+
     if self._task_queue_profiler:
       self._task_queue_profiler.Sample(tasks_status)
 
@@ -835,6 +1027,153 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     if self._status_update_callback:
       self._status_update_callback(self._processing_status)
 
+  def _PushEventSource(self, storage_writer, event_source_heap, event_source):
+    """Pushes an event source onto the event source heap.
+
+    The file entry of the event source is opened once, to determine the size
+    of its data. Event sources of file entries that cannot be opened, are
+    excluded from extraction or are unchanged since a previous session are
+    not pushed onto the heap.
+
+    Args:
+      storage_writer (StorageWriter): storage writer for a session storage.
+      event_source_heap (_EventSourceHeap): event source heap.
+      event_source (EventSource): event source.
+    """
+    if event_source.CONTAINER_TYPE == (
+        self._CONTAINER_TYPE_RECORD_RANGE_EVENT_SOURCE):
+      # The file of a record range was already checked when the task that
+      # split it into record ranges was created.
+      data_size = (
+          self._processing_configuration.extraction.record_range_data_size)
+      event_source_heap.PushEventSource(event_source, data_size=data_size)
+      return
+
+    try:
+      file_entry = self._OpenEventSourceFileEntry(storage_writer, event_source)
+    except (IOError, OSError, dfvfs_errors.Error) as exception:
+      self._ProduceExtractionWarning(storage_writer, (
+          f'unable to open file entry with error: {exception!s}'),
+          event_source.path_spec)
+      file_entry = None
+
+    if file_entry and self._fingerprinter and (
+        self._fingerprinter.CheckFileEntry(file_entry)):
+      file_entry = None
+
+    if not file_entry:
+      self._number_of_consumed_sources += 1
+      return
+
+    data_size = 0
+    if event_source.file_entry_type == dfvfs_definitions.FILE_ENTRY_TYPE_FILE:
+      data_size = file_entry.size or 0
+
+    event_source_heap.PushEventSource(event_source, data_size=data_size)
+
+  def _RemapEventDataStreamIdentifier(self, merge_helper, container):
+    """Remaps the event data stream identifier of a container.
+
+    Args:
+      merge_helper (ExtractionTaskMergeHelper): helper to merge attribute
+          containers.
+      container (AttributeContainer): date-less log helper or event data
+          attribute container.
+
+    Returns:
+      bool: True if the container can be merged, False otherwise.
+    """
+    task_identifier = container.GetEventDataStreamIdentifier()
+    if not task_identifier:
+      return True
+
+    identifier = merge_helper.GetAttributeContainerIdentifier(task_identifier)
+    if identifier:
+      container.SetEventDataStreamIdentifier(identifier)
+      return True
+
+    identifier = container.GetIdentifier()
+    identifier_string = identifier.CopyToString()
+    task_identifier_string = task_identifier.CopyToString()
+
+    # TODO: store this as a merge warning so this is preserved
+    # in the storage file.
+    logger.error((
+        f'Unable to merge {container.CONTAINER_TYPE:s} attribute '
+        f'container: {identifier_string:s} since corresponding event '
+        f'data stream: {task_identifier_string:s} could not be found.'))
+    return False
+
+  def _RemapMessageFileIdentifier(self, merge_helper, container):
+    """Remaps the Windows EventLog message file identifier of a container.
+
+    Args:
+      merge_helper (ExtractionTaskMergeHelper): helper to merge attribute
+          containers.
+      container (AttributeContainer): Windows EventLog message string or
+          WEVT_TEMPLATE event definition attribute container.
+
+    Returns:
+      bool: True if the container can be merged, False otherwise.
+    """
+    task_identifier = container.GetMessageFileIdentifier()
+
+    identifier = merge_helper.GetAttributeContainerIdentifier(task_identifier)
+    if identifier:
+      container.SetMessageFileIdentifier(identifier)
+      return True
+
+    identifier = container.GetIdentifier()
+    identifier_string = identifier.CopyToString()
+    task_identifier_string = task_identifier.CopyToString()
+
+    # TODO: store this as a merge warning so this is preserved
+    # in the storage file.
+    if container.CONTAINER_TYPE == 'windows_eventlog_message_string':
+      description = 'Windows EventLog message string'
+    else:
+      description = 'WEVT_TEMPLATE event definition'
+
+    logger.error((
+        f'Unable to merge {description:s} attribute container: '
+        f'{identifier_string:s} since corresponding Windows EventLog '
+        f'message file: {task_identifier_string:s} could not be found.'))
+    return False
+
+  def _RemapRecordRangeEventDataStreams(self, merge_helper, containers):
+    """Remaps event data streams of record ranges to the stored one.
+
+    A data stream that is split into record ranges is processed by a task per
+    record range, which each produce an event data stream. Only the event data
+    stream of the task that split the data stream is stored, the event data
+    streams of the record range tasks are remapped to it.
+
+    Args:
+      merge_helper (ExtractionTaskMergeHelper): helper to merge attribute
+          containers.
+      containers (list[EventDataStream]): event data streams.
+
+    Returns:
+      list[EventDataStream]: event data streams that need to be stored.
+    """
+    remaining_containers = []
+    task_identifiers = []
+    identifiers = []
+    for container in containers:
+      lookup_key = getattr(container.path_spec, 'comparable', None)
+      identifier = self._record_range_event_data_streams.get(lookup_key, None)
+      if not identifier:
+        remaining_containers.append(container)
+      else:
+        task_identifiers.append(container.GetIdentifier())
+        identifiers.append(identifier)
+
+    if task_identifiers:
+      merge_helper.SetAttributeContainerIdentifiers(
+          task_identifiers, identifiers)
+
+    return remaining_containers
+
   def _ScheduleTask(self, task):
     """Schedules a task.
 
@@ -985,7 +1324,7 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
     process = self._processes_per_pid[pid]
 
-    processing_status = process_status.get('processing_status', None)
+    status_indicator = process_status.get('processing_status', None)
 
     self._RaiseIfNotMonitored(pid)
 
@@ -1006,7 +1345,7 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     number_of_produced_sources = process_status.get(
         'number_of_produced_sources', None)
 
-    if processing_status != definitions.STATUS_INDICATOR_IDLE:
+    if status_indicator != definitions.STATUS_INDICATOR_IDLE:
       last_activity_timestamp = process_status.get(
           'last_activity_timestamp', 0.0)
 
@@ -1018,15 +1357,25 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
           logger.error((
               f'Process {process.name:s} (PID: {pid:d}) has not reported '
               f'activity within the timeout period.'))
-          processing_status = definitions.STATUS_INDICATOR_NOT_RESPONDING
+          status_indicator = definitions.STATUS_INDICATOR_NOT_RESPONDING
 
     self._processing_status.UpdateWorkerStatus(
-        process.name, processing_status, pid, used_memory, display_name,
+        process.name, status_indicator, pid, used_memory, display_name,
         number_of_consumed_sources, number_of_produced_sources,
         number_of_consumed_event_data, number_of_produced_event_data,
         number_of_consumed_events, number_of_produced_events,
         0, 0, 0, 0)
 
+    number_of_parse_cache_hits = process_status.get(
+        'number_of_parse_cache_hits', None)
+    number_of_parse_cache_misses = process_status.get(
+        'number_of_parse_cache_misses', None)
+    parse_cache_time_saved = process_status.get('parse_cache_time_saved', None)
+    if number_of_parse_cache_hits or number_of_parse_cache_misses:
+      self._parse_cache_status_per_pid[pid] = (
+          number_of_parse_cache_hits, number_of_parse_cache_misses,
+          parse_cache_time_saved or 0.0)
+
     task_identifier = process_status.get('task_identifier', '')
     if not task_identifier:
       return
@@ -1049,11 +1398,40 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     self._UpdateForemanProcessStatus()
 
     tasks_status = self._task_manager.GetStatusInformation()
+
+    event_source_heap = self._event_source_heap
+    if event_source_heap:
+      tasks_status.number_of_queued_event_sources = (
+          event_source_heap.number_of_event_sources)
+      tasks_status.queued_event_sources_data_size = (
+          event_source_heap.data_size)
+
     if self._task_queue_profiler:
       self._task_queue_profiler.Sample(tasks_status)
 
     self._processing_status.UpdateTasksStatus(tasks_status)
 
+    if self._fingerprinter:
+      incremental_extraction_status = (
+          processing_status.IncrementalExtractionStatus())
+      incremental_extraction_status.number_of_parsed_file_entries = (
+          self._fingerprinter.number_of_parsed_file_entries)
+      incremental_extraction_status.number_of_skipped_file_entries = (
+          self._fingerprinter.number_of_skipped_file_entries)
+
+      self._processing_status.UpdateIncrementalExtractionStatus(
+          incremental_extraction_status)
+
+    if self._parse_cache_status_per_pid:
+      parse_cache_status = processing_status.ParseCacheStatus()
+      for number_of_hits, number_of_misses, time_saved in (
+          self._parse_cache_status_per_pid.values()):
+        parse_cache_status.number_of_hits += number_of_hits
+        parse_cache_status.number_of_misses += number_of_misses
+        parse_cache_status.time_saved += time_saved
+
+      self._processing_status.UpdateParseCacheStatus(parse_cache_status)
+
     if self._status_update_callback:
       self._status_update_callback(self._processing_status)
 
@@ -1128,6 +1506,13 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     self._windows_event_log_providers = list(
         storage_writer.GetAttributeContainers('windows_eventlog_provider'))
 
+    self._fingerprinter = None
+    if processing_configuration.incremental_extraction:
+      self._fingerprinter = fingerprints.FileEntryFingerprinter(
+          calculate_digest=(
+              processing_configuration.incremental_extraction_digest))
+      self._fingerprinter.ReadFingerprints(storage_writer)
+
     # Set up the task queue.
     task_outbound_queue = zeromq_queue.ZeroMQBufferedReplyBindQueue(
         delay_open=True, linger_seconds=0, maximum_items=1,
@@ -1194,6 +1579,17 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     # close is a failsafe.
     self._task_queue.Close(abort=True)
 
+    # Close task stores that were not fully merged, for example on abort.
+    for merge_helper in (
+        self._task_merge_helper, self._task_merge_helper_on_hold):
+      if merge_helper:
+        merge_helper.Close()
+
+    self._merge_task = None
+    self._merge_task_on_hold = None
+    self._task_merge_helper = None
+    self._task_merge_helper_on_hold = None
+
     if self._processing_status.error_path_specs:
       task_storage_abort = True
     else:
@@ -1219,7 +1615,9 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     self._enable_sigsegv_handler = None
     self._event_data_timeliner = None
     self._file_system_cache = []
+    self._fingerprinter = None
     self._processing_configuration = None
+    self._record_range_event_data_streams = {}
     self._storage_file_path = None
     self._storage_writer = None
     self._system_configurations = None
@@ -108,6 +108,8 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
         processing_configuration.preferred_codepage)
     parser_mediator.SetPreferredLanguage(
         processing_configuration.preferred_language)
+    parser_mediator.SetRecordRangeDataSize(
+        processing_configuration.extraction.record_range_data_size)
     parser_mediator.SetTemporaryDirectory(
         processing_configuration.temporary_directory)
 
@@ -139,6 +141,17 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
       last_activity_timestamp = 0.0
       processing_status = self._status
 
+    if self._extraction_worker:
+      number_of_parse_cache_hits = (
+          self._extraction_worker.number_of_parse_cache_hits)
+      number_of_parse_cache_misses = (
+          self._extraction_worker.number_of_parse_cache_misses)
+      parse_cache_time_saved = self._extraction_worker.parse_cache_time_saved
+    else:
+      number_of_parse_cache_hits = None
+      number_of_parse_cache_misses = None
+      parse_cache_time_saved = None
+
     task_identifier = getattr(self._task, 'identifier', '')
 
     if self._process_information:
@@ -161,10 +174,13 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
         'number_of_consumed_event_tags': None,
         'number_of_consumed_events': None,
         'number_of_consumed_sources': self._number_of_consumed_sources,
+        'number_of_parse_cache_hits': number_of_parse_cache_hits,
+        'number_of_parse_cache_misses': number_of_parse_cache_misses,
         'number_of_produced_event_data': number_of_produced_event_data,
         'number_of_produced_event_tags': None,
         'number_of_produced_events': None,
         'number_of_produced_sources': number_of_produced_sources,
+        'parse_cache_time_saved': parse_cache_time_saved,
         'processing_status': processing_status,
         'task_identifier': task_identifier,
         'used_memory': used_memory}
@@ -253,6 +269,9 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
     self._StopProfiling()
     self._parser_mediator.StopProfiling()
 
+    self._extraction_worker.CloseParseCache()
+    self._extraction_worker.StopAnalyzerThreads()
+
     self._extraction_worker = None
     self._file_system_cache = []
     self._parser_mediator = None
@@ -307,6 +326,33 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
             f'{self._current_display_name:s}.'))
         logger.exception(exception)
 
+  def _ProcessRecordRange(self, extraction_worker, parser_mediator, task):
+    """Processes a record range.
+
+    Args:
+      extraction_worker (worker.ExtractionWorker): extraction worker.
+      parser_mediator (ParserMediator): parser mediator.
+      task (Task): task that processes the record range.
+    """
+    self._current_display_name = parser_mediator.GetDisplayNameForPathSpec(
+        task.path_spec)
+
+    try:
+      extraction_worker.ProcessRecordRange(
+          parser_mediator, task.path_spec, task.parser_name,
+          task.first_record_index, task.number_of_records)
+
+    except Exception as exception:  # pylint: disable=broad-except
+      parser_mediator.ProduceExtractionWarning((
+          f'unable to process record range with error: {exception!s}'),
+          path_spec=task.path_spec)
+
+      if self._processing_configuration.debug_output:
+        logger.warning((
+            f'Unhandled exception while processing record range of: '
+            f'{self._current_display_name:s}.'))
+        logger.exception(exception)
+
   def _ProcessTask(self, task):
     """Processes a task.
 
@@ -336,16 +382,31 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
     storage_file_path = self._GetTaskStorageFilePath(
         self._processing_configuration.task_storage_format, task)
     task_storage_writer.Open(
-        path=storage_file_path, session_identifier=task.session_identifier,
+        path=storage_file_path,
+        compression_format=(
+            self._processing_configuration.task_compression_format),
+        serialization_format=(
+            self._processing_configuration.task_serialization_format),
+        session_identifier=task.session_identifier,
         task_identifier=task.identifier)
 
     try:
       task_storage_writer.AddAttributeContainer(task)
 
       # TODO: add support for more task types.
-      self._ProcessPathSpec(
-          self._extraction_worker, self._parser_mediator, task.path_spec)
-      self._number_of_consumed_sources += 1
+      if task.parser_name:
+        self._ProcessRecordRange(
+            self._extraction_worker, self._parser_mediator, task)
+        self._number_of_consumed_sources += 1
+
+      else:
+        for path_spec in task.path_specs or [task.path_spec]:
+          if self._abort:
+            break
+
+          self._ProcessPathSpec(
+              self._extraction_worker, self._parser_mediator, path_spec)
+          self._number_of_consumed_sources += 1
 
     finally:
       task.aborted = self._abort
@@ -1,6 +1,10 @@
 # -*- coding: utf-8 -*-
 """Classes to assist in merging attribute containers of tasks."""
 
+import bisect
+
+from acstore.containers import interface as containers_interface
+
 from plaso.containers import analysis_results
 from plaso.containers import artifacts
 from plaso.containers import event_sources
@@ -18,6 +22,9 @@ class BaseTaskMergeHelper(object):
 
   _CONTAINER_TYPES = ()
 
+  # Default maximum number of attribute containers in a batch.
+  _DEFAULT_MAXIMUM_NUMBER_OF_CONTAINERS = 1000
+
   def __init__(self, task_storage_reader, task_identifier):
     """Initialize a helper for merging task related attribute containers.
 
@@ -26,8 +33,9 @@ class BaseTaskMergeHelper(object):
       task_identifier (str): identifier of the task that is merged.
     """
     super(BaseTaskMergeHelper, self).__init__()
-    self._container_identifier_mappings = {}
     self._generator = self._GetAttributeContainers(task_storage_reader)
+    self._identifier_ranges = {}
+    self._next_container = None
     self._task_storage_reader = task_storage_reader
 
     self.fully_merged = False
@@ -60,33 +68,119 @@ class BaseTaskMergeHelper(object):
     Returns:
       AttributeContainer: attribute container or None if not available.
     """
-    try:
-      container = next(self._generator)
-    except StopIteration:
-      container = None
+    container = self._next_container
+    if container:
+      self._next_container = None
+    else:
+      try:
+        container = next(self._generator)
+      except StopIteration:
+        container = None
 
     return container
 
-  def GetAttributeContainerIdentifier(self, lookup_key):
-    """Retrieves an attribute container.
+  def GetAttributeContainerIdentifier(self, task_identifier):
+    """Retrieves the identifier of a merged attribute container.
 
     Args:
-      lookup_key (str): lookup key that identifies the attribute container.
+      task_identifier (AttributeContainerIdentifier): identifier of
+          the attribute container in the task storage.
 
     Returns:
-      AttributeContainerIdentifier: attribute container identifier that maps
-          to the lookup key or None if not available.
+      AttributeContainerIdentifier: identifier of the attribute container in
+          the session storage or None if not available.
     """
-    return self._container_identifier_mappings.get(lookup_key, None)
+    identifier_ranges = self._identifier_ranges.get(task_identifier.name, None)
+    if not identifier_ranges:
+      return None
+
+    range_start_sequence_numbers, ranges = identifier_ranges
+
+    task_sequence_number = task_identifier.sequence_number
+    range_index = bisect.bisect_right(
+        range_start_sequence_numbers, task_sequence_number) - 1
+    if range_index < 0:
+      return None
+
+    range_start, session_range_start, range_size = ranges[range_index]
+
+    offset = task_sequence_number - range_start
+    if offset >= range_size:
+      return None
 
-  def SetAttributeContainerIdentifier(self, lookup_key, identifier):
-    """Sets an attribute container.
+    return containers_interface.AttributeContainerIdentifier(
+        name=task_identifier.name, sequence_number=session_range_start + offset)
+
+  def GetAttributeContainers(self, maximum_number_of_containers=0):
+    """Retrieves a batch of attribute containers of the same type to merge.
 
     Args:
-      lookup_key (str): lookup key that identifies the attribute container.
-      identifier (AttributeContainerIdentifier): attribute container identifier.
+      maximum_number_of_containers (Optional[int]): maximum number of
+          containers in the batch, where 0 represents the default.
+
+    Returns:
+      list[AttributeContainer]: attribute containers of the same type or
+          an empty list if not available.
     """
-    self._container_identifier_mappings[lookup_key] = identifier
+    if maximum_number_of_containers <= 0:
+      maximum_number_of_containers = self._DEFAULT_MAXIMUM_NUMBER_OF_CONTAINERS
+
+    containers = []
+
+    container = self.GetAttributeContainer()
+    if container:
+      container_type = container.CONTAINER_TYPE
+
+      while container:
+        if container.CONTAINER_TYPE != container_type:
+          self._next_container = container
+          break
+
+        containers.append(container)
+        if len(containers) >= maximum_number_of_containers:
+          break
+
+        container = self.GetAttributeContainer()
+
+    return containers
+
+  def SetAttributeContainerIdentifiers(self, task_identifiers, identifiers):
+    """Sets the identifiers of merged attribute containers.
+
+    The identifiers are stored as ranges of consecutive sequence numbers,
+    where the task identifiers are expected to be of the same type and in
+    ascending order.
+
+    Args:
+      task_identifiers (list[AttributeContainerIdentifier]): identifiers of
+          the attribute containers in the task storage.
+      identifiers (list[AttributeContainerIdentifier]): identifiers of
+          the attribute containers in the session storage.
+    """
+    if not task_identifiers:
+      return
+
+    container_type = task_identifiers[0].name
+    if container_type not in self._identifier_ranges:
+      self._identifier_ranges[container_type] = ([], [])
+
+    range_start_sequence_numbers, ranges = self._identifier_ranges[
+        container_type]
+
+    for task_identifier, identifier in zip(task_identifiers, identifiers):
+      task_sequence_number = task_identifier.sequence_number
+      session_sequence_number = identifier.sequence_number
+
+      if ranges:
+        range_start, session_range_start, range_size = ranges[-1]
+
+        if (task_sequence_number == range_start + range_size and
+            session_sequence_number == session_range_start + range_size):
+          ranges[-1] = (range_start, session_range_start, range_size + 1)
+          continue
+
+      range_start_sequence_numbers.append(task_sequence_number)
+      ranges.append((task_sequence_number, session_sequence_number, 1))
 
 
 class AnalysisTaskMergeHelper(BaseTaskMergeHelper):
@@ -115,6 +209,7 @@ class ExtractionTaskMergeHelper(BaseTaskMergeHelper):
 
   _CONTAINER_TYPES = (
       event_sources.EventSource.CONTAINER_TYPE,
+      event_sources.RecordRangeEventSource.CONTAINER_TYPE,
       events.EventDataStream.CONTAINER_TYPE,
       # The date-less log helper is needed to generate event from the event
       # data by the timeliner and therefore needs to be merged before event
@@ -2,15 +2,16 @@
 """The output and formatting multi-processing engine."""
 
 import heapq
-import os
 
-from plaso.containers import events
 from plaso.engine import processing_status
 from plaso.lib import bufferlib
 from plaso.lib import definitions
 from plaso.lib import errors
 from plaso.multi_process import engine
 from plaso.multi_process import logger
+from plaso.multi_process import output_process
+from plaso.multi_process import plaso_queue
+from plaso.multi_process import zeromq_queue
 from plaso.output import mediator as output_mediator
 from plaso.storage import time_range as storage_time_range
 
@@ -34,17 +35,16 @@ class PsortEventHeap(object):
     Returns:
       tuple: containing:
 
-        str: identifier of the event MACB group or None if the event cannot
-            be grouped.
-        str: identifier of the event content.
+        int: event values hash, which identifies the event content.
         EventObject: event.
         EventData: event data.
         EventDataStream: event data stream.
+        EventTag: event tag.
     """
     try:
-      (event_values_hash, _, event, event_data,
-       event_data_stream) = heapq.heappop(self._heap)
-      return event_values_hash, event, event_data, event_data_stream
+      (event_values_hash, _, event, event_data, event_data_stream,
+       event_tag) = heapq.heappop(self._heap)
+      return event_values_hash, event, event_data, event_data_stream, event_tag
 
     except IndexError:
       return None
@@ -55,30 +55,40 @@ class PsortEventHeap(object):
     Yields:
       tuple: containing:
 
-        str: identifier of the event MACB group or None if the event cannot
-            be grouped.
-        str: identifier of the event content.
+        int: event values hash, which identifies the event content.
         EventObject: event.
         EventData: event data.
         EventDataStream: event data stream.
+        EventTag: event tag.
     """
     heap_values = self.PopEvent()
     while heap_values:
       yield heap_values
       heap_values = self.PopEvent()
 
-  def PushEvent(self, event, event_data, event_data_stream):
+  def PushEvent(self, event, event_data, event_data_stream, event_tag=None):
     """Pushes an event onto the heap.
 
     Args:
       event (EventObject): event.
       event_data (EventData): event data.
       event_data_stream (EventDataStream): event data stream.
+      event_tag (Optional[EventTag]): event tag.
     """
     event_values_hash = getattr(event_data, '_event_values_hash', None)
     if event_values_hash is None:
       logger.warning('Missing _event_values_hash attribute')
-      event_values_hash = 'UNKNOWN'
+      event_values_hash = 0
+
+    elif isinstance(event_values_hash, str):
+      # Storage files written by older versions of plaso store the event
+      # values hash as the hexadecimal representation of a MD5 digest.
+      try:
+        event_values_hash = int(event_values_hash, 16)
+      except ValueError:
+        logger.warning(
+            f'Unsupported _event_values_hash attribute: {event_values_hash:s}')
+        event_values_hash = 0
 
     timestamp_desc = event.timestamp_desc
     if timestamp_desc is None:
@@ -90,7 +100,7 @@ class PsortEventHeap(object):
     # similar event values.
     heapq.heappush(self._heap, (
         event_values_hash, timestamp_desc, event, event_data,
-        event_data_stream))
+        event_data_stream, event_tag))
 
 
 class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
@@ -99,11 +109,21 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
   # TODO: move this to a single process engine.
   # pylint: disable=abstract-method
 
+  # The number of events that are read from storage together with their
+  # event data, event data stream and event tag at a time.
+  _EXPORT_EVENTS_BATCH_SIZE = 1024
+
+  # The number of output entries, single events or MACB groups, per batch
+  # that is formatted by an output formatting process.
+  _FORMATTING_BATCH_SIZE = 512
+
   _HEAP_MAXIMUM_EVENTS = 100000
 
-  _MESSAGE_FORMATTERS_DIRECTORY_NAME = 'formatters'
+  # The maximum number of batches pending formatting per output formatting
+  # process.
+  _MAXIMUM_PENDING_BATCHES_PER_PROCESS = 4
 
-  _MESSAGE_FORMATTERS_FILE_NAME = 'formatters.yaml'
+  _QUEUE_TIMEOUT = 10 * 60
 
   def __init__(self):
     """Initializes an output and formatting multi-processing engine."""
@@ -113,11 +133,47 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
     self._events_status = processing_status.EventsStatus()
     self._export_event_heap = PsortEventHeap()
     self._export_event_timestamp = 0
+    self._formatted_batches = {}
+    self._formatting_cache_status_per_pid = {}
+    self._formatting_input_queue = None
+    self._formatting_output_queue = None
+    self._maximum_pending_batches = 0
     self._number_of_consumed_events = 0
+    self._number_of_pushed_batches = 0
+    self._number_of_written_batches = 0
+    self._output_entries = []
     self._output_mediator = None
+    self._output_module = None
     self._processing_configuration = None
     self._status = definitions.STATUS_INDICATOR_IDLE
     self._status_update_callback = None
+    self._storage_file_path = None
+
+  def _CheckStatusFormattingProcess(self, pid):
+    """Checks the status of an output formatting process.
+
+    Args:
+      pid (int): process ID (PID) of a registered output formatting process.
+
+    Raises:
+      KeyError: if the process is not registered with the engine.
+    """
+    self._RaiseIfNotRegistered(pid)
+
+    process = self._processes_per_pid[pid]
+
+    process_status = self._QueryProcessStatus(process)
+    if process_status is None:
+      process_status = {
+          'processing_status': definitions.STATUS_INDICATOR_KILLED}
+
+    process_information = self._process_information_per_pid.get(pid, None)
+    if not process_information:
+      return
+
+    used_memory = process_information.GetUsedMemory() or 0
+
+    self._UpdateProcessingStatus(pid, process_status, used_memory)
 
   def _CreateOutputMediator(self, storage_reader, processing_configuration):
     """Creates an output mediator.
@@ -135,48 +191,31 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
       BadConfigOption: if the message formatters file or directory cannot be
           read.
     """
-    mediator = output_mediator.OutputMediator(
-        storage_reader, data_location=processing_configuration.data_location,
-        dynamic_time=processing_configuration.dynamic_time,
-        preferred_encoding=processing_configuration.preferred_encoding)
-
-    if processing_configuration.preferred_language:
-      try:
-        mediator.SetPreferredLanguageIdentifier(
-            processing_configuration.preferred_language)
-      except (KeyError, TypeError):
-        logger.warning('Unable to to set preferred language: {0!s}.'.format(
-              processing_configuration.preferred_language))
-
-    mediator.SetTimeZone(processing_configuration.preferred_time_zone)
-
-    self._ReadMessageFormatters(
-        mediator, processing_configuration.data_location,
-        processing_configuration.custom_formatters_path)
-
-    return mediator
+    return output_process.CreateOutputMediator(
+        storage_reader, processing_configuration)
 
   def _ExportEvent(
-      self, storage_reader, output_module, event, event_data, event_data_stream,
+      self, output_module, event, event_data, event_data_stream, event_tag,
       deduplicate_events=True):
     """Exports an event using an output module.
 
     Args:
-      storage_reader (StorageReader): storage reader.
       output_module (OutputModule): output module.
       event (EventObject): event.
       event_data (EventData): event data.
       event_data_stream (EventDataStream): event data stream.
+      event_tag (EventTag): event tag.
       deduplicate_events (Optional[bool]): True if events should be
           deduplicated.
     """
     if (event.timestamp != self._export_event_timestamp or
         self._export_event_heap.number_of_events > self._HEAP_MAXIMUM_EVENTS):
       self._FlushExportBuffer(
-          storage_reader, output_module, deduplicate_events=deduplicate_events)
+          output_module, deduplicate_events=deduplicate_events)
       self._export_event_timestamp = event.timestamp
 
-    self._export_event_heap.PushEvent(event, event_data, event_data_stream)
+    self._export_event_heap.PushEvent(
+        event, event_data, event_data_stream, event_tag=event_tag)
 
   def _ExportEvents(
       self, storage_reader, output_module, deduplicate_events=True,
@@ -214,20 +253,23 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
     self._events_status.number_of_filtered_events = 0
     self._events_status.number_of_events_from_time_slice = 0
 
-    for event in storage_reader.GetSortedEvents(time_range=time_slice_range):
-      event_data_identifier = event.GetEventDataIdentifier()
-      event_data = storage_reader.GetAttributeContainerByIdentifier(
-          events.EventData.CONTAINER_TYPE, event_data_identifier)
+    storage_data_types = None
+    storage_time_range = time_slice_range
 
-      event_data_stream_identifier = event_data.GetEventDataStreamIdentifier()
-      if event_data_stream_identifier:
-        event_data_stream = storage_reader.GetAttributeContainerByIdentifier(
-            events.EventDataStream.CONTAINER_TYPE, event_data_stream_identifier)
-      else:
-        event_data_stream = None
+    # Let the storage skip events that cannot match the filter. This is only
+    # done when all events are read, since the time slice and the filter
+    # limit depend on the events that do not match the filter.
+    if event_filter and not time_slice and not filter_limit:
+      storage_time_range, storage_data_types = (
+          event_filter.GetStorageFilterValues())
 
-      event_identifier = event.GetIdentifier()
-      event_tag = storage_reader.GetEventTagByEventIdentifer(event_identifier)
+    number_of_read_events = 0
+
+    for event, event_data, event_data_stream, event_tag in (
+        storage_reader.GetSortedEventsWithData(
+            time_range=storage_time_range, data_types=storage_data_types,
+            batch_size=self._EXPORT_EVENTS_BATCH_SIZE)):
+      number_of_read_events += 1
 
       if time_slice_range and event.timestamp != time_slice.event_timestamp:
         self._events_status.number_of_events_from_time_slice += 1
@@ -244,13 +286,14 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
           self._events_status.number_of_filtered_events += 1
 
         elif forward_entries == 0:
-          time_slice_buffer.Append((event, event_data))
+          time_slice_buffer.Append(
+              (event, event_data, event_data_stream, event_tag))
           self._events_status.number_of_filtered_events += 1
 
         elif forward_entries <= time_slice_buffer.size:
           self._ExportEvent(
-              storage_reader, output_module, event, event_data,
-              event_data_stream, deduplicate_events=deduplicate_events)
+              output_module, event, event_data, event_data_stream, event_tag,
+              deduplicate_events=deduplicate_events)
           self._number_of_consumed_events += 1
           self._events_status.number_of_events_from_time_slice += 1
           forward_entries += 1
@@ -265,11 +308,12 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
         # pylint: disable=singleton-comparison
         if filter_match == True and time_slice_buffer:
           # Empty the time slice buffer.
-          for event_in_buffer, event_data_in_buffer in (
-              time_slice_buffer.Flush()):
+          for (event_in_buffer, event_data_in_buffer,
+               event_data_stream_in_buffer, event_tag_in_buffer) in (
+                   time_slice_buffer.Flush()):
             self._ExportEvent(
-                storage_reader, output_module, event_in_buffer,
-                event_data_in_buffer, event_data_stream,
+                output_module, event_in_buffer, event_data_in_buffer,
+                event_data_stream_in_buffer, event_tag_in_buffer,
                 deduplicate_events=deduplicate_events)
             self._number_of_consumed_events += 1
             self._events_status.number_of_filtered_events += 1
@@ -278,7 +322,7 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
           forward_entries = 1
 
         self._ExportEvent(
-            storage_reader, output_module, event, event_data, event_data_stream,
+            output_module, event, event_data, event_data_stream, event_tag,
             deduplicate_events=deduplicate_events)
         self._number_of_consumed_events += 1
 
@@ -287,14 +331,26 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
             filter_limit == self._number_of_consumed_events):
           break
 
-    self._FlushExportBuffer(storage_reader, output_module)
+    if storage_time_range != time_slice_range or (
+        storage_data_types is not None):
+      # Account for the events that were skipped by the storage.
+      number_of_events = storage_reader.GetNumberOfAttributeContainers('event')
+      self._events_status.number_of_filtered_events += (
+          number_of_events - number_of_read_events)
+
+    self._FlushExportBuffer(output_module)
 
-  def _FlushExportBuffer(
-      self, storage_reader, output_module, deduplicate_events=True):
+    if self._formatting_input_queue:
+      if self._output_entries:
+        self._PushFormattingBatch(output_module)
+
+      while self._number_of_written_batches < self._number_of_pushed_batches:
+        self._PopFormattedBatch(output_module)
+
+  def _FlushExportBuffer(self, output_module, deduplicate_events=True):
     """Flushes buffered events and writes them to the output module.
 
     Args:
-      storage_reader (StorageReader): storage reader.
       output_module (OutputModule): output module.
       deduplicate_events (Optional[bool]): True if events should be
           deduplicated.
@@ -304,8 +360,8 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
     last_timestamp_desc = None
     macb_group = []
 
-    for (event_values_hash, event, event_data,
-         event_data_stream) in self._export_event_heap.PopEvents():
+    for (event_values_hash, event, event_data, event_data_stream,
+         event_tag) in self._export_event_heap.PopEvents():
       timestamp_desc = event.timestamp_desc
 
       if (deduplicate_events and timestamp_desc == last_timestamp_desc and
@@ -313,9 +369,6 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
         self._events_status.number_of_duplicate_events += 1
         continue
 
-      event_identifier = event.GetIdentifier()
-      event_tag = storage_reader.GetEventTagByEventIdentifer(event_identifier)
-
       if timestamp_desc in (
           definitions.TIME_DESCRIPTION_LAST_ACCESS,
           definitions.TIME_DESCRIPTION_CREATION,
@@ -327,14 +380,12 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
 
       if macb_group_identifier is None:
         if macb_group:
-          output_module.WriteFieldValuesOfMACBGroup(
-              self._output_mediator, macb_group)
+          self._WriteOutputEntry(output_module, True, macb_group)
           macb_group = []
 
-        field_values = output_module.GetFieldValues(
-            self._output_mediator, event, event_data, event_data_stream,
-            event_tag)
-        output_module.WriteFieldValues(self._output_mediator, field_values)
+        self._WriteOutputEntry(
+            output_module, False,
+            [(event, event_data, event_data_stream, event_tag)])
 
       else:
         if (last_macb_group_identifier == macb_group_identifier or
@@ -342,8 +393,7 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
           macb_group.append((event, event_data, event_data_stream, event_tag))
 
         else:
-          output_module.WriteFieldValuesOfMACBGroup(
-              self._output_mediator, macb_group)
+          self._WriteOutputEntry(output_module, True, macb_group)
           macb_group = [(event, event_data, event_data_stream, event_tag)]
 
         self._events_status.number_of_macb_grouped_events += 1
@@ -353,56 +403,191 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
       last_timestamp_desc = timestamp_desc
 
     if macb_group:
-      output_module.WriteFieldValuesOfMACBGroup(
-          self._output_mediator, macb_group)
+      self._WriteOutputEntry(output_module, True, macb_group)
+
+  def _PopFormattedBatch(self, output_module):
+    """Pops a formatted batch and writes the batches that are ready.
 
-  def _ReadMessageFormatters(
-      self, output_mediator_object, data_location, custom_formatters_path):
-    """Reads the message formatters from a formatters file or directory.
+    Formatted batches are written in the order they were pushed, which can
+    differ from the order in which the output formatting processes complete
+    them.
 
     Args:
-      output_mediator_object (OutputMediator): mediates interactions between
-          output modules and other components, such as storage and dfVFS.
-      data_location (str): path to the data files.
-      custom_formatters_path (str): path to custom formatter definitions file.
+      output_module (OutputModule): output module.
 
     Raises:
-      BadConfigOption: if the message formatters file or directory cannot be
-          read.
+      RuntimeError: if no formatted batch could be popped within the queue
+          timeout.
     """
-    formatters_directory = os.path.join(
-        data_location, self._MESSAGE_FORMATTERS_DIRECTORY_NAME)
-    formatters_file = os.path.join(
-        data_location, self._MESSAGE_FORMATTERS_FILE_NAME)
+    try:
+      queued_object = self._formatting_output_queue.PopItem()
+    except (errors.QueueClose, errors.QueueEmpty) as exception:
+      raise RuntimeError(
+          'Unable to retrieve formatted batch with error: {0!s}'.format(
+              exception))
 
-    if os.path.isdir(formatters_directory):
-      try:
-        output_mediator_object.ReadMessageFormattersFromDirectory(
-            formatters_directory)
-      except KeyError as exception:
-        raise errors.BadConfigOption((
-            'Unable to read message formatters from directory: {0:s} with '
-            'error: {1!s}').format(formatters_directory, exception))
-
-    elif os.path.isfile(formatters_file):
-      try:
-        output_mediator_object.ReadMessageFormattersFromFile(formatters_file)
-      except KeyError as exception:
-        raise errors.BadConfigOption((
-            'Unable to read message formatters from file: {0:s} with error: '
-            '{1!s}').format(formatters_file, exception))
+    batch_number, formatted_entries = queued_object
+    self._formatted_batches[batch_number] = formatted_entries
 
-    else:
-      raise errors.BadConfigOption('Missing formatters file and directory.')
+    formatted_entries = self._formatted_batches.pop(
+        self._number_of_written_batches, None)
+    while formatted_entries is not None:
+      self._WriteFormattedEntries(output_module, formatted_entries)
+      self._number_of_written_batches += 1
+
+      formatted_entries = self._formatted_batches.pop(
+          self._number_of_written_batches, None)
+
+  def _PushFormattingBatch(self, output_module):
+    """Pushes the buffered output entries to the output formatting processes.
+
+    Args:
+      output_module (OutputModule): output module.
+    """
+    while (self._number_of_pushed_batches - self._number_of_written_batches >=
+           self._maximum_pending_batches):
+      self._PopFormattedBatch(output_module)
+
+    self._formatting_input_queue.PushItem(
+        (self._number_of_pushed_batches, self._output_entries))
+
+    self._number_of_pushed_batches += 1
+    self._output_entries = []
+
+  def _StartFormattingProcesses(
+      self, output_module, number_of_processes, storage_file_path):
+    """Starts the output formatting processes.
+
+    Args:
+      output_module (OutputModule): output module.
+      number_of_processes (int): number of output formatting processes.
+      storage_file_path (str): path of the storage file.
+    """
+    self._formatted_batches = {}
+    self._formatting_cache_status_per_pid = {}
+    self._maximum_pending_batches = (
+        number_of_processes * self._MAXIMUM_PENDING_BATCHES_PER_PROCESS)
+    self._number_of_pushed_batches = 0
+    self._number_of_written_batches = 0
+    self._output_entries = []
+    self._output_module = output_module
+    self._storage_file_path = storage_file_path
+
+    # The output formatting processes request batches from the input queue,
+    # which ensures every process receives an abort when it is pushed once
+    # per process.
+    self._formatting_input_queue = zeromq_queue.ZeroMQBufferedReplyBindQueue(
+        delay_open=True, linger_seconds=0, maximum_items=1,
+        name='Output formatting input queue',
+        timeout_seconds=self._QUEUE_TIMEOUT)
+    # Open the queue so it can bind to a random port, and we can get the
+    # port number to use in the output formatting processes.
+    self._formatting_input_queue.Open()
+
+    self._formatting_output_queue = zeromq_queue.ZeroMQPullBindQueue(
+        name='Output formatting output queue',
+        timeout_seconds=self._QUEUE_TIMEOUT)
+    self._formatting_output_queue.Open()
+
+    logger.info('Starting output formatting processes.')
+
+    for _ in range(number_of_processes):
+      process_name = 'Formatter{0:02d}'.format(self._last_worker_number)
+      process = self._StartWorkerProcess(process_name)
+      if not process:
+        logger.error('Unable to create output formatting process: {0:s}'.format(
+            process_name))
+
+      self._last_worker_number += 1
+
+  def _StartWorkerProcess(self, process_name):
+    """Creates, starts, monitors and registers a worker process.
+
+    Args:
+      process_name (str): process name.
+
+    Returns:
+      OutputFormattingProcess: output formatting process or None on error.
+    """
+    queue_name = '{0:s} input queue'.format(process_name)
+    input_queue = zeromq_queue.ZeroMQRequestConnectQueue(
+        delay_open=True, linger_seconds=0, name=queue_name,
+        port=self._formatting_input_queue.port,
+        timeout_seconds=self._QUEUE_TIMEOUT)
+
+    queue_name = '{0:s} output queue'.format(process_name)
+    output_queue = zeromq_queue.ZeroMQPushConnectQueue(
+        name=queue_name, delay_open=True,
+        port=self._formatting_output_queue.port,
+        timeout_seconds=self._QUEUE_TIMEOUT)
+
+    process = output_process.OutputFormattingProcess(
+        input_queue, output_queue, self._output_module,
+        self._processing_configuration, self._storage_file_path,
+        name=process_name)
+
+    process.start()
+
+    logger.info('Started output formatting process: {0:s} (PID: {1:d}).'.format(
+        process_name, process.pid))
+
+    try:
+      self._StartMonitoringProcess(process)
+    except (IOError, KeyError) as exception:
+      logger.error((
+          'Unable to monitor output formatting process: {0:s} (PID: {1:d}) '
+          'with error: {2!s}').format(process_name, process.pid, exception))
+
+      process.terminate()
+      return None
+
+    self._RegisterProcess(process)
+    return process
+
+  def _StopFormattingProcesses(self, abort=False):
+    """Stops the output formatting processes.
+
+    Args:
+      abort (bool): True to indicated the stop is issued on abort.
+    """
+    logger.debug('Stopping output formatting processes.')
+    self._StopMonitoringProcesses()
+
+    if abort:
+      # Signal all the processes to abort.
+      self._AbortTerminate()
 
-    if custom_formatters_path:
+    # Wake the processes to make sure that they are not blocking
+    # waiting for the queue new items.
+    for _ in self._processes_per_pid:
       try:
-        output_mediator_object.ReadMessageFormattersFromFile(
-            custom_formatters_path, override_existing=True)
-      except KeyError as exception:
-        raise errors.BadConfigOption((
-            'Unable to read custrom message formatters from file: {0:s} with '
-            'error: {1!s}').format(formatters_file, exception))
+        self._formatting_input_queue.PushItem(
+            plaso_queue.QueueAbort(), block=False)
+      except errors.QueueFull:
+        logger.warning(
+            'Output formatting input queue full, unable to push abort message.')
+
+    # Try waiting for the processes to exit normally.
+    self._AbortJoin(timeout=self._PROCESS_JOIN_TIMEOUT)
+
+    if abort:
+      # Kill any remaining processes.
+      self._AbortKill()
+    else:
+      # Check if the processes are still alive and terminate them if necessary.
+      self._AbortTerminate()
+      self._AbortJoin(timeout=self._PROCESS_JOIN_TIMEOUT)
+
+    self._formatting_input_queue.Close(abort=True)
+    self._formatting_output_queue.Close(abort=True)
+
+    self._formatted_batches = {}
+    self._formatting_input_queue = None
+    self._formatting_output_queue = None
+    self._output_entries = []
+    self._output_module = None
+    self._processes_per_pid = {}
+    self._storage_file_path = None
 
   def _UpdateForemanProcessStatus(self):
     """Update the foreman process status."""
@@ -412,21 +597,130 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
         self._name, self._status, self._pid, used_memory, '',
         0, 0, 0, 0, self._number_of_consumed_events, 0, 0, 0, 0, 0)
 
+    number_of_cache_hits = 0
+    number_of_cache_misses = 0
+    if self._output_mediator:
+      number_of_cache_hits = (
+          self._output_mediator.number_of_formatting_cache_hits)
+      number_of_cache_misses = (
+          self._output_mediator.number_of_formatting_cache_misses)
+
+    for cache_hits, cache_misses in (
+        self._formatting_cache_status_per_pid.values()):
+      number_of_cache_hits += cache_hits
+      number_of_cache_misses += cache_misses
+
+    self._events_status.number_of_formatting_cache_hits = number_of_cache_hits
+    self._events_status.number_of_formatting_cache_misses = (
+        number_of_cache_misses)
+
     self._processing_status.UpdateEventsStatus(self._events_status)
 
+  def _UpdateProcessingStatus(self, pid, process_status, used_memory):
+    """Updates the processing status.
+
+    Args:
+      pid (int): process identifier (PID) of the worker process.
+      process_status (dict[str, object]): status values received from
+          the worker process.
+      used_memory (int): size of used memory in bytes.
+
+    Raises:
+      KeyError: if the process is not registered with the engine.
+    """
+    self._RaiseIfNotRegistered(pid)
+
+    if not process_status:
+      return
+
+    process = self._processes_per_pid[pid]
+
+    status_indicator = process_status.get('processing_status', None)
+    number_of_consumed_events = process_status.get(
+        'number_of_consumed_events', None)
+
+    self._processing_status.UpdateWorkerStatus(
+        process.name, status_indicator, pid, used_memory, '', None, None, None,
+        None, number_of_consumed_events, None, None, None, None, None)
+
+    number_of_cache_hits = process_status.get(
+        'number_of_formatting_cache_hits', None)
+    number_of_cache_misses = process_status.get(
+        'number_of_formatting_cache_misses', None)
+    if number_of_cache_hits is not None and number_of_cache_misses is not None:
+      self._formatting_cache_status_per_pid[pid] = (
+          number_of_cache_hits, number_of_cache_misses)
+
   def _UpdateStatus(self):
     """Update the status."""
+    # Make a local copy of the PIDs in case the dict is changed by
+    # the main thread.
+    for pid in list(self._process_information_per_pid.keys()):
+      self._CheckStatusFormattingProcess(pid)
+
     self._UpdateForemanProcessStatus()
 
     if self._status_update_callback:
       self._status_update_callback(self._processing_status)
 
+  def _WriteFormattedEntries(self, output_module, formatted_entries):
+    """Writes formatted output entries.
+
+    Args:
+      output_module (OutputModule): output module.
+      formatted_entries (list[tuple[bool, object]]): formatted output entries,
+          where each entry consists of a flag that indicates if the entry is
+          a MACB group and either the output field values of the event or
+          a list of output field values of the MACB group.
+    """
+    for is_macb_group, field_values in formatted_entries:
+      if is_macb_group:
+        output_module.WriteFormattedMACBGroup(
+            self._output_mediator, field_values)
+      else:
+        output_module.WriteFieldValues(self._output_mediator, field_values)
+
+  def _WriteOutputEntry(self, output_module, is_macb_group, entry_events):
+    """Writes an output entry.
+
+    If output formatting processes are used the entry is buffered and
+    formatted in a batch by one of the processes, otherwise it is formatted
+    and written directly.
+
+    Args:
+      output_module (OutputModule): output module.
+      is_macb_group (bool): True if the entry is a MACB group.
+      entry_events (list[tuple[EventObject, EventData, EventDataStream,
+          EventTag]]): events of the entry.
+    """
+    if self._formatting_input_queue:
+      self._output_entries.append((is_macb_group, entry_events))
+
+      if len(self._output_entries) >= self._FORMATTING_BATCH_SIZE:
+        self._PushFormattingBatch(output_module)
+
+    elif is_macb_group:
+      output_module.WriteFieldValuesOfMACBGroup(
+          self._output_mediator, entry_events)
+
+    else:
+      event, event_data, event_data_stream, event_tag = entry_events[0]
+      field_values = output_module.GetFieldValues(
+          self._output_mediator, event, event_data, event_data_stream,
+          event_tag)
+      output_module.WriteFieldValues(self._output_mediator, field_values)
+
   def ExportEvents(
       self, storage_reader, output_module, processing_configuration,
-      deduplicate_events=True, event_filter=None, status_update_callback=None,
-      time_slice=None, use_time_slicer=False):
+      deduplicate_events=True, event_filter=None, number_of_worker_processes=0,
+      status_update_callback=None, storage_file_path=None, time_slice=None,
+      use_time_slicer=False):
     """Exports events using an output module.
 
+    Output formatting processes are only used when both the number of worker
+    processes and the storage file path are set, since every process reads
+    the event data it needs to format from the storage file.
+
     Args:
       storage_reader (StorageReader): storage reader.
       output_module (OutputModule): output module.
@@ -435,8 +729,12 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
       deduplicate_events (Optional[bool]): True if events should be
           deduplicated.
       event_filter (Optional[EventObjectFilter]): event filter.
+      number_of_worker_processes (Optional[int]): number of output formatting
+          processes, where 0 represents formatting in the main process.
       status_update_callback (Optional[function]): callback function for status
           updates.
+      storage_file_path (Optional[str]): path of the storage file, which is
+          opened by the output formatting processes.
       time_slice (Optional[TimeSlice]): slice of time to output.
       use_time_slicer (Optional[bool]): True if the 'time slicer' should be
           used. The 'time slicer' will provide a context of events around
@@ -470,6 +768,13 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
 
     self._StartProfiling(self._processing_configuration.profiling)
 
+    use_formatting_processes = bool(
+        number_of_worker_processes and storage_file_path)
+    if use_formatting_processes:
+      self._StartFormattingProcesses(
+          output_module, number_of_worker_processes, storage_file_path)
+
+    abort = True
     try:
       self._ExportEvents(
           storage_reader, output_module, deduplicate_events=deduplicate_events,
@@ -477,8 +782,12 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
           use_time_slicer=use_time_slicer)
 
       self._status = definitions.STATUS_INDICATOR_COMPLETED
+      abort = False
 
     finally:
+      if use_formatting_processes:
+        self._StopFormattingProcesses(abort=abort)
+
       # Stop the status update thread after close of the storage writer
       # so we include the storage sync to disk in the status updates.
       self._StopStatusUpdateThread()
@@ -0,0 +1,308 @@
+# -*- coding: utf-8 -*-
+"""The multi-process output formatting worker process."""
+
+import os
+
+from plaso.lib import definitions
+from plaso.lib import errors
+from plaso.multi_process import base_process
+from plaso.multi_process import logger
+from plaso.multi_process import plaso_queue
+from plaso.output import mediator as output_mediator
+from plaso.storage import factory as storage_factory
+
+
+_MESSAGE_FORMATTERS_DIRECTORY_NAME = 'formatters'
+
+_MESSAGE_FORMATTERS_FILE_NAME = 'formatters.yaml'
+
+
+def CreateOutputMediator(storage_reader, processing_configuration):
+  """Creates an output mediator.
+
+  Args:
+    storage_reader (StorageReader): storage reader.
+    processing_configuration (ProcessingConfiguration): processing
+        configuration.
+
+  Returns:
+    OutputMediator: mediates interactions between output modules and other
+        components, such as storage and dfVFS.
+
+  Raises:
+    BadConfigOption: if the message formatters file or directory cannot be
+        read.
+  """
+  mediator = output_mediator.OutputMediator(
+      storage_reader, data_location=processing_configuration.data_location,
+      dynamic_time=processing_configuration.dynamic_time,
+      preferred_encoding=processing_configuration.preferred_encoding)
+
+  if processing_configuration.preferred_language:
+    try:
+      mediator.SetPreferredLanguageIdentifier(
+          processing_configuration.preferred_language)
+    except (KeyError, TypeError):
+      logger.warning('Unable to to set preferred language: {0!s}.'.format(
+            processing_configuration.preferred_language))
+
+  mediator.SetTimeZone(processing_configuration.preferred_time_zone)
+
+  ReadMessageFormatters(
+      mediator, processing_configuration.data_location,
+      processing_configuration.custom_formatters_path)
+
+  return mediator
+
+
+def ReadMessageFormatters(
+    output_mediator_object, data_location, custom_formatters_path):
+  """Reads the message formatters from a formatters file or directory.
+
+  Args:
+    output_mediator_object (OutputMediator): mediates interactions between
+        output modules and other components, such as storage and dfVFS.
+    data_location (str): path to the data files.
+    custom_formatters_path (str): path to custom formatter definitions file.
+
+  Raises:
+    BadConfigOption: if the message formatters file or directory cannot be
+        read.
+  """
+  formatters_directory = os.path.join(
+      data_location, _MESSAGE_FORMATTERS_DIRECTORY_NAME)
+  formatters_file = os.path.join(
+      data_location, _MESSAGE_FORMATTERS_FILE_NAME)
+
+  if os.path.isdir(formatters_directory):
+    try:
+      output_mediator_object.ReadMessageFormattersFromDirectory(
+          formatters_directory)
+    except KeyError as exception:
+      raise errors.BadConfigOption((
+          'Unable to read message formatters from directory: {0:s} with '
+          'error: {1!s}').format(formatters_directory, exception))
+
+  elif os.path.isfile(formatters_file):
+    try:
+      output_mediator_object.ReadMessageFormattersFromFile(formatters_file)
+    except KeyError as exception:
+      raise errors.BadConfigOption((
+          'Unable to read message formatters from file: {0:s} with error: '
+          '{1!s}').format(formatters_file, exception))
+
+  else:
+    raise errors.BadConfigOption('Missing formatters file and directory.')
+
+  if custom_formatters_path:
+    try:
+      output_mediator_object.ReadMessageFormattersFromFile(
+          custom_formatters_path, override_existing=True)
+    except KeyError as exception:
+      raise errors.BadConfigOption((
+          'Unable to read custrom message formatters from file: {0:s} with '
+          'error: {1!s}').format(formatters_file, exception))
+
+
+def FormatOutputEntries(output_module, output_mediator_object, output_entries):
+  """Formats output entries.
+
+  Args:
+    output_module (OutputModule): output module.
+    output_mediator_object (OutputMediator): mediates interactions between
+        output modules and other components, such as storage and dfVFS.
+    output_entries (list[tuple[bool, list[tuple[EventObject, EventData,
+        EventDataStream, EventTag]]]]): output entries, where each entry
+        consists of a flag that indicates if the entry is a MACB group and
+        the events of the entry.
+
+  Returns:
+    list[tuple[bool, object]]: formatted output entries, where each entry
+        consists of a flag that indicates if the entry is a MACB group and
+        either the output field values of the event or a list of output
+        field values of the MACB group.
+  """
+  formatted_entries = []
+  for is_macb_group, entry_events in output_entries:
+    if is_macb_group:
+      field_values = output_module.GetFieldValuesOfMACBGroup(
+          output_mediator_object, entry_events)
+    else:
+      event, event_data, event_data_stream, event_tag = entry_events[0]
+      field_values = output_module.GetFieldValues(
+          output_mediator_object, event, event_data, event_data_stream,
+          event_tag)
+
+    formatted_entries.append((is_macb_group, field_values))
+
+  return formatted_entries
+
+
+class OutputFormattingProcess(base_process.MultiProcessBaseProcess):
+  """Multi-processing output formatting worker process.
+
+  The process consumes batches of output entries from an input queue, formats
+  them with its copy of the output module and pushes the formatted entries,
+  together with the batch number, to an output queue. The batch number is
+  used by the output engine to write the formatted entries in their original
+  order.
+  """
+
+  def __init__(
+      self, input_queue, output_queue, output_module, processing_configuration,
+      storage_file_path, **kwargs):
+    """Initializes an output formatting worker process.
+
+    Non-specified keyword arguments (kwargs) are directly passed to
+    multiprocessing.Process.
+
+    Args:
+      input_queue (plaso_queue.Queue): queue with batches of output entries.
+      output_queue (plaso_queue.Queue): queue with batches of formatted output
+          entries.
+      output_module (OutputModule): output module used to format the entries.
+      processing_configuration (ProcessingConfiguration): processing
+          configuration.
+      storage_file_path (str): path of the storage file.
+    """
+    super(OutputFormattingProcess, self).__init__(
+        processing_configuration, **kwargs)
+    self._abort = False
+    self._input_queue = input_queue
+    self._number_of_consumed_events = 0
+    self._output_mediator = None
+    self._output_module = output_module
+    self._output_queue = output_queue
+    self._status = definitions.STATUS_INDICATOR_INITIALIZED
+    self._storage_file_path = storage_file_path
+
+  def _GetStatus(self):
+    """Retrieves status information.
+
+    Returns:
+      dict[str, object]: status attributes, indexed by name.
+    """
+    if self._process_information:
+      used_memory = self._process_information.GetUsedMemory() or 0
+    else:
+      used_memory = 0
+
+    if self._memory_profiler:
+      self._memory_profiler.Sample('main', used_memory)
+
+    # XML RPC does not support integer values > 2 GiB so we format them
+    # as a string.
+    used_memory = '{0:d}'.format(used_memory)
+
+    number_of_formatting_cache_hits = None
+    number_of_formatting_cache_misses = None
+    if self._output_mediator:
+      number_of_formatting_cache_hits = (
+          self._output_mediator.number_of_formatting_cache_hits)
+      number_of_formatting_cache_misses = (
+          self._output_mediator.number_of_formatting_cache_misses)
+
+    status = {
+        'display_name': '',
+        'identifier': self._name,
+        'number_of_consumed_event_data': None,
+        'number_of_consumed_event_tags': None,
+        'number_of_consumed_events': self._number_of_consumed_events,
+        'number_of_consumed_reports': None,
+        'number_of_consumed_sources': None,
+        'number_of_formatting_cache_hits': number_of_formatting_cache_hits,
+        'number_of_formatting_cache_misses': (
+            number_of_formatting_cache_misses),
+        'number_of_produced_event_data': None,
+        'number_of_produced_event_tags': None,
+        'number_of_produced_events': None,
+        'number_of_produced_reports': None,
+        'number_of_produced_sources': None,
+        'processing_status': self._status,
+        'task_identifier': None,
+        'used_memory': used_memory}
+
+    return status
+
+  def _Main(self):
+    """The main loop."""
+    self._StartProfiling(self._processing_configuration.profiling)
+
+    logger.debug('Output formatting process: {0!s} (PID: {1:d}) started'.format(
+        self._name, self._pid))
+
+    self._status = definitions.STATUS_INDICATOR_RUNNING
+
+    storage_reader = None
+
+    # The output queue is opened explicitly so that it can be closed even if
+    # the process did not format any batch.
+    self._output_queue.Open()
+
+    try:
+      storage_reader = (
+          storage_factory.StorageFactory.CreateStorageReaderForFile(
+              self._storage_file_path))
+
+      self._output_mediator = CreateOutputMediator(
+          storage_reader, self._processing_configuration)
+
+      while not self._abort:
+        try:
+          queued_object = self._input_queue.PopItem()
+
+        except (errors.QueueClose, errors.QueueEmpty) as exception:
+          logger.debug('ConsumeItems exiting with exception {0!s}.'.format(
+              type(exception)))
+          break
+
+        if isinstance(queued_object, plaso_queue.QueueAbort):
+          logger.debug('ConsumeItems exiting, dequeued QueueAbort object.')
+          break
+
+        batch_number, output_entries = queued_object
+
+        formatted_entries = FormatOutputEntries(
+            self._output_module, self._output_mediator, output_entries)
+        self._output_queue.PushItem((batch_number, formatted_entries))
+
+        for _, entry_events in output_entries:
+          self._number_of_consumed_events += len(entry_events)
+
+    # All exceptions need to be caught here to prevent the process
+    # from being killed by an uncaught exception.
+    except Exception as exception:  # pylint: disable=broad-except
+      logger.warning(
+          'Unhandled exception in process: {0!s} (PID: {1:d}).'.format(
+              self._name, self._pid))
+      logger.exception(exception)
+
+      self._abort = True
+
+    finally:
+      if storage_reader:
+        storage_reader.Close()
+
+    if self._abort:
+      self._status = definitions.STATUS_INDICATOR_ABORTED
+    else:
+      self._status = definitions.STATUS_INDICATOR_COMPLETED
+
+    logger.debug('Output formatting process: {0!s} (PID: {1:d}) stopped'.format(
+        self._name, self._pid))
+
+    self._StopProfiling()
+
+    try:
+      self._input_queue.Close(abort=self._abort)
+    except errors.QueueAlreadyClosed:
+      logger.error('Queue for {0:s} was already closed.'.format(self.name))
+
+    try:
+      self._output_queue.Close(abort=self._abort)
+    except errors.QueueAlreadyClosed:
+      logger.error('Queue for {0:s} was already closed.'.format(self.name))
+
+  def SignalAbort(self):
+    """Signals the process to abort."""
+    self._abort = True
@@ -140,6 +140,10 @@ class TaskManager(object):
     super(TaskManager, self).__init__()
     self._lock = threading.Lock()
 
+    # Retry tasks of an abandoned batch task that have not been returned by
+    # CreateRetryTask yet.
+    self._retry_tasks = collections.deque()
+
     # This dictionary maps task identifiers to tasks that have been abandoned,
     # as no worker has reported processing the task in the expected interval.
     self._tasks_abandoned = {}
@@ -211,6 +215,40 @@ class TaskManager(object):
       self._tasks_abandoned[task_identifier] = task
       del self._tasks_queued[task_identifier]
 
+  def _CreateRetryTasks(self, abandoned_task):
+    """Creates tasks to retry a previously abandoned task.
+
+    The path specifications of an abandoned batch task are retried in
+    separate tasks. The results of the path specifications that were processed
+    before the batch task was abandoned are not merged, hence these are
+    retried as well, but a path specification that caused the batch task to
+    be abandoned can no longer cause the others to be abandoned again.
+
+    Args:
+      abandoned_task (Task): abandoned task.
+
+    Returns:
+      list[Task]: tasks to retry the abandoned task.
+    """
+    if not abandoned_task.path_specs:
+      retry_task = abandoned_task.CreateRetryTask()
+      logger.debug('Retrying task {0:s} as {1:s}.'.format(
+          abandoned_task.identifier, retry_task.identifier))
+      return [retry_task]
+
+    retry_tasks = []
+    for path_spec in abandoned_task.path_specs:
+      retry_task = abandoned_task.CreateRetryTask()
+      retry_task.path_spec = path_spec
+      retry_task.path_specs = None
+
+      retry_tasks.append(retry_task)
+
+    logger.debug('Retrying batch task {0:s} as {1:d} tasks.'.format(
+        abandoned_task.identifier, len(retry_tasks)))
+
+    return retry_tasks
+
   def _GetTaskPendingRetry(self):
     """Retrieves an abandoned task that should be retried.
 
@@ -247,7 +285,7 @@ class TaskManager(object):
     Returns:
       bool: True if there are abandoned tasks that need to be retried.
     """
-    return bool(self._GetTaskPendingRetry())
+    return bool(self._retry_tasks) or bool(self._GetTaskPendingRetry())
 
   def _UpdateLatestProcessingTime(self, task):
     """Updates the latest processing time of the task manager from the task.
@@ -292,16 +330,17 @@ class TaskManager(object):
           no abandoned tasks that should be retried.
     """
     with self._lock:
-      abandoned_task = self._GetTaskPendingRetry()
-      if not abandoned_task:
-        return None
+      if not self._retry_tasks:
+        abandoned_task = self._GetTaskPendingRetry()
+        if not abandoned_task:
+          return None
 
-      # The abandoned task is kept in _tasks_abandoned so it can be still
-      # identified in CheckTaskToMerge and UpdateTaskAsPendingMerge.
+        # The abandoned task is kept in _tasks_abandoned so it can be still
+        # identified in CheckTaskToMerge and UpdateTaskAsPendingMerge.
 
-      retry_task = abandoned_task.CreateRetryTask()
-      logger.debug('Retrying task {0:s} as {1:s}.'.format(
-          abandoned_task.identifier, retry_task.identifier))
+        self._retry_tasks.extend(self._CreateRetryTasks(abandoned_task))
+
+      retry_task = self._retry_tasks.popleft()
 
       self._tasks_queued[retry_task.identifier] = retry_task
       self._total_number_of_tasks += 1
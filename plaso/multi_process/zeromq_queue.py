@@ -381,6 +381,14 @@ class ZeroMQPullQueue(ZeroMQQueue):
     raise errors.WrongQueueType()
 
 
+class ZeroMQPullBindQueue(ZeroMQPullQueue):
+  """A Plaso queue backed by a ZeroMQ PULL socket that binds to a port.
+
+  This queue may only be used to pop items, not to push.
+  """
+  SOCKET_CONNECTION_TYPE = ZeroMQQueue.SOCKET_CONNECTION_BIND
+
+
 class ZeroMQPullConnectQueue(ZeroMQPullQueue):
   """A Plaso queue backed by a ZeroMQ PULL socket that connects to a port.
 
@@ -464,6 +472,14 @@ class ZeroMQPushBindQueue(ZeroMQPushQueue):
   SOCKET_CONNECTION_TYPE = ZeroMQQueue.SOCKET_CONNECTION_BIND
 
 
+class ZeroMQPushConnectQueue(ZeroMQPushQueue):
+  """A Plaso queue backed by a ZeroMQ PUSH socket that connects to a port.
+
+  This queue may only be used to push items, not to pop.
+  """
+  SOCKET_CONNECTION_TYPE = ZeroMQQueue.SOCKET_CONNECTION_CONNECT
+
+
 class ZeroMQRequestQueue(ZeroMQQueue):
   """Parent class for Plaso queues backed by ZeroMQ REQ sockets.
 
@@ -14,6 +14,35 @@ from plaso.formatters import default
 from plaso.output import logger
 
 
+class FormattedEventValues(object):
+  """Formatted event values.
+
+  The message and short message are determined on demand, since not every
+  output module uses both.
+
+  Attributes:
+    event_values (dict[str, object]): event values formatted by the message
+        formatter.
+    message (str): message or None if not determined.
+    message_formatter (EventFormatter): message formatter.
+    message_short (str): short message or None if not determined.
+  """
+
+  def __init__(self, message_formatter, event_values):
+    """Initializes formatted event values.
+
+    Args:
+      message_formatter (EventFormatter): message formatter.
+      event_values (dict[str, object]): event values formatted by the message
+          formatter.
+    """
+    super(FormattedEventValues, self).__init__()
+    self.event_values = event_values
+    self.message = None
+    self.message_formatter = message_formatter
+    self.message_short = None
+
+
 class EventFormattingHelper(object):
   """Output module event formatting helper."""
 
@@ -303,18 +332,15 @@ class FieldFormattingHelper(object):
     Returns:
       str: message field.
     """
-    message_formatter = output_mediator.GetMessageFormatter(
-        event_data.data_type)
-    if not message_formatter:
-      logger.warning(
-          'Using default message formatter for data type: {0:s}'.format(
-              event_data.data_type))
-      message_formatter = self._DEFAULT_MESSAGE_FORMATTER
+    formatted_event_values = self._GetFormattedEventValues(
+        output_mediator, event_data)
 
-    event_values = event_data.CopyToDict()
-    message_formatter.FormatEventValues(output_mediator, event_values)
+    if formatted_event_values.message is None:
+      formatted_event_values.message = (
+          formatted_event_values.message_formatter.GetMessage(
+              formatted_event_values.event_values))
 
-    return message_formatter.GetMessage(event_values)
+    return formatted_event_values.message
 
   def _FormatMessageShort(
       self, output_mediator, event, event_data, event_data_stream):
@@ -330,18 +356,15 @@ class FieldFormattingHelper(object):
     Returns:
       str: short message field.
     """
-    message_formatter = output_mediator.GetMessageFormatter(
-        event_data.data_type)
-    if not message_formatter:
-      logger.warning(
-          'Using default message formatter for data type: {0:s}'.format(
-              event_data.data_type))
-      message_formatter = self._DEFAULT_MESSAGE_FORMATTER
+    formatted_event_values = self._GetFormattedEventValues(
+        output_mediator, event_data)
 
-    event_values = event_data.CopyToDict()
-    message_formatter.FormatEventValues(output_mediator, event_values)
+    if formatted_event_values.message_short is None:
+      formatted_event_values.message_short = (
+          formatted_event_values.message_formatter.GetMessageShort(
+              formatted_event_values.event_values))
 
-    return message_formatter.GetMessageShort(event_values)
+    return formatted_event_values.message_short
 
   def _FormatParser(
       self, output_mediator, event, event_data, event_data_stream):
@@ -544,6 +567,41 @@ class FieldFormattingHelper(object):
 
   # pylint: enable=unused-argument
 
+  def _GetFormattedEventValues(self, output_mediator, event_data):
+    """Retrieves the formatted event values of event data.
+
+    The formatted event values are cached by the output mediator, so that
+    event data shared by multiple events and output fields is formatted once.
+
+    Args:
+      output_mediator (OutputMediator): mediates interactions between output
+          modules and other components, such as storage and dfVFS.
+      event_data (EventData): event data.
+
+    Returns:
+      FormattedEventValues: formatted event values.
+    """
+    formatted_event_values = output_mediator.GetCachedFormattedEventValues(
+        event_data)
+    if not formatted_event_values:
+      message_formatter = output_mediator.GetMessageFormatter(
+          event_data.data_type)
+      if not message_formatter:
+        logger.warning(
+            'Using default message formatter for data type: {0:s}'.format(
+                event_data.data_type))
+        message_formatter = self._DEFAULT_MESSAGE_FORMATTER
+
+      event_values = event_data.CopyToDict()
+      message_formatter.FormatEventValues(output_mediator, event_values)
+
+      formatted_event_values = FormattedEventValues(
+          message_formatter, event_values)
+      output_mediator.CacheFormattedEventValues(
+          event_data, formatted_event_values)
+
+    return formatted_event_values
+
   def _ReportEventError(self, event, event_data, error_message):
     """Reports an event related error.
 
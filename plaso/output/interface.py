@@ -62,6 +62,27 @@ class OutputModule(object):
       dict[str, str]: output field values per name.
     """
 
+  def GetFieldValuesOfMACBGroup(self, output_mediator, macb_group):
+    """Retrieves the output field values of a MACB group.
+
+    Args:
+      output_mediator (OutputMediator): mediates interactions between output
+          modules and other components, such as storage and dfVFS.
+      macb_group (list[tuple[event, event_data, event_data_stream, event_tag]]):
+          group of event, event_data, event_data_stream and event_tag objects
+          with identical timestamps, attributes and values.
+
+    Returns:
+      list[dict[str, str]]: output field values per name of the MACB group.
+    """
+    field_values_of_macb_group = []
+    for event, event_data, event_data_stream, event_tag in macb_group:
+      field_values = self.GetFieldValues(
+          output_mediator, event, event_data, event_data_stream, event_tag)
+      field_values_of_macb_group.append(field_values)
+
+    return field_values_of_macb_group
+
   def GetMissingArguments(self):
     """Retrieves arguments required by the module that have not been specified.
 
@@ -95,9 +116,21 @@ class OutputModule(object):
           group of event, event_data, event_data_stream and event_tag objects
           with identical timestamps, attributes and values.
     """
-    for event, event_data, event_data_stream, event_tag in macb_group:
-      field_values = self.GetFieldValues(
-          output_mediator, event, event_data, event_data_stream, event_tag)
+    field_values_of_macb_group = self.GetFieldValuesOfMACBGroup(
+        output_mediator, macb_group)
+    self.WriteFormattedMACBGroup(output_mediator, field_values_of_macb_group)
+
+  def WriteFormattedMACBGroup(
+      self, output_mediator, field_values_of_macb_group):
+    """Writes the output field values of a MACB group to the output.
+
+    Args:
+      output_mediator (OutputMediator): mediates interactions between output
+          modules and other components, such as storage and dfVFS.
+      field_values_of_macb_group (list[dict[str, str]]): output field values
+          per name of the MACB group, as returned by GetFieldValuesOfMACBGroup.
+    """
+    for field_values in field_values_of_macb_group:
       self.WriteFieldValues(output_mediator, field_values)
 
   def WriteFooter(self):
@@ -5,6 +5,7 @@ For documentation on the L2T CSV format see:
   https://forensics.wiki/l2t_csv
 """
 
+import collections
 import datetime
 import pytz
 
@@ -23,8 +24,8 @@ from plaso.output import text_file
 class L2TCSVEventFormattingHelper(shared_dsv.DSVEventFormattingHelper):
   """L2T CSV output module event formatting helper."""
 
-  def GetFormattedMACBGroup(self, output_mediator, macb_group):
-    """Retrieves a string representation of a MACB group.
+  def GetFieldValuesOfMACBGroup(self, output_mediator, macb_group):
+    """Retrieves the output field values of a MACB group.
 
     Args:
       output_mediator (OutputMediator): mediates interactions between output
@@ -34,12 +35,12 @@ class L2TCSVEventFormattingHelper(shared_dsv.DSVEventFormattingHelper):
           with identical timestamps, attributes and values.
 
     Returns:
-      str: string representation of the MACB group.
+      dict[str, str]: output field values per name of the MACB group.
     """
     timestamp_descriptions = [
         event.timestamp_desc for event, _, _, _ in macb_group]
 
-    field_values = []
+    field_values = collections.OrderedDict()
     for field_name in self._field_names:
       if field_name == 'MACB':
         field_value = output_mediator.GetMACBRepresentationFromDescriptions(
@@ -57,9 +58,25 @@ class L2TCSVEventFormattingHelper(shared_dsv.DSVEventFormattingHelper):
         field_value = '-'
 
       field_value = self._SanitizeField(field_value)
-      field_values.append(field_value)
+      field_values[field_name] = field_value
 
-    return self.field_delimiter.join(field_values)
+    return field_values
+
+  def GetFormattedMACBGroup(self, output_mediator, macb_group):
+    """Retrieves a string representation of a MACB group.
+
+    Args:
+      output_mediator (OutputMediator): mediates interactions between output
+          modules and other components, such as storage and dfVFS.
+      macb_group (list[tuple[event, event_data, event_data_stream, event_tag]]):
+          group of event, event_data, event_data_stream and event_tag objects
+          with identical timestamps, attributes and values.
+
+    Returns:
+      str: string representation of the MACB group.
+    """
+    field_values = self.GetFieldValuesOfMACBGroup(output_mediator, macb_group)
+    return self.field_delimiter.join(field_values.values())
 
 
 class L2TCSVFieldFormattingHelper(formatting_helper.FieldFormattingHelper):
@@ -302,8 +319,8 @@ class L2TCSVOutputModule(text_file.SortedTextFileOutputModule):
         field_values.values())
     return ''.join([output_text, '\n'])
 
-  def WriteFieldValuesOfMACBGroup(self, output_mediator, macb_group):
-    """Writes field values of a MACB group to the output.
+  def GetFieldValuesOfMACBGroup(self, output_mediator, macb_group):
+    """Retrieves the output field values of a MACB group.
 
     Args:
       output_mediator (OutputMediator): mediates interactions between output
@@ -311,11 +328,28 @@ class L2TCSVOutputModule(text_file.SortedTextFileOutputModule):
       macb_group (list[tuple[event, event_data, event_data_stream, event_tag]]):
           group of event, event_data, event_data_stream and event_tag objects
           with identical timestamps, attributes and values.
+
+    Returns:
+      list[dict[str, str]]: output field values per name of the MACB group.
     """
-    output_text = self._event_formatting_helper.GetFormattedMACBGroup(
+    field_values = self._event_formatting_helper.GetFieldValuesOfMACBGroup(
         output_mediator, macb_group)
+    return [field_values]
 
-    self.WriteLine(output_text)
+  def WriteFormattedMACBGroup(
+      self, output_mediator, field_values_of_macb_group):
+    """Writes the output field values of a MACB group to the output.
+
+    Args:
+      output_mediator (OutputMediator): mediates interactions between output
+          modules and other components, such as storage and dfVFS.
+      field_values_of_macb_group (list[dict[str, str]]): output field values
+          per name of the MACB group, as returned by GetFieldValuesOfMACBGroup.
+    """
+    for field_values in field_values_of_macb_group:
+      output_text = self._event_formatting_helper.field_delimiter.join(
+          field_values.values())
+      self.WriteLine(output_text)
 
   def WriteHeader(self, output_mediator):
     """Writes the header to the output.
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """The output mediator object."""
 
+import collections
 import glob
 import os
 import pytz
@@ -18,6 +19,10 @@ class OutputMediator(object):
 
   Attributes:
     data_location (Optional[str]): path of the formatter data files.
+    number_of_formatting_cache_hits (int): number of times formatted event
+        values were retrieved from the formatting cache.
+    number_of_formatting_cache_misses (int): number of times formatted event
+        values were not available in the formatting cache.
   """
 
   _DEFAULT_ENCODING = 'utf-8'
@@ -27,6 +32,11 @@ class OutputMediator(object):
 
   _DEFAULT_TIME_ZONE = pytz.UTC
 
+  # The maximum number of event data of which the formatted event values are
+  # cached. Events that share event data, such as the events of a MACB group,
+  # are typically close to each other in the timeline.
+  _MAXIMUM_NUMBER_OF_CACHED_FORMATTED_EVENT_VALUES = 8192
+
   _WINEVT_RC_DATABASE = 'winevt-rc.db'
 
   def __init__(
@@ -43,6 +53,7 @@ class OutputMediator(object):
     """
     super(OutputMediator, self).__init__()
     self._dynamic_time = dynamic_time
+    self._formatting_cache = collections.OrderedDict()
     self._hostname = None
     self._language_tag = None
     self._lcid = None
@@ -55,6 +66,8 @@ class OutputMediator(object):
     self._username_by_identifier = {}
 
     self.data_location = data_location
+    self.number_of_formatting_cache_hits = 0
+    self.number_of_formatting_cache_misses = 0
 
   @property
   def dynamic_time(self):
@@ -71,6 +84,27 @@ class OutputMediator(object):
     """datetime.tzinfo: time zone."""
     return self._time_zone or self._DEFAULT_TIME_ZONE
 
+  def _GetFormattingCacheLookupKey(self, event_data):
+    """Retrieves the formatting cache lookup key of event data.
+
+    Args:
+      event_data (EventData): event data.
+
+    Returns:
+      int: formatting cache lookup key or None if the event data was not read
+          from storage.
+    """
+    identifier = event_data.GetIdentifier()
+    if not identifier or identifier.name != event_data.CONTAINER_TYPE:
+      return None
+
+    # Attribute containers that were not read from storage have an identifier
+    # based on the memory address of the container, which can be reused.
+    if identifier.sequence_number == id(event_data):
+      return None
+
+    return identifier.sequence_number
+
   def _ReadMessageFormattersFile(self, path, override_existing=False):
     """Reads a message formatters configuration file.
 
@@ -122,6 +156,51 @@ class OutputMediator(object):
 
     return user_accounts[0]
 
+  def CacheFormattedEventValues(self, event_data, formatted_event_values):
+    """Caches the formatted event values of event data.
+
+    The least recently used formatted event values are removed from the cache
+    when the maximum number of cached formatted event values is exceeded.
+    Event data that was not read from storage is not cached.
+
+    Args:
+      event_data (EventData): event data.
+      formatted_event_values (FormattedEventValues): formatted event values.
+    """
+    lookup_key = self._GetFormattingCacheLookupKey(event_data)
+    if lookup_key is None:
+      return
+
+    self._formatting_cache[lookup_key] = formatted_event_values
+
+    if (len(self._formatting_cache) >
+        self._MAXIMUM_NUMBER_OF_CACHED_FORMATTED_EVENT_VALUES):
+      self._formatting_cache.popitem(last=False)
+
+  def GetCachedFormattedEventValues(self, event_data):
+    """Retrieves the cached formatted event values of event data.
+
+    Args:
+      event_data (EventData): event data.
+
+    Returns:
+      FormattedEventValues: formatted event values or None if not available.
+    """
+    formatted_event_values = None
+
+    lookup_key = self._GetFormattingCacheLookupKey(event_data)
+    if lookup_key is not None:
+      formatted_event_values = self._formatting_cache.get(lookup_key, None)
+
+    if not formatted_event_values:
+      self.number_of_formatting_cache_misses += 1
+      return None
+
+    self._formatting_cache.move_to_end(lookup_key)
+    self.number_of_formatting_cache_hits += 1
+
+    return formatted_event_values
+
   def GetDisplayNameForPathSpec(self, path_spec):
     """Retrieves the display name for a path specification.
 
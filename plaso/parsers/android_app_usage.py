@@ -38,6 +38,7 @@ class AndroidAppUsageParser(interface.FileObjectParser):
 
   NAME = 'android_app_usage'
   DATA_FORMAT = 'Android usage history (usage-history.xml) file'
+  PARSE_CACHE_SUPPORTED = True
 
   _HEADER_READ_SIZE = 128
 
@@ -82,6 +82,7 @@ class ASLParser(interface.FileObjectParser, dtfabric_helper.DtFabricHelper):
 
   NAME = 'asl_log'
   DATA_FORMAT = 'Apple System Log (ASL) file'
+  PARSE_CACHE_SUPPORTED = True
 
   _DEFINITION_FILE = os.path.join(
       os.path.dirname(__file__), 'asl.yaml')
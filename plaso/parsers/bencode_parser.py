@@ -146,6 +146,7 @@ class BencodeParser(interface.FileObjectParser):
 
   NAME = 'bencode'
   DATA_FORMAT = 'Bencoded file'
+  PARSE_CACHE_SUPPORTED = True
 
   # Regex match for a bencode dictionary followed by a field size.
   _BENCODE_RE = re.compile(b'd[0-9]')
@@ -41,6 +41,7 @@ class TransmissionBencodePlugin(interface.BencodePlugin):
 
   NAME = 'bencode_transmission'
   DATA_FORMAT = 'Transmission BitTorrent activity file'
+  PARSE_CACHE_SUPPORTED = True
 
   _BENCODE_KEYS = frozenset([
       'activity-date', 'added-date', 'destination', 'done-date',
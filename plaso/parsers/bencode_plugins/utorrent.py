@@ -49,6 +49,7 @@ class UTorrentBencodePlugin(interface.BencodePlugin):
 
   NAME = 'bencode_utorrent'
   DATA_FORMAT = 'uTorrent active torrent file'
+  PARSE_CACHE_SUPPORTED = True
 
   # The following set is used to determine if the bencoded data is appropriate
   # for this plugin. If there's a match, the entire bencoded data block is
@@ -73,6 +73,7 @@ class BodyfileParser(interface.FileObjectParser):
 
   NAME = 'bodyfile'
   DATA_FORMAT = 'SleuthKit version 3 bodyfile'
+  PARSE_CACHE_SUPPORTED = True
 
   _INITIAL_FILE_OFFSET = 0
 
@@ -45,6 +45,7 @@ class BSMParser(interface.FileObjectParser, dtfabric_helper.DtFabricHelper):
 
   NAME = 'bsm_log'
   DATA_FORMAT = 'Basic Security Module (BSM) event auditing file'
+  PARSE_CACHE_SUPPORTED = True
 
   _DEFINITION_FILE = os.path.join(
       os.path.dirname(__file__), 'bsm.yaml')
@@ -84,6 +84,7 @@ class ChromePreferencesParser(interface.FileObjectParser):
   """Parses Chrome Preferences files."""
 
   NAME = 'chrome_preferences'
+  PARSE_CACHE_SUPPORTED = True
 
   DATA_FORMAT = 'Google Chrome Preferences file'
 
@@ -84,6 +84,7 @@ class CupsIppParser(interface.FileObjectParser, dtfabric_helper.DtFabricHelper):
 
   NAME = 'cups_ipp'
   DATA_FORMAT = 'CUPS IPP file'
+  PARSE_CACHE_SUPPORTED = True
 
   _DEFINITION_FILE = os.path.join(
       os.path.dirname(__file__), 'cups_ipp.yaml')
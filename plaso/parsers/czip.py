@@ -18,6 +18,7 @@ class CompoundZIPParser(interface.FileObjectParser):
 
   NAME = 'czip'
   DATA_FORMAT = 'Compound ZIP file'
+  PARSE_CACHE_SUPPORTED = True
 
   _plugin_classes = {}
 
@@ -89,6 +89,7 @@ class OpenXMLPlugin(interface.CompoundZIPPlugin):
 
   NAME = 'oxml'
   DATA_FORMAT = 'OpenXML (OXML) file'
+  PARSE_CACHE_SUPPORTED = True
 
   REQUIRED_PATHS = frozenset([
       '[Content_Types].xml', '_rels/.rels', 'docProps/core.xml'])
@@ -83,6 +83,7 @@ class ESEDBParser(interface.FileObjectParser):
 
   NAME = 'esedb'
   DATA_FORMAT = 'Extensible Storage Engine (ESE) Database File (EDB) format'
+  PARSE_CACHE_SUPPORTED = True
 
   _plugin_classes = {}
 
@@ -119,6 +120,7 @@ class ESEDBParser(interface.FileObjectParser):
     # Compare the list of available plugin objects.
     cache = ESEDBCache()
     try:
+      plugin_tables = []
       for plugin_name, plugin in self._plugins_per_name.items():
         if parser_mediator.abort:
           break
@@ -137,14 +139,35 @@ class ESEDBParser(interface.FileObjectParser):
               display_name, plugin_name))
           continue
 
+        for table_name in plugin.GetTableNames():
+          plugin_tables.append((plugin_name, table_name))
+
+      # The tables of a large database can be split into ranges of tables
+      # that are parsed separately.
+      first_table_index, number_of_tables = parser_mediator.GetRecordRange(
+          len(plugin_tables))
+
+      table_names_per_plugin = {}
+      for plugin_name, table_name in plugin_tables[
+          first_table_index:first_table_index + number_of_tables]:
+        table_names_per_plugin.setdefault(plugin_name, set()).add(table_name)
+
+      for plugin_name, table_names in table_names_per_plugin.items():
+        if parser_mediator.abort:
+          break
+
         logger.debug('Parsing file: {0:s} with plugin: {1:s}'.format(
             display_name, plugin_name))
 
+        plugin = self._plugins_per_name[plugin_name]
+        profiling_name = '/'.join([self.NAME, plugin.NAME])
+
         parser_mediator.SampleStartTiming(profiling_name)
 
         try:
           plugin.UpdateChainAndProcess(
-              parser_mediator, cache=cache, database=database)
+              parser_mediator, cache=cache, database=database,
+              table_names=table_names)
 
         except Exception as exception:  # pylint: disable=broad-except
           parser_mediator.ProduceExtractionWarning((
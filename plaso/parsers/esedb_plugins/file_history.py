@@ -41,6 +41,7 @@ class FileHistoryESEDBPlugin(interface.ESEDBPlugin):
 
   NAME = 'file_history'
   DATA_FORMAT = 'Windows 8 File History ESE database file'
+  PARSE_CACHE_SUPPORTED = True
 
   # TODO: Add support for other tables as well, backupset, file, library, etc.
   REQUIRED_TABLES = {
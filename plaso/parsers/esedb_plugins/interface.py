@@ -284,7 +284,8 @@ class ESEDBPlugin(plugins.BasePlugin, dtfabric_helper.DtFabricHelper):
     return record_values
 
   def _ParseESEDatabase(
-      self, parser_mediator, cache=None, database=None, **kwargs):
+      self, parser_mediator, cache=None, database=None, table_names=None,
+      **kwargs):
     """Extracts event objects from the database.
 
     Args:
@@ -292,6 +293,8 @@ class ESEDBPlugin(plugins.BasePlugin, dtfabric_helper.DtFabricHelper):
           and other components, such as storage and dfVFS.
       cache (Optional[ESEDBCache]): cache.
       database (Optional[ESEDatabase]): ESE database.
+      table_names (Optional[set[str]]): names of the tables to parse, where
+          None represents all tables.
 
     Raises:
       ValueError: If the database attribute is not valid.
@@ -303,6 +306,9 @@ class ESEDBPlugin(plugins.BasePlugin, dtfabric_helper.DtFabricHelper):
       if parser_mediator.abort:
         break
 
+      if table_names is not None and table_name not in table_names:
+        continue
+
       if not callback_method:
         # Table names without a callback method are allowed to improve
         # the detection of a database based on its table names.
@@ -346,8 +352,22 @@ class ESEDBPlugin(plugins.BasePlugin, dtfabric_helper.DtFabricHelper):
 
     return set(self.REQUIRED_TABLES.keys()).issubset(database.tables)
 
+  def GetTableNames(self):
+    """Retrieves the names of the tables the plugin parses.
+
+    Returns:
+      list[str]: names of the tables with a callback method, sorted in the
+          order they are parsed.
+    """
+    return [
+        table_name
+        for table_name, callback_method in sorted(self._tables.items())
+        if callback_method]
+
   # pylint: disable=arguments-differ
-  def Process(self, parser_mediator, cache=None, database=None, **kwargs):
+  def Process(
+      self, parser_mediator, cache=None, database=None, table_names=None,
+      **kwargs):
     """Extracts events from an ESE database.
 
     Args:
@@ -355,6 +375,8 @@ class ESEDBPlugin(plugins.BasePlugin, dtfabric_helper.DtFabricHelper):
           and other components, such as storage and dfVFS.
       cache (Optional[ESEDBCache]): cache.
       database (Optional[ESEDatabase]): ESE database.
+      table_names (Optional[set[str]]): names of the tables to parse, where
+          None represents all tables.
 
     Raises:
       ValueError: If the database argument is not valid.
@@ -366,4 +388,5 @@ class ESEDBPlugin(plugins.BasePlugin, dtfabric_helper.DtFabricHelper):
     super(ESEDBPlugin, self).Process(parser_mediator)
 
     self._ParseESEDatabase(
-        parser_mediator, cache=cache, database=database, **kwargs)
+        parser_mediator, cache=cache, database=database,
+        table_names=table_names, **kwargs)
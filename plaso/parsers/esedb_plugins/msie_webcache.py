@@ -174,6 +174,7 @@ class MsieWebCacheESEDBPlugin(interface.ESEDBPlugin):
   DATA_FORMAT = (
       'Internet Explorer WebCache ESE database (WebCacheV01.dat, '
       'WebCacheV24.dat) file')
+  PARSE_CACHE_SUPPORTED = True
 
   # TODO: add support for AppCache_#, AppCacheEntry_#, DependencyEntry_#
 
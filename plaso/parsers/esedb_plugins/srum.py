@@ -148,6 +148,7 @@ class SystemResourceUsageMonitorESEDBPlugin(interface.ESEDBPlugin):
 
   NAME = 'srum'
   DATA_FORMAT = 'System Resource Usage Monitor (SRUM) ESE database file'
+  PARSE_CACHE_SUPPORTED = True
 
   # TODO: add support for tables:
   # {5C8CF1C7-7257-4F13-B223-970EF5939312}
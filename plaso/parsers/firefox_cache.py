@@ -143,6 +143,7 @@ class FirefoxCacheParser(
 
   NAME = 'firefox_cache'
   DATA_FORMAT = 'Mozilla Firefox Cache version 1 file (version 31 or earlier)'
+  PARSE_CACHE_SUPPORTED = True
 
   _DEFINITION_FILE = os.path.join(
       os.path.dirname(__file__), 'firefox_cache.yaml')
@@ -365,6 +366,7 @@ class FirefoxCache2Parser(
 
   NAME = 'firefox_cache2'
   DATA_FORMAT = 'Mozilla Firefox Cache version 2 file (version 32 or later)'
+  PARSE_CACHE_SUPPORTED = True
 
   _DEFINITION_FILE = os.path.join(
       os.path.dirname(__file__), 'firefox_cache.yaml')
@@ -39,6 +39,7 @@ class FishHistoryParser(interface.FileObjectParser):
 
   NAME = 'fish_history'
   DATA_FORMAT = 'Fish history file'
+  PARSE_CACHE_SUPPORTED = True
 
   _ENCODING = 'utf-8'
 
@@ -63,6 +63,10 @@ class BaseParser(object):
   # the parser manager to generate parser and plugin information.
   DATA_FORMAT = ''
 
+  # True if the parse results of the parser only depend on the content and
+  # name of the data stream, so that these can be stored in the parse cache.
+  PARSE_CACHE_SUPPORTED = False
+
   # List of filters that should match for the parser to be applied.
   FILTERS = frozenset()
 
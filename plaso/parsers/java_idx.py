@@ -62,6 +62,7 @@ class JavaIDXParser(interface.FileObjectParser, dtfabric_helper.DtFabricHelper):
 
   NAME = 'java_idx'
   DATA_FORMAT = 'Java WebStart Cache IDX file'
+  PARSE_CACHE_SUPPORTED = True
 
   _INITIAL_FILE_OFFSET = None
 
@@ -17,6 +17,7 @@ class JSONLParser(interface.FileObjectParser):
 
   NAME = 'jsonl'
   DATA_FORMAT = 'JSON-L log file'
+  PARSE_CACHE_SUPPORTED = True
 
   _ENCODING = 'utf-8'
 
@@ -51,6 +51,7 @@ class AWSCloudTrailLogJSONLPlugin(interface.JSONLPlugin):
 
   NAME = 'aws_cloudtrail_log'
   DATA_FORMAT = 'AWS CloudTrail Log'
+  PARSE_CACHE_SUPPORTED = True
 
   def _ParseRecord(self, parser_mediator, json_dict):
     """Parses an AWS CloudTrail log record.
@@ -57,6 +57,7 @@ class AzureActivityLogJSONLPlugin(interface.JSONLPlugin):
 
   NAME = 'azure_activity_log'
   DATA_FORMAT = 'Azure Activity Log'
+  PARSE_CACHE_SUPPORTED = True
 
   def _ParseRecord(self, parser_mediator, json_dict):
     """Parses an Azure activity log record.
@@ -106,6 +106,7 @@ class AzureApplicationGatewayAccessLogJSONLPlugin(interface.JSONLPlugin):
 
   NAME = 'azure_application_gateway_access_log'
   DATA_FORMAT = 'Azure Application Gateway access log'
+  PARSE_CACHE_SUPPORTED = True
 
   def _ParseRecord(self, parser_mediator, json_dict):
     """Parses an Azure application gateway access log record.
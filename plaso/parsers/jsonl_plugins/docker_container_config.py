@@ -46,6 +46,7 @@ class DockerContainerConfigurationJSONLPlugin(interface.JSONLPlugin):
 
   NAME = 'docker_container_config'
   DATA_FORMAT = 'Docker container configuration file'
+  PARSE_CACHE_SUPPORTED = True
 
   def _ParseISO8601DateTimeString(self, parser_mediator, json_dict, name):
     """Parses an ISO8601 date and time string.
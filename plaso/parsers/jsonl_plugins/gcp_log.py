@@ -77,6 +77,7 @@ class GCPLogJSONLPlugin(interface.JSONLPlugin):
 
   NAME = 'gcp_log'
   DATA_FORMAT = 'Google Cloud (GCP) log'
+  PARSE_CACHE_SUPPORTED = True
 
   def _ParseJSONPayload(self, json_dict, event_data):
     """Extracts information from a jsonPayload value.
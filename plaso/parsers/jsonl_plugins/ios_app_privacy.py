@@ -56,6 +56,7 @@ class IOSAppPrivacPlugin(interface.JSONLPlugin):
 
   NAME = 'ios_application_privacy'
   DATA_FORMAT = 'iOS Application Privacy report'
+  PARSE_CACHE_SUPPORTED = True
 
   def _ParseRecord(self, parser_mediator, json_dict):
     """Parses an iOS application privacy report record.
@@ -57,6 +57,7 @@ class Microsoft365AuditLogJSONLPlugin(interface.JSONLPlugin):
 
   NAME = 'microsoft_audit_log'
   DATA_FORMAT = 'Microsoft (Office) 365 audit log'
+  PARSE_CACHE_SUPPORTED = True
 
   def _ParseRecord(self, parser_mediator, json_dict):
     """Parses a Microsoft (Office) 365 audit log record.
@@ -39,6 +39,7 @@ class LocateDatabaseParser(
 
   NAME = 'locate_database'
   DATA_FORMAT = 'Locate database file (updatedb)'
+  PARSE_CACHE_SUPPORTED = True
 
   _DEFINITION_FILE = os.path.join(
       os.path.dirname(__file__), 'locate.yaml')
@@ -128,6 +128,7 @@ class KeychainParser(
 
   NAME = 'mac_keychain'
   DATA_FORMAT = 'MacOS keychain database file'
+  PARSE_CACHE_SUPPORTED = True
 
   _DEFINITION_FILE = os.path.join(
       os.path.dirname(__file__), 'macos_keychain.yaml')
@@ -1,14 +1,22 @@
 # -*- coding: utf-8 -*-
 """The parsers and plugins manager."""
 
+import importlib
+
 import pysigscan
 
 from plaso.filters import parser_filter
 from plaso.lib import specification
+from plaso.parsers import manifest
 
 
 class ParsersManager(object):
-  """The parsers and plugins manager."""
+  """The parsers and plugins manager.
+
+  The modules of the parsers are imported on demand, based on the parsers
+  manifest, so that only the parsers selected by a parser filter expression
+  are imported.
+  """
 
   ALL_PLUGINS = set(['*'])
 
@@ -39,6 +47,11 @@ class ParsersManager(object):
     excludes, includes = parser_filter_helper.SplitExpression(
         parser_filter_expression)
 
+    if includes:
+      cls._ImportParserModules(parser_names=includes.keys())
+    else:
+      cls._ImportParserModules()
+
     for parser_name, parser_class in cls._parser_classes.items():
       # If there are no includes all parsers are included by default.
       if not includes and parser_name in excludes:
@@ -49,6 +62,26 @@ class ParsersManager(object):
 
       yield parser_name, parser_class
 
+  @classmethod
+  def _ImportParserModules(cls, parser_names=None):
+    """Imports the modules of parsers, which registers them.
+
+    Parsers that are not defined in the parsers manifest, such as parsers
+    registered by tests, are expected to be registered explicitly.
+
+    Args:
+      parser_names (Optional[iterable[str]]): names of the parsers to import,
+          where None represents all parsers in the parsers manifest.
+    """
+    if parser_names is None:
+      parser_names = manifest.PARSER_MODULES.keys()
+
+    for parser_name in parser_names:
+      for module_name in manifest.PARSER_MODULES.get(parser_name, None) or []:
+        # Modules that were imported previously are retrieved from the module
+        # cache by import_module.
+        importlib.import_module(module_name)
+
   @classmethod
   def CreateSignatureScanner(cls, specification_store):
     """Creates a signature scanner for format specifications with signatures.
@@ -107,6 +140,8 @@ class ParsersManager(object):
     unknown_parser_elements = set()
 
     if not parser_filter_expression:
+      cls._ImportParserModules()
+
       for parser_name, parser_class in cls._parser_classes.items():
         known_parser_elements.add(parser_name)
         if parser_class.SupportsPlugins():
@@ -120,6 +155,8 @@ class ParsersManager(object):
           parser_expression = element[1:]
 
         parser_name, _, plugin_name = parser_expression.partition('/')
+        cls._ImportParserModules(parser_names=[parser_name])
+
         parser_class = cls._parser_classes.get(parser_name, None)
         if not parser_class:
           unknown_parser_elements.add(element)
@@ -220,6 +257,27 @@ class ParsersManager(object):
 
     return sorted(parser_names)
 
+  @classmethod
+  def GetNamesWithParseCacheSupport(cls):
+    """Retrieves the names of parsers and plugins that support the parse cache.
+
+    Returns:
+      set[str]: names of the parsers and plugins of which the parse results
+          can be stored in the parse cache.
+    """
+    parser_names = set()
+
+    for parser_name, parser_class in cls._GetParsers():
+      if parser_class.PARSE_CACHE_SUPPORTED:
+        parser_names.add(parser_name)
+
+      if parser_class.SupportsPlugins():
+        for plugin_name, plugin_class in parser_class.GetPlugins():
+          if plugin_class.PARSE_CACHE_SUPPORTED:
+            parser_names.add(plugin_name)
+
+    return parser_names
+
   @classmethod
   def GetParserPluginsInformation(cls, parser_filter_expression=None):
     """Retrieves the parser plugins information.
@@ -275,18 +333,12 @@ class ParsersManager(object):
       dict[str, BaseParser]: parsers per name.
     """
     parser_filter_helper = parser_filter.ParserFilterExpressionHelper()
-    excludes, includes = parser_filter_helper.SplitExpression(
+    _, includes = parser_filter_helper.SplitExpression(
         parser_filter_expression)
 
     parser_objects = {}
-    for parser_name, parser_class in cls._parser_classes.items():
-      # If there are no includes all parsers are included by default.
-      if not includes and parser_name in excludes:
-        continue
-
-      if includes and parser_name not in includes:
-        continue
-
+    for parser_name, parser_class in cls._GetParsers(
+        parser_filter_expression=parser_filter_expression):
       parser_object = parser_class()
       if parser_class.SupportsPlugins():
         plugin_includes = includes.get(parser_name, cls.ALL_PLUGINS)
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""The parsers manifest.
+
+The parsers manifest maps the name of a parser to the modules that need to be
+imported to register the parser and its plugins.
+
+This file is generated by utils/generate_parsers_manifest.py, do not edit.
+"""
+
+PARSER_MODULES = {
+    'android_app_usage': ('plaso.parsers.android_app_usage', ),
+    'asl_log': ('plaso.parsers.asl', ),
+    'bencode': (
+        'plaso.parsers.bencode_parser',
+        'plaso.parsers.bencode_plugins'),
+    'binary_cookies': ('plaso.parsers.safari_cookies', ),
+    'bodyfile': ('plaso.parsers.bodyfile', ),
+    'bsm_log': ('plaso.parsers.bsm', ),
+    'chrome_cache': ('plaso.parsers.chrome_cache', ),
+    'chrome_preferences': ('plaso.parsers.chrome_preferences', ),
+    'cups_ipp': ('plaso.parsers.cups_ipp', ),
+    'custom_destinations': ('plaso.parsers.custom_destinations', ),
+    'czip': (
+        'plaso.parsers.czip',
+        'plaso.parsers.czip_plugins'),
+    'esedb': (
+        'plaso.parsers.esedb',
+        'plaso.parsers.esedb_plugins'),
+    'filestat': ('plaso.parsers.filestat', ),
+    'firefox_cache': ('plaso.parsers.firefox_cache', ),
+    'firefox_cache2': ('plaso.parsers.firefox_cache', ),
+    'fish_history': ('plaso.parsers.fish_history', ),
+    'fseventsd': ('plaso.parsers.fseventsd', ),
+    'java_idx': ('plaso.parsers.java_idx', ),
+    'jsonl': (
+        'plaso.parsers.jsonl_parser',
+        'plaso.parsers.jsonl_plugins'),
+    'lnk': ('plaso.parsers.winlnk', ),
+    'locate_database': ('plaso.parsers.locate', ),
+    'mac_keychain': ('plaso.parsers.macos_keychain', ),
+    'mcafee_protection': ('plaso.parsers.mcafeeav', ),
+    'mft': ('plaso.parsers.ntfs', ),
+    'msiecf': ('plaso.parsers.msiecf', ),
+    'networkminer_fileinfo': ('plaso.parsers.networkminer', ),
+    'olecf': (
+        'plaso.parsers.olecf',
+        'plaso.parsers.olecf_plugins'),
+    'onedrive_log': ('plaso.parsers.onedrive', ),
+    'opera_global': ('plaso.parsers.opera', ),
+    'opera_typed_history': ('plaso.parsers.opera', ),
+    'pe': ('plaso.parsers.pe', ),
+    'plist': (
+        'plaso.parsers.plist',
+        'plaso.parsers.plist_plugins'),
+    'pls_recall': ('plaso.parsers.pls_recall', ),
+    'prefetch': ('plaso.parsers.winprefetch', ),
+    'recycle_bin': ('plaso.parsers.recycler', ),
+    'recycle_bin_info2': ('plaso.parsers.recycler', ),
+    'rplog': ('plaso.parsers.winrestore', ),
+    'simatic_s7': ('plaso.parsers.wincc', ),
+    'spotlight_storedb': ('plaso.parsers.spotlight_storedb', ),
+    'sqlite': (
+        'plaso.parsers.sqlite',
+        'plaso.parsers.sqlite_plugins'),
+    'symantec_scanlog': ('plaso.parsers.symantec', ),
+    'systemd_journal': ('plaso.parsers.systemd_journal', ),
+    'text': (
+        'plaso.parsers.text_parser',
+        'plaso.parsers.text_plugins'),
+    'trendmicro_url': ('plaso.parsers.trendmicroav', ),
+    'trendmicro_vd': ('plaso.parsers.trendmicroav', ),
+    'unified_logging': ('plaso.parsers.unified_logging', ),
+    'usnjrnl': ('plaso.parsers.ntfs', ),
+    'utmp': ('plaso.parsers.utmp', ),
+    'utmpx': ('plaso.parsers.utmpx', ),
+    'wincc_sys': ('plaso.parsers.wincc', ),
+    'windefender_history': ('plaso.parsers.windefender_history', ),
+    'winevt': ('plaso.parsers.winevt', ),
+    'winevtx': ('plaso.parsers.winevtx', ),
+    'winjob': ('plaso.parsers.winjob', ),
+    'winpca_db0': ('plaso.parsers.winpca', ),
+    'winpca_dic': ('plaso.parsers.winpca', ),
+    'winreg': (
+        'plaso.parsers.winreg_parser',
+        'plaso.parsers.winreg_plugins')}
@@ -48,6 +48,7 @@ class McafeeAccessProtectionParser(dsv_parser.DSVParser):
 
   NAME = 'mcafee_protection'
   DATA_FORMAT = 'McAfee Anti-Virus access protection log file'
+  PARSE_CACHE_SUPPORTED = True
 
   DELIMITER = '\t'
   COLUMNS = [
@@ -6,6 +6,7 @@ import datetime
 import time
 
 from plaso.containers import artifacts
+from plaso.containers import event_sources
 from plaso.containers import events
 from plaso.containers import warnings
 from plaso.engine import path_helper
@@ -53,9 +54,12 @@ class ParserMediator(object):
     super(ParserMediator, self).__init__()
     self._abort = False
     self._cached_parser_chain = None
+    self._deferred_event_data = None
+    self._deferred_event_data_stream = None
     self._environment_variables_per_path_spec = None
     self._event_data_stream = None
     self._event_data_stream_identifier = None
+    self._event_data_stream_values_string = None
     self._extract_winevt_resources = True
     self._extract_winreg_binary_values = False
     self._file_entry = None
@@ -73,6 +77,9 @@ class ParserMediator(object):
     self._parsers_memory_profiler = None
     self._preferred_code_page = None
     self._process_information = None
+    self._record_range = None
+    self._record_range_data_size = 0
+    self._recorded_attribute_containers = None
     self._resolver_context = resolver_context
     self._storage_writer = None
     self._temporary_directory = None
@@ -126,6 +133,19 @@ class ParserMediator(object):
     """str: path of the directory for temporary files."""
     return self._temporary_directory
 
+  def _AddAttributeContainer(self, container):
+    """Adds an attribute container to the storage writer.
+
+    The attribute container is also recorded when recording is enabled.
+
+    Args:
+      container (AttributeContainer): attribute container.
+    """
+    self._storage_writer.AddAttributeContainer(container)
+
+    if self._recorded_attribute_containers is not None:
+      self._recorded_attribute_containers.append(container)
+
   def _CreateEnvironmentVariablesPerPathSpec(self, system_configurations):
     """Creates the environment variables per path specification lookup table.
 
@@ -210,7 +230,7 @@ class ParserMediator(object):
       date_less_log_helper.SetEventDataStreamIdentifier(
           self._event_data_stream_identifier)
 
-    self._storage_writer.AddAttributeContainer(date_less_log_helper)
+    self._AddAttributeContainer(date_less_log_helper)
 
   def AddWindowsEventLogMessageFile(self, message_file):
     """Adds a Windows EventLog message file.
@@ -219,7 +239,7 @@ class ParserMediator(object):
       message_file (WindowsEventLogMessageFileArtifact): Windows EventLog
           message file.
     """
-    self._storage_writer.AddAttributeContainer(message_file)
+    self._AddAttributeContainer(message_file)
 
   def AddWindowsEventLogMessageString(self, message_string):
     """Adds a Windows EventLog message string.
@@ -228,7 +248,7 @@ class ParserMediator(object):
       message_string (WindowsEventLogMessageStringArtifact): Windows EventLog
           message string.
     """
-    self._storage_writer.AddAttributeContainer(message_string)
+    self._AddAttributeContainer(message_string)
 
   def AddWindowsWevtTemplateEvent(self, event_definition):
     """Adds a Windows WEVT_TEMPLATE event definition.
@@ -237,7 +257,7 @@ class ParserMediator(object):
       event_definition (WindowsWevtTemplateEvent): Windows WEVT_TEMPLATE event
           definition.
     """
-    self._storage_writer.AddAttributeContainer(event_definition)
+    self._AddAttributeContainer(event_definition)
 
   def AppendToParserChain(self, name):
     """Adds a parser or parser plugin to the parser chain.
@@ -372,6 +392,62 @@ class ParserMediator(object):
       self._cached_parser_chain = '/'.join(self._parser_chain_components)
     return self._cached_parser_chain
 
+  def GetRecordRange(self, number_of_records):
+    """Retrieves the range of records of the active data stream to parse.
+
+    Parsers that can split a data stream into record ranges call this method
+    with the number of records in the data stream. When a record range was set,
+    that range is parsed. Otherwise, when the data stream is larger than twice
+    the record range data size, event sources are produced for all but the
+    first record range, so that these can be parsed by other workers.
+
+    Args:
+      number_of_records (int): number of records in the data stream.
+
+    Returns:
+      tuple[int, int]: index of the first record and number of records to
+          parse.
+
+    Raises:
+      RuntimeError: when storage writer is not set.
+    """
+    if self._record_range:
+      first_record_index, number_of_records_in_range = self._record_range
+      first_record_index = min(first_record_index, number_of_records)
+      number_of_records_in_range = min(
+          number_of_records_in_range, number_of_records - first_record_index)
+      return first_record_index, number_of_records_in_range
+
+    data_size = getattr(self._file_entry, 'size', None) or 0
+    parser_chain = self.GetParserChain()
+
+    # Only data streams parsed directly by a parser, and not by a parser
+    # plugin or nested parser, are split.
+    if (not self._record_range_data_size or number_of_records < 2 or
+        data_size < 2 * self._record_range_data_size or '/' in parser_chain):
+      return 0, number_of_records
+
+    number_of_ranges = min(
+        data_size // self._record_range_data_size, number_of_records)
+    range_size, remainder = divmod(number_of_records, number_of_ranges)
+    if remainder:
+      range_size += 1
+
+    path_spec = getattr(self._event_data_stream, 'path_spec', None)
+    if not path_spec:
+      path_spec = self._file_entry.path_spec
+
+    for first_record_index in range(range_size, number_of_records, range_size):
+      event_source = event_sources.RecordRangeEventSource(
+          file_entry_type=self._file_entry.entry_type,
+          first_record_index=first_record_index,
+          number_of_records=min(
+              range_size, number_of_records - first_record_index),
+          parser_name=parser_chain, path_spec=path_spec)
+      self.ProduceEventSource(event_source)
+
+    return 0, range_size
+
   def GetRelativePath(self):
     """Retrieves the relative path of the current file entry.
 
@@ -485,11 +561,23 @@ class ParserMediator(object):
       event_data.SetEventDataStreamIdentifier(
           self._event_data_stream_identifier)
 
-    event_values_hash = events.CalculateEventValuesHash(
-        event_data, self._event_data_stream)
-    setattr(event_data, '_event_values_hash', event_values_hash)
+    if self._deferred_event_data is not None:
+      self._deferred_event_data.append((event_data, self._event_data_stream))
+
+      # Deferred event data is recorded when produced, so that recording
+      # covers the event data of the current data stream.
+      if self._recorded_attribute_containers is not None:
+        self._recorded_attribute_containers.append(event_data)
+
+    else:
+      event_values_hash = events.CalculateEventValuesHash(
+          event_data, self._event_data_stream,
+          event_data_stream_values_string=(
+              self._event_data_stream_values_string))
+      setattr(event_data, '_event_values_hash', event_values_hash)
+
+      self._AddAttributeContainer(event_data)
 
-    self._storage_writer.AddAttributeContainer(event_data)
     self._number_of_event_data += 1
 
     self.last_activity_timestamp = time.time()
@@ -510,16 +598,22 @@ class ParserMediator(object):
     if not event_data_stream:
       self._event_data_stream = None
       self._event_data_stream_identifier = None
+      self._event_data_stream_values_string = None
     else:
       if not event_data_stream.path_spec:
         event_data_stream.path_spec = getattr(
             self._file_entry, 'path_spec', None)
 
-      self._storage_writer.AddAttributeContainer(event_data_stream)
+      self._AddAttributeContainer(event_data_stream)
 
       self._event_data_stream = event_data_stream
       self._event_data_stream_identifier = event_data_stream.GetIdentifier()
 
+      # The event data stream values are part of the event values hash of
+      # every event data of the stream, hence they are determined once.
+      self._event_data_stream_values_string = (
+          events.GetEventDataStreamValuesString(event_data_stream))
+
     self.last_activity_timestamp = time.time()
 
   def ProduceEventSource(self, event_source):
@@ -534,7 +628,7 @@ class ParserMediator(object):
     if not self._storage_writer:
       raise RuntimeError('Storage writer not set.')
 
-    self._storage_writer.AddAttributeContainer(event_source)
+    self._AddAttributeContainer(event_source)
     self._number_of_event_sources += 1
 
     self.last_activity_timestamp = time.time()
@@ -560,7 +654,7 @@ class ParserMediator(object):
     parser_chain = self.GetParserChain()
     warning = warnings.ExtractionWarning(
         message=message, parser_chain=parser_chain, path_spec=path_spec)
-    self._storage_writer.AddAttributeContainer(warning)
+    self._AddAttributeContainer(warning)
     self._number_of_extraction_warnings += 1
 
     self.last_activity_timestamp = time.time()
@@ -586,7 +680,7 @@ class ParserMediator(object):
     parser_chain = self.GetParserChain()
     warning = warnings.RecoveryWarning(
         message=message, parser_chain=parser_chain, path_spec=path_spec)
-    self._storage_writer.AddAttributeContainer(warning)
+    self._AddAttributeContainer(warning)
     self._number_of_recovery_warnings += 1
 
     self.last_activity_timestamp = time.time()
@@ -676,6 +770,7 @@ class ParserMediator(object):
     """
     self._event_data_stream = None
     self._event_data_stream_identifier = None
+    self._event_data_stream_values_string = None
     self._file_entry = file_entry
 
   def SetPreferredCodepage(self, code_page):
@@ -711,6 +806,29 @@ class ParserMediator(object):
     self._language_tag = language_tag
     self._lcid = lcid
 
+  def SetRecordRange(self, first_record_index, number_of_records):
+    """Sets the range of records of the active data stream to parse.
+
+    Args:
+      first_record_index (int): index of the first record to parse or None
+          to parse all records.
+      number_of_records (int): number of records to parse.
+    """
+    if first_record_index is None:
+      self._record_range = None
+    else:
+      self._record_range = (first_record_index, number_of_records)
+
+  def SetRecordRangeDataSize(self, record_range_data_size):
+    """Sets the record range data size.
+
+    Args:
+      record_range_data_size (int): approximate size of the data, in bytes,
+          of a record range into which a data stream is split, where 0
+          represents data streams are not split.
+    """
+    self._record_range_data_size = record_range_data_size or 0
+
   def SetStorageWriter(self, storage_writer):
     """Sets the storage writer.
 
@@ -735,6 +853,16 @@ class ParserMediator(object):
     """Signals the parsers to abort."""
     self._abort = True
 
+  def StartDeferringEventData(self):
+    """Starts deferring the event data produced for the event data stream.
+
+    Event data is deferred when the values of the event data stream, which
+    are part of the event values hash, are not final yet, such as when the
+    analyzers run concurrently with the parsers.
+    """
+    self._deferred_event_data = []
+    self._deferred_event_data_stream = self._event_data_stream
+
   def StartProfiling(self, configuration, identifier, process_information):
     """Starts profiling.
 
@@ -767,6 +895,10 @@ class ParserMediator(object):
 
     self._process_information = process_information
 
+  def StartRecordingAttributeContainers(self):
+    """Starts recording the attribute containers added to storage."""
+    self._recorded_attribute_containers = []
+
   def StopProfiling(self):
     """Stops profiling."""
     if self._format_checks_cpu_time_profiler:
@@ -782,3 +914,62 @@ class ParserMediator(object):
       self._parsers_memory_profiler = None
 
     self._process_information = None
+
+  def StopDeferringEventData(self):
+    """Stops deferring event data and writes the deferred event data.
+
+    The event data stream that was active when deferring started is updated
+    in storage since its values are final. Note that a parser can produce
+    other event data streams while event data is deferred, such as the SQLite
+    parser for a database with a write-ahead log (WAL).
+
+    Raises:
+      RuntimeError: when storage writer is not set.
+    """
+    if not self._storage_writer:
+      raise RuntimeError('Storage writer not set.')
+
+    deferred_event_data = self._deferred_event_data or []
+    deferred_event_data_stream = self._deferred_event_data_stream
+    self._deferred_event_data = None
+    self._deferred_event_data_stream = None
+
+    if deferred_event_data_stream:
+      self._storage_writer.UpdateAttributeContainer(deferred_event_data_stream)
+
+      if self._event_data_stream is deferred_event_data_stream:
+        self._event_data_stream_values_string = (
+            events.GetEventDataStreamValuesString(deferred_event_data_stream))
+
+    values_string_per_event_data_stream = {}
+    for event_data, event_data_stream in deferred_event_data:
+      values_string = None
+      if event_data_stream:
+        lookup_key = id(event_data_stream)
+        values_string = values_string_per_event_data_stream.get(
+            lookup_key, None)
+        if values_string is None:
+          values_string = events.GetEventDataStreamValuesString(
+              event_data_stream)
+          values_string_per_event_data_stream[lookup_key] = values_string
+
+      event_values_hash = events.CalculateEventValuesHash(
+          event_data, event_data_stream,
+          event_data_stream_values_string=values_string)
+      setattr(event_data, '_event_values_hash', event_values_hash)
+
+      # The event data was already recorded when it was produced.
+      self._storage_writer.AddAttributeContainer(event_data)
+
+    self.last_activity_timestamp = time.time()
+
+  def StopRecordingAttributeContainers(self):
+    """Stops recording the attribute containers added to storage.
+
+    Returns:
+      list[AttributeContainer]: attribute containers added to storage since
+          recording was started.
+    """
+    recorded_attribute_containers = self._recorded_attribute_containers or []
+    self._recorded_attribute_containers = None
+    return recorded_attribute_containers
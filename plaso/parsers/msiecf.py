@@ -122,6 +122,7 @@ class MSIECFParser(interface.FileObjectParser):
   NAME = 'msiecf'
   DATA_FORMAT = (
       'Microsoft Internet Explorer (MSIE) 4 - 9 cache (index.dat) file')
+  PARSE_CACHE_SUPPORTED = True
 
   def _ParseLeak(
       self, parser_mediator, cache_directories, msiecf_item, recovered=False):
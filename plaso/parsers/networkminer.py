@@ -45,6 +45,7 @@ class NetworkMinerParser(dsv_parser.DSVParser):
 
   NAME = 'networkminer_fileinfo'
   DATA_FORMAT = 'NetworkMiner .fileinfos file'
+  PARSE_CACHE_SUPPORTED = True
 
   COLUMNS = (
       'source_ip', 'source_port', 'destination_ip', 'destination_port',
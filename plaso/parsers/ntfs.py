@@ -341,7 +341,13 @@ class NTFSMFTParser(interface.FileObjectParser):
           'unable to open $MFT file with error: {0!s}'.format(exception))
       return
 
-    for entry_index in range(0, mft_metadata_file.number_of_file_entries):
+    # The entries of a large $MFT can be split into record ranges that are
+    # parsed separately.
+    first_entry_index, number_of_entries = parser_mediator.GetRecordRange(
+        mft_metadata_file.number_of_file_entries)
+
+    for entry_index in range(
+        first_entry_index, first_entry_index + number_of_entries):
       try:
         mft_entry = mft_metadata_file.get_file_entry(entry_index)
         if (not mft_entry.is_empty() and
@@ -16,6 +16,7 @@ class OLECFParser(interface.FileObjectParser):
 
   NAME = 'olecf'
   DATA_FORMAT = 'OLE Compound File (OLECF) format'
+  PARSE_CACHE_SUPPORTED = True
 
   _INITIAL_FILE_OFFSET = None
 
@@ -34,6 +34,7 @@ class DefaultOLECFPlugin(interface.OLECFPlugin):
 
   NAME = 'olecf_default'
   DATA_FORMAT = 'Generic OLE compound item'
+  PARSE_CACHE_SUPPORTED = True
 
   def _ParseItem(self, parser_mediator, olecf_item):
     """Parses an OLECF item.
@@ -328,6 +328,7 @@ class DocumentSummaryInformationOLECFPlugin(interface.OLECFPlugin):
   NAME = 'olecf_document_summary'
   DATA_FORMAT = (
       'Document summary information (\\0x05DocumentSummaryInformation)')
+  PARSE_CACHE_SUPPORTED = True
 
   # pylint: disable=anomalous-backslash-in-string
   REQUIRED_ITEMS = frozenset(['\005DocumentSummaryInformation'])
@@ -369,6 +370,7 @@ class SummaryInformationOLECFPlugin(interface.OLECFPlugin):
   NAME = 'olecf_summary'
   DATA_FORMAT = (
       'Summary information (\\0x05SummaryInformation) (top-level only)')
+  PARSE_CACHE_SUPPORTED = True
 
   # pylint: disable=anomalous-backslash-in-string
   REQUIRED_ITEMS = frozenset(['\005SummaryInformation'])
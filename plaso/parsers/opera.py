@@ -69,6 +69,7 @@ class OperaTypedHistoryParser(interface.FileObjectParser):
 
   NAME = 'opera_typed_history'
   DATA_FORMAT = 'Opera typed history (typed_history.xml) file'
+  PARSE_CACHE_SUPPORTED = True
 
   _HEADER_READ_SIZE = 128
 
@@ -133,6 +134,7 @@ class OperaGlobalHistoryParser(interface.FileObjectParser):
 
   NAME = 'opera_global'
   DATA_FORMAT = 'Opera global history (global_history.dat) file'
+  PARSE_CACHE_SUPPORTED = True
 
   _ENCODING = 'utf-8'
 
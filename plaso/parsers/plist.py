@@ -18,6 +18,7 @@ class PlistParser(interface.FileObjectParser):
 
   NAME = 'plist'
   DATA_FORMAT = 'Property list (plist) file'
+  PARSE_CACHE_SUPPORTED = True
 
   # 50 MB is 10x larger than any plist file seen to date.
   _MAXIMUM_FILE_SIZE = 50000000
@@ -31,6 +31,7 @@ class MacOSAirportPlistPlugin(interface.PlistPlugin):
 
   NAME = 'airport'
   DATA_FORMAT = 'Airport plist file'
+  PARSE_CACHE_SUPPORTED = True
 
   PLIST_PATH_FILTERS = frozenset([
       interface.PlistPathFilter('com.apple.airport.preferences.plist')])
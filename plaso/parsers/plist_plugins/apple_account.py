@@ -48,6 +48,7 @@ class AppleAccountPlistPlugin(interface.PlistPlugin):
 
   NAME = 'apple_id'
   DATA_FORMAT = 'Apple account information plist file'
+  PARSE_CACHE_SUPPORTED = True
 
   PLIST_PATH_FILTERS = frozenset([
       interface.PrefixPlistPathFilter(
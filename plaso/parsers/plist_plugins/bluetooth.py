@@ -54,6 +54,7 @@ class MacOSBluetoothPlistPlugin(interface.PlistPlugin):
 
   NAME = 'macos_bluetooth'
   DATA_FORMAT = 'MacOS Bluetooth plist file'
+  PARSE_CACHE_SUPPORTED = True
 
   PLIST_PATH_FILTERS = frozenset([
       interface.PlistPathFilter('com.apple.bluetooth.plist')])
@@ -15,6 +15,7 @@ class DefaultPlugin(interface.PlistPlugin):
 
   NAME = 'plist_default'
   DATA_FORMAT = 'plist file'
+  PARSE_CACHE_SUPPORTED = True
 
   # pylint: disable=arguments-differ
   def _ParsePlist(self, parser_mediator, top_level=None, **unused_kwargs):
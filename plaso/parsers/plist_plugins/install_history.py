@@ -34,6 +34,7 @@ class MacOSInstallHistoryPlistPlugin(interface.PlistPlugin):
 
   NAME = 'macos_install_history'
   DATA_FORMAT = 'MacOS installation history plist file'
+  PARSE_CACHE_SUPPORTED = True
 
   PLIST_PATH_FILTERS = frozenset([
       interface.PlistPathFilter('InstallHistory.plist')])
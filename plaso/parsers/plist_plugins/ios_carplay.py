@@ -35,6 +35,7 @@ class IOSCarPlayPlistPlugin(interface.PlistPlugin):
 
   NAME = 'ios_carplay'
   DATA_FORMAT = 'Apple iOS Car Play application plist file'
+  PARSE_CACHE_SUPPORTED = True
 
   PLIST_PATH_FILTERS = frozenset([
       interface.PlistPathFilter('com.apple.CarPlayApp.plist')])
@@ -36,6 +36,7 @@ class IOSIdstatusachePlistPlugin(interface.PlistPlugin):
 
   NAME = 'ios_identityservices'
   DATA_FORMAT = 'Idstatuscache plist file'
+  PARSE_CACHE_SUPPORTED = True
 
   PLIST_PATH_FILTERS = frozenset([interface.PlistPathFilter(
       'com.apple.identityservices.idstatuscache.plist')])
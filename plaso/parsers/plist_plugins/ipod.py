@@ -41,6 +41,7 @@ class IPodPlugin(interface.PlistPlugin):
 
   NAME = 'ipod_device'
   DATA_FORMAT = 'iPod, iPad and iPhone plist file'
+  PARSE_CACHE_SUPPORTED = True
 
   PLIST_PATH_FILTERS = frozenset([
       interface.PlistPathFilter('com.apple.iPod.plist')])
@@ -47,6 +47,7 @@ class MacOSLaunchdPlistPlugin(interface.PlistPlugin):
 
   NAME = 'launchd_plist'
   DATA_FORMAT = 'Launchd plist file'
+  PARSE_CACHE_SUPPORTED = True
 
   # The PLIST_PATH is dynamic, the prefix filename is, by default, named using
   # reverse-domain notation. For example, Chrome is com.google.chrome.plist.
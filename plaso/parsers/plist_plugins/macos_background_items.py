@@ -48,6 +48,7 @@ class MacOSBackgroundItemsPlistPlugin(
   NAME = 'macos_background_items_plist'
   DATA_FORMAT = (
       'Mac OS backgrounditems.btm or BackgroundItems-v[3-9].btm plist file')
+  PARSE_CACHE_SUPPORTED = True
 
   PLIST_PATH_FILTERS = frozenset([
       interface.PlistPathFilter('backgrounditems.btm'),
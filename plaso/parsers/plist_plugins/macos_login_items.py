@@ -51,6 +51,7 @@ class MacOSLoginItemsPlistPlugin(
 
   NAME = 'macos_login_items_plist'
   DATA_FORMAT = 'Mac OS com.apple.loginitems.plist file'
+  PARSE_CACHE_SUPPORTED = True
 
   PLIST_PATH_FILTERS = frozenset([
       interface.PlistPathFilter('com.apple.loginitems.plist')])
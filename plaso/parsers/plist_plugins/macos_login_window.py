@@ -56,6 +56,7 @@ class MacOSLoginWindowPlugin(interface.PlistPlugin):
 
   NAME = 'macos_login_window_plist'
   DATA_FORMAT = 'Mac OS login window plist file'
+  PARSE_CACHE_SUPPORTED = True
 
   PLIST_PATH_FILTERS = frozenset([
     interface.PlistPathFilter('loginwindow.plist'),
@@ -34,6 +34,7 @@ class MacOSStartupItemPlugin(interface.PlistPlugin):
 
   NAME = 'macos_startup_item_plist'
   DATA_FORMAT = 'Mac OS startup item plist file'
+  PARSE_CACHE_SUPPORTED = True
 
   PLIST_PATH_FILTERS = frozenset([
       interface.PlistPathFilter('StartupParameters.plist')])
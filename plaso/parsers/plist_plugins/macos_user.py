@@ -69,6 +69,7 @@ class MacOSUserPlistPlugin(interface.PlistPlugin):
 
   NAME = 'macuser'
   DATA_FORMAT = 'MacOS user plist file'
+  PARSE_CACHE_SUPPORTED = True
 
   # The PLIST_PATH is dynamic, "user".plist is the name of the
   # MacOS user.
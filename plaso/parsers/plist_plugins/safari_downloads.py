@@ -40,6 +40,7 @@ class SafariDownloadsPlistPlugin(interface.PlistPlugin):
 
   NAME = 'safari_downloads'
   DATA_FORMAT = 'Safari Downloads plist file'
+  PARSE_CACHE_SUPPORTED = True
 
   PLIST_PATH_FILTERS = frozenset([
       interface.PlistPathFilter('Downloads.plist')])
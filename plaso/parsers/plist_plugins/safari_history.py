@@ -40,6 +40,7 @@ class SafariHistoryPlugin(interface.PlistPlugin):
 
   NAME = 'safari_history'
   DATA_FORMAT = 'Safari history plist file'
+  PARSE_CACHE_SUPPORTED = True
 
   PLIST_PATH_FILTERS = frozenset([
       interface.PlistPathFilter('History.plist')])
@@ -41,6 +41,7 @@ class MacOSSoftwareUpdatePlistPlugin(interface.PlistPlugin):
 
   NAME = 'macos_software_update'
   DATA_FORMAT = 'MacOS software update plist file'
+  PARSE_CACHE_SUPPORTED = True
 
   PLIST_PATH_FILTERS = frozenset([
       interface.PlistPathFilter('com.apple.SoftwareUpdate.plist')])
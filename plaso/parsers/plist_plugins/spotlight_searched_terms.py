@@ -41,6 +41,7 @@ class SpotlightSearchedTermsPlistPlugin(interface.PlistPlugin):
 
   NAME = 'spotlight'
   DATA_FORMAT = 'Spotlight searched terms plist file'
+  PARSE_CACHE_SUPPORTED = True
 
   PLIST_PATH_FILTERS = frozenset([
       interface.PlistPathFilter('com.apple.spotlight.plist')])
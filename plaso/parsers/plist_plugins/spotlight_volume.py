@@ -31,6 +31,7 @@ class SpotlightVolumeConfigurationPlistPlugin(interface.PlistPlugin):
 
   NAME = 'spotlight_volume'
   DATA_FORMAT = 'Spotlight volume configuration plist file'
+  PARSE_CACHE_SUPPORTED = True
 
   PLIST_PATH_FILTERS = frozenset([
       interface.PlistPathFilter('VolumeConfiguration.plist')])
@@ -52,6 +52,7 @@ class MacOSTimeMachinePlistPlugin(
 
   NAME = 'time_machine'
   DATA_FORMAT = 'MacOS TimeMachine plist file'
+  PARSE_CACHE_SUPPORTED = True
 
   PLIST_PATH_FILTERS = frozenset([
       interface.PlistPathFilter('com.apple.TimeMachine.plist')])
@@ -39,6 +39,10 @@ class BasePlugin(object):
   # the parser manager to generate parser and plugin information.
   DATA_FORMAT = ''
 
+  # True if the parse results of the plugin only depend on the content and
+  # name of the data stream, so that these can be stored in the parse cache.
+  PARSE_CACHE_SUPPORTED = False
+
   # pylint: disable=unused-argument
   def Process(self, parser_mediator, **kwargs):
     """Extracts events using a parser plugin.
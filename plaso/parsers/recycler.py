@@ -48,6 +48,7 @@ class WinRecycleBinParser(
 
   NAME = 'recycle_bin'
   DATA_FORMAT = 'Windows $Recycle.Bin $I file'
+  PARSE_CACHE_SUPPORTED = True
 
   _DEFINITION_FILE = os.path.join(
       os.path.dirname(__file__), 'recycler.yaml')
@@ -146,6 +147,7 @@ class WinRecyclerInfo2Parser(
 
   NAME = 'recycle_bin_info2'
   DATA_FORMAT = 'Windows Recycler INFO2 file'
+  PARSE_CACHE_SUPPORTED = True
 
   _DEFINITION_FILE = os.path.join(
       os.path.dirname(__file__), 'recycler.yaml')
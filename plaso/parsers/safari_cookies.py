@@ -52,6 +52,7 @@ class BinaryCookieParser(
 
   NAME = 'binary_cookies'
   DATA_FORMAT = 'Safari Binary Cookie file'
+  PARSE_CACHE_SUPPORTED = True
 
   _DEFINITION_FILE = os.path.join(
       os.path.dirname(__file__), 'safari_cookies.yaml')
@@ -2,9 +2,11 @@
 """SQLite parser."""
 
 import os
+import pathlib
 import sqlite3
 import tempfile
 
+from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.path import factory as path_spec_factory
 
 from plaso.containers import events
@@ -108,6 +110,13 @@ class SQLiteCache(plugins.BasePluginCache):
 class SQLiteDatabase(object):
   """SQLite database.
 
+  The database is opened, in order of preference:
+
+  * directly, read-only and immutable, if the database is stored in a file on
+    the host operating system and has no Write-Ahead Log (WAL);
+  * from memory, if the database has no WAL and is small enough;
+  * from a temporary copy of the database and its WAL otherwise.
+
   Attributes:
     schema (dict[str, str]): schema as an SQL query per table name, for
         example {'Users': 'CREATE TABLE Users ("id" INTEGER PRIMARY KEY, ...)'}.
@@ -115,6 +124,9 @@ class SQLiteDatabase(object):
 
   _READ_BUFFER_SIZE = 65536
 
+  # Maximum size of a database that is opened from memory.
+  _MAXIMUM_IN_MEMORY_SIZE = 64 * 1024 * 1024
+
   SCHEMA_QUERY = (
       'SELECT tbl_name, sql '
       'FROM sqlite_master '
@@ -157,40 +169,64 @@ class SQLiteDatabase(object):
       temporary_file.write(data)
       data = file_object.read(self._READ_BUFFER_SIZE)
 
-  def Close(self):
-    """Closes the database connection and cleans up the temporary file."""
-    self.schema = {}
-    self._database = None
+  def _OpenDatabaseInMemory(self, file_object):
+    """Opens the database from a copy of the file-like object in memory.
 
-    if os.path.exists(self._temp_db_file_path):
-      try:
-        os.remove(self._temp_db_file_path)
-      except (OSError, IOError) as exception:
-        logger.warning((
-            'Unable to remove temporary copy: {0:s} of SQLite database: '
-            '{1:s} with error: {2!s}').format(
-                self._temp_db_file_path, self._filename, exception))
+    The database is not opened if it is too large to be copied into memory.
 
-    self._temp_db_file_path = ''
+    Args:
+      file_object (dfvfs.FileIO): file-like object.
 
-    if os.path.exists(self._temp_wal_file_path):
-      try:
-        os.remove(self._temp_wal_file_path)
-      except (OSError, IOError) as exception:
-        logger.warning((
-            'Unable to remove temporary copy: {0:s} of SQLite database: '
-            '{1:s} with error: {2!s}').format(
-                self._temp_wal_file_path, self._filename, exception))
+    Raises:
+      IOError: if the file-like object cannot be read.
+      OSError: if the file-like object cannot be read.
+      sqlite3.DatabaseError: if the database cannot be opened.
+    """
+    # Connection.deserialize is available as of Python 3.11.
+    if not hasattr(sqlite3.Connection, 'deserialize'):
+      return
 
-    self._temp_wal_file_path = ''
+    file_object.seek(0, os.SEEK_END)
+    file_size = file_object.tell()
+    if file_size > self._MAXIMUM_IN_MEMORY_SIZE:
+      return
 
-  def Open(self, file_object, wal_file_object=None):
-    """Opens a SQLite database file.
+    file_object.seek(0, os.SEEK_SET)
+    data = bytearray(file_object.read(file_size))
 
-    Since pysqlite cannot read directly from a file-like object a temporary
-    copy of the file is made. After creating a copy the database file this
-    function sets up a connection with the database and determines the names
-    of the tables.
+    # SQLite cannot open a database in WAL mode from memory, hence the file
+    # format version numbers are changed from WAL (2) to legacy (1). This
+    # does not affect reading the database since the WAL is not used.
+    if data[18:20] == b'\x02\x02':
+      data[18:20] = b'\x01\x01'
+
+    self._database = sqlite3.connect(':memory:')
+    try:
+      self._database.deserialize(bytes(data))
+    except sqlite3.DatabaseError:
+      self._database.close()
+      self._database = None
+      raise
+
+  def _OpenDatabaseWithPath(self, path):
+    """Opens the database directly from a file on the host operating system.
+
+    The database is opened read-only and immutable, which prevents SQLite from
+    changing the file or creating journal files next to it.
+
+    Args:
+      path (str): path of the database file on the host operating system.
+
+    Raises:
+      sqlite3.OperationalError: if the database file cannot be opened.
+    """
+    uri = '{0:s}?mode=ro&immutable=1'.format(
+        pathlib.Path(os.path.abspath(path)).as_uri())
+
+    self._database = sqlite3.connect(uri, uri=True)
+
+  def _OpenDatabaseWithTemporaryCopy(self, file_object, wal_file_object=None):
+    """Opens the database from a temporary copy of the file-like objects.
 
     Args:
       file_object (dfvfs.FileIO): file-like object.
@@ -200,25 +236,7 @@ class SQLiteDatabase(object):
     Raises:
       IOError: if the file-like object cannot be read.
       OSError: if the file-like object cannot be read.
-      sqlite3.DatabaseError: if the database cannot be parsed.
-      ValueError: if the file-like object is missing.
     """
-    if not file_object:
-      raise ValueError('Missing file object.')
-
-    # TODO: Current design copies the entire file into a buffer
-    # that is parsed by each SQLite parser. This is not very efficient,
-    # especially when many SQLite parsers are ran against a relatively
-    # large SQLite database. This temporary file that is created should
-    # be usable by all SQLite parsers so the file should only be read
-    # once in memory and then deleted when all SQLite parsers have completed.
-
-    # TODO: Change this into a proper implementation using APSW
-    # and virtual filesystems when that will be available.
-    # Info: http://apidoc.apsw.googlecode.com/hg/vfs.html#vfs and
-    # http://apidoc.apsw.googlecode.com/hg/example.html#example-vfs
-    # Until then, just copy the file into a tempfile and parse it.
-
     with tempfile.NamedTemporaryFile(
         delete=False, dir=self._temporary_directory) as temporary_file:
       try:
@@ -244,6 +262,83 @@ class SQLiteDatabase(object):
           raise
 
     self._database = sqlite3.connect(self._temp_db_file_path)
+
+  def _RemoveTemporaryFile(self, path):
+    """Removes a temporary copy of the database or its WAL.
+
+    Args:
+      path (str): path of the temporary file.
+    """
+    if os.path.exists(path):
+      try:
+        os.remove(path)
+      except (OSError, IOError) as exception:
+        logger.warning((
+            'Unable to remove temporary copy: {0:s} of SQLite database: '
+            '{1:s} with error: {2!s}').format(
+                path, self._filename, exception))
+
+  def Close(self):
+    """Closes the database connection and cleans up the temporary files."""
+    self.schema = {}
+
+    if self._database:
+      self._database.close()
+      self._database = None
+
+    self._RemoveTemporaryFile(self._temp_db_file_path)
+    self._temp_db_file_path = ''
+
+    self._RemoveTemporaryFile(self._temp_wal_file_path)
+    self._temp_wal_file_path = ''
+
+  def Open(self, file_object, wal_file_object=None, path=None):
+    """Opens a SQLite database file.
+
+    Since pysqlite cannot read directly from a file-like object the database
+    is opened directly if it is stored in a file on the host operating
+    system, or otherwise from a copy in memory or in a temporary file. After
+    opening the database this function determines the names of the tables.
+
+    Args:
+      file_object (dfvfs.FileIO): file-like object.
+      wal_file_object (Optional[dfvfs.FileIO]): file-like object for the
+          Write-Ahead Log (WAL) file.
+      path (Optional[str]): path of the database file on the host operating
+          system, where None represents a database that is not stored in
+          a file on the host operating system.
+
+    Raises:
+      IOError: if the file-like object cannot be read.
+      OSError: if the file-like object cannot be read.
+      sqlite3.DatabaseError: if the database cannot be parsed.
+      ValueError: if the file-like object is missing.
+    """
+    if not file_object:
+      raise ValueError('Missing file object.')
+
+    # The WAL needs to be stored next to the database for SQLite to apply it,
+    # hence a database with a WAL is always opened from a temporary copy.
+    if path and not wal_file_object:
+      try:
+        self._OpenDatabaseWithPath(path)
+      except sqlite3.OperationalError as exception:
+        logger.debug((
+            'Unable to open SQLite database: {0:s} directly with error: '
+            '{1!s}').format(self._filename, exception))
+
+    if not self._database and not wal_file_object:
+      try:
+        self._OpenDatabaseInMemory(file_object)
+      except sqlite3.DatabaseError as exception:
+        logger.debug((
+            'Unable to open SQLite database: {0:s} from memory with error: '
+            '{1!s}').format(self._filename, exception))
+
+    if not self._database:
+      self._OpenDatabaseWithTemporaryCopy(
+          file_object, wal_file_object=wal_file_object)
+
     try:
       self._database.row_factory = sqlite3.Row
       cursor = self._database.cursor()
@@ -266,14 +361,7 @@ class SQLiteDatabase(object):
           self.columns_per_table[table_name].append(pragma_result['name'])
 
     except sqlite3.DatabaseError as exception:
-      self._database.close()
-      self._database = None
-
-      os.remove(self._temp_db_file_path)
-      self._temp_db_file_path = ''
-      if self._temp_wal_file_path:
-        os.remove(self._temp_wal_file_path)
-        self._temp_wal_file_path = ''
+      self.Close()
 
       logger.debug(
           'Unable to parse SQLite database: {0:s} with error: {1!s}'.format(
@@ -356,6 +444,23 @@ class SQLiteParser(interface.FileEntryParser):
 
     return database_wal, wal_file_entry
 
+  def _GetHostPath(self, file_entry):
+    """Retrieves the path of a file entry on the host operating system.
+
+    Args:
+      file_entry (dfvfs.FileEntry): file entry.
+
+    Returns:
+      str: path of the file entry on the host operating system or None if
+          the file entry is not stored in a file on the host operating system.
+    """
+    path_spec = file_entry.path_spec
+    if (path_spec.type_indicator != dfvfs_definitions.TYPE_INDICATOR_OS or
+        path_spec.HasParent()):
+      return None
+
+    return getattr(path_spec, 'location', None)
+
   def _ParseFileEntryWithPlugin(
       self, parser_mediator, plugin, database, display_name, cache):
     """Parses a SQLite database file entry with a specific plugin.
@@ -428,7 +533,7 @@ class SQLiteParser(interface.FileEntryParser):
 
     file_object = file_entry.GetFileObject()
     try:
-      database.Open(file_object)
+      database.Open(file_object, path=self._GetHostPath(file_entry))
 
     except (IOError, ValueError, sqlite3.DatabaseError) as exception:
       parser_mediator.ProduceExtractionWarning(
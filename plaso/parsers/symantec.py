@@ -152,6 +152,7 @@ class SymantecParser(dsv_parser.DSVParser):
 
   NAME = 'symantec_scanlog'
   DATA_FORMAT = 'Symantec AV Corporate Edition and Endpoint Protection log file'
+  PARSE_CACHE_SUPPORTED = True
 
   # Define the columns that make up the structure of a Symantec log file.
   # http://www.symantec.com/docs/TECH100099
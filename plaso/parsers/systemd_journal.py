@@ -47,6 +47,7 @@ class SystemdJournalParser(
 
   NAME = 'systemd_journal'
   DATA_FORMAT = 'Systemd journal file'
+  PARSE_CACHE_SUPPORTED = True
 
   _DEFINITION_FILE = os.path.join(
       os.path.dirname(__file__), 'systemd_journal.yaml')
@@ -120,6 +120,7 @@ class TextLogParser(interface.FileObjectParser):
 
   NAME = 'text'
   DATA_FORMAT = 'text-based log file'
+  PARSE_CACHE_SUPPORTED = True
 
   _NON_TEXT_CHARACTERS = frozenset([
       '\x00', '\x01', '\x02', '\x03', '\x04', '\x05', '\x06', '\x0b', '\x0e',
@@ -81,6 +81,7 @@ class AndroidLogcatTextPlugin(
 
   NAME = 'android_logcat'
   DATA_FORMAT = 'Android logcat file'
+  PARSE_CACHE_SUPPORTED = True
 
   ENCODING = 'utf-8'
 
@@ -6,6 +6,8 @@ defined in
 https://httpd.apache.org/docs/2.4/logs.html
 """
 
+import re
+
 import pyparsing
 
 from dfdatetime import time_elements as dfdatetime_time_elements
@@ -57,6 +59,7 @@ class ApacheAccessLogTextPlugin(interface.TextPlugin):
 
   NAME = 'apache_access'
   DATA_FORMAT = 'Apache access log (access.log) file'
+  PARSE_CACHE_SUPPORTED = True
 
   _MONTH_DICT = {
       'jan': 1,
@@ -182,6 +185,26 @@ class ApacheAccessLogTextPlugin(interface.TextPlugin):
       ('common_log_format', _COMMON_LOG_FORMAT_LINE),
       ('vhost_combined_log_format', _VHOST_COMBINED_LOG_FORMAT_LINE)]
 
+  # Fast path for log lines with an IPv4 address, that only matches lines that
+  # are parsed the same by the pyparsing grammar. Note that the referer cannot
+  # contain a backslash, since pyparsing converts escaped whitespace characters
+  # in a quoted string.
+  _FAST_PATH_REGULAR_EXPRESSION = re.compile(
+      r'(?:(?P<server_name>[-.0-9A-Za-z]+):(?P<port_number>[0-9]+) )?'
+      r'(?P<ip_address>'
+      r'(?:25[0-5]|2[0-4][0-9]|1?[0-9]{1,2})'
+      r'(?:\.(?:25[0-5]|2[0-4][0-9]|1?[0-9]{1,2})){3}) '
+      r'(?P<remote_name>[0-9A-Za-z]+|-) '
+      r'(?P<user_name>[.0-9@A-Za-z]+|-) '
+      r'\[(?P<day_of_month>[0-9]{2})/(?P<month>[A-Za-z]{3})/'
+      r'(?P<year>[0-9]{4}):(?P<hours>[0-9]{2}):(?P<minutes>[0-9]{2}):'
+      r'(?P<seconds>[0-9]{2}) (?P<time_zone_sign>[+-])'
+      r'(?P<time_zone_hours>[0-9]{2})(?P<time_zone_minutes>[0-9]{2})\] '
+      r'"(?P<http_method>CONNECT|DELETE|GET|HEAD|OPTIONS|PATCH|POST|PUT|'
+      r'TRACE) (?P<http_path>\S+) (?P<http_version>HTTP/[.0-9]+)" '
+      r'(?P<response_code>[0-9]+) (?P<response_bytes>[0-9]+|-)'
+      r'(?: "(?P<referer>[^"\n\r\\]*)" "(?P<user_agent>[^"\n\r]+)")?\n')
+
   VERIFICATION_GRAMMAR = (
       _COMBINED_LOG_FORMAT_LINE ^ _COMMON_LOG_FORMAT_LINE ^
       _VHOST_COMBINED_LOG_FORMAT_LINE)
@@ -190,6 +213,58 @@ class ApacheAccessLogTextPlugin(interface.TextPlugin):
       '"CONNECT ', '"DELETE ', '"GET ', '"HEAD ', ' HTTP/', '"OPTIONS ',
       '"PATCH ', '"POST ', '"PUT ', '"TRACE ']
 
+  def _GetFastPathStructure(self, match):
+    """Retrieves a line structure from a fast path regular expression match.
+
+    Args:
+      match (re.Match): fast path regular expression match.
+
+    Returns:
+      tuple[str, dict[str, object]]: name of the line structure (key) and
+          tokens of the line or None if the line should be parsed with
+          the pyparsing grammar instead.
+    """
+    response_bytes = match.group('response_bytes')
+    if response_bytes != '-':
+      response_bytes = int(response_bytes, 10)
+
+    structure = {
+        'date_time': [
+            int(match.group('day_of_month'), 10), match.group('month'),
+            int(match.group('year'), 10), int(match.group('hours'), 10),
+            int(match.group('minutes'), 10), int(match.group('seconds'), 10),
+            match.group('time_zone_sign'),
+            int(match.group('time_zone_hours'), 10),
+            int(match.group('time_zone_minutes'), 10)],
+        'http_request': [
+            match.group('http_method'), match.group('http_path'),
+            match.group('http_version')],
+        'ip_address': match.group('ip_address'),
+        'remote_name': match.group('remote_name'),
+        'response_bytes': response_bytes,
+        'response_code': int(match.group('response_code'), 10),
+        'user_name': match.group('user_name')}
+
+    server_name = match.group('server_name')
+    user_agent = match.group('user_agent')
+
+    if user_agent is None:
+      if server_name is not None:
+        return None
+
+      return 'common_log_format', structure
+
+    structure['referer'] = match.group('referer')
+    structure['user_agent'] = user_agent
+
+    if server_name is None:
+      return 'combined_log_format', structure
+
+    structure['port_number'] = int(match.group('port_number'), 10)
+    structure['server_name'] = server_name
+
+    return 'vhost_combined_log_format', structure
+
   def _ParseRecord(self, parser_mediator, key, structure):
     """Parses a pyparsing structure.
 
@@ -44,6 +44,7 @@ class APTHistoryLogTextPlugin(interface.TextPlugin):
   """Text parser plugin for Advanced Packaging Tool (APT) History log files."""
 
   NAME = 'apt_history'
+  PARSE_CACHE_SUPPORTED = True
 
   DATA_FORMAT = 'Advanced Packaging Tool (APT) History log file'
 
@@ -174,6 +174,7 @@ class AWSELBTextPlugin(interface.TextPlugin):
 
   NAME = 'aws_elb_access'
   DATA_FORMAT = 'AWS ELB Access log file'
+  PARSE_CACHE_SUPPORTED = True
 
   ENCODING = 'utf-8'
 
@@ -33,6 +33,7 @@ class BashHistoryTextPlugin(interface.TextPluginWithLineContinuation):
   """Text parser plugin for bash history files."""
 
   NAME = 'bash_history'
+  PARSE_CACHE_SUPPORTED = True
 
   DATA_FORMAT = 'Bash history file'
 
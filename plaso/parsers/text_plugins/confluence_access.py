@@ -61,6 +61,7 @@ class ConfluenceAccessTextPlugin(interface.TextPlugin):
 
   NAME = 'confluence_access'
   DATA_FORMAT = 'Confluence access log (access.log) file'
+  PARSE_CACHE_SUPPORTED = True
 
   _INTEGER = pyparsing.Word(pyparsing.nums).set_parse_action(
       lambda tokens: int(tokens[0], 10))
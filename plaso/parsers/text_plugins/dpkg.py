@@ -55,6 +55,7 @@ class DpkgTextPlugin(interface.TextPlugin):
 
   NAME = 'dpkg'
   DATA_FORMAT = 'Debian package manager log (dpkg.log) file'
+  PARSE_CACHE_SUPPORTED = True
 
   ENCODING = 'utf-8'
 
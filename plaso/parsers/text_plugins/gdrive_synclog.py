@@ -44,6 +44,7 @@ class GoogleDriveSyncLogTextPlugin(interface.TextPluginWithLineContinuation):
 
   NAME = 'gdrive_synclog'
   DATA_FORMAT = 'Google Drive Sync log file'
+  PARSE_CACHE_SUPPORTED = True
 
   ENCODING = 'utf-8'
 
@@ -61,6 +61,7 @@ class GoogleLogTextPlugin(
 
   NAME = 'googlelog'
   DATA_FORMAT = 'Google-formatted log file'
+  PARSE_CACHE_SUPPORTED = True
 
   _ONE_OR_TWO_DIGITS = pyparsing.Word(pyparsing.nums, max=2).set_parse_action(
       lambda tokens: int(tokens[0], 10))
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """Text parser plugin for Microsoft IIS log files."""
 
+import re
+
 import pyparsing
 
 from dfdatetime import time_elements as dfdatetime_time_elements
@@ -75,6 +77,7 @@ class WinIISTextPlugin(interface.TextPlugin):
 
   NAME = 'winiis'
   DATA_FORMAT = 'Microsoft IIS log file'
+  PARSE_CACHE_SUPPORTED = True
 
   # Log file are all extended ASCII encoded unless UTF-8 is explicitly enabled.
   # TODO: fix
@@ -205,6 +208,63 @@ class WinIISTextPlugin(interface.TextPlugin):
   _LOG_LINE_STRUCTURES['cs(Referrer)'] = _URI.set_results_name('cs_referrer')
   _LOG_LINE_STRUCTURES['cs(Referer)'] = _URI.set_results_name('cs_referrer')
 
+  # Regular expressions of the fields, used to build the fast path regular
+  # expression. These only match field values that are parsed the same by
+  # the pyparsing log line structures, where IPv6 addresses are left to
+  # the pyparsing grammar.
+
+  _FAST_PATH_DATE = r'[0-9]{4}-[0-9]{2}-[0-9]{2}'
+
+  _FAST_PATH_HTTP_METHOD = r'[-0-9A-Z_a-z]+'
+
+  _FAST_PATH_INTEGER = r'[0-9]+|-'
+
+  _FAST_PATH_IP_ADDRESS = (
+      r'(?:25[0-5]|2[0-4][0-9]|1?[0-9]{1,2})'
+      r'(?:\.(?:25[0-5]|2[0-4][0-9]|1?[0-9]{1,2})){3}|-')
+
+  _FAST_PATH_PORT = r'[0-9]{1,6}|-'
+
+  _FAST_PATH_QUERY = '[0-9A-Za-z{0:s}]+|-'.format(re.escape(
+      _URI_SAFE_CHARACTERS + '{}|\\^~[]`\'"<>@$'))
+
+  _FAST_PATH_TIME = r'[0-9]{2}:[0-9]{2}:[0-9]{2}'
+
+  _FAST_PATH_URI = '[0-9A-Za-z{0:s}]+|-'.format(re.escape(
+      _URI_SAFE_CHARACTERS))
+
+  _FAST_PATH_URI_STEM = '[0-9A-Za-z{0:s}]+|-'.format(re.escape(
+      _URI_SAFE_CHARACTERS + '$'))
+
+  _FAST_PATH_USERNAME = '[0-9A-Za-z{0:s}]+|-'.format(re.escape('-.\\$'))
+
+  # Tuples of the name of the value in the structure, the type of the value
+  # and the regular expression of the value per field.
+  _FAST_PATH_FIELDS = {
+      'c-ip': ('source_ip', 'string', _FAST_PATH_IP_ADDRESS),
+      'cs(Cookie)': ('cs_cookie', 'string', _FAST_PATH_URI),
+      'cs(Referer)': ('cs_referrer', 'string', _FAST_PATH_URI),
+      'cs(Referrer)': ('cs_referrer', 'string', _FAST_PATH_URI),
+      'cs(User-Agent)': ('user_agent', 'string', _FAST_PATH_URI),
+      'cs-bytes': ('received_bytes', 'integer', _FAST_PATH_INTEGER),
+      'cs-host': ('cs_host', 'string', _FAST_PATH_URI),
+      'cs-method': ('http_method', 'string', _FAST_PATH_HTTP_METHOD),
+      'cs-uri-query': ('cs_uri_query', 'string', _FAST_PATH_QUERY),
+      'cs-uri-stem': ('requested_uri_stem', 'string', _FAST_PATH_URI_STEM),
+      'cs-username': ('cs_username', 'string', _FAST_PATH_USERNAME),
+      'cs-version': ('protocol_version', 'string', _FAST_PATH_URI),
+      'date': ('date', 'date', _FAST_PATH_DATE),
+      's-computername': ('s_computername', 'string', _FAST_PATH_URI),
+      's-ip': ('dest_ip', 'string', _FAST_PATH_IP_ADDRESS),
+      's-port': ('dest_port', 'integer', _FAST_PATH_PORT),
+      's-sitename': ('s_sitename', 'string', _FAST_PATH_URI),
+      'sc-bytes': ('sent_bytes', 'integer', _FAST_PATH_INTEGER),
+      'sc-status': ('http_status', 'integer', _FAST_PATH_INTEGER),
+      'sc-substatus': ('sc_substatus', 'integer', _FAST_PATH_INTEGER),
+      'sc-win32-status': ('sc_win32_status', 'integer', _FAST_PATH_INTEGER),
+      'time': ('time', 'time', _FAST_PATH_TIME),
+      'time-taken': ('time_taken', 'integer', _FAST_PATH_INTEGER)}
+
   # Define the available log line structures. Default to the IIS v. 6.0
   # common format.
 
@@ -229,9 +289,39 @@ class WinIISTextPlugin(interface.TextPlugin):
     """Initializes a parser."""
     super(WinIISTextPlugin, self).__init__()
     self._day_of_month = None
+    self._fast_path_fields = []
     self._month = None
     self._year = None
 
+  def _GetFastPathStructure(self, match):
+    """Retrieves a line structure from a fast path regular expression match.
+
+    Args:
+      match (re.Match): fast path regular expression match.
+
+    Returns:
+      tuple[str, dict[str, object]]: name of the line structure (key) and
+          tokens of the line.
+    """
+    structure = {}
+    for (name, value_type), value in zip(
+        self._fast_path_fields, match.groups()):
+      if not name:
+        continue
+
+      if value_type == 'date':
+        value = [int(value[0:4], 10), int(value[5:7], 10), int(value[8:], 10)]
+
+      elif value_type == 'time':
+        value = [int(value[0:2], 10), int(value[3:5], 10), int(value[6:], 10)]
+
+      elif value_type == 'integer' and value != '-':
+        value = int(value, 10)
+
+      structure[name] = value
+
+    return 'log_line', structure
+
   def _ParseFieldsMetadata(self, parser_mediator, fields):
     """Parses the fields metadata and updates the log line definition to match.
 
@@ -240,6 +330,9 @@ class WinIISTextPlugin(interface.TextPlugin):
           and other components, such as storage and dfVFS.
       fields (str): field definitions.
     """
+    fast_path_expressions = []
+    self._fast_path_fields = []
+
     log_line_structure = pyparsing.Empty()
     for member in fields.split(' '):
       if not member:
@@ -254,10 +347,19 @@ class WinIISTextPlugin(interface.TextPlugin):
 
       log_line_structure += field_structure
 
+      name, value_type, expression = self._FAST_PATH_FIELDS.get(
+          member, (None, 'string', self._FAST_PATH_URI))
+      fast_path_expressions.append('({0:s})'.format(expression))
+      self._fast_path_fields.append((name, value_type))
+
     log_line_structure += self._END_OF_LINE
 
     self._SetLineStructures([('log_line', log_line_structure)])
 
+    if fast_path_expressions:
+      self._fast_path_regular_expression = re.compile(
+          '{0:s}[ ]*\n'.format(' +'.join(fast_path_expressions)))
+
   def _ParseHeader(self, parser_mediator, text_reader):
     """Parses a text-log file header.
 
@@ -391,6 +493,8 @@ class WinIISTextPlugin(interface.TextPlugin):
   def _ResetState(self):
     """Resets stored values."""
     self._day_of_month = None
+    self._fast_path_fields = []
+    self._fast_path_regular_expression = None
     self._month = None
     self._year = None
 
@@ -25,6 +25,11 @@ class TextPlugin(plugins.BasePlugin):
   # the supported grammar.
   _LINE_STRUCTURES = []
 
+  # Compiled regular expression that matches the most common line structure,
+  # which is used as a faster alternative to the pyparsing grammar. Lines that
+  # do not match the regular expression are parsed with the pyparsing grammar.
+  _FAST_PATH_REGULAR_EXPRESSION = None
+
   # PyParsing grammer used to verify the text-log file format. Note that since
   # this is called often it should optimize on failing fast.
   VERIFICATION_GRAMMAR = None
@@ -38,6 +43,8 @@ class TextPlugin(plugins.BasePlugin):
     """Initializes a parser."""
     super(TextPlugin, self).__init__()
     self._current_offset = 0
+    self._fast_path_enabled = True
+    self._fast_path_regular_expression = self._FAST_PATH_REGULAR_EXPRESSION
     self._parser_mediator = None
     self._pyparsing_grammar = None
 
@@ -89,6 +96,23 @@ class TextPlugin(plugins.BasePlugin):
 
     return None
 
+  def _GetFastPathStructure(self, match):  # pylint: disable=unused-argument
+    """Retrieves a line structure from a fast path regular expression match.
+
+    Plugins that define a fast path regular expression must override this
+    method to return the same tokens as the corresponding pyparsing line
+    structure.
+
+    Args:
+      match (re.Match): fast path regular expression match.
+
+    Returns:
+      tuple[str, dict[str, object]]: name of the line structure (key) and
+          tokens of the line or None if the line should be parsed with
+          the pyparsing grammar instead.
+    """
+    return None
+
   def _GetStringValueFromStructure(self, structure, name):
     """Retrieves a string value from a Pyparsing structure.
 
@@ -127,6 +151,31 @@ class TextPlugin(plugins.BasePlugin):
 
     return value
 
+  def _ParseFastPath(self, string):
+    """Parses a string with the fast path regular expression.
+
+    Args:
+      string (str): string.
+
+    Returns:
+      tuple[str, dict[str, object], int, int]: key, parsed tokens, start
+          and end offset or None if the string does not match the fast path
+          regular expression.
+    """
+    if not self._fast_path_enabled or not self._fast_path_regular_expression:
+      return None
+
+    match = self._fast_path_regular_expression.match(string)
+    if not match:
+      return None
+
+    key_and_structure = self._GetFastPathStructure(match)
+    if not key_and_structure:
+      return None
+
+    key, structure = key_and_structure
+    return key, structure, 0, match.end()
+
   def _ParseFinalize(self, parser_mediator):  # pylint: disable=unused-argument
     """Finalizes parsing.
 
@@ -179,7 +228,9 @@ class TextPlugin(plugins.BasePlugin):
         break
 
       try:
-        key, structure, _, end = self._ParseString(text_reader.lines)
+        key, structure, _, end = (
+            self._ParseFastPath(text_reader.lines) or
+            self._ParseString(text_reader.lines))
 
       except errors.ParseError as exception:
         line = text_reader.ReadLine()
@@ -232,7 +283,9 @@ class TextPlugin(plugins.BasePlugin):
       parser_mediator (ParserMediator): mediates interactions between parsers
           and other components, such as storage and dfVFS.
       key (str): name of the parsed structure.
-      structure (pyparsing.ParseResults): tokens from a parsed log line.
+      structure (pyparsing.ParseResults|dict[str, object]): tokens from
+          a parsed log line, where a dictionary is used for tokens parsed
+          with the fast path regular expression.
 
     Raises:
       ParseError: when the structure type is unknown.
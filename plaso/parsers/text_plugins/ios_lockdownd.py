@@ -37,6 +37,7 @@ class IOSLockdowndLogTextPlugin(interface.TextPluginWithLineContinuation):
 
   NAME = 'ios_lockdownd'
   DATA_FORMAT = 'iOS lockdown daemon log'
+  PARSE_CACHE_SUPPORTED = True
 
   _INTEGER = pyparsing.Word(pyparsing.nums).set_parse_action(
       lambda tokens: int(tokens[0], 10))
@@ -36,6 +36,7 @@ class IOSSysdiagnoseLogdTextPlugin(interface.TextPlugin):
 
   NAME = 'ios_logd'
   DATA_FORMAT = 'iOS sysdiagnose logd file'
+  PARSE_CACHE_SUPPORTED = True
 
   _TWO_DIGITS = pyparsing.Word(pyparsing.nums, exact=2).set_parse_action(
       lambda tokens: int(tokens[0], 10))
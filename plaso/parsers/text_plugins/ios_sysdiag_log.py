@@ -40,6 +40,7 @@ class IOSSysdiagLogTextPlugin(interface.TextPluginWithLineContinuation):
 
   NAME = 'ios_sysdiag_log'
   DATA_FORMAT = 'iOS sysdiag log'
+  PARSE_CACHE_SUPPORTED = True
 
   _MONTH_DICT = {
       'jan': 1,
@@ -44,6 +44,7 @@ class MacOSAppFirewallTextPlugin(
 
   NAME = 'mac_appfirewall_log'
   DATA_FORMAT = 'MacOS Application firewall log (appfirewall.log) file'
+  PARSE_CACHE_SUPPORTED = True
 
   ENCODING = 'utf-8'
 
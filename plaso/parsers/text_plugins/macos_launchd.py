@@ -38,6 +38,7 @@ class MacOSLaunchdLogTextPlugin(interface.TextPlugin):
 
   NAME = 'macos_launchd_log'
   DATA_FORMAT = 'Mac OS launchd log file'
+  PARSE_CACHE_SUPPORTED = True
 
   # Date and time values are formatted as:
   # 2023-06-08 14:51:38.987368
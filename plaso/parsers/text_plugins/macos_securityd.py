@@ -52,6 +52,7 @@ class MacOSSecuritydLogTextPlugin(
 
   NAME = 'mac_securityd'
   DATA_FORMAT = 'MacOS security daemon (securityd) log file'
+  PARSE_CACHE_SUPPORTED = True
 
   ENCODING = 'utf-8'
 
@@ -46,6 +46,7 @@ class MacOSWiFiLogTextPlugin(
 
   NAME = 'mac_wifi'
   DATA_FORMAT = 'MacOS Wi-Fi log (wifi.log) file'
+  PARSE_CACHE_SUPPORTED = True
 
   ENCODING = 'utf-8'
 
@@ -146,6 +146,7 @@ class PopularityContestTextPlugin(interface.TextPlugin):
 
   NAME = 'popularity_contest'
   DATA_FORMAT = 'Popularity Contest log file'
+  PARSE_CACHE_SUPPORTED = True
 
   ENCODING = 'utf-8'
 
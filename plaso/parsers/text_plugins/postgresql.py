@@ -48,6 +48,7 @@ class PostgreSQLTextPlugin(interface.TextPlugin):
 
   NAME = 'postgresql'
   DATA_FORMAT = 'PostgreSQL application log file'
+  PARSE_CACHE_SUPPORTED = True
 
   ENCODING = 'utf-8'
 
@@ -64,6 +64,7 @@ class PowerShellTranscriptLogTextPlugin(interface.TextPlugin):
   """Text parser plugin for PowerShell transcript log files."""
 
   NAME = 'powershell_transcript'
+  PARSE_CACHE_SUPPORTED = True
 
   DATA_FORMAT = 'PowerShell transcript event'
 
@@ -178,6 +178,7 @@ class SantaTextPlugin(interface.TextPlugin):
 
   NAME = 'santa'
   DATA_FORMAT = 'Santa log (santa.log) file'
+  PARSE_CACHE_SUPPORTED = True
 
   ENCODING = 'utf-8'
 
@@ -38,6 +38,7 @@ class SCCMTextPlugin(interface.TextPlugin):
 
   NAME = 'sccm'
   DATA_FORMAT = 'System Center Configuration Manager (SCCM) client log file'
+  PARSE_CACHE_SUPPORTED = True
 
   ENCODING = 'utf-8'
 
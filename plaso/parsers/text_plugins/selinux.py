@@ -52,6 +52,7 @@ class SELinuxTextPlugin(interface.TextPlugin):
 
   NAME = 'selinux'
   DATA_FORMAT = 'SELinux audit log (audit.log) file'
+  PARSE_CACHE_SUPPORTED = True
 
   _INTEGER = pyparsing.Word(pyparsing.nums).set_parse_action(
       lambda tokens: int(tokens[0], 10))
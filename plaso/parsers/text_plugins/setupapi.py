@@ -45,6 +45,7 @@ class SetupAPILogTextPlugin(interface.TextPlugin):
 
   NAME = 'setupapi'
   DATA_FORMAT = 'Windows SetupAPI log file'
+  PARSE_CACHE_SUPPORTED = True
 
   _TWO_DIGITS = pyparsing.Word(pyparsing.nums, exact=2).set_parse_action(
       lambda tokens: int(tokens[0], 10))
@@ -42,6 +42,7 @@ class SkyDriveLog1TextPlugin(interface.TextPlugin):
 
   NAME = 'skydrive_log_v1'
   DATA_FORMAT = 'OneDrive (or SkyDrive) version 1 log file'
+  PARSE_CACHE_SUPPORTED = True
 
   ENCODING = 'utf-8'
 
@@ -240,6 +241,7 @@ class SkyDriveLog2TextPlugin(interface.TextPluginWithLineContinuation):
 
   NAME = 'skydrive_log_v2'
   DATA_FORMAT = 'OneDrive (or SkyDrive) version 2 log file'
+  PARSE_CACHE_SUPPORTED = True
 
   ENCODING = 'utf-8'
 
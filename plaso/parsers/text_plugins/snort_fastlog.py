@@ -69,6 +69,7 @@ class SnortFastLogTextPlugin(
 
   NAME = 'snort_fastlog'
   DATA_FORMAT = 'Snort3/Suricata fast-log alert log (fast.log) file'
+  PARSE_CACHE_SUPPORTED = True
 
   _INTEGER = pyparsing.Word(pyparsing.nums).set_parse_action(
       lambda tokens: int(tokens[0], 10))
@@ -34,6 +34,7 @@ class SophosAVLogTextPlugin(interface.TextPlugin):
 
   NAME = 'sophos_av'
   DATA_FORMAT = 'Sophos anti-virus log file (SAV.txt) file'
+  PARSE_CACHE_SUPPORTED = True
 
   ENCODING = 'utf-16-le'
 
@@ -295,6 +295,7 @@ class SyslogTextPlugin(BaseSyslogTextPlugin):
 
   NAME = 'syslog'
   DATA_FORMAT = 'System log (syslog) file'
+  PARSE_CACHE_SUPPORTED = True
 
   ENCODING = 'utf-8'
 
@@ -560,6 +561,7 @@ class TraditionalSyslogTextPlugin(
 
   NAME = 'syslog_traditional'
   DATA_FORMAT = 'Traditional system log (syslog) file'
+  PARSE_CACHE_SUPPORTED = True
 
   ENCODING = 'utf-8'
 
@@ -96,6 +96,7 @@ class TeamViewerApplicationLogTextPlugin(
 
   NAME = 'teamviewer_application_log'
   DATA_FORMAT = 'TeamViewer application log file parser.'
+  PARSE_CACHE_SUPPORTED = True
 
   _TWO_DIGITS = pyparsing.Word(pyparsing.nums, exact=2).set_parse_action(
       lambda tokens: int(tokens[0], 10))
@@ -262,6 +263,7 @@ class TeamViewerConnectionsOutgoingLogTextPlugin(interface.TextPlugin):
 
   NAME = 'teamviewer_connections_outgoing'
   DATA_FORMAT = 'TeamViewer connections.txt log file'
+  PARSE_CACHE_SUPPORTED = True
 
   _TEAMVIEWER_ID = pyparsing.Word(
       pyparsing.nums, min=8, max=11).set_parse_action(
@@ -396,6 +398,7 @@ class TeamViewerConnectionsIncomingLogTextPlugin(interface.TextPlugin):
 
   NAME = 'teamviewer_connections_incoming'
   DATA_FORMAT = 'TeamViewer connections_incoming.txt log file'
+  PARSE_CACHE_SUPPORTED = True
 
   _TEAMVIEWER_ID = pyparsing.Word(
       pyparsing.nums, min=8, max=11).set_parse_action(
@@ -40,6 +40,7 @@ class VimInfoTextPlugin(interface.TextPlugin,):
 
   NAME = 'viminfo'
   DATA_FORMAT = 'Viminfo file'
+  PARSE_CACHE_SUPPORTED = True
 
   ENCODING = 'utf-8'
 
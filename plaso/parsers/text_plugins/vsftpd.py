@@ -34,6 +34,7 @@ class VsftpdLogTextPlugin(interface.TextPlugin):
 
   NAME = 'vsftpd'
   DATA_FORMAT = 'vsftpd log file'
+  PARSE_CACHE_SUPPORTED = True
 
   _MONTH_DICT = {
       'jan': 1,
@@ -63,6 +63,7 @@ class WinFirewallLogTextPlugin(interface.TextPlugin):
 
   NAME = 'winfirewall'
   DATA_FORMAT = 'Windows Firewall log file'
+  PARSE_CACHE_SUPPORTED = True
 
   # A Windows Firewall is encoded using the system codepage.
   ENCODING = None
@@ -88,6 +88,7 @@ class XChatLogTextPlugin(
 
   NAME = 'xchatlog'
   DATA_FORMAT = 'XChat log file'
+  PARSE_CACHE_SUPPORTED = True
 
   ENCODING = 'utf-8'
 
@@ -70,6 +70,7 @@ class XChatScrollbackLogTextPlugin(interface.TextPlugin):
 
   NAME = 'xchatscrollback'
   DATA_FORMAT = 'XChat scrollback log file'
+  PARSE_CACHE_SUPPORTED = True
 
   ENCODING = 'utf-8'
 
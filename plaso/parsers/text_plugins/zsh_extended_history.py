@@ -40,6 +40,7 @@ class ZshExtendedHistoryTextPlugin(interface.TextPluginWithLineContinuation):
 
   NAME = 'zsh_extended_history'
   DATA_FORMAT = 'ZSH extended history file'
+  PARSE_CACHE_SUPPORTED = True
 
   ENCODING = 'utf-8'
 
@@ -221,6 +221,7 @@ class OfficeScanVirusDetectionParser(TrendMicroBaseParser):
 
   NAME = 'trendmicro_vd'
   DATA_FORMAT = 'Trend Micro Office Scan Virus Detection log file'
+  PARSE_CACHE_SUPPORTED = True
 
   COLUMNS = [
       'date', 'time', 'threat', 'action', 'scan_type', 'unused1',
@@ -303,6 +304,7 @@ class OfficeScanWebReputationParser(TrendMicroBaseParser):
 
   NAME = 'trendmicro_url'
   DATA_FORMAT = 'Trend Micro Office Web Reputation log file'
+  PARSE_CACHE_SUPPORTED = True
 
   COLUMNS = (
       'date', 'time', 'block_mode', 'url', 'group_code', 'group_name',
@@ -52,6 +52,7 @@ class UtmpParser(interface.FileObjectParser, dtfabric_helper.DtFabricHelper):
 
   NAME = 'utmp'
   DATA_FORMAT = 'Linux libc6 utmp file'
+  PARSE_CACHE_SUPPORTED = True
 
   _DEFINITION_FILE = os.path.join(
       os.path.dirname(__file__), 'utmp.yaml')
@@ -49,6 +49,7 @@ class UtmpxParser(interface.FileObjectParser, dtfabric_helper.DtFabricHelper):
 
   NAME = 'utmpx'
   DATA_FORMAT = 'Mac OS X 10.5 utmpx file'
+  PARSE_CACHE_SUPPORTED = True
 
   _DEFINITION_FILE = os.path.join(
       os.path.dirname(__file__), 'utmp.yaml')
@@ -60,6 +60,7 @@ class SIMATICLogParser(interface.FileObjectParser):
 
   NAME = 'simatic_s7'
   DATA_FORMAT = 'SIMATIC S7 Log file'
+  PARSE_CACHE_SUPPORTED = True
 
   DELIMITER = ','
   ENCODING = 'ascii'
@@ -167,6 +168,7 @@ class WinCCSysLogParser(interface.FileObjectParser):
 
   NAME = 'wincc_sys'
   DATA_FORMAT = 'WinCC Sys Log file'
+  PARSE_CACHE_SUPPORTED = True
 
   DELIMITER = ','
   ENCODING = 'utf-16-le'
@@ -54,6 +54,7 @@ class WinDefenderHistoryParser(
 
   NAME = 'windefender_history'
   DATA_FORMAT = 'Windows Defender scan DetectionHistory file'
+  PARSE_CACHE_SUPPORTED = True
 
   _FILE_SIGNATURE = 'Magic.Version:1.2'
 
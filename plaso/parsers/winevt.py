@@ -64,6 +64,7 @@ class WinEvtParser(interface.FileObjectParser):
 
   NAME = 'winevt'
   DATA_FORMAT = 'Windows EventLog (EVT) file'
+  PARSE_CACHE_SUPPORTED = True
 
   @classmethod
   def GetFormatSpecification(cls):
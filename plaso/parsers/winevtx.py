@@ -64,6 +64,7 @@ class WinEvtxParser(interface.FileObjectParser):
 
   NAME = 'winevtx'
   DATA_FORMAT = 'Windows XML EventLog (EVTX) file'
+  PARSE_CACHE_SUPPORTED = True
 
   def _GetEventDataFromRecord(
       self, parser_mediator, record_index, evtx_record, recovered=False):
@@ -209,7 +210,14 @@ class WinEvtxParser(interface.FileObjectParser):
     # The call to evt_file.get_record() and access to members of evt_record
     # should be called within a try-except.
 
-    for record_index in range(evtx_file.number_of_records):
+    # The records of a large file can be split into record ranges that are
+    # parsed separately, where the recovered records are parsed together with
+    # the first record range.
+    first_record_index, number_of_records = parser_mediator.GetRecordRange(
+        evtx_file.number_of_records)
+
+    for record_index in range(
+        first_record_index, first_record_index + number_of_records):
       if parser_mediator.abort:
         break
 
@@ -222,6 +230,9 @@ class WinEvtxParser(interface.FileObjectParser):
             'unable to parse event record: {0:d} with error: {1!s}'.format(
                 record_index, exception))
 
+    if first_record_index > 0:
+      return
+
     for record_index in range(evtx_file.number_of_recovered_records):
       if parser_mediator.abort:
         break
@@ -75,6 +75,7 @@ class WinJobParser(interface.FileObjectParser, dtfabric_helper.DtFabricHelper):
 
   NAME = 'winjob'
   DATA_FORMAT = 'Windows Scheduled Task job (or at-job) file'
+  PARSE_CACHE_SUPPORTED = True
 
   _DEFINITION_FILE = os.path.join(
       os.path.dirname(__file__), 'winjob.yaml')
@@ -100,6 +100,7 @@ class WindowsPCADB0Parser(WindowsPCABaseParser):
 
   NAME = 'winpca_db0'
   DATA_FORMAT = 'Windows PCA DB0 log file'
+  PARSE_CACHE_SUPPORTED = True
 
   COLUMNS = [
       'datetime', 'run_status', 'program', 'description', 'vendor',
@@ -140,6 +141,7 @@ class WindowsPCADicParser(WindowsPCABaseParser):
 
   NAME = 'winpca_dic'
   DATA_FORMAT = 'Windows PCA DIC log file'
+  PARSE_CACHE_SUPPORTED = True
 
   COLUMNS = ['program', 'datetime']
 
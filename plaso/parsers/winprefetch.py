@@ -57,6 +57,7 @@ class WinPrefetchParser(interface.FileObjectParser):
 
   NAME = 'prefetch'
   DATA_FORMAT = 'Windows Prefetch File (PF)'
+  PARSE_CACHE_SUPPORTED = True
 
   @classmethod
   def GetFormatSpecification(cls):
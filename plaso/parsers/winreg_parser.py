@@ -14,11 +14,123 @@ from plaso.parsers import logger
 from plaso.parsers import manager
 
 
+class WindowsRegistryPluginsIndex(object):
+  """Index of Windows Registry plugins that do not define key paths.
+
+  The index determines the filters that can match a Windows Registry key
+  based on the key path prefix, key path suffix or value names defined by
+  the filters, so that filters that cannot match the key are not evaluated.
+  Filters that define these are expected to only match keys with the key
+  path prefix, key path suffix or value names.
+  """
+
+  def __init__(self):
+    """Initializes a Windows Registry plugins index."""
+    super(WindowsRegistryPluginsIndex, self).__init__()
+    self._filters_per_key_path_prefix = {}
+    self._filters_per_key_path_suffix = {}
+    self._filters_per_value_name = {}
+    self._number_of_plugins = 0
+    self._unindexed_filters = []
+
+  @property
+  def number_of_plugins(self):
+    """int: number of plugins in the index."""
+    return self._number_of_plugins
+
+  def AddPlugin(self, plugin):
+    """Adds a plugin to the index.
+
+    Plugins are matched in the order they were added. Filters that define
+    key paths are ignored since these are matched by the path filter of
+    the parser.
+
+    Args:
+      plugin (WindowsRegistryPlugin): Windows Registry plugin.
+    """
+    plugin_index = self._number_of_plugins
+    self._number_of_plugins += 1
+
+    for registry_key_filter in plugin.FILTERS:
+      if getattr(registry_key_filter, 'key_paths', []):
+        continue
+
+      filter_entry = (plugin_index, plugin, registry_key_filter)
+
+      key_path_prefix = getattr(registry_key_filter, 'key_path_prefix', None)
+      key_path_suffix = getattr(registry_key_filter, 'key_path_suffix', None)
+      value_names = getattr(registry_key_filter, 'value_names', None)
+
+      if key_path_prefix:
+        filters_per_key_path_prefix = (
+            self._filters_per_key_path_prefix.setdefault(
+                len(key_path_prefix), {}))
+        filters_per_key_path_prefix.setdefault(key_path_prefix, []).append(
+            filter_entry)
+
+      elif key_path_suffix:
+        filters_per_key_path_suffix = (
+            self._filters_per_key_path_suffix.setdefault(
+                len(key_path_suffix), {}))
+        filters_per_key_path_suffix.setdefault(key_path_suffix, []).append(
+            filter_entry)
+
+      elif value_names and any(value_names):
+        # A key can only match if it contains every value name of the filter,
+        # hence the filter is indexed by its longest, typically most
+        # distinctive, value name.
+        value_name = max(
+            value_names, key=lambda value_name: (len(value_name), value_name))
+        self._filters_per_value_name.setdefault(value_name, []).append(
+            filter_entry)
+
+      else:
+        self._unindexed_filters.append(filter_entry)
+
+  def GetCandidateFilters(self, registry_key):
+    """Retrieves the filters that can match a Windows Registry key.
+
+    Args:
+      registry_key (dfwinreg.WinRegistryKey): Windows Registry key.
+
+    Returns:
+      list[tuple[WindowsRegistryPlugin, BaseWindowsRegistryKeyFilter]]:
+          plugins and filters, in the order the plugins were added, of which
+          the filter needs to be matched against the key.
+    """
+    filter_entries = list(self._unindexed_filters)
+
+    key_path = registry_key.path
+    for length, filters_per_key_path_prefix in (
+        self._filters_per_key_path_prefix.items()):
+      filter_entries.extend(filters_per_key_path_prefix.get(
+          key_path[:length], []))
+
+    for length, filters_per_key_path_suffix in (
+        self._filters_per_key_path_suffix.items()):
+      filter_entries.extend(filters_per_key_path_suffix.get(
+          key_path[-length:], []))
+
+    if self._filters_per_value_name and registry_key.number_of_values:
+      for value_name, value_name_filter_entries in (
+          self._filters_per_value_name.items()):
+        if registry_key.GetValueByName(value_name):
+          filter_entries.extend(value_name_filter_entries)
+
+    if len(filter_entries) > 1:
+      filter_entries.sort(key=lambda filter_entry: filter_entry[0])
+
+    return [
+        (plugin, registry_key_filter)
+        for _, plugin, registry_key_filter in filter_entries]
+
+
 class WinRegistryParser(interface.FileObjectParser):
   """Parses Windows NT Registry (REGF) files."""
 
   NAME = 'winreg'
   DATA_FORMAT = 'Windows NT Registry (REGF) file'
+  PARSE_CACHE_SUPPORTED = True
 
   _plugin_classes = {}
 
@@ -40,28 +152,7 @@ class WinRegistryParser(interface.FileObjectParser):
     super(WinRegistryParser, self).__init__()
     self._path_filter = None
     self._plugins_per_key_path = {}
-    self._plugins_without_key_paths = []
-
-  def _CanProcessKeyWithPlugin(self, registry_key, plugin):
-    """Determines if a plugin can process a Windows Registry key or its values.
-
-    Args:
-      registry_key (dfwinreg.WinRegistryKey): Windows Registry key.
-      plugin (WindowsRegistryPlugin): Windows Registry plugin.
-
-    Returns:
-      bool: True if the Registry key can be processed with the plugin.
-    """
-    for registry_key_filter in plugin.FILTERS:
-      # Skip filters that define key paths since they are already
-      # checked by the path filter.
-      if getattr(registry_key_filter, 'key_paths', []):
-        continue
-
-      if registry_key_filter.Match(registry_key):
-        return True
-
-    return False
+    self._plugins_without_key_paths = WindowsRegistryPluginsIndex()
 
   def EnablePlugins(self, plugin_includes):
     """Enables parser plugins.
@@ -73,7 +164,7 @@ class WinRegistryParser(interface.FileObjectParser):
     """
     self._plugins_per_name = {}
     self._plugins_per_key_path = {}
-    self._plugins_without_key_paths = []
+    self._plugins_without_key_paths = WindowsRegistryPluginsIndex()
 
     if not self._plugin_classes:
       return
@@ -92,11 +183,12 @@ class WinRegistryParser(interface.FileObjectParser):
       plugin_object = plugin_class()
       self._plugins_per_name[plugin_name] = plugin_object
 
+      has_filters_without_key_paths = False
+
       for registry_key_filter in plugin_object.FILTERS:
         plugin_key_paths = getattr(registry_key_filter, 'key_paths', [])
-        if (not plugin_key_paths and
-            plugin_object not in self._plugins_without_key_paths):
-          self._plugins_without_key_paths.append(plugin_object)
+        if not plugin_key_paths:
+          has_filters_without_key_paths = True
           continue
 
         for plugin_key_path in plugin_key_paths:
@@ -113,6 +205,9 @@ class WinRegistryParser(interface.FileObjectParser):
 
           key_paths.append(plugin_key_path)
 
+      if has_filters_without_key_paths:
+        self._plugins_without_key_paths.AddPlugin(plugin_object)
+
     self._path_filter = path_filter.PathFilterScanTree(
         key_paths, case_sensitive=False, path_segment_separator='\\')
 
@@ -175,13 +270,14 @@ class WinRegistryParser(interface.FileObjectParser):
     if self._path_filter and self._path_filter.CheckPath(normalized_key_path):
       matching_plugin = self._plugins_per_key_path[normalized_key_path]
     else:
-      for plugin in self._plugins_without_key_paths:
+      for plugin, registry_key_filter in (
+          self._plugins_without_key_paths.GetCandidateFilters(registry_key)):
         profiling_name = '/'.join([self.NAME, plugin.NAME])
 
         parser_mediator.SampleFormatCheckStartTiming(profiling_name)
 
         try:
-          if self._CanProcessKeyWithPlugin(registry_key, plugin):
+          if registry_key_filter.Match(registry_key):
             matching_plugin = plugin
             break
 
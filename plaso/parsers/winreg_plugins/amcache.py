@@ -109,6 +109,7 @@ class AMCachePlugin(interface.WindowsRegistryPlugin):
 
   NAME = 'amcache'
   DATA_FORMAT = 'AMCache (AMCache.hve)'
+  PARSE_CACHE_SUPPORTED = True
 
   FILTERS = frozenset([
       interface.WindowsRegistryKeyPathFilter('\\Root')])
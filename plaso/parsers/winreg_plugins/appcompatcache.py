@@ -75,6 +75,7 @@ class AppCompatCacheWindowsRegistryPlugin(
 
   NAME = 'appcompatcache'
   DATA_FORMAT = 'Application Compatibility Cache Registry data'
+  PARSE_CACHE_SUPPORTED = True
 
   FILTERS = frozenset([
       interface.WindowsRegistryKeyPathFilter(
@@ -39,6 +39,7 @@ class BagMRUWindowsRegistryPlugin(
 
   NAME = 'bagmru'
   DATA_FORMAT = 'BagMRU (or ShellBags) Registry data'
+  PARSE_CACHE_SUPPORTED = True
 
   FILTERS = frozenset([
       interface.WindowsRegistryKeyPathFilter(
@@ -39,6 +39,7 @@ class BackgroundActivityModeratorWindowsRegistryPlugin(
 
   NAME = 'bam'
   DATA_FORMAT = 'Background Activity Moderator (BAM) Registry data'
+  PARSE_CACHE_SUPPORTED = True
 
   FILTERS = frozenset([
       interface.WindowsRegistryKeyPathFilter(
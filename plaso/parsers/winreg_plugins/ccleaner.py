@@ -58,6 +58,7 @@ class CCleanerPlugin(interface.WindowsRegistryPlugin):
 
   NAME = 'ccleaner'
   DATA_FORMAT = 'CCleaner Registry data'
+  PARSE_CACHE_SUPPORTED = True
 
   FILTERS = frozenset([
       interface.WindowsRegistryKeyPathFilter(
@@ -16,6 +16,7 @@ class DefaultPlugin(interface.WindowsRegistryPlugin):
 
   NAME = 'winreg_default'
   DATA_FORMAT = 'Windows Registry data'
+  PARSE_CACHE_SUPPORTED = True
 
   def ExtractEvents(self, parser_mediator, registry_key, **kwargs):
     """Extracts events from a Windows Registry key.
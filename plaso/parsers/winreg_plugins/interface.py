@@ -135,6 +135,11 @@ class WindowsRegistryKeyPathPrefixFilter(BaseWindowsRegistryKeyFilter):
     super(WindowsRegistryKeyPathPrefixFilter, self).__init__()
     self._key_path_prefix = key_path_prefix
 
+  @property
+  def key_path_prefix(self):
+    """str: key path prefix defined by the filter."""
+    return self._key_path_prefix
+
   def Match(self, registry_key):
     """Determines if a Windows Registry key matches the filter.
 
@@ -159,6 +164,11 @@ class WindowsRegistryKeyPathSuffixFilter(BaseWindowsRegistryKeyFilter):
     super(WindowsRegistryKeyPathSuffixFilter, self).__init__()
     self._key_path_suffix = key_path_suffix
 
+  @property
+  def key_path_suffix(self):
+    """str: key path suffix defined by the filter."""
+    return self._key_path_suffix
+
   def Match(self, registry_key):
     """Determines if a Windows Registry key matches the filter.
 
@@ -185,6 +195,11 @@ class WindowsRegistryKeyWithValuesFilter(BaseWindowsRegistryKeyFilter):
     super(WindowsRegistryKeyWithValuesFilter, self).__init__()
     self._value_names = frozenset(value_names)
 
+  @property
+  def value_names(self):
+    """frozenset[str]: names of values defined by the filter."""
+    return self._value_names
+
   def Match(self, registry_key):
     """Determines if a Windows Registry key matches the filter.
 
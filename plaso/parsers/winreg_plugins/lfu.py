@@ -55,6 +55,7 @@ class BootVerificationPlugin(interface.WindowsRegistryPlugin):
 
   NAME = 'windows_boot_verify'
   DATA_FORMAT = 'Windows boot verification Registry data'
+  PARSE_CACHE_SUPPORTED = True
 
   FILTERS = frozenset([
       interface.WindowsRegistryKeyPathFilter(
@@ -91,6 +92,7 @@ class BootExecutePlugin(interface.WindowsRegistryPlugin):
 
   NAME = 'windows_boot_execute'
   DATA_FORMAT = 'Boot Execution Registry data'
+  PARSE_CACHE_SUPPORTED = True
 
   FILTERS = frozenset([
       interface.WindowsRegistryKeyPathFilter(
@@ -40,6 +40,7 @@ class MountPoints2Plugin(interface.WindowsRegistryPlugin):
 
   NAME = 'explorer_mountpoints2'
   DATA_FORMAT = 'Windows Explorer mount points Registry data'
+  PARSE_CACHE_SUPPORTED = True
 
   FILTERS = frozenset([
       interface.WindowsRegistryKeyPathFilter(
@@ -176,6 +176,7 @@ class MRUListStringWindowsRegistryPlugin(BaseMRUListWindowsRegistryPlugin):
 
   NAME = 'mrulist_string'
   DATA_FORMAT = 'Most Recently Used (MRU) Registry data'
+  PARSE_CACHE_SUPPORTED = True
 
   FILTERS = frozenset([MRUListStringRegistryKeyFilter()])
 
@@ -244,6 +245,7 @@ class MRUListShellItemListWindowsRegistryPlugin(
 
   NAME = 'mrulist_shell_item_list'
   DATA_FORMAT = 'Most Recently Used (MRU) Registry data'
+  PARSE_CACHE_SUPPORTED = True
 
   FILTERS = frozenset([
       interface.WindowsRegistryKeyPathFilter(
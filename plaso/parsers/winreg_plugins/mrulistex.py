@@ -185,6 +185,7 @@ class MRUListExStringWindowsRegistryPlugin(BaseMRUListExWindowsRegistryPlugin):
 
   NAME = 'mrulistex_string'
   DATA_FORMAT = 'Most Recently Used (MRU) Registry data'
+  PARSE_CACHE_SUPPORTED = True
 
   FILTERS = frozenset([MRUListExStringRegistryKeyFilter()])
 
@@ -250,6 +251,7 @@ class MRUListExShellItemListWindowsRegistryPlugin(
 
   NAME = 'mrulistex_shell_item_list'
   DATA_FORMAT = 'Most Recently Used (MRU) Registry data'
+  PARSE_CACHE_SUPPORTED = True
 
   FILTERS = frozenset([
       interface.WindowsRegistryKeyPathFilter(
@@ -327,6 +329,7 @@ class MRUListExStringAndShellItemWindowsRegistryPlugin(
 
   NAME = 'mrulistex_string_and_shell_item'
   DATA_FORMAT = 'Most Recently Used (MRU) Registry data'
+  PARSE_CACHE_SUPPORTED = True
 
   FILTERS = frozenset([
       interface.WindowsRegistryKeyPathFilter(
@@ -424,6 +427,7 @@ class MRUListExStringAndShellItemListWindowsRegistryPlugin(
 
   NAME = 'mrulistex_string_and_shell_item_list'
   DATA_FORMAT = 'Most Recently Used (MRU) Registry data'
+  PARSE_CACHE_SUPPORTED = True
 
   FILTERS = frozenset([
       interface.WindowsRegistryKeyPathFilter(
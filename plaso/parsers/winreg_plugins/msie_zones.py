@@ -36,6 +36,7 @@ class MSIEZoneSettingsPlugin(interface.WindowsRegistryPlugin):
 
   NAME = 'msie_zone'
   DATA_FORMAT = 'Microsoft Internet Explorer zone settings Registry data'
+  PARSE_CACHE_SUPPORTED = True
 
   FILTERS = frozenset([
       interface.WindowsRegistryKeyPathFilter(
@@ -35,6 +35,7 @@ class NetworkDrivesPlugin(interface.WindowsRegistryPlugin):
 
   NAME = 'network_drives'
   DATA_FORMAT = 'Windows network drives Registry data'
+  PARSE_CACHE_SUPPORTED = True
 
   FILTERS = frozenset([
       interface.WindowsRegistryKeyPathFilter('HKEY_CURRENT_USER\\Network')])
@@ -49,6 +49,7 @@ class NetworksWindowsRegistryPlugin(
 
   NAME = 'networks'
   DATA_FORMAT = 'Windows networks (NetworkList) Registry data'
+  PARSE_CACHE_SUPPORTED = True
 
   FILTERS = frozenset([
       interface.WindowsRegistryKeyPathFilter(
@@ -57,6 +57,7 @@ class OfficeMRUPlugin(interface.WindowsRegistryPlugin):
 
   NAME = 'microsoft_office_mru'
   DATA_FORMAT = 'Microsoft Office MRU Registry data'
+  PARSE_CACHE_SUPPORTED = True
 
   FILTERS = frozenset([
       interface.WindowsRegistryKeyPathFilter(
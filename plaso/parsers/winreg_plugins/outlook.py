@@ -31,6 +31,7 @@ class OutlookSearchMRUPlugin(interface.WindowsRegistryPlugin):
 
   NAME = 'microsoft_outlook_mru'
   DATA_FORMAT = 'Microsoft Outlook search MRU Registry data'
+  PARSE_CACHE_SUPPORTED = True
 
   FILTERS = frozenset([
       interface.WindowsRegistryKeyPathFilter(
@@ -45,6 +45,7 @@ class ExplorerProgramsCacheWindowsRegistryPlugin(
 
   NAME = 'explorer_programscache'
   DATA_FORMAT = 'Windows Explorer Programs Cache Registry data'
+  PARSE_CACHE_SUPPORTED = True
 
   FILTERS = frozenset([
       interface.WindowsRegistryKeyPathFilter(
@@ -31,6 +31,7 @@ class AutoRunsPlugin(interface.WindowsRegistryPlugin):
 
   NAME = 'windows_run'
   DATA_FORMAT = 'Run and run once Registry data'
+  PARSE_CACHE_SUPPORTED = True
 
   FILTERS = frozenset([
       interface.WindowsRegistryKeyPathFilter(
@@ -53,6 +53,7 @@ class SAMUsersWindowsRegistryPlugin(
 
   NAME = 'windows_sam_users'
   DATA_FORMAT = 'Security Accounts Manager (SAM) users Registry data'
+  PARSE_CACHE_SUPPORTED = True
 
   FILTERS = frozenset([
       interface.WindowsRegistryKeyPathFilter(
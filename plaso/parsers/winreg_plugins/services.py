@@ -49,6 +49,7 @@ class ServicesPlugin(interface.WindowsRegistryPlugin):
 
   NAME = 'windows_services'
   DATA_FORMAT = 'Windows drivers and services Registry data'
+  PARSE_CACHE_SUPPORTED = True
 
   # TODO: use a key path prefix match here. Might be more efficient.
   # HKEY_LOCAL_MACHINE\\System\\CurrentControlSet\\Services
@@ -40,6 +40,7 @@ class ShutdownWindowsRegistryPlugin(
 
   NAME = 'windows_shutdown'
   DATA_FORMAT = 'Windows last shutdown Registry data'
+  PARSE_CACHE_SUPPORTED = True
 
   FILTERS = frozenset([
       interface.WindowsRegistryKeyPathFilter(
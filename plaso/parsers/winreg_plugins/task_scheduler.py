@@ -48,6 +48,7 @@ class TaskCacheWindowsRegistryPlugin(
 
   NAME = 'windows_task_cache'
   DATA_FORMAT = 'Windows Task Scheduler cache Registry data'
+  PARSE_CACHE_SUPPORTED = True
 
   FILTERS = frozenset([
       interface.WindowsRegistryKeyPathFilter(
@@ -57,6 +57,7 @@ class TerminalServerClientPlugin(interface.WindowsRegistryPlugin):
 
   NAME = 'mstsc_rdp'
   DATA_FORMAT = 'Terminal Server Client Connection Registry data'
+  PARSE_CACHE_SUPPORTED = True
 
   FILTERS = frozenset([
       interface.WindowsRegistryKeyPathFilter(
@@ -97,6 +98,7 @@ class TerminalServerClientMRUPlugin(interface.WindowsRegistryPlugin):
 
   NAME = 'mstsc_rdp_mru'
   DATA_FORMAT = 'Terminal Server Client Most Recently Used (MRU) Registry data'
+  PARSE_CACHE_SUPPORTED = True
 
   FILTERS = frozenset([
       interface.WindowsRegistryKeyPathFilter(
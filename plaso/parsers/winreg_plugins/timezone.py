@@ -32,6 +32,7 @@ class WinRegTimezonePlugin(interface.WindowsRegistryPlugin):
 
   NAME = 'windows_timezone'
   DATA_FORMAT = 'Windows time zone Registry data'
+  PARSE_CACHE_SUPPORTED = True
 
   FILTERS = frozenset([
       interface.WindowsRegistryKeyPathFilter(
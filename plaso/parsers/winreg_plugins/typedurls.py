@@ -33,6 +33,7 @@ class TypedURLsPlugin(interface.WindowsRegistryPlugin):
 
   NAME = 'windows_typed_urls'
   DATA_FORMAT = 'Windows Explorer typed URLs Registry data'
+  PARSE_CACHE_SUPPORTED = True
 
   FILTERS = frozenset([
       interface.WindowsRegistryKeyPathFilter(
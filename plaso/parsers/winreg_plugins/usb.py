@@ -43,6 +43,7 @@ class USBPlugin(interface.WindowsRegistryPlugin):
 
   NAME = 'windows_usb_devices'
   DATA_FORMAT = 'Windows USB device Registry data'
+  PARSE_CACHE_SUPPORTED = True
 
   FILTERS = frozenset([
       interface.WindowsRegistryKeyPathFilter(
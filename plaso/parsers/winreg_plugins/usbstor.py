@@ -63,6 +63,7 @@ class USBStorPlugin(
 
   NAME = 'windows_usbstor_devices'
   DATA_FORMAT = 'Windows USB Plug And Play Manager USBStor Registry data'
+  PARSE_CACHE_SUPPORTED = True
 
   FILTERS = frozenset([
       interface.WindowsRegistryKeyPathFilter(
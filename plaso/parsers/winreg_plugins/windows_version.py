@@ -42,6 +42,7 @@ class WindowsVersionPlugin(interface.WindowsRegistryPlugin):
 
   NAME = 'windows_version'
   DATA_FORMAT = 'Windows version (product) Registry data'
+  PARSE_CACHE_SUPPORTED = True
 
   FILTERS = frozenset([
       interface.WindowsRegistryKeyPathFilter(
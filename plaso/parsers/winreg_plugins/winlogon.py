@@ -37,6 +37,7 @@ class WinlogonPlugin(interface.WindowsRegistryPlugin):
 
   NAME = 'winlogon'
   DATA_FORMAT = 'Windows log-on Registry data'
+  PARSE_CACHE_SUPPORTED = True
 
   FILTERS = frozenset([
       interface.WindowsRegistryKeyPathFilter(
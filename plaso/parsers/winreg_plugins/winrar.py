@@ -33,6 +33,7 @@ class WinRARHistoryPlugin(interface.WindowsRegistryPlugin):
 
   NAME = 'winrar_mru'
   DATA_FORMAT = 'WinRAR History Registry data'
+  PARSE_CACHE_SUPPORTED = True
 
   FILTERS = frozenset([
       interface.WindowsRegistryKeyPathFilter(
@@ -41,6 +41,7 @@ class RestorePointLogParser(
 
   NAME = 'rplog'
   DATA_FORMAT = 'Windows Restore Point log (rp.log) file'
+  PARSE_CACHE_SUPPORTED = True
 
   FILTERS = frozenset([
       interface.FileNameFileEntryFilter('rp.log')])
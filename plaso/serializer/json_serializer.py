@@ -29,6 +29,8 @@ schema_helper.SchemaHelper.RegisterDataTypes({
         'json': serializers.JSONDateTimeAttributeSerializer()},
     'dfvfs.PathSpec': {
         'json': serializers.JSONPathSpecAttributeSerializer()},
+    'List[dfvfs.PathSpec]': {
+        'json': serializers.JSONPathSpecListAttributeSerializer()},
     'List[int]': {
         'json': serializers.JSONValueListAttributeSerializer()},
     'List[str]': {
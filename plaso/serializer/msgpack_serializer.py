@@ -0,0 +1,362 @@
+# -*- coding: utf-8 -*-
+"""MessagePack attribute container serializer.
+
+The MessagePack serialization format is a compact binary alternative to
+the JSON serialization format. Values that have no native MessagePack
+representation are stored as:
+* attribute container identifiers and integers that do not fit in 64-bit,
+  MessagePack extension types;
+* attribute containers, collections.Counter, date and time values, path
+  specifications and tuples, maps with a '__type__' key similar to the JSON
+  serialization format.
+"""
+
+import collections
+import threading
+
+import msgpack
+
+from acstore.containers import interface as containers_interface
+from acstore.containers import manager as containers_manager
+
+from dfdatetime import interface as dfdatetime_interface
+from dfdatetime import serializer as dfdatetime_serializer
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import path_spec as dfvfs_path_spec
+from dfvfs.path import factory as dfvfs_path_spec_factory
+
+# The following import is needed to make sure TSKTime is registered with
+# the dfDateTime factory.
+from dfvfs.vfs import tsk_file_entry  # pylint: disable=unused-import
+
+
+class MessagePackAttributeContainerSerializer(object):
+  """MessagePack attribute container serializer."""
+
+  _CONTAINERS_MANAGER = containers_manager.AttributeContainersManager
+
+  # Container types of which all attributes are deserialized, instead of only
+  # the supported attributes.
+  _CONTAINER_TYPES_WITH_DYNAMIC_ATTRIBUTES = frozenset([
+      'event_data', 'system_configuration'])
+
+  # MessagePack extension type codes.
+  _EXTENSION_TYPE_ATTRIBUTE_CONTAINER_IDENTIFIER = 1
+  _EXTENSION_TYPE_INTEGER = 2
+
+  _convert_dict_to_value = {}
+
+  # The packer is reused per thread since creating it is relatively expensive.
+  _thread_local = threading.local()
+
+  @classmethod
+  def _ConvertAttributeContainerToDict(cls, attribute_container):
+    """Converts an attribute container into a dictionary.
+
+    Args:
+      attribute_container (AttributeContainer): attribute container.
+
+    Returns:
+      dict[str, object]: attribute container type, stored as
+          '__container_type__', and attribute values.
+    """
+    container_dict = dict(attribute_container.GetAttributes())
+    container_dict['__container_type__'] = attribute_container.CONTAINER_TYPE
+    container_dict['__type__'] = 'AttributeContainer'
+    return container_dict
+
+  @classmethod
+  def _ConvertDictToAttributeContainer(cls, container_dict):
+    """Converts a dictionary into an attribute container.
+
+    Args:
+      container_dict (dict[str, object]): attribute container type, stored as
+          '__container_type__', and attribute values.
+
+    Returns:
+      AttributeContainer: attribute container.
+    """
+    del container_dict['__type__']
+    container_type = container_dict.pop('__container_type__', None)
+
+    attribute_container = cls._CONTAINERS_MANAGER.CreateAttributeContainer(
+        container_type)
+
+    if container_type in cls._CONTAINER_TYPES_WITH_DYNAMIC_ATTRIBUTES:
+      attribute_container.__dict__.update(container_dict)
+
+    else:
+      # Be strict about which attributes to set.
+      supported_attribute_names = attribute_container.GetAttributeNames()
+      for attribute_name, attribute_value in container_dict.items():
+        if attribute_name in supported_attribute_names:
+          setattr(attribute_container, attribute_name, attribute_value)
+
+    return attribute_container
+
+  @classmethod
+  def _ConvertDictToCollectionsCounter(cls, counter_dict):
+    """Converts a dictionary into a collections.Counter.
+
+    Args:
+      counter_dict (dict[str, object]): collections.Counter values, stored as
+          'values'.
+
+    Returns:
+      collections.Counter: a collections.Counter value.
+    """
+    return collections.Counter(counter_dict['values'])
+
+  @classmethod
+  def _ConvertDictToPathSpec(cls, path_spec_dict):
+    """Converts a dictionary into a path specification.
+
+    Args:
+      path_spec_dict (dict[str, object]): type indicator and properties of
+          the path specification.
+
+    Returns:
+      dfvfs.PathSpec: path specification.
+    """
+    del path_spec_dict['__type__']
+    type_indicator = path_spec_dict.pop('type_indicator', None)
+
+    path_spec = dfvfs_path_spec_factory.Factory.NewPathSpec(
+        type_indicator, **path_spec_dict)
+
+    if type_indicator == dfvfs_definitions.TYPE_INDICATOR_OS:
+      # dfvfs.OSPathSpec() will change the location to an absolute path
+      # here we want to preserve the original location.
+      path_spec.location = path_spec_dict.get('location', None)
+
+    return path_spec
+
+  @classmethod
+  def _ConvertDictToTuple(cls, tuple_dict):
+    """Converts a dictionary into a tuple.
+
+    Args:
+      tuple_dict (dict[str, object]): elements of the tuple, stored as
+          'values'.
+
+    Returns:
+      tuple: a tuple value.
+    """
+    return tuple(tuple_dict['values'])
+
+  # Pylint is confused by the formatting of the return type.
+  # pylint: disable=missing-return-type-doc
+  @classmethod
+  def _ConvertDictToValue(cls, value_dict):
+    """Converts a dictionary into a value.
+
+    Args:
+      value_dict (dict[object, object]): dictionary, where '__type__' indicates
+          the type of value it represents.
+
+    Returns:
+      AttributeContainer|collections.Counter|dfdatetime.DateTimeValues|
+          dfvfs.PathSpec|dict|tuple: value.
+
+    Raises:
+      ValueError: if the type of the dictionary is not supported.
+    """
+    if not cls._convert_dict_to_value:
+      cls._convert_dict_to_value = {
+          'AttributeContainer': cls._ConvertDictToAttributeContainer,
+          'collections.Counter': cls._ConvertDictToCollectionsCounter,
+          'DateTimeValues': (
+              dfdatetime_serializer.Serializer.ConvertDictToDateTimeValues),
+          'PathSpec': cls._ConvertDictToPathSpec,
+          'tuple': cls._ConvertDictToTuple}
+
+    value_type = value_dict.get('__type__', None)
+    if not value_type:
+      return value_dict
+
+    convert_function = cls._convert_dict_to_value.get(value_type, None)
+    if not convert_function:
+      raise ValueError(f'Unsupported dictionary type: {value_type!s}')
+
+    return convert_function(value_dict)
+
+  @classmethod
+  def _ConvertPathSpecToDict(cls, path_spec):
+    """Converts a path specification into a dictionary.
+
+    Args:
+      path_spec (dfvfs.PathSpec): path specification.
+
+    Returns:
+      dict[str, object]: type indicator and properties of the path
+          specification, where the parent path specification is stored as
+          a path specification object.
+    """
+    path_spec_dict = {'__type__': 'PathSpec'}
+    for property_name in dfvfs_path_spec_factory.Factory.PROPERTY_NAMES:
+      property_value = getattr(path_spec, property_name, None)
+      if property_value is not None:
+        path_spec_dict[property_name] = property_value
+
+    if path_spec.HasParent():
+      path_spec_dict['parent'] = path_spec.parent
+
+    path_spec_dict['type_indicator'] = path_spec.type_indicator
+
+    return path_spec_dict
+
+  @classmethod
+  def _DecodeExtensionType(cls, code, data):
+    """Decodes a MessagePack extension type.
+
+    Args:
+      code (int): extension type code.
+      data (bytes): extension type data.
+
+    Returns:
+      AttributeContainerIdentifier|int: decoded value.
+
+    Raises:
+      ValueError: if the extension type is not supported.
+    """
+    if code == cls._EXTENSION_TYPE_ATTRIBUTE_CONTAINER_IDENTIFIER:
+      identifier = containers_interface.AttributeContainerIdentifier()
+      identifier.CopyFromString(data.decode('utf-8'))
+      return identifier
+
+    if code == cls._EXTENSION_TYPE_INTEGER:
+      return int(data.decode('ascii'), 10)
+
+    raise ValueError(f'Unsupported extension type: {code:d}')
+
+  @classmethod
+  def _EncodeValue(cls, value):
+    """Encodes a value that has no native MessagePack representation.
+
+    Note that this function should not pack values itself, since it is
+    called by the packer of the current thread.
+
+    Args:
+      value (object): value.
+
+    Returns:
+      object: value that can be packed.
+
+    Raises:
+      TypeError: if the type of the value is not supported.
+    """
+    if isinstance(value, containers_interface.AttributeContainer):
+      return cls._ConvertAttributeContainerToDict(value)
+
+    if isinstance(value, dfdatetime_interface.DateTimeValues):
+      return dfdatetime_serializer.Serializer.ConvertDateTimeValuesToDict(
+          value)
+
+    if isinstance(value, dfvfs_path_spec.PathSpec):
+      return cls._ConvertPathSpecToDict(value)
+
+    if isinstance(value, containers_interface.AttributeContainerIdentifier):
+      return msgpack.ExtType(
+          cls._EXTENSION_TYPE_ATTRIBUTE_CONTAINER_IDENTIFIER,
+          value.CopyToString().encode('utf-8'))
+
+    if isinstance(value, tuple):
+      return {'__type__': 'tuple', 'values': list(value)}
+
+    if isinstance(value, collections.Counter):
+      return {'__type__': 'collections.Counter', 'values': dict(value)}
+
+    # Integers that do not fit in 64-bit are stored as a decimal string.
+    if isinstance(value, int) and not isinstance(value, bool):
+      if -(1 << 63) <= value < (1 << 64):
+        return int(value)
+
+      return msgpack.ExtType(
+          cls._EXTENSION_TYPE_INTEGER, f'{value:d}'.encode('ascii'))
+
+    # Subclasses of the native types are stored as their native type.
+    for native_type in (str, bytes, float, list, dict):
+      if isinstance(value, native_type):
+        return native_type(value)
+
+    # Sets are stored as lists, similar to the JSON serializer.
+    if isinstance(value, (set, frozenset)):
+      return list(value)
+
+    value_type = type(value)
+    raise TypeError(f'Unsupported value type: {value_type!s}')
+
+  @classmethod
+  def _GetPacker(cls):
+    """Retrieves the packer of the current thread.
+
+    Returns:
+      msgpack.Packer: packer.
+    """
+    packer = getattr(cls._thread_local, 'packer', None)
+    if not packer:
+      # Strict types is used to preserve tuples and collections.Counter.
+      packer = msgpack.Packer(default=cls._EncodeValue, strict_types=True)
+      cls._thread_local.packer = packer
+
+    return packer
+
+  @classmethod
+  def ReadSerialized(cls, serialized_data):
+    """Reads an attribute container from serialized form.
+
+    Args:
+      serialized_data (bytes): MessagePack serialized attribute container.
+
+    Returns:
+      AttributeContainer: attribute container or None.
+
+    Raises:
+      TypeError: if the serialized data does not contain an attribute
+          container.
+      ValueError: if the serialized data cannot be read.
+    """
+    if not serialized_data:
+      return None
+
+    try:
+      attribute_container = msgpack.unpackb(
+          serialized_data, ext_hook=cls._DecodeExtensionType,
+          object_hook=cls._ConvertDictToValue, raw=False,
+          strict_map_key=False)
+    except (msgpack.ExtraData, msgpack.FormatError,
+            msgpack.StackError) as exception:
+      raise ValueError(
+          f'Unable to read serialized data with error: {exception!s}')
+
+    if not isinstance(
+        attribute_container, containers_interface.AttributeContainer):
+      attribute_container_type = type(attribute_container)
+      raise TypeError(f'{attribute_container_type!s} is not a supported type.')
+
+    return attribute_container
+
+  @classmethod
+  def WriteSerialized(cls, attribute_container):
+    """Writes an attribute container to serialized form.
+
+    Args:
+      attribute_container (AttributeContainer): attribute container.
+
+    Returns:
+      bytes: MessagePack serialized attribute container.
+
+    Raises:
+      TypeError: if an attribute value type is not supported.
+    """
+    packer = cls._GetPacker()
+
+    container_dict = cls._ConvertAttributeContainerToDict(attribute_container)
+
+    try:
+      return packer.pack(container_dict)
+    except Exception:
+      # The packer is reset since it can contain partially packed data.
+      packer.reset()
+      raise
@@ -15,8 +15,10 @@ from plaso.containers import event_sources
 from plaso.containers import events
 from plaso.engine import engine
 from plaso.engine import extractors
+from plaso.engine import fingerprints
 from plaso.engine import logger
 from plaso.engine import process_info
+from plaso.engine import processing_status
 from plaso.engine import timeliner
 from plaso.engine import worker
 from plaso.lib import definitions
@@ -44,6 +46,7 @@ class SingleProcessEngine(engine.BaseEngine):
     self._event_data_timeliner = None
     self._extraction_worker = None
     self._file_system_cache = []
+    self._fingerprinter = None
     self._number_of_consumed_event_data = 0
     self._number_of_consumed_sources = 0
     self._number_of_produced_events = 0
@@ -274,8 +277,39 @@ class SingleProcessEngine(engine.BaseEngine):
             f'Excluded from extraction: {self._current_display_name:s}.')
         return
 
+      if self._fingerprinter and self._fingerprinter.CheckFileEntry(
+          file_entry):
+        logger.debug((
+            f'Unchanged since previous session: '
+            f'{self._current_display_name:s}.'))
+        return
+
+      first_event_data_stream_index = 0
+      if self._fingerprinter:
+        first_event_data_stream_index = (
+            self._storage_writer.GetNumberOfAttributeContainers(
+                self._CONTAINER_TYPE_EVENT_DATA_STREAM))
+
       self._extraction_worker.ProcessFileEntry(parser_mediator, file_entry)
 
+      # The fingerprint of a file entry is only recorded once it was processed
+      # without error.
+      if self._fingerprinter and not self._abort:
+        # The digest of a fingerprint is taken from the event data streams
+        # produced by the extraction worker.
+        number_of_event_data_streams = (
+            self._storage_writer.GetNumberOfAttributeContainers(
+                self._CONTAINER_TYPE_EVENT_DATA_STREAM))
+        for index in range(
+            first_event_data_stream_index, number_of_event_data_streams):
+          event_data_stream = (
+              self._storage_writer.GetAttributeContainerByIndex(
+                  self._CONTAINER_TYPE_EVENT_DATA_STREAM, index))
+          self._fingerprinter.SetDigest(event_data_stream)
+
+        self._fingerprinter.RecordFingerprint(
+            self._storage_writer, file_entry.path_spec)
+
     except KeyboardInterrupt:
       self._abort = True
 
@@ -373,6 +407,29 @@ class SingleProcessEngine(engine.BaseEngine):
         0, 0,
         0, 0)
 
+    if (self._extraction_worker.number_of_parse_cache_hits or
+        self._extraction_worker.number_of_parse_cache_misses):
+      parse_cache_status = processing_status.ParseCacheStatus()
+      parse_cache_status.number_of_hits = (
+          self._extraction_worker.number_of_parse_cache_hits)
+      parse_cache_status.number_of_misses = (
+          self._extraction_worker.number_of_parse_cache_misses)
+      parse_cache_status.time_saved = (
+          self._extraction_worker.parse_cache_time_saved)
+
+      self._processing_status.UpdateParseCacheStatus(parse_cache_status)
+
+    if self._fingerprinter:
+      incremental_extraction_status = (
+          processing_status.IncrementalExtractionStatus())
+      incremental_extraction_status.number_of_parsed_file_entries = (
+          self._fingerprinter.number_of_parsed_file_entries)
+      incremental_extraction_status.number_of_skipped_file_entries = (
+          self._fingerprinter.number_of_skipped_file_entries)
+
+      self._processing_status.UpdateIncrementalExtractionStatus(
+          incremental_extraction_status)
+
     if self._status_update_callback:
       self._status_update_callback(self._processing_status)
 
@@ -488,6 +545,13 @@ class SingleProcessEngine(engine.BaseEngine):
     except ValueError as exception:
       raise errors.BadConfigOption(exception)
 
+    self._fingerprinter = None
+    if processing_configuration.incremental_extraction:
+      self._fingerprinter = fingerprints.FileEntryFingerprinter(
+          calculate_digest=(
+              processing_configuration.incremental_extraction_digest))
+      self._fingerprinter.ReadFingerprints(storage_writer)
+
     self._parser_mediator = parser_mediator
     self._processing_configuration = processing_configuration
     self._resolver_context = resolver_context
@@ -574,9 +638,13 @@ class SingleProcessEngine(engine.BaseEngine):
     # Update the status view one last time.
     self._UpdateStatus()
 
+    self._extraction_worker.CloseParseCache()
+    self._extraction_worker.StopAnalyzerThreads()
+
     self._event_data_timeliner = None
     self._extraction_worker = None
     self._file_system_cache = []
+    self._fingerprinter = None
     self._parser_mediator = None
     self._processing_configuration = None
     self._resolver_context = None
@@ -15,6 +15,7 @@ class FakeStore(acstore_fake_store.FakeAttributeContainerStore):
   """
 
   _CONTAINER_TYPE_EVENT = events.EventObject.CONTAINER_TYPE
+  _CONTAINER_TYPE_EVENT_DATA = events.EventData.CONTAINER_TYPE
 
   def __init__(self):
     """Initializes a fake (in-memory only) store."""
@@ -22,12 +23,50 @@ class FakeStore(acstore_fake_store.FakeAttributeContainerStore):
     self._serializers_profiler = None
     self.serialization_format = None
 
-  def GetSortedEvents(self, time_range=None):
+  def AddAttributeContainers(self, containers):
+    """Adds new attribute containers in bulk.
+
+    Args:
+      containers (list[AttributeContainer]): attribute containers of the same
+          type.
+
+    Raises:
+      IOError: if the store cannot be written to.
+      OSError: if the store cannot be written to.
+    """
+    for container in containers:
+      self.AddAttributeContainer(container)
+
+  def GetAttributeContainersByIndexes(self, container_type, indexes):
+    """Retrieves specific attribute containers in bulk.
+
+    Args:
+      container_type (str): attribute container type.
+      indexes (list[int]): attribute container indexes.
+
+    Returns:
+      dict[int, AttributeContainer]: attribute containers per index, where
+          indexes that are not available are omitted.
+    """
+    containers_per_index = {}
+    for index in indexes:
+      container = self.GetAttributeContainerByIndex(container_type, index)
+      if container:
+        containers_per_index[index] = container
+
+    return containers_per_index
+
+  def GetSortedEvents(
+      self, time_range=None, data_types=None, parser_chains=None):
     """Retrieves the events in increasing chronological order.
 
     Args:
       time_range (Optional[TimeRange]): time range used to filter events
           that fall in a specific period.
+      data_types (Optional[list[str]]): event data types to include, where
+          None represents all data types.
+      parser_chains (Optional[list[str]]): parser chains to include, where
+          None represents all parser chains.
 
     Returns:
       generator(EventObject): event generator.
@@ -48,6 +87,24 @@ class FakeStore(acstore_fake_store.FakeAttributeContainerStore):
           event.timestamp > time_range.end_timestamp)):
         continue
 
+      if data_types is not None or parser_chains is not None:
+        event_data_identifier = event.GetEventDataIdentifier()
+        event_data = None
+        if event_data_identifier:
+          event_data = self.GetAttributeContainerByIdentifier(
+              self._CONTAINER_TYPE_EVENT_DATA, event_data_identifier)
+
+        if not event_data:
+          continue
+
+        data_type = getattr(event_data, 'data_type', None)
+        if data_types is not None and data_type not in data_types:
+          continue
+
+        parser_chain = getattr(event_data, '_parser_chain', None)
+        if parser_chains is not None and parser_chain not in parser_chains:
+          continue
+
       # The event index is used to ensure to sort events with the same date and
       # time and description in the order they were added to the store.
       sorted_events.PushEvent(event, event_index)
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """The storage reader."""
 
+import collections
+
 from plaso.containers import events
 from plaso.containers import sessions
 from plaso.storage import logger
@@ -10,11 +12,24 @@ class StorageReader(object):
   """Storage reader interface."""
 
   _CONTAINER_TYPE_SESSION = sessions.Session.CONTAINER_TYPE
+  _CONTAINER_TYPE_EVENT_DATA = events.EventData.CONTAINER_TYPE
+  _CONTAINER_TYPE_EVENT_DATA_STREAM = events.EventDataStream.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_TAG = events.EventTag.CONTAINER_TYPE
 
+  # The default number of events per batch of joined sorted events.
+  _DEFAULT_SORTED_EVENTS_BATCH_SIZE = 1024
+
+  # The maximum number of cached event data streams
+  _MAXIMUM_CACHED_EVENT_DATA_STREAMS = 16 * 1024
+
+  # The maximum number of event identifiers per event tag query, which keeps
+  # the depth of the resulting SQL expression well within the SQLite limit.
+  _MAXIMUM_EVENT_TAGS_PER_QUERY = 128
+
   def __init__(self):
     """Initializes a storage reader."""
     super(StorageReader, self).__init__()
+    self._event_data_stream_per_index = collections.OrderedDict()
     self._serializers_profiler = None
     self._storage_profiler = None
     self._store = None
@@ -28,10 +43,139 @@ class StorageReader(object):
     """Make usable with "with" statement."""
     self.Close()
 
+  def _GetEventDataStreamsByIndexes(self, indexes):
+    """Retrieves event data streams using the event data stream cache.
+
+    Args:
+      indexes (list[int]): event data stream indexes.
+
+    Returns:
+      dict[int, EventDataStream]: event data streams per index.
+    """
+    event_data_streams = {}
+    missing_indexes = []
+
+    for index in indexes:
+      event_data_stream = self._event_data_stream_per_index.get(index, None)
+      if event_data_stream:
+        self._event_data_stream_per_index.move_to_end(index, last=False)
+        event_data_streams[index] = event_data_stream
+      else:
+        missing_indexes.append(index)
+
+    if missing_indexes:
+      event_data_stream_per_index = self._store.GetAttributeContainersByIndexes(
+          self._CONTAINER_TYPE_EVENT_DATA_STREAM, missing_indexes)
+
+      for index, event_data_stream in event_data_stream_per_index.items():
+        if len(self._event_data_stream_per_index) >= (
+            self._MAXIMUM_CACHED_EVENT_DATA_STREAMS):
+          self._event_data_stream_per_index.popitem(last=True)
+
+        self._event_data_stream_per_index[index] = event_data_stream
+        self._event_data_stream_per_index.move_to_end(index, last=False)
+
+      event_data_streams.update(event_data_stream_per_index)
+
+    return event_data_streams
+
+  def _GetEventTagsByEventIdentifiers(self, event_identifiers):
+    """Retrieves the event tags of specific events.
+
+    Args:
+      event_identifiers (list[AttributeContainerIdentifier]): event attribute
+          container identifiers.
+
+    Returns:
+      dict[str, EventTag]: event tags per event identifier string, where
+          events without an event tag are omitted.
+    """
+    lookup_keys = [
+        event_identifier.CopyToString()
+        for event_identifier in event_identifiers]
+
+    event_tags = {}
+    for first_key_index in range(
+        0, len(lookup_keys), self._MAXIMUM_EVENT_TAGS_PER_QUERY):
+      last_key_index = first_key_index + self._MAXIMUM_EVENT_TAGS_PER_QUERY
+      filter_expression = ' or '.join([
+          f'_event_identifier == "{lookup_key:s}"'
+          for lookup_key in lookup_keys[first_key_index:last_key_index]])
+
+      for event_tag in self.GetAttributeContainers(
+          self._CONTAINER_TYPE_EVENT_TAG, filter_expression=filter_expression):
+        event_identifier = event_tag.GetEventIdentifier()
+        lookup_key = event_identifier.CopyToString()
+        if lookup_key in event_tags:
+          logger.warning('More than 1 event tag returned.')
+        else:
+          event_tags[lookup_key] = event_tag
+
+    return event_tags
+
+  def _JoinSortedEvents(self, sorted_events, has_event_tags):
+    """Joins a batch of sorted events with their event data and event tags.
+
+    Args:
+      sorted_events (list[EventObject]): events in increasing chronological
+          order.
+      has_event_tags (bool): True if the store contains event tags.
+
+    Yields:
+      tuple: containing:
+
+        EventObject: event.
+        EventData: event data or None if not available.
+        EventDataStream: event data stream or None if not available.
+        EventTag: event tag or None if the event has no event tag.
+    """
+    event_data_indexes = set()
+    for event in sorted_events:
+      event_data_identifier = event.GetEventDataIdentifier()
+      event_data_indexes.add(event_data_identifier.sequence_number - 1)
+
+    event_data_per_index = self._store.GetAttributeContainersByIndexes(
+        self._CONTAINER_TYPE_EVENT_DATA, sorted(event_data_indexes))
+
+    event_data_stream_indexes = set()
+    for event_data in event_data_per_index.values():
+      event_data_stream_identifier = event_data.GetEventDataStreamIdentifier()
+      if event_data_stream_identifier:
+        event_data_stream_indexes.add(
+            event_data_stream_identifier.sequence_number - 1)
+
+    event_data_stream_per_index = self._GetEventDataStreamsByIndexes(
+        sorted(event_data_stream_indexes))
+
+    event_tags = {}
+    if has_event_tags:
+      event_tags = self._GetEventTagsByEventIdentifiers([
+          event.GetIdentifier() for event in sorted_events])
+
+    for event in sorted_events:
+      event_data_identifier = event.GetEventDataIdentifier()
+      event_data = event_data_per_index.get(
+          event_data_identifier.sequence_number - 1, None)
+
+      event_data_stream = None
+      if event_data:
+        event_data_stream_identifier = event_data.GetEventDataStreamIdentifier()
+        if event_data_stream_identifier:
+          event_data_stream = event_data_stream_per_index.get(
+              event_data_stream_identifier.sequence_number - 1, None)
+
+      event_tag = None
+      if event_tags:
+        event_identifier = event.GetIdentifier()
+        event_tag = event_tags.get(event_identifier.CopyToString(), None)
+
+      yield event, event_data, event_data_stream, event_tag
+
   def Close(self):
     """Closes the storage reader."""
     self._store.Close()
     self._store = None
+    self._event_data_stream_per_index = collections.OrderedDict()
 
   def GetAttributeContainerByIdentifier(self, container_type, identifier):
     """Retrieves a specific type of container with a specific identifier.
@@ -131,7 +275,8 @@ class StorageReader(object):
     """
     yield from self.GetAttributeContainers(self._CONTAINER_TYPE_SESSION)
 
-  def GetSortedEvents(self, time_range=None):
+  def GetSortedEvents(
+      self, time_range=None, data_types=None, parser_chains=None):
     """Retrieves the events in increasing chronological order.
 
     This includes all events written to the storage including those pending
@@ -140,11 +285,61 @@ class StorageReader(object):
     Args:
       time_range (Optional[TimeRange]): time range used to filter events
           that fall in a specific period.
+      data_types (Optional[list[str]]): event data types to include, where
+          None represents all data types.
+      parser_chains (Optional[list[str]]): parser chains to include, where
+          None represents all parser chains.
 
     Returns:
       generator(EventObject): event generator.
     """
-    return self._store.GetSortedEvents(time_range=time_range)
+    return self._store.GetSortedEvents(
+        time_range=time_range, data_types=data_types,
+        parser_chains=parser_chains)
+
+  def GetSortedEventsWithData(
+      self, time_range=None, data_types=None, parser_chains=None,
+      batch_size=None):
+    """Retrieves the events and related containers in chronological order.
+
+    The event data, event data streams and event tags are read in bulk per
+    batch of events instead of per event.
+
+    Args:
+      time_range (Optional[TimeRange]): time range used to filter events
+          that fall in a specific period.
+      data_types (Optional[list[str]]): event data types to include, where
+          None represents all data types.
+      parser_chains (Optional[list[str]]): parser chains to include, where
+          None represents all parser chains.
+      batch_size (Optional[int]): number of events that are joined with
+          their related attribute containers at a time, where None represents
+          the default batch size.
+
+    Yields:
+      tuple: containing:
+
+        EventObject: event.
+        EventData: event data or None if not available.
+        EventDataStream: event data stream or None if not available.
+        EventTag: event tag or None if the event has no event tag.
+    """
+    batch_size = batch_size or self._DEFAULT_SORTED_EVENTS_BATCH_SIZE
+
+    has_event_tags = self.HasAttributeContainers(self._CONTAINER_TYPE_EVENT_TAG)
+
+    sorted_events = []
+    for event in self.GetSortedEvents(
+        time_range=time_range, data_types=data_types,
+        parser_chains=parser_chains):
+      sorted_events.append(event)
+
+      if len(sorted_events) >= batch_size:
+        yield from self._JoinSortedEvents(sorted_events, has_event_tags)
+        sorted_events = []
+
+    if sorted_events:
+      yield from self._JoinSortedEvents(sorted_events, has_event_tags)
 
   def HasAttributeContainers(self, container_type):
     """Determines if a store contains a specific type of attribute container.
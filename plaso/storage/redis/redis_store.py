@@ -35,20 +35,77 @@ class BaseRedisAttributeContainerStore(
 
   _FORMAT_VERSION = 20230312
 
+  # Number of attribute containers that are read with a single HMGET command.
+  _READ_BATCH_SIZE = 1000
+
   DEFAULT_REDIS_URL = 'redis://127.0.0.1/0'
 
+  # Default number of write commands that are buffered in a pipeline before
+  # they are sent to the Redis server.
+  DEFAULT_WRITE_BATCH_SIZE = 1000
+
   def __init__(self):
     """Initializes a Redis attribute container store."""
     super(BaseRedisAttributeContainerStore, self).__init__()
     self._json_serializer = (
         containers_json_serializer.AttributeContainerJSONSerializer)
+    self._number_of_buffered_writes = 0
     self._redis_client = None
+    self._redis_pipeline = None
     self._session_identifier = None
     self._task_identifier = None
+    self._write_batch_size = self.DEFAULT_WRITE_BATCH_SIZE
 
     self.format_version = self._FORMAT_VERSION
     self.serialization_format = definitions.SERIALIZER_FORMAT_JSON
 
+  def _BufferWrite(self):
+    """Accounts for a write command buffered in the pipeline.
+
+    The pipeline is sent to the Redis server when the write batch size is
+    reached.
+    """
+    self._number_of_buffered_writes += 1
+    if self._number_of_buffered_writes >= self._write_batch_size:
+      self._FlushWrites()
+
+  def _CreateAttributeContainer(
+      self, container_type, identifier, serialized_data):
+    """Creates an attribute container from serialized data.
+
+    Args:
+      container_type (str): attribute container type.
+      identifier (AttributeContainerIdentifier): attribute container
+          identifier.
+      serialized_data (bytes): serialized attribute container data.
+
+    Returns:
+      AttributeContainer: attribute container.
+    """
+    json_dict = json.loads(serialized_data)
+
+    container = self._json_serializer.ConvertJSONToAttributeContainer(json_dict)
+    container.SetIdentifier(identifier)
+    return container
+
+  def _FlushWrites(self):
+    """Sends the write commands buffered in the pipeline to the Redis server.
+
+    Raises:
+      IOError: if the write commands cannot be sent.
+      OSError: if the write commands cannot be sent.
+    """
+    if not self._number_of_buffered_writes:
+      return
+
+    self._number_of_buffered_writes = 0
+
+    try:
+      self._redis_pipeline.execute()
+    except redis.RedisError as exception:
+      raise IOError(
+          f'Unable to write attribute containers with error: {exception!s}')
+
   def _GetRedisHashName(self, container_type):
     """Retrieves the Redis hash name of the attribute container type.
 
@@ -61,6 +118,57 @@ class BaseRedisAttributeContainerStore(
     return (f'{self._session_identifier:s}-{self._task_identifier:s}-'
             f'{container_type:s}')
 
+  def _GetSerializedAttributeContainers(self, container_type):
+    """Retrieves serialized attribute containers in order of sequence number.
+
+    The attribute containers are read in batches with the HMGET command.
+    Since the sequence numbers of the attribute containers in a store are
+    consecutive, starting with 1, the keys of a batch can be determined in
+    advance.
+
+    Args:
+      container_type (str): attribute container type.
+
+    Yields:
+      tuple[AttributeContainerIdentifier, bytes]: attribute container
+          identifier and serialized attribute container data.
+    """
+    redis_hash_name = self._GetRedisHashName(container_type)
+
+    number_of_containers = self._redis_client.hlen(redis_hash_name)
+    number_of_read_containers = 0
+
+    for first_sequence_number in range(
+        1, number_of_containers + 1, self._READ_BATCH_SIZE):
+      last_sequence_number = min(
+          first_sequence_number + self._READ_BATCH_SIZE - 1,
+          number_of_containers)
+
+      identifiers = [
+          containers_interface.AttributeContainerIdentifier(
+              name=container_type, sequence_number=sequence_number)
+          for sequence_number in range(
+              first_sequence_number, last_sequence_number + 1)]
+
+      redis_keys = [identifier.CopyToString() for identifier in identifiers]
+      values = self._redis_client.hmget(redis_hash_name, redis_keys)
+
+      for identifier, serialized_data in zip(identifiers, values):
+        if serialized_data:
+          number_of_read_containers += 1
+          yield identifier, serialized_data
+
+    if number_of_read_containers < number_of_containers:
+      # The sequence numbers are not consecutive, which is not expected, hence
+      # the remaining attribute containers are read by scanning the hash.
+      for redis_key, serialized_data in self._redis_client.hscan_iter(
+          redis_hash_name):
+        identifier = containers_interface.AttributeContainerIdentifier()
+        identifier.CopyFromString(redis_key.decode('utf-8'))
+
+        if identifier.sequence_number > number_of_containers:
+          yield identifier, serialized_data
+
   def _RaiseIfNotReadable(self):
     """Raises if the attribute container store is not readable.
 
@@ -125,7 +233,8 @@ class BaseRedisAttributeContainerStore(
           f'Unable to serialize attribute container: '
           f'{container.CONTAINER_TYPE:s}'))
 
-    self._redis_client.hset(redis_hash_name, key=redis_key, value=json_string)
+    self._redis_pipeline.hset(redis_hash_name, key=redis_key, value=json_string)
+    self._BufferWrite()
 
   def _WriteNewAttributeContainer(self, container):
     """Writes a new attribute container to the store.
@@ -157,7 +266,8 @@ class BaseRedisAttributeContainerStore(
           f'Unable to serialize attribute container: '
           f'{container.CONTAINER_TYPE:s}'))
 
-    self._redis_client.hsetnx(redis_hash_name, redis_key, json_string)
+    self._redis_pipeline.hsetnx(redis_hash_name, redis_key, json_string)
+    self._BufferWrite()
 
     self._CacheAttributeContainerByIndex(container, next_sequence_number - 1)
 
@@ -171,6 +281,20 @@ class BaseRedisAttributeContainerStore(
     for key, value in metadata.items():
       self._redis_client.hset(metadata_key, key=key, value=value)
 
+  def AddAttributeContainers(self, containers):
+    """Adds new attribute containers in bulk.
+
+    Args:
+      containers (list[AttributeContainer]): attribute containers of the same
+          type.
+
+    Raises:
+      IOError: if the store cannot be written to.
+      OSError: if the store cannot be written to.
+    """
+    for container in containers:
+      self.AddAttributeContainer(container)
+
   def Close(self):
     """Closes the store.
 
@@ -181,7 +305,10 @@ class BaseRedisAttributeContainerStore(
     if not self._redis_client:
       raise IOError('Store already closed.')
 
+    self._FlushWrites()
+
     self._redis_client = None
+    self._redis_pipeline = None
 
   def GetAttributeContainerByIdentifier(self, container_type, identifier):
     """Retrieves a specific type of container with a specific identifier.
@@ -193,18 +320,17 @@ class BaseRedisAttributeContainerStore(
     Returns:
       AttributeContainer: attribute container or None if not available.
     """
+    self._FlushWrites()
+
     redis_hash_name = self._GetRedisHashName(container_type)
     redis_key = identifier.CopyToString()
 
-    json_string = self._redis_client.hget(redis_hash_name, redis_key)
-    if not json_string:
+    serialized_data = self._redis_client.hget(redis_hash_name, redis_key)
+    if not serialized_data:
       return None
 
-    json_dict = json.loads(json_string)
-
-    container = self._json_serializer.ConvertJSONToAttributeContainer(json_dict)
-    container.SetIdentifier(identifier)
-    return container
+    return self._CreateAttributeContainer(
+        container_type, identifier, serialized_data)
 
   def GetAttributeContainerByIndex(self, container_type, index):
     """Retrieves a specific attribute container.
@@ -219,18 +345,42 @@ class BaseRedisAttributeContainerStore(
     identifier = containers_interface.AttributeContainerIdentifier(
         name=container_type, sequence_number=index + 1)
 
+    return self.GetAttributeContainerByIdentifier(container_type, identifier)
+
+  def GetAttributeContainersByIndexes(self, container_type, indexes):
+    """Retrieves specific attribute containers in bulk.
+
+    Args:
+      container_type (str): attribute container type.
+      indexes (list[int]): attribute container indexes.
+
+    Returns:
+      dict[int, AttributeContainer]: attribute containers per index, where
+          indexes that are not available are omitted.
+    """
+    self._FlushWrites()
+
+    containers_per_index = {}
+    if not indexes:
+      return containers_per_index
+
     redis_hash_name = self._GetRedisHashName(container_type)
-    redis_key = identifier.CopyToString()
 
-    json_string = self._redis_client.hget(redis_hash_name, redis_key)
-    if not json_string:
-      return None
+    identifiers = [
+        containers_interface.AttributeContainerIdentifier(
+            name=container_type, sequence_number=index + 1)
+        for index in indexes]
 
-    json_dict = json.loads(json_string)
+    redis_keys = [identifier.CopyToString() for identifier in identifiers]
+    values = self._redis_client.hmget(redis_hash_name, redis_keys)
 
-    container = self._json_serializer.ConvertJSONToAttributeContainer(json_dict)
-    container.SetIdentifier(identifier)
-    return container
+    for index, identifier, serialized_data in zip(
+        indexes, identifiers, values):
+      if serialized_data:
+        containers_per_index[index] = self._CreateAttributeContainer(
+            container_type, identifier, serialized_data)
+
+    return containers_per_index
 
   def GetAttributeContainers(self, container_type, filter_expression=None):
     """Retrieves a specific type of attribute containers.
@@ -243,25 +393,19 @@ class BaseRedisAttributeContainerStore(
     Yields:
       AttributeContainer: attribute container.
     """
-    redis_hash_name = self._GetRedisHashName(container_type)
+    self._FlushWrites()
 
     if filter_expression:
       expression_ast = ast.parse(filter_expression, mode='eval')
       filter_expression = compile(expression_ast, '<string>', mode='eval')
 
-    for redis_key, json_string in self._redis_client.hscan_iter(
-        redis_hash_name):
-      json_dict = json.loads(json_string)
+    for identifier, serialized_data in self._GetSerializedAttributeContainers(
+        container_type):
+      container = self._CreateAttributeContainer(
+          container_type, identifier, serialized_data)
 
-      container = self._json_serializer.ConvertJSONToAttributeContainer(
-          json_dict)
       # TODO: map filter expression to Redis native filter.
       if container.MatchesExpression(filter_expression):
-        key = redis_key.decode('utf8')
-        identifier = containers_interface.AttributeContainerIdentifier()
-        identifier.CopyFromString(key)
-
-        container.SetIdentifier(identifier)
         yield container
 
   def GetNumberOfAttributeContainers(self, container_type):
@@ -273,6 +417,8 @@ class BaseRedisAttributeContainerStore(
     Returns:
       int: the number of containers of a specified type.
     """
+    self._FlushWrites()
+
     redis_hash_name = self._GetRedisHashName(container_type)
     return self._redis_client.hlen(redis_hash_name)
 
@@ -291,7 +437,7 @@ class BaseRedisAttributeContainerStore(
   # pylint: disable=arguments-differ
   def Open(
       self, redis_client=None, session_identifier=None, task_identifier=None,
-      url=None, **unused_kwargs):
+      url=None, write_batch_size=None, **unused_kwargs):
     """Opens the store.
 
     Args:
@@ -304,6 +450,9 @@ class BaseRedisAttributeContainerStore(
           generated.
       url (Optional[str]): URL for a Redis database. If not specified, the
           DEFAULT_REDIS_URL will be used.
+      write_batch_size (Optional[int]): number of write commands that are
+          buffered before they are sent to the Redis server. If not specified,
+          the DEFAULT_WRITE_BATCH_SIZE will be used.
 
     Raises:
       IOError: if the store is already connected to a Redis instance.
@@ -319,6 +468,9 @@ class BaseRedisAttributeContainerStore(
       redis_client = redis.from_url(url=url, socket_timeout=60)
 
     self._redis_client = redis_client
+    self._redis_pipeline = redis_client.pipeline(transaction=False)
+    self._number_of_buffered_writes = 0
+    self._write_batch_size = write_batch_size or self.DEFAULT_WRITE_BATCH_SIZE
 
     self._session_identifier = session_identifier or str(uuid.uuid4())
     self._task_identifier = task_identifier or str(uuid.uuid4())
@@ -351,6 +503,40 @@ class RedisAttributeContainerStore(BaseRedisAttributeContainerStore):
     self._serializer = json_serializer.JSONAttributeContainerSerializer
     self._serializers_profiler = None
 
+  def _CreateAttributeContainer(
+      self, container_type, identifier, serialized_data):
+    """Creates an attribute container from serialized data.
+
+    Args:
+      container_type (str): attribute container type.
+      identifier (AttributeContainerIdentifier): attribute container
+          identifier.
+      serialized_data (bytes): serialized attribute container data.
+
+    Returns:
+      AttributeContainer: attribute container.
+    """
+    schema = self._GetAttributeContainerSchema(container_type)
+    if schema:
+      return super(
+          RedisAttributeContainerStore, self)._CreateAttributeContainer(
+              container_type, identifier, serialized_data)
+
+    container = self._DeserializeAttributeContainer(
+        container_type, serialized_data)
+    container.SetIdentifier(identifier)
+
+    if container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_DATA:
+      identifier = getattr(container, '_event_data_stream_identifier', None)
+      if identifier:
+        event_data_stream_identifier = (
+            containers_interface.AttributeContainerIdentifier(
+                name=self._CONTAINER_TYPE_EVENT_DATA_STREAM,
+                sequence_number=identifier))
+        container.SetEventDataStreamIdentifier(event_data_stream_identifier)
+
+    return container
+
   def _DeserializeAttributeContainer(self, container_type, serialized_data):
     """Deserializes an attribute container.
 
@@ -449,7 +635,8 @@ class RedisAttributeContainerStore(BaseRedisAttributeContainerStore):
                   event_data_stream_identifier.sequence_number)
 
       serialized_data = self._SerializeAttributeContainer(container)
-      self._redis_client.hsetnx(redis_hash_name, redis_key, serialized_data)
+      self._redis_pipeline.hsetnx(redis_hash_name, redis_key, serialized_data)
+      self._BufferWrite()
 
     if container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT:
       index_name = self._GetRedisHashName(self._EVENT_INDEX_NAME)
@@ -457,106 +644,34 @@ class RedisAttributeContainerStore(BaseRedisAttributeContainerStore):
       identifier = container.GetIdentifier()
       redis_key = identifier.CopyToString()
 
-      self._redis_client.zincrby(index_name, container.timestamp, redis_key)
-
-  def GetAttributeContainerByIndex(self, container_type, index):
-    """Retrieves a specific attribute container.
+      self._redis_pipeline.zincrby(index_name, container.timestamp, redis_key)
+      self._BufferWrite()
 
-    Args:
-      container_type (str): attribute container type.
-      index (int): attribute container index.
-
-    Returns:
-      AttributeContainer: attribute container or None if not available.
-    """
-    schema = self._GetAttributeContainerSchema(container_type)
-    if schema:
-      return super(
-          RedisAttributeContainerStore, self).GetAttributeContainerByIndex(
-              container_type, index)
-
-    identifier = containers_interface.AttributeContainerIdentifier(
-        name=container_type, sequence_number=index + 1)
-
-    redis_hash_name = self._GetRedisHashName(container_type)
-    redis_key = identifier.CopyToString()
-
-    serialized_data = self._redis_client.hget(redis_hash_name, redis_key)
-    if not serialized_data:
-      return None
-
-    container = self._DeserializeAttributeContainer(
-        container_type, serialized_data)
-    container.SetIdentifier(identifier)
-
-    if container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_DATA:
-      identifier = getattr(container, '_event_data_stream_identifier', None)
-      if identifier:
-        event_data_stream_identifier = (
-            containers_interface.AttributeContainerIdentifier(
-                name=self._CONTAINER_TYPE_EVENT_DATA_STREAM,
-                sequence_number=identifier))
-        container.SetEventDataStreamIdentifier(event_data_stream_identifier)
-
-    return container
-
-  def GetAttributeContainers(self, container_type, filter_expression=None):
-    """Retrieves a specific type of attribute containers.
-
-    Args:
-      container_type (str): attribute container type.
-      filter_expression (Optional[str]): expression to filter the resulting
-          attribute containers by.
-
-    Yields:
-      AttributeContainer: attribute container.
-    """
-    schema = self._GetAttributeContainerSchema(container_type)
-    if schema:
-      yield from super(
-          RedisAttributeContainerStore, self).GetAttributeContainers(
-              container_type, filter_expression=filter_expression)
-    else:
-      redis_hash_name = self._GetRedisHashName(container_type)
-      for redis_key, serialized_data in self._redis_client.hscan_iter(
-          redis_hash_name):
-        container = self._DeserializeAttributeContainer(
-            container_type, serialized_data)
-
-        redis_key = redis_key.decode('utf-8')
-        identifier = containers_interface.AttributeContainerIdentifier()
-        identifier.CopyFromString(redis_key)
-
-        if container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_DATA:
-          identifier = getattr(container, '_event_data_stream_identifier', None)
-          if identifier:
-            event_data_stream_identifier = (
-                containers_interface.AttributeContainerIdentifier(
-                    name=self._CONTAINER_TYPE_EVENT_DATA_STREAM,
-                    sequence_number=identifier))
-            container.SetEventDataStreamIdentifier(event_data_stream_identifier)
-
-        # TODO: map filter expression to Redis native filter.
-        if container.MatchesExpression(filter_expression):
-          yield container
-
-  def GetSortedEvents(self, time_range=None):
+  def GetSortedEvents(
+      self, time_range=None, data_types=None, parser_chains=None):
     """Retrieves the events in increasing chronological order.
 
     Args:
       time_range (Optional[TimeRange]): This argument is not supported by the
           Redis store.
+      data_types (Optional[list[str]]): This argument is not supported by the
+          Redis store.
+      parser_chains (Optional[list[str]]): This argument is not supported by
+          the Redis store.
 
     Yields:
       EventObject: event.
 
     Raises:
-      RuntimeError: if a time_range argument is specified.
+      RuntimeError: if a time_range, data_types or parser_chains argument is
+          specified.
     """
     event_index_name = self._GetRedisHashName(self._EVENT_INDEX_NAME)
-    if time_range:
+    if time_range or data_types is not None or parser_chains is not None:
       raise RuntimeError('Not supported')
 
+    self._FlushWrites()
+
     for redis_key, _ in self._redis_client.zscan_iter(event_index_name):
       redis_key = redis_key.decode('utf-8')
       identifier = containers_interface.AttributeContainerIdentifier()
@@ -2,10 +2,21 @@
 """SQLite-based storage file."""
 
 import ast
+import base64
 import json
 import sqlite3
 import zlib
 
+try:
+  import lz4.block
+except ModuleNotFoundError:
+  lz4 = None
+
+try:
+  import zstandard
+except ModuleNotFoundError:
+  zstandard = None
+
 from acstore import sqlite_store
 from acstore.containers import interface as containers_interface
 
@@ -13,16 +24,26 @@ from plaso.containers import events
 from plaso.lib import definitions
 from plaso.serializer import json_serializer
 
+try:
+  from plaso.serializer import msgpack_serializer
+except ModuleNotFoundError:
+  msgpack_serializer = None
+
 
 class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
   """SQLite-based storage file.
 
   Attributes:
     compression_format (str): compression format.
+    maintain_event_index (bool): True if the event index should be maintained
+        when events are written.
+    serialization_format (str): serialization format.
   """
 
-  _FORMAT_VERSION = 20230327
+  _FORMAT_VERSION = 20240409
 
+  # Format versions older than 20240409 do not have an event index and are
+  # upgraded when opened for appending.
   _APPEND_COMPATIBLE_FORMAT_VERSION = 20230327
 
   _UPGRADE_COMPATIBLE_FORMAT_VERSION = 20230327
@@ -33,13 +54,135 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
   _CONTAINER_TYPE_EVENT_DATA = events.EventData.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_TAG = events.EventTag.CONTAINER_TYPE
 
+  # The event index stores the values needed to select and sort events, and
+  # the data type and parser chain of their event data, so that these do not
+  # require deserializing the event data.
+  _EVENT_INDEX_TABLE_NAME = 'event_index'
+
+  # The event index strings table maps the data type and parser chain strings
+  # of the event index to integer identifiers.
+  _EVENT_INDEX_STRINGS_TABLE_NAME = 'event_index_strings'
+
+  _EVENT_INDEX_COLUMN_NAMES = [
+      '_identifier', 'timestamp', 'timestamp_desc',
+      '_event_data_row_identifier', '_data_type_identifier',
+      '_parser_identifier']
+
+  _CREATE_EVENT_INDEX_QUERIES = [
+      ('CREATE TABLE event_index (_identifier INTEGER PRIMARY KEY, '
+       'timestamp INTEGER, timestamp_desc TEXT, '
+       '_event_data_row_identifier INTEGER, _data_type_identifier INTEGER, '
+       '_parser_identifier INTEGER)'),
+      ('CREATE TABLE event_index_strings (_identifier INTEGER PRIMARY KEY, '
+       'value TEXT UNIQUE)'),
+      ('CREATE INDEX event_index_per_timestamp '
+       'ON event_index (timestamp)'),
+      ('CREATE INDEX event_index_per_data_type '
+       'ON event_index (_data_type_identifier, timestamp)'),
+      ('CREATE INDEX event_index_per_parser '
+       'ON event_index (_parser_identifier, timestamp)')]
+
+  # Serialized attribute containers are small and therefore compress poorly
+  # on their own. With the zstd compression format a dictionary is trained
+  # per attribute container type, from the first containers of that type.
+  # The dictionaries are stored in the metadata table.
+  _ZSTD_DICTIONARY_METADATA_KEY_PREFIX = 'zstd_dictionary:'
+
+  _ZSTD_DICTIONARY_NUMBER_OF_SAMPLES = 1000
+
+  _ZSTD_DICTIONARY_SIZE = 32 * 1024
+
   def __init__(self):
     """Initializes a SQLite-based storage file."""
     super(SQLiteStorageFile, self).__init__()
+    self._event_index_string_identifiers = {}
+    self._has_event_index = None
+    self._msgpack_serializer = None
     self._serializer = json_serializer.JSONAttributeContainerSerializer
     self._serializers_profiler = None
+    self._zstd_compressor = None
+    self._zstd_compressors = {}
+    self._zstd_decompressor = None
+    self._zstd_decompressors = {}
+    self._zstd_dictionary_samples = {}
 
     self.compression_format = definitions.COMPRESSION_FORMAT_ZLIB
+    self.maintain_event_index = True
+
+    if msgpack_serializer:
+      self._msgpack_serializer = (
+          msgpack_serializer.MessagePackAttributeContainerSerializer)
+
+    if zstandard:
+      self._zstd_compressor = zstandard.ZstdCompressor()
+      self._zstd_decompressor = zstandard.ZstdDecompressor()
+
+  def _BuildEventIndex(self):
+    """Builds the event index from the events and event data in the file.
+
+    This is used to upgrade storage files that were written with a format
+    version that does not have an event index.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    self._CreateEventIndexTables()
+
+    if (not self._HasTable(self._CONTAINER_TYPE_EVENT) or
+        not self._HasTable(self._CONTAINER_TYPE_EVENT_DATA)):
+      return
+
+    event_data_string_identifiers = {}
+
+    query = (f'SELECT _identifier, _data FROM '
+             f'{self._CONTAINER_TYPE_EVENT_DATA:s}')
+
+    # Use a local cursor since string identifiers are added while iterating.
+    cursor = self._connection.cursor()
+
+    try:
+      cursor.execute(query)
+    except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+      raise IOError(f'Unable to query storage file with error: {exception!s}')
+
+    for row in cursor:
+      event_data = self._CreateAttributeContainerFromRow(
+          self._CONTAINER_TYPE_EVENT_DATA, ['_data'], row, 1)
+      if event_data:
+        data_type = getattr(event_data, 'data_type', None)
+        parser_chain = getattr(event_data, '_parser_chain', None)
+
+        event_data_string_identifiers[row[0]] = (
+            self._GetEventIndexStringIdentifier(data_type),
+            self._GetEventIndexStringIdentifier(parser_chain))
+
+    query = (f'SELECT _identifier, timestamp, timestamp_desc, '
+             f'_event_data_identifier FROM {self._CONTAINER_TYPE_EVENT:s}')
+
+    try:
+      cursor.execute(query)
+    except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+      raise IOError(f'Unable to query storage file with error: {exception!s}')
+
+    for row in cursor:
+      event_data_row_identifier = None
+      if row[3]:
+        event_data_identifier = (
+            containers_interface.AttributeContainerIdentifier())
+        event_data_identifier.CopyFromString(row[3])
+        event_data_row_identifier = event_data_identifier.sequence_number
+
+      data_type_identifier, parser_identifier = (
+          event_data_string_identifiers.get(
+              event_data_row_identifier, (None, None)))
+
+      self._CacheAttributeContainerForWrite(
+          self._EVENT_INDEX_TABLE_NAME, self._EVENT_INDEX_COLUMN_NAMES, [
+              row[0], row[1], row[2], event_data_row_identifier,
+              data_type_identifier, parser_identifier])
+
+    self._CommitWriteCache(self._EVENT_INDEX_TABLE_NAME)
 
   def _CheckStorageMetadata(self, metadata_values, check_readable_only=False):
     """Checks the storage metadata.
@@ -51,16 +194,83 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
           to see if it can be read and written to.
 
     Raises:
-      IOError: if the format version or the serializer format is not supported.
-      OSError: if the format version or the serializer format is not supported.
+      IOError: if the format version, the serializer format or the compression
+          format is not supported.
+      OSError: if the format version, the serializer format or the compression
+          format is not supported.
     """
-    super(SQLiteStorageFile, self)._CheckStorageMetadata(
-        metadata_values, check_readable_only=check_readable_only)
+    serialization_format = metadata_values.get('serialization_format', None)
+    if serialization_format not in definitions.SERIALIZER_FORMATS:
+      raise IOError(
+          f'Unsupported serialization format: {serialization_format!s}')
+
+    if (serialization_format == definitions.SERIALIZER_FORMAT_MSGPACK and
+        not msgpack_serializer):
+      raise IOError((
+          f'Unsupported serialization format: {serialization_format:s} '
+          f'missing msgpack support.'))
+
+    # The base class only supports the JSON serialization format, which
+    # is restored after the other metadata values have been checked.
+    metadata_values['serialization_format'] = (
+        definitions.SERIALIZER_FORMAT_JSON)
+
+    try:
+      super(SQLiteStorageFile, self)._CheckStorageMetadata(
+          metadata_values, check_readable_only=check_readable_only)
+    finally:
+      metadata_values['serialization_format'] = serialization_format
 
     compression_format = metadata_values.get('compression_format', None)
     if compression_format not in definitions.COMPRESSION_FORMATS:
       raise IOError(f'Unsupported compression format: {compression_format!s}')
 
+    if compression_format == definitions.COMPRESSION_FORMAT_LZ4 and not lz4:
+      raise IOError((
+          f'Unsupported compression format: {compression_format:s} missing '
+          f'lz4 support.'))
+
+    if (compression_format == definitions.COMPRESSION_FORMAT_ZSTD and
+        not zstandard):
+      raise IOError((
+          f'Unsupported compression format: {compression_format:s} missing '
+          f'zstandard support.'))
+
+  def _CompressSerializedData(self, container_type, serialized_data):
+    """Compresses serialized attribute container data.
+
+    Args:
+      container_type (str): attribute container type.
+      serialized_data (bytes): serialized attribute container data.
+
+    Returns:
+      bytes: compressed attribute container data.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    if self.compression_format == definitions.COMPRESSION_FORMAT_LZ4:
+      return lz4.block.compress(serialized_data)
+
+    if self.compression_format == definitions.COMPRESSION_FORMAT_ZSTD:
+      compressor = self._zstd_compressors.get(container_type, None)
+      if not compressor:
+        samples = self._zstd_dictionary_samples.setdefault(container_type, [])
+        samples.append(serialized_data)
+
+        if len(samples) < self._ZSTD_DICTIONARY_NUMBER_OF_SAMPLES:
+          return self._zstd_compressor.compress(serialized_data)
+
+        del self._zstd_dictionary_samples[container_type]
+
+        self._TrainZstdDictionary(container_type, samples)
+        compressor = self._zstd_compressors[container_type]
+
+      return compressor.compress(serialized_data)
+
+    return zlib.compress(serialized_data)
+
   def _CreateAttributeContainerFromRow(
       self, container_type, column_names, row, first_column_index):
     """Creates an attribute container of a row in the database.
@@ -79,12 +289,13 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
       return super(SQLiteStorageFile, self)._CreateAttributeContainerFromRow(
           container_type, column_names, row, first_column_index)
 
-    if self.compression_format == definitions.COMPRESSION_FORMAT_ZLIB:
-      compressed_data = row[first_column_index]
-      serialized_data = zlib.decompress(compressed_data)
-    else:
+    if self.compression_format == definitions.COMPRESSION_FORMAT_NONE:
       compressed_data = b''
       serialized_data = row[first_column_index]
+    else:
+      compressed_data = row[first_column_index]
+      serialized_data = self._DecompressSerializedData(
+          container_type, compressed_data)
 
     if self._storage_profiler:
       self._storage_profiler.Sample(
@@ -110,10 +321,10 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
       super(SQLiteStorageFile, self)._CreateAttributeContainerTable(
           container_type)
     else:
-      if self.compression_format == definitions.COMPRESSION_FORMAT_ZLIB:
-        data_column_type = 'BLOB'
-      else:
+      if self.compression_format == definitions.COMPRESSION_FORMAT_NONE:
         data_column_type = 'TEXT'
+      else:
+        data_column_type = 'BLOB'
 
       query = (
           f'CREATE TABLE {container_type:s} (_identifier INTEGER PRIMARY KEY '
@@ -132,6 +343,69 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
       except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
         raise IOError(f'Unable to query storage file with error: {exception!s}')
 
+  def _CreateEventIndexTables(self):
+    """Creates the event index tables and their indexes.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    for query in self._CREATE_EVENT_INDEX_QUERIES:
+      try:
+        self._cursor.execute(query)
+      except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+        raise IOError(f'Unable to query storage file with error: {exception!s}')
+
+    self._has_event_index = True
+
+  def _DecompressSerializedData(self, container_type, compressed_data):
+    """Decompresses serialized attribute container data.
+
+    Args:
+      container_type (str): attribute container type.
+      compressed_data (bytes): compressed attribute container data.
+
+    Returns:
+      bytes: serialized attribute container data.
+
+    Raises:
+      IOError: if the compressed data cannot be decompressed.
+      OSError: if the compressed data cannot be decompressed.
+    """
+    if self.compression_format == definitions.COMPRESSION_FORMAT_LZ4:
+      try:
+        return lz4.block.decompress(compressed_data)
+      except lz4.block.LZ4BlockError as exception:
+        raise IOError(
+            f'Unable to decompress serialized data with error: {exception!s}')
+
+    if self.compression_format == definitions.COMPRESSION_FORMAT_ZSTD:
+      try:
+        frame_parameters = zstandard.get_frame_parameters(compressed_data)
+
+        # Attribute containers that were written before the dictionary of
+        # their type was trained are compressed without a dictionary.
+        if not frame_parameters.dict_id:
+          decompressor = self._zstd_decompressor
+        else:
+          decompressor = self._zstd_decompressors.get(container_type, None)
+          if not decompressor:
+            raise IOError((
+                f'Missing zstd dictionary of attribute container type: '
+                f'{container_type:s}'))
+
+        return decompressor.decompress(compressed_data)
+
+      except zstandard.ZstdError as exception:
+        raise IOError(
+            f'Unable to decompress serialized data with error: {exception!s}')
+
+    try:
+      return zlib.decompress(compressed_data)
+    except zlib.error as exception:
+      raise IOError(
+          f'Unable to decompress serialized data with error: {exception!s}')
+
   def _DeserializeAttributeContainer(self, container_type, serialized_data):
     """Deserializes an attribute container.
 
@@ -153,8 +427,11 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
       self._serializers_profiler.StartTiming(container_type)
 
     try:
-      serialized_string = serialized_data.decode('utf-8')
-      container = self._serializer.ReadSerialized(serialized_string)
+      if self.serialization_format == definitions.SERIALIZER_FORMAT_MSGPACK:
+        container = self._msgpack_serializer.ReadSerialized(serialized_data)
+      else:
+        serialized_string = serialized_data.decode('utf-8')
+        container = self._serializer.ReadSerialized(serialized_string)
 
     except UnicodeDecodeError as exception:
       raise IOError(
@@ -171,7 +448,7 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
     if container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_DATA:
       serialized_identifier = getattr(
           container, '_event_data_stream_identifier', None)
-      if serialized_identifier:
+      if isinstance(serialized_identifier, str):
         event_data_stream_identifier = (
             containers_interface.AttributeContainerIdentifier())
         event_data_stream_identifier.CopyFromString(serialized_identifier)
@@ -179,6 +456,236 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
 
     return container
 
+  def _FilterEventsByEventData(
+      self, events_generator, data_types, parser_chains):
+    """Filters events by the data type and parser chain of their event data.
+
+    This is used for storage files without an event index.
+
+    Args:
+      events_generator (generator(EventObject)): event generator.
+      data_types (list[str]): event data types to include, where None
+          represents all data types.
+      parser_chains (list[str]): parser chains to include, where None
+          represents all parser chains.
+
+    Yields:
+      EventObject: event.
+    """
+    for event in events_generator:
+      event_data_identifier = event.GetEventDataIdentifier()
+      event_data = None
+      if event_data_identifier:
+        event_data = self.GetAttributeContainerByIndex(
+            self._CONTAINER_TYPE_EVENT_DATA,
+            event_data_identifier.sequence_number - 1)
+
+      if not event_data:
+        continue
+
+      data_type = getattr(event_data, 'data_type', None)
+      if data_types is not None and data_type not in data_types:
+        continue
+
+      parser_chain = getattr(event_data, '_parser_chain', None)
+      if parser_chains is not None and parser_chain not in parser_chains:
+        continue
+
+      yield event
+
+  def _GetEventIndexStringIdentifier(self, string):
+    """Retrieves the identifier of a string in the event index.
+
+    The string is added to the event index strings table if needed.
+
+    Args:
+      string (str): data type or parser chain string.
+
+    Returns:
+      int: identifier of the string or None if the string is not set.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    if not string:
+      return None
+
+    identifier = self._event_index_string_identifiers.get(string, None)
+    if identifier is None:
+      query = (f'SELECT _identifier FROM '
+               f'{self._EVENT_INDEX_STRINGS_TABLE_NAME:s} WHERE value = ?')
+
+      try:
+        self._cursor.execute(query, (string, ))
+        row = self._cursor.fetchone()
+        if row:
+          identifier = row[0]
+        else:
+          query = (f'INSERT INTO {self._EVENT_INDEX_STRINGS_TABLE_NAME:s} '
+                   f'(value) VALUES (?)')
+          self._cursor.execute(query, (string, ))
+          identifier = self._cursor.lastrowid
+
+      except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+        raise IOError(f'Unable to query storage file with error: {exception!s}')
+
+      self._event_index_string_identifiers[string] = identifier
+
+    return identifier
+
+  def _GetEventIndexStringIdentifiers(self, strings):
+    """Retrieves the identifiers of existing strings in the event index.
+
+    Args:
+      strings (list[str]): data type or parser chain strings.
+
+    Returns:
+      list[int]: identifiers of the strings that are stored in the event index.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    placeholders = ', '.join(['?'] * len(strings))
+    query = (f'SELECT _identifier FROM '
+             f'{self._EVENT_INDEX_STRINGS_TABLE_NAME:s} '
+             f'WHERE value IN ({placeholders:s})')
+
+    try:
+      self._cursor.execute(query, list(strings))
+    except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+      raise IOError(f'Unable to query storage file with error: {exception!s}')
+
+    return [row[0] for row in self._cursor.fetchall()]
+
+  def _GetSortedEventsWithEventIndex(
+      self, time_range=None, data_types=None, parser_chains=None):
+    """Retrieves the events in increasing chronological order using the index.
+
+    Args:
+      time_range (Optional[TimeRange]): time range used to filter events
+          that fall in a specific period.
+      data_types (Optional[list[str]]): event data types to include, where
+          None represents all data types.
+      parser_chains (Optional[list[str]]): parser chains to include, where
+          None represents all parser chains.
+
+    Yields:
+      EventObject: event.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    self._CommitWriteCache(self._CONTAINER_TYPE_EVENT)
+    self._CommitWriteCache(self._EVENT_INDEX_TABLE_NAME)
+
+    if not self._attribute_container_sequence_numbers[
+        self._CONTAINER_TYPE_EVENT]:
+      return
+
+    conditions = []
+    if time_range:
+      if time_range.start_timestamp is not None:
+        conditions.append(
+            f'event_index.timestamp >= {time_range.start_timestamp:d}')
+
+      if time_range.end_timestamp is not None:
+        conditions.append(
+            f'event_index.timestamp <= {time_range.end_timestamp:d}')
+
+    for column_name, strings in (
+        ('_data_type_identifier', data_types),
+        ('_parser_identifier', parser_chains)):
+      if strings is not None:
+        identifiers = self._GetEventIndexStringIdentifiers(strings)
+        if not identifiers:
+          return
+
+        identifiers_string = ', '.join([
+            f'{identifier:d}' for identifier in identifiers])
+        conditions.append(
+            f'event_index.{column_name:s} IN ({identifiers_string:s})')
+
+    schema = self._GetAttributeContainerSchema(self._CONTAINER_TYPE_EVENT)
+    column_names = sorted(schema.keys())
+
+    column_names_string = ', '.join([
+        f'event.{column_name:s}' for column_name in column_names])
+
+    query = (f'SELECT event._identifier, {column_names_string:s} '
+             f'FROM event_index JOIN event '
+             f'ON event._identifier = event_index._identifier')
+    if conditions:
+      conditions_string = ' AND '.join(conditions)
+      query = f'{query:s} WHERE {conditions_string:s}'
+
+    query = (f'{query:s} ORDER BY event_index.timestamp, '
+             f'event_index._identifier')
+
+    # Use a local cursor to prevent another query interrupting the generator.
+    cursor = self._connection.cursor()
+
+    try:
+      cursor.execute(query)
+    except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+      raise IOError(f'Unable to query storage file with error: {exception!s}')
+
+    for row in cursor:
+      container = self._CreateAttributeContainerFromRow(
+          self._CONTAINER_TYPE_EVENT, column_names, row, 1)
+
+      identifier = containers_interface.AttributeContainerIdentifier(
+          name=self._CONTAINER_TYPE_EVENT, sequence_number=row[0])
+      container.SetIdentifier(identifier)
+
+      yield container
+
+  def _GetSerializedDataColumnValue(self, container):
+    """Retrieves the value of the serialized data column of a container.
+
+    Args:
+      container (AttributeContainer): attribute container.
+
+    Returns:
+      bytes: serialized and, if configured, compressed attribute container.
+
+    Raises:
+      IOError: if the attribute container cannot be serialized.
+      OSError: if the attribute container cannot be serialized.
+    """
+    serialized_data = self._SerializeAttributeContainer(container)
+
+    if self.compression_format == definitions.COMPRESSION_FORMAT_NONE:
+      compressed_data = ''
+    else:
+      compressed_data = self._CompressSerializedData(
+          container.CONTAINER_TYPE, serialized_data)
+      serialized_data = sqlite3.Binary(compressed_data)
+
+    if self._storage_profiler:
+      self._storage_profiler.Sample(
+          'write_new', 'write', container.CONTAINER_TYPE,
+          len(serialized_data), len(compressed_data))
+
+    return serialized_data
+
+  def _HasEventIndex(self):
+    """Determines if the storage file has an event index.
+
+    Returns:
+      bool: True if the storage file has an event index.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    if self._has_event_index is None:
+      self._has_event_index = self._HasTable(self._EVENT_INDEX_TABLE_NAME)
+
+    return self._has_event_index
+
   def _ReadAndCheckStorageMetadata(self, check_readable_only=False):
     """Reads storage metadata and checks that the values are valid.
 
@@ -200,6 +707,37 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
     self.compression_format = metadata_values['compression_format']
     self.serialization_format = metadata_values['serialization_format']
 
+    if self.compression_format == definitions.COMPRESSION_FORMAT_ZSTD:
+      self._ReadZstdDictionaries(metadata_values)
+
+  def _ReadZstdDictionaries(self, metadata_values):
+    """Reads the zstd dictionaries from the storage metadata.
+
+    Args:
+      metadata_values (dict[str, str]): metadata values per key.
+
+    Raises:
+      IOError: if a zstd dictionary cannot be read.
+      OSError: if a zstd dictionary cannot be read.
+    """
+    prefix_length = len(self._ZSTD_DICTIONARY_METADATA_KEY_PREFIX)
+
+    for key, value in metadata_values.items():
+      if not key.startswith(self._ZSTD_DICTIONARY_METADATA_KEY_PREFIX):
+        continue
+
+      container_type = key[prefix_length:]
+
+      try:
+        dictionary_data = base64.b64decode(value)
+      except (TypeError, ValueError) as exception:
+        raise IOError((
+            f'Unable to read zstd dictionary of attribute container type: '
+            f'{container_type:s} with error: {exception!s}'))
+
+      dictionary = zstandard.ZstdCompressionDict(dictionary_data)
+      self._SetZstdDictionary(container_type, dictionary)
+
   def _SerializeAttributeContainer(self, container):
     """Serializes an attribute container.
 
@@ -217,6 +755,9 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
       self._serializers_profiler.StartTiming(container.CONTAINER_TYPE)
 
     try:
+      if self.serialization_format == definitions.SERIALIZER_FORMAT_MSGPACK:
+        return self._SerializeAttributeContainerWithMessagePack(container)
+
       json_dict = self._serializer.WriteSerializedDict(container)
 
       if container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_DATA:
@@ -245,6 +786,132 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
 
     return serialized_string
 
+  def _SerializeAttributeContainerWithMessagePack(self, container):
+    """Serializes an attribute container with MessagePack.
+
+    Args:
+      container (AttributeContainer): attribute container.
+
+    Returns:
+      bytes: serialized attribute container.
+
+    Raises:
+      IOError: if the attribute container cannot be serialized.
+      OSError: if the attribute container cannot be serialized.
+    """
+    try:
+      serialized_data = self._msgpack_serializer.WriteSerialized(container)
+    except (OverflowError, TypeError, ValueError) as exception:
+      raise IOError((
+          f'Unable to serialize attribute container: '
+          f'{container.CONTAINER_TYPE:s} with error: {exception!s}.'))
+
+    if not serialized_data:
+      raise IOError((
+          f'Unable to serialize attribute container: '
+          f'{container.CONTAINER_TYPE:s}'))
+
+    return serialized_data
+
+  def _SetZstdDictionary(self, container_type, dictionary):
+    """Sets the zstd dictionary of a specific attribute container type.
+
+    Args:
+      container_type (str): attribute container type.
+      dictionary (zstandard.ZstdCompressionDict): zstd dictionary.
+    """
+    self._zstd_compressors[container_type] = zstandard.ZstdCompressor(
+        dict_data=dictionary)
+    self._zstd_decompressors[container_type] = zstandard.ZstdDecompressor(
+        dict_data=dictionary)
+
+  def _TrainZstdDictionary(self, container_type, samples):
+    """Trains a zstd dictionary for a specific attribute container type.
+
+    The dictionary is stored in the metadata table. If no dictionary can
+    be trained, attribute containers of the type are compressed without
+    a dictionary.
+
+    Args:
+      container_type (str): attribute container type.
+      samples (list[bytes]): serialized attribute containers to train
+          the dictionary with.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    try:
+      dictionary = zstandard.train_dictionary(
+          self._ZSTD_DICTIONARY_SIZE, samples)
+    except zstandard.ZstdError:
+      # Training fails when there is not enough sample data.
+      self._zstd_compressors[container_type] = self._zstd_compressor
+      return
+
+    dictionary_data = base64.b64encode(dictionary.as_bytes())
+
+    self._WriteMetadataValue(
+        f'{self._ZSTD_DICTIONARY_METADATA_KEY_PREFIX:s}{container_type:s}',
+        dictionary_data.decode('ascii'))
+
+    self._SetZstdDictionary(container_type, dictionary)
+
+  def _UpdateStorageMetadataFormatVersion(self):
+    """Updates the storage metadata format version.
+
+    Storage files that were written with a format version without an event
+    index are upgraded by building the event index.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    if (self.format_version < self._FORMAT_VERSION and
+        not self._HasEventIndex()):
+      self._BuildEventIndex()
+
+    super(SQLiteStorageFile, self)._UpdateStorageMetadataFormatVersion()
+
+  def _WriteEventIndexValues(self, event):
+    """Writes the event index values of a new event.
+
+    Args:
+      event (EventObject): event.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    if not self._HasEventIndex():
+      self._CreateEventIndexTables()
+
+    identifier = event.GetIdentifier()
+
+    event_data_row_identifier = None
+    data_type_identifier = None
+    parser_identifier = None
+
+    event_data_identifier = event.GetEventDataIdentifier()
+    if event_data_identifier:
+      event_data_row_identifier = event_data_identifier.sequence_number
+
+      # The event data is typically written right before its events and
+      # therefore is expected to be in the read cache.
+      event_data = self.GetAttributeContainerByIndex(
+          self._CONTAINER_TYPE_EVENT_DATA, event_data_row_identifier - 1)
+      if event_data:
+        data_type_identifier = self._GetEventIndexStringIdentifier(
+            getattr(event_data, 'data_type', None))
+        parser_identifier = self._GetEventIndexStringIdentifier(
+            getattr(event_data, '_parser_chain', None))
+
+    self._CacheAttributeContainerForWrite(
+        self._EVENT_INDEX_TABLE_NAME, self._EVENT_INDEX_COLUMN_NAMES, [
+            identifier.sequence_number, event.timestamp, event.timestamp_desc,
+            event_data_row_identifier, data_type_identifier,
+            parser_identifier])
+
   def _WriteMetadata(self):
     """Writes metadata.
 
@@ -278,6 +945,11 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
     schema = self._GetAttributeContainerSchema(container.CONTAINER_TYPE)
     if schema:
       super(SQLiteStorageFile, self)._WriteNewAttributeContainer(container)
+
+      if (container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT and
+          self.maintain_event_index):
+        self._WriteEventIndexValues(container)
+
     else:
       next_sequence_number = self._GetAttributeContainerNextSequenceNumber(
           container.CONTAINER_TYPE)
@@ -290,26 +962,127 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
           name=container.CONTAINER_TYPE, sequence_number=next_sequence_number)
       container.SetIdentifier(identifier)
 
-      serialized_data = self._SerializeAttributeContainer(container)
+      column_names = ['_data']
+      values = [self._GetSerializedDataColumnValue(container)]
+
+      self._CacheAttributeContainerForWrite(
+          container.CONTAINER_TYPE, column_names, values)
+
+      self._CacheAttributeContainerByIndex(container, next_sequence_number - 1)
+
+  def AddAttributeContainers(self, containers):
+    """Adds new attribute containers in bulk.
+
+    The attribute containers are assigned consecutive sequence numbers and
+    are inserted with a single statement.
+
+    Args:
+      containers (list[AttributeContainer]): attribute containers of the same
+          type.
+
+    Raises:
+      IOError: when the storage file cannot be written to, if the attribute
+          containers are not of the same type or if an unsupported attribute
+          container is provided.
+      OSError: when the storage file cannot be written to, if the attribute
+          containers are not of the same type or if an unsupported attribute
+          container is provided.
+    """
+    if not containers:
+      return
+
+    self._RaiseIfNotWritable()
+
+    container_type = containers[0].CONTAINER_TYPE
+    if (container_type == self._CONTAINER_TYPE_EVENT and
+        self.maintain_event_index):
+      # Events are written one at a time to maintain the event index.
+      for container in containers:
+        self._WriteNewAttributeContainer(container)
+      return
+
+    sequence_number = self._attribute_container_sequence_numbers[
+        container_type]
+    if sequence_number == 0 and not self._HasTable(container_type):
+      self._CreateAttributeContainerTable(container_type)
+
+    # The row identifiers need to match the sequence numbers, hence containers
+    # cached for writing are written first.
+    self._CommitWriteCache(container_type)
+
+    schema = self._GetAttributeContainerSchema(container_type)
+    if schema:
+      column_names = sorted(schema.keys())
+    else:
+      column_names = ['_data']
+
+    rows = []
+    for container in containers:
+      if container.CONTAINER_TYPE != container_type:
+        raise IOError((
+            f'Unsupported attribute container type: '
+            f'{container.CONTAINER_TYPE:s} expected: {container_type:s}'))
+
+      sequence_number += 1
+
+      identifier = containers_interface.AttributeContainerIdentifier(
+          name=container_type, sequence_number=sequence_number)
+      container.SetIdentifier(identifier)
 
-      if self.compression_format == definitions.COMPRESSION_FORMAT_ZLIB:
-        compressed_data = zlib.compress(serialized_data)
-        serialized_data = sqlite3.Binary(compressed_data)
+      if not schema:
+        row_values = [self._GetSerializedDataColumnValue(container)]
       else:
-        compressed_data = ''
+        row_values = []
+        for name in column_names:
+          data_type = schema[name]
+          attribute_value = getattr(container, name, None)
+          try:
+            row_value = self._schema_helper.SerializeValue(
+                data_type, attribute_value)
+          except IOError:
+            raise IOError((
+                f'Unsupported attribute container type: {container_type:s} '
+                f'attribute: {name:s} data type: {data_type:s}'))
+
+          row_values.append(row_value)
+
+      rows.append(row_values)
+
+      self._CacheAttributeContainerByIndex(container, sequence_number - 1)
+
+    column_names_string = ', '.join(column_names)
+    values_string = ', '.join(['?'] * len(column_names))
+
+    query = (f'INSERT INTO {container_type:s} ({column_names_string:s}) '
+             f'VALUES ({values_string:s})')
+
+    if self._storage_profiler:
+      self._storage_profiler.StartTiming('write_new')
 
+    try:
+      self._cursor.executemany(query, rows)
+
+    except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+      raise IOError(f'Unable to query storage file with error: {exception!s}')
+
+    finally:
       if self._storage_profiler:
-        self._storage_profiler.Sample(
-            'write_new', 'write', container.CONTAINER_TYPE,
-            len(serialized_data), len(compressed_data))
+        self._storage_profiler.StopTiming('write_new')
 
-      column_names = ['_data']
-      values = [serialized_data]
+    self._SetAttributeContainerNextSequenceNumber(
+        container_type, sequence_number)
 
-      self._CacheAttributeContainerForWrite(
-          container.CONTAINER_TYPE, column_names, values)
+  def Close(self):
+    """Closes the file.
 
-      self._CacheAttributeContainerByIndex(container, next_sequence_number - 1)
+    Raises:
+      IOError: if the storage file is already closed.
+      OSError: if the storage file is already closed.
+    """
+    super(SQLiteStorageFile, self).Close()
+
+    self._event_index_string_identifiers = {}
+    self._has_event_index = None
 
   def GetAttributeContainerByIndex(self, container_type, index):
     """Retrieves a specific attribute container.
@@ -385,6 +1158,60 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
     self._CacheAttributeContainerByIndex(container, index)
     return container
 
+  def GetAttributeContainersByIndexes(self, container_type, indexes):
+    """Retrieves specific attribute containers in bulk.
+
+    Containers that are not in the read cache are retrieved with a single
+    query per call instead of a query per container.
+
+    Args:
+      container_type (str): attribute container type.
+      indexes (list[int]): attribute container indexes.
+
+    Returns:
+      dict[int, AttributeContainer]: attribute containers per index, where
+          indexes that are not available are omitted.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    containers_per_index = {}
+    missing_row_numbers = set()
+
+    for index in indexes:
+      container = self._GetCachedAttributeContainer(container_type, index)
+      if container:
+        containers_per_index[index] = container
+      else:
+        missing_row_numbers.add(index + 1)
+
+    if not missing_row_numbers:
+      return containers_per_index
+
+    self._CommitWriteCache(container_type)
+
+    if not self._attribute_container_sequence_numbers[container_type]:
+      return containers_per_index
+
+    schema = self._GetAttributeContainerSchema(container_type)
+    if schema:
+      column_names = sorted(schema.keys())
+    else:
+      column_names = ['_data']
+
+    row_numbers = ', '.join([
+        f'{row_number:d}' for row_number in sorted(missing_row_numbers)])
+    filter_expression = f'_identifier IN ({row_numbers:s})'
+
+    for container in self._GetAttributeContainersWithFilter(
+        container_type, column_names=column_names,
+        filter_expression=filter_expression):
+      identifier = container.GetIdentifier()
+      containers_per_index[identifier.sequence_number - 1] = container
+
+    return containers_per_index
+
   def GetAttributeContainers(self, container_type, filter_expression=None):
     """Retrieves a specific type of stored attribute containers.
 
@@ -423,16 +1250,26 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
           container_type, column_names=['_data'],
           filter_expression=sql_filter_expression)
 
-  def GetSortedEvents(self, time_range=None):
+  def GetSortedEvents(
+      self, time_range=None, data_types=None, parser_chains=None):
     """Retrieves the events in increasing chronological order.
 
     Args:
       time_range (Optional[TimeRange]): time range used to filter events
           that fall in a specific period.
+      data_types (Optional[list[str]]): event data types to include, where
+          None represents all data types.
+      parser_chains (Optional[list[str]]): parser chains to include, where
+          None represents all parser chains.
 
     Returns:
       generator(EventObject): event generator.
     """
+    if self._HasEventIndex():
+      return self._GetSortedEventsWithEventIndex(
+          time_range=time_range, data_types=data_types,
+          parser_chains=parser_chains)
+
     schema = self._GetAttributeContainerSchema(self._CONTAINER_TYPE_EVENT)
     column_names = sorted(schema.keys())
 
@@ -440,18 +1277,24 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
     if time_range:
       filter_expression = []
 
-      if time_range.start_timestamp:
+      if time_range.start_timestamp is not None:
         filter_expression.append(f'timestamp >= {time_range.start_timestamp:d}')
 
-      if time_range.end_timestamp:
+      if time_range.end_timestamp is not None:
         filter_expression.append(f'timestamp <= {time_range.end_timestamp:d}')
 
       filter_expression = ' AND '.join(filter_expression)
 
-    return self._GetAttributeContainersWithFilter(
+    events_generator = self._GetAttributeContainersWithFilter(
         self._CONTAINER_TYPE_EVENT, column_names=column_names,
         filter_expression=filter_expression, order_by='timestamp')
 
+    if data_types is not None or parser_chains is not None:
+      events_generator = self._FilterEventsByEventData(
+          events_generator, data_types, parser_chains)
+
+    return events_generator
+
   def SetSerializersProfiler(self, serializers_profiler):
     """Sets the serializers profiler.
 
@@ -15,7 +15,7 @@ class SQLiteStorageWriter(writer.StorageWriter):
     Args:
       storage_type (Optional[str]): storage type.
     """
-    super(SQLiteStorageWriter, self).__init__()
+    super(SQLiteStorageWriter, self).__init__(storage_type=storage_type)
     self._first_written_event_data_index = 0
     self._first_written_event_source_index = 0
     self._written_event_data_index = 0
@@ -108,11 +108,19 @@ class SQLiteStorageWriter(writer.StorageWriter):
     return event_source
 
   # pylint: disable=arguments-differ
-  def Open(self, path=None, **unused_kwargs):
+  def Open(
+      self, path=None, compression_format=None, serialization_format=None,
+      **unused_kwargs):
     """Opens the storage writer.
 
     Args:
       path (Optional[str]): path to the output SQLite database.
+      compression_format (Optional[str]): compression format of a new SQLite
+          database, where None represents the default. The compression format
+          of an existing SQLite database is preserved.
+      serialization_format (Optional[str]): serialization format of a new
+          SQLite database, where None represents the default. The serialization
+          format of an existing SQLite database is preserved.
 
     Raises:
       IOError: if the storage writer is already opened.
@@ -123,6 +131,17 @@ class SQLiteStorageWriter(writer.StorageWriter):
 
     self._store = sqlite_file.SQLiteStorageFile()
 
+    if compression_format:
+      self._store.compression_format = compression_format
+
+    if serialization_format:
+      self._store.serialization_format = serialization_format
+
+    # The event index is only used to read the events of a session storage
+    # file, hence it is not maintained for a task storage file.
+    self._store.maintain_event_index = (
+        self._storage_type == definitions.STORAGE_TYPE_SESSION)
+
     if self._serializers_profiler:
       self._store.SetSerializersProfiler(self._serializers_profiler)
 
@@ -119,6 +119,25 @@ class StorageWriter(reader.StorageReader):
 
     self._attribute_containers_counter[container.CONTAINER_TYPE] += 1
 
+  def AddAttributeContainers(self, containers):
+    """Adds attribute containers in bulk.
+
+    Args:
+      containers (list[AttributeContainer]): attribute containers of the same
+          type.
+
+    Raises:
+      IOError: when the storage writer is closed.
+      OSError: when the storage writer is closed.
+    """
+    self._RaiseIfNotWritable()
+
+    if containers:
+      self._store.AddAttributeContainers(containers)
+
+      container_type = containers[0].CONTAINER_TYPE
+      self._attribute_containers_counter[container_type] += len(containers)
+
   def AddOrUpdateEventTag(self, event_tag):
     """Adds a new or updates an existing event tag.
 
@@ -22,6 +22,46 @@ class EntropyHasherTest(test_lib.HasherTestCase):
     hasher = entropy.EntropyHasher()
     self._AssertTestPathStringDigestMatch(hasher, ['syslog.zip'], '7.264319')
 
+  def testFileHashMatchesKnownFileWithoutNumPy(self):
+    """Tests that hasher without NumPy matches the hash of a known file."""
+    hasher = entropy.EntropyHasher(use_numpy=False)
+    self._AssertTestPathStringDigestMatch(hasher, ['syslog.zip'], '7.264319')
+
+  def testUpdate(self):
+    """Tests the Update function."""
+    test_data = bytes(range(256)) * 4 + b'\x00' * 1024
+
+    hasher = entropy.EntropyHasher(use_numpy=False)
+    hasher.Update(test_data[:100])
+    hasher.Update(test_data[100:])
+    expected_digest = hasher.GetStringDigest()
+    self.assertEqual(expected_digest, '4.981552')
+
+    hasher = entropy.EntropyHasher()
+    hasher.Update(test_data)
+    self.assertEqual(hasher.GetStringDigest(), expected_digest)
+
+  @unittest.skipUnless(entropy.numpy, 'missing numpy support')
+  def testUpdateWithNumPy(self):
+    """Tests the Update function with NumPy."""
+    test_data = bytes(
+        (index * 7 + index // 256) % 256 for index in range(65536))
+
+    hasher = entropy.EntropyHasher(use_numpy=False)
+    hasher.Update(test_data[:1000])
+    hasher.Update(test_data[1000:])
+    expected_byte_frequencies = hasher._GetByteFrequencies()
+    expected_digest = hasher.GetStringDigest()
+
+    hasher = entropy.EntropyHasher(use_numpy=True)
+    self.assertIsNotNone(hasher._byte_frequencies)
+
+    hasher.Update(test_data[:1000])
+    hasher.Update(test_data[1000:])
+    self.assertEqual(
+        hasher._GetByteFrequencies(), expected_byte_frequencies)
+    self.assertEqual(hasher.GetStringDigest(), expected_digest)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -40,6 +40,14 @@ class YaraAnalyzerTest(shared_test_lib.BaseTestCase):
 
     self.assertIsNotNone(analyzer._rules)
 
+  def testGetReadSize(self):
+    """Tests the GetReadSize function."""
+    analyzer = yara_analyzer.YaraAnalyzer()
+    self.assertEqual(analyzer.GetReadSize(), 32 * 1024 * 1024)
+
+    analyzer.SetWindow(64 * 1024 * 1024, None)
+    self.assertEqual(analyzer.GetReadSize(), 64 * 1024 * 1024)
+
   def testMatchFile(self):
     """Tests that the Yara analyzer correctly matches a file."""
     test_yara_rules = self._ReadTestRuleFile()
@@ -64,6 +72,58 @@ class YaraAnalyzerTest(shared_test_lib.BaseTestCase):
     self.assertEqual(first_result.analyzer_name, 'yara')
     self.assertEqual(first_result.attribute_value, ['PEfileBasic', 'PEfile'])
 
+  def testMatchFileWithAnalyzeFile(self):
+    """Tests that the Yara analyzer correctly matches a file by path."""
+    test_yara_rules = self._ReadTestRuleFile()
+
+    test_file_path = self._GetTestFilePath(['test_pe.exe'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    analyzer = yara_analyzer.YaraAnalyzer()
+    analyzer.SetRules(test_yara_rules)
+
+    analyzer.AnalyzeFile(test_file_path)
+
+    results = analyzer.GetResults()
+    self.assertEqual(len(results), 1)
+    self.assertEqual(results[0].attribute_value, ['PEfileBasic', 'PEfile'])
+
+  def testMatchWindows(self):
+    """Tests that the Yara analyzer matches data in overlapping windows."""
+    analyzer = yara_analyzer.YaraAnalyzer()
+    analyzer.SetRules((
+        'rule first { strings: $a = "first match" condition: $a }\n'
+        'rule second { strings: $a = "second match" condition: $a }\n'))
+    analyzer.SetWindow(32, 16)
+
+    # The first match spans the boundary of the first 2 windows and the
+    # second match is found in a window that continues the previous block
+    # of data.
+    analyzer.Analyze(b''.join([b'A' * 26, b'first match', b'A' * 27]))
+    analyzer.Analyze(b''.join([b'second match', b'A' * 64]))
+
+    results = analyzer.GetResults()
+    self.assertEqual(len(results), 1)
+    self.assertEqual(results[0].attribute_value, ['first', 'second'])
+
+    analyzer.Reset()
+
+    results = analyzer.GetResults()
+    self.assertEqual(results[0].attribute_value, [])
+
+    # Without overlap matches that span window boundaries are not found.
+    analyzer.SetWindow(32, 0)
+    analyzer.Analyze(b''.join([b'A' * 26, b'first match', b'A' * 27]))
+
+    results = analyzer.GetResults()
+    self.assertEqual(results[0].attribute_value, [])
+
+    with self.assertRaises(ValueError):
+      analyzer.SetWindow(0, 0)
+
+    with self.assertRaises(ValueError):
+      analyzer.SetWindow(32, 32)
+
 
 if __name__ == '__main__':
   unittest.main()
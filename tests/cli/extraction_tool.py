@@ -39,14 +39,35 @@ Test argument parser.
 usage: extraction_tool_test.py [--single_process]
                                [--temporary_directory DIRECTORY]
                                [--vfs_back_end TYPE]
+                               [--analyzer_threads NUMBER]
+                               [--record_range_size SIZE]
+                               [--task_batch_size NUMBER]
                                [--worker_memory_limit SIZE]
                                [--worker_timeout MINUTES] [--workers WORKERS]
 
 Test argument parser.
 
 {0:s}:
+  --analyzer_threads NUMBER, --analyzer-threads NUMBER
+                        Number of threads per worker process that run the
+                        analyzers, such as the hashers and Yara, concurrently
+                        with parsing. The default is 0, which runs the
+                        analyzers before parsing.
+  --record_range_size SIZE, --record-range-size SIZE
+                        Approximate size in bytes of the record ranges into
+                        which large Windows XML EventLog (EVTX), ESE database
+                        and NTFS $MFT files are split, so that these are
+                        parsed by multiple worker processes, where 0
+                        represents files are not split. The default is
+                        268435456 (256 MiB).
   --single_process, --single-process
                         Indicate that the tool should run in a single process.
+  --task_batch_size NUMBER, --task-batch-size NUMBER
+                        Maximum number of small files that are processed by a
+                        worker process as a single task. The default is 1,
+                        which processes every file as a separate task.
+                        Batching small files reduces the overhead per task,
+                        such as on sources with many tiny files.
   --temporary_directory DIRECTORY, --temporary-directory DIRECTORY
                         Path to the directory that should be used to store
                         temporary files created during processing.
@@ -76,12 +97,20 @@ usage: extraction_tool_test.py [--single_process]
                                [--process_memory_limit SIZE]
                                [--temporary_directory DIRECTORY]
                                [--vfs_back_end TYPE]
+                               [--analyzer_threads NUMBER]
+                               [--record_range_size SIZE]
+                               [--task_batch_size NUMBER]
                                [--worker_memory_limit SIZE]
                                [--worker_timeout MINUTES] [--workers WORKERS]
 
 Test argument parser.
 
 {0:s}:
+  --analyzer_threads NUMBER, --analyzer-threads NUMBER
+                        Number of threads per worker process that run the
+                        analyzers, such as the hashers and Yara, concurrently
+                        with parsing. The default is 0, which runs the
+                        analyzers before parsing.
   --process_memory_limit SIZE, --process-memory-limit SIZE
                         Maximum amount of memory (data segment) a process is
                         allowed to allocate in bytes, where 0 represents no
@@ -90,8 +119,21 @@ Test argument parser.
                         worker processes. This limit is enforced by the
                         operating system and will supersede the worker memory
                         limit (--worker_memory_limit).
+  --record_range_size SIZE, --record-range-size SIZE
+                        Approximate size in bytes of the record ranges into
+                        which large Windows XML EventLog (EVTX), ESE database
+                        and NTFS $MFT files are split, so that these are
+                        parsed by multiple worker processes, where 0
+                        represents files are not split. The default is
+                        268435456 (256 MiB).
   --single_process, --single-process
                         Indicate that the tool should run in a single process.
+  --task_batch_size NUMBER, --task-batch-size NUMBER
+                        Maximum number of small files that are processed by a
+                        worker process as a single task. The default is 1,
+                        which processes every file as a separate task.
+                        Batching small files reduces the overhead per task,
+                        such as on sources with many tiny files.
   --temporary_directory DIRECTORY, --temporary-directory DIRECTORY
                         Path to the directory that should be used to store
                         temporary files created during processing.
@@ -147,7 +189,26 @@ Test argument parser.
 
   _STORAGE_FILENAME_TEMPLATE = r'\d{{8}}T\d{{6}}-{filename}.plaso'
 
-  # TODO: add test for _CreateProcessingConfiguration
+  def testCreateExtractionProcessingConfiguration(self):
+    """Tests the _CreateExtractionProcessingConfiguration function."""
+    test_tool = extraction_tool.ExtractionTool()
+    test_tool._hasher_names_string = 'md5'
+
+    configuration = test_tool._CreateExtractionProcessingConfiguration()
+    self.assertEqual(configuration.extraction.hasher_names_string, 'md5')
+
+    # The digest of incremental extraction requires the sha256 hasher.
+    test_tool._incremental_extraction = True
+    test_tool._incremental_extraction_digest = True
+
+    configuration = test_tool._CreateExtractionProcessingConfiguration()
+    self.assertEqual(
+        configuration.extraction.hasher_names_string, 'md5,sha256')
+
+    test_tool._hasher_names_string = 'all'
+
+    configuration = test_tool._CreateExtractionProcessingConfiguration()
+    self.assertEqual(configuration.extraction.hasher_names_string, 'all')
 
   def testGenerateStorageFileName(self):
     """Tests the _GenerateStorageFileName function."""
@@ -3,12 +3,14 @@
 """Tests for the extraction CLI arguments helper."""
 
 import argparse
+import os
 import unittest
 
 from plaso.cli import tools
 from plaso.cli.helpers import extraction
 from plaso.lib import errors
 
+from tests import test_lib as shared_test_lib
 from tests.cli import test_lib as cli_test_lib
 
 
@@ -18,8 +20,10 @@ class ExtractionArgumentsHelperTest(cli_test_lib.CLIToolTestCase):
   # pylint: disable=no-member,protected-access
 
   _EXPECTED_OUTPUT = """\
-usage: cli_helper.py [--extract_winreg_binary] [--preferred_year YEAR]
-                     [--skip_compressed_streams]
+usage: cli_helper.py [--extract_winreg_binary] [--incremental_extraction]
+                     [--incremental_extraction_digest] [--parse_cache PATH]
+                     [--preferred_year YEAR] [--skip_compressed_streams]
+                     [--spool_data_streams]
 
 Test argument parser.
 
@@ -27,6 +31,29 @@ Test argument parser.
   --extract_winreg_binary, --extract-winreg-binary
                         Extract binary Windows Registry values. WARNING: This
                         can make processing significantly slower.
+  --incremental_extraction, --incremental-extraction
+                        Skip file entries of which the size, modification time
+                        and inode number are unchanged since a previous
+                        extraction session in the same storage file. New and
+                        changed file entries are parsed. WARNING: The events
+                        of a previous session are not removed when a changed
+                        file entry is parsed again, hence for example every
+                        record of a log file that was appended to is stored
+                        again.
+  --incremental_extraction_digest, --incremental-extraction-digest
+                        Also compare a SHA-256 digest of the content of the
+                        file entries to determine if they are unchanged. This
+                        implies --incremental_extraction and the sha256
+                        hasher. WARNING: This requires the content of every
+                        file entry of which the size, modification time and
+                        inode number are unchanged to be read. File entries
+                        larger than the hasher file size limit have no digest.
+  --parse_cache PATH, --parse-cache PATH
+                        Path of a parse cache database file. Event data
+                        extracted from a data stream is stored in the parse
+                        cache and reused for data streams with identical
+                        content and name, including in subsequent runs. The
+                        file is created if it does not exist.
   --preferred_year YEAR, --preferred-year YEAR
                         When a format\'s timestamp does not include a year,
                         e.g. syslog, use this as the initial year instead of
@@ -34,6 +61,12 @@ Test argument parser.
   --skip_compressed_streams, --skip-compressed-streams
                         Skip processing file content within compressed
                         streams, such as syslog.gz and syslog.bz2.
+  --spool_data_streams, --spool-data-streams
+                        Read the content of a data stream once into a spool,
+                        in memory or in a temporary file for larger data
+                        streams, that is shared by the analyzers, the format
+                        scanners and the parsers. This can make processing of
+                        compressed or nested storage media images faster.
 """.format(cli_test_lib.ARGPARSE_OPTIONS)
 
   def testAddArguments(self):
@@ -55,12 +88,33 @@ Test argument parser.
     test_tool = tools.CLITool()
     extraction.ExtractionArgumentsHelper.ParseOptions(options, test_tool)
 
+    self.assertFalse(test_tool._incremental_extraction)
+    self.assertFalse(test_tool._incremental_extraction_digest)
+    self.assertIsNone(test_tool._parse_cache_path)
     self.assertIsNone(test_tool._preferred_year)
     self.assertTrue(test_tool._process_compressed_streams)
+    self.assertFalse(test_tool._spool_data_streams)
 
     with self.assertRaises(errors.BadConfigObject):
       extraction.ExtractionArgumentsHelper.ParseOptions(options, None)
 
+    options.incremental_extraction_digest = True
+    extraction.ExtractionArgumentsHelper.ParseOptions(options, test_tool)
+
+    self.assertTrue(test_tool._incremental_extraction)
+    self.assertTrue(test_tool._incremental_extraction_digest)
+
+    with shared_test_lib.TempDirectory() as temporary_directory:
+      options.parse_cache = os.path.join(temporary_directory, 'cache.db')
+      extraction.ExtractionArgumentsHelper.ParseOptions(options, test_tool)
+
+      self.assertEqual(test_tool._parse_cache_path, options.parse_cache)
+
+      options.parse_cache = os.path.join(
+          temporary_directory, 'bogus', 'cache.db')
+      with self.assertRaises(errors.BadConfigOption):
+        extraction.ExtractionArgumentsHelper.ParseOptions(options, test_tool)
+
     # TODO: improve test coverage.
 
 
@@ -18,11 +18,21 @@ class StorageFormatArgumentsHelperTest(cli_test_lib.CLIToolTestCase):
   # pylint: disable=no-member,protected-access
 
   _EXPECTED_OUTPUT = """\
-usage: cli_helper.py [--storage_format FORMAT] [--task_storage_format FORMAT]
+usage: cli_helper.py [--compression_format FORMAT]
+                     [--serialization_format FORMAT] [--storage_format FORMAT]
+                     [--task_storage_format FORMAT]
 
 Test argument parser.
 
 {0:s}:
+  --compression_format FORMAT, --compression-format FORMAT
+                        Format used to compress attribute containers in SQLite
+                        storage files, the default is: zlib. Supported
+                        options: lz4, none, zlib, zstd
+  --serialization_format FORMAT, --serialization-format FORMAT
+                        Format used to serialize attribute containers in
+                        SQLite storage files, the default is: json. Supported
+                        options: json, msgpack
   --storage_format FORMAT, --storage-format FORMAT
                         Format of the storage file, the default is: sqlite.
                         Supported options: sqlite
@@ -55,10 +65,36 @@ Test argument parser.
     self.assertEqual(test_tool._storage_format, options.storage_format)
     self.assertEqual(
         test_tool._task_storage_format, options.task_storage_format)
+    self.assertEqual(test_tool._serialization_format, 'json')
+
+    options.serialization_format = 'msgpack'
+    storage_format.StorageFormatArgumentsHelper.ParseOptions(options, test_tool)
+
+    self.assertEqual(test_tool._serialization_format, 'msgpack')
+    self.assertEqual(test_tool._compression_format, 'zlib')
+
+    options.compression_format = 'zstd'
+    storage_format.StorageFormatArgumentsHelper.ParseOptions(options, test_tool)
+
+    self.assertEqual(test_tool._compression_format, 'zstd')
 
     with self.assertRaises(errors.BadConfigObject):
       storage_format.StorageFormatArgumentsHelper.ParseOptions(options, None)
 
+    with self.assertRaises(errors.BadConfigOption):
+      options.serialization_format = 'bogus'
+      storage_format.StorageFormatArgumentsHelper.ParseOptions(
+          options, test_tool)
+
+    options.serialization_format = 'json'
+
+    with self.assertRaises(errors.BadConfigOption):
+      options.compression_format = 'bogus'
+      storage_format.StorageFormatArgumentsHelper.ParseOptions(
+          options, test_tool)
+
+    options.compression_format = 'zlib'
+
     with self.assertRaises(errors.BadConfigOption):
       options.storage_format = 'bogus'
       storage_format.StorageFormatArgumentsHelper.ParseOptions(
@@ -18,12 +18,31 @@ class WorkersArgumentsHelperTest(cli_test_lib.CLIToolTestCase):
   # pylint: disable=no-member,protected-access
 
   _EXPECTED_OUTPUT = """\
-usage: cli_helper.py [--worker_memory_limit SIZE] [--worker_timeout MINUTES]
-                     [--workers WORKERS]
+usage: cli_helper.py [--analyzer_threads NUMBER] [--record_range_size SIZE]
+                     [--task_batch_size NUMBER] [--worker_memory_limit SIZE]
+                     [--worker_timeout MINUTES] [--workers WORKERS]
 
 Test argument parser.
 
 {0:s}:
+  --analyzer_threads NUMBER, --analyzer-threads NUMBER
+                        Number of threads per worker process that run the
+                        analyzers, such as the hashers and Yara, concurrently
+                        with parsing. The default is 0, which runs the
+                        analyzers before parsing.
+  --record_range_size SIZE, --record-range-size SIZE
+                        Approximate size in bytes of the record ranges into
+                        which large Windows XML EventLog (EVTX), ESE database
+                        and NTFS $MFT files are split, so that these are
+                        parsed by multiple worker processes, where 0
+                        represents files are not split. The default is
+                        268435456 (256 MiB).
+  --task_batch_size NUMBER, --task-batch-size NUMBER
+                        Maximum number of small files that are processed by a
+                        worker process as a single task. The default is 1,
+                        which processes every file as a separate task.
+                        Batching small files reduces the overhead per task,
+                        such as on sources with many tiny files.
   --worker_memory_limit SIZE, --worker-memory-limit SIZE
                         Maximum amount of memory (data segment and shared
                         memory) a worker process is allowed to consume in
@@ -61,7 +80,40 @@ Test argument parser.
     test_tool = tools.CLITool()
     workers.WorkersArgumentsHelper.ParseOptions(options, test_tool)
 
+    self.assertEqual(test_tool._number_of_analyzer_threads, 0)
     self.assertEqual(test_tool._number_of_extraction_workers, options.workers)
+    self.assertEqual(test_tool._record_range_data_size, 256 * 1024 * 1024)
+    self.assertEqual(test_tool._task_batch_size, 1)
+
+    options.task_batch_size = 100
+    workers.WorkersArgumentsHelper.ParseOptions(options, test_tool)
+    self.assertEqual(test_tool._task_batch_size, 100)
+
+    with self.assertRaises(errors.BadConfigOption):
+      options.task_batch_size = 0
+      workers.WorkersArgumentsHelper.ParseOptions(options, test_tool)
+
+    options.task_batch_size = None
+
+    options.analyzer_threads = 2
+    workers.WorkersArgumentsHelper.ParseOptions(options, test_tool)
+    self.assertEqual(test_tool._number_of_analyzer_threads, 2)
+
+    with self.assertRaises(errors.BadConfigOption):
+      options.analyzer_threads = -1
+      workers.WorkersArgumentsHelper.ParseOptions(options, test_tool)
+
+    options.analyzer_threads = None
+
+    options.record_range_size = 0
+    workers.WorkersArgumentsHelper.ParseOptions(options, test_tool)
+    self.assertEqual(test_tool._record_range_data_size, 0)
+
+    with self.assertRaises(errors.BadConfigOption):
+      options.record_range_size = -1
+      workers.WorkersArgumentsHelper.ParseOptions(options, test_tool)
+
+    options.record_range_size = None
 
     with self.assertRaises(errors.BadConfigObject):
       workers.WorkersArgumentsHelper.ParseOptions(options, None)
@@ -18,13 +18,26 @@ class YaraRulesArgumentsHelperTest(cli_test_lib.CLIToolTestCase):
   # pylint: disable=no-member,protected-access
 
   _EXPECTED_OUTPUT = """\
-usage: cli_helper.py [--yara_rules PATH]
+usage: cli_helper.py [--yara_rules PATH] [--yara_window_overlap SIZE]
+                     [--yara_window_size SIZE]
 
 Test argument parser.
 
 {0:s}:
   --yara_rules PATH, --yara-rules PATH
                         Path to a file containing Yara rules definitions.
+  --yara_window_overlap SIZE, --yara-window-overlap SIZE
+                        Number of bytes of the previous window that precede a
+                        window in which Yara rules are matched, so that
+                        matches that span window boundaries are found. The
+                        default is 1048576 (1 MiB).
+  --yara_window_size SIZE, --yara-window-size SIZE
+                        Size of the windows in which Yara rules are matched,
+                        which allows large files to be matched without reading
+                        them into memory as a whole. Note that conditions that
+                        depend on offsets or the file size apply to a window
+                        and that data is read in blocks of at least the window
+                        size. The default is 33554432 (32 MiB).
 """.format(cli_test_lib.ARGPARSE_OPTIONS)
 
   def testAddArguments(self):
@@ -73,6 +86,27 @@ Test argument parser.
     with self.assertRaises(errors.BadConfigOption):
       yara_rules.YaraRulesArgumentsHelper.ParseOptions(options, test_tool)
 
+    options.yara_rules_path = test_file_path
+    options.yara_window_overlap = 1024
+    options.yara_window_size = 4096
+    yara_rules.YaraRulesArgumentsHelper.ParseOptions(options, test_tool)
+
+    self.assertEqual(test_tool._yara_window_overlap, 1024)
+    self.assertEqual(test_tool._yara_window_size, 4096)
+
+    options.yara_window_size = 0
+    with self.assertRaises(errors.BadConfigOption):
+      yara_rules.YaraRulesArgumentsHelper.ParseOptions(options, test_tool)
+
+    options.yara_window_size = 1024
+    with self.assertRaises(errors.BadConfigOption):
+      yara_rules.YaraRulesArgumentsHelper.ParseOptions(options, test_tool)
+
+    options.yara_window_overlap = -1
+    options.yara_window_size = None
+    with self.assertRaises(errors.BadConfigOption):
+      yara_rules.YaraRulesArgumentsHelper.ParseOptions(options, test_tool)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -98,11 +98,18 @@ class PsortToolTest(test_lib.CLIToolTestCase):
   if resource is None:
     _EXPECTED_PROCESSING_OPTIONS = """\
 usage: psort_test.py [--temporary_directory DIRECTORY]
-                     [--worker_memory_limit SIZE] [--worker_timeout MINUTES]
+                     [--output_workers NUMBER] [--worker_memory_limit SIZE]
+                     [--worker_timeout MINUTES]
 
 Test argument parser.
 
 {0:s}:
+  --output_workers NUMBER, --output-workers NUMBER
+                        Number of worker processes used to format the events
+                        for output, where 0 represents formatting the events
+                        in the main (foreman) process. The default is 0. The
+                        events are written in the same order regardless of the
+                        number of worker processes.
   --temporary_directory DIRECTORY, --temporary-directory DIRECTORY
                         Path to the directory that should be used to store
                         temporary files created during processing.
@@ -124,11 +131,18 @@ Test argument parser.
     _EXPECTED_PROCESSING_OPTIONS = """\
 usage: psort_test.py [--process_memory_limit SIZE]
                      [--temporary_directory DIRECTORY]
-                     [--worker_memory_limit SIZE] [--worker_timeout MINUTES]
+                     [--output_workers NUMBER] [--worker_memory_limit SIZE]
+                     [--worker_timeout MINUTES]
 
 Test argument parser.
 
 {0:s}:
+  --output_workers NUMBER, --output-workers NUMBER
+                        Number of worker processes used to format the events
+                        for output, where 0 represents formatting the events
+                        in the main (foreman) process. The default is 0. The
+                        events are written in the same order regardless of the
+                        number of worker processes.
   --process_memory_limit SIZE, --process-memory-limit SIZE
                         Maximum amount of memory (data segment) a process is
                         allowed to allocate in bytes, where 0 represents no
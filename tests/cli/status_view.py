@@ -227,7 +227,27 @@ class StatusViewTest(test_lib.CLIToolTestCase):
 
     self.assertEqual(processing_time, '5 days, 05:01:01')
 
-  # TODO: add tests for _PrintTasksStatus
+  def testPrintTasksStatus(self):
+    """Tests the _PrintTasksStatus function."""
+    output_writer = test_lib.TestOutputWriter()
+
+    test_view = status_view.StatusView(output_writer, 'test_tool')
+
+    tasks_status = processing_status.TasksStatus()
+    tasks_status.number_of_queued_event_sources = 12
+    tasks_status.number_of_queued_tasks = 2
+    tasks_status.queued_event_sources_data_size = 3 * 1024 * 1024
+    tasks_status.total_number_of_tasks = 5
+
+    test_processing_status = processing_status.ProcessingStatus()
+    test_processing_status.UpdateTasksStatus(tasks_status)
+
+    test_view._PrintTasksStatus(test_processing_status)
+
+    output = output_writer.ReadOutput()
+    self.assertIn('Remaining:', output)
+    self.assertIn('3.0 MiB', output)
+
   # TODO: add tests for GetAnalysisStatusUpdateCallback
   # TODO: add tests for GetExtractionStatusUpdateCallback
   # TODO: add tests for PrintAnalysisReportsDetails
@@ -242,7 +262,36 @@ class StatusViewTest(test_lib.CLIToolTestCase):
 
     test_view.PrintExtractionStatusHeader(None)
 
-  # TODO: add tests for PrintExtractionSummary
+  def testPrintExtractionSummary(self):
+    """Tests the PrintExtractionSummary function."""
+    output_writer = test_lib.TestOutputWriter()
+
+    test_view = status_view.StatusView(output_writer, 'test_tool')
+
+    parse_cache_status = processing_status.ParseCacheStatus()
+    parse_cache_status.number_of_hits = 3
+    parse_cache_status.number_of_misses = 1
+    parse_cache_status.time_saved = 2.5
+
+    incremental_extraction_status = (
+        processing_status.IncrementalExtractionStatus())
+    incremental_extraction_status.number_of_parsed_file_entries = 2
+    incremental_extraction_status.number_of_skipped_file_entries = 7
+
+    test_processing_status = processing_status.ProcessingStatus()
+    test_processing_status.UpdateIncrementalExtractionStatus(
+        incremental_extraction_status)
+    test_processing_status.UpdateParseCacheStatus(parse_cache_status)
+
+    test_view.PrintExtractionSummary(test_processing_status, 0)
+
+    output = output_writer.ReadOutput()
+    self.assertIn(
+        'Parse cache hits: 3, misses: 1, time saved: 2.5 seconds.', output)
+    self.assertIn((
+        'Incremental extraction parsed file entries: 2, skipped unchanged '
+        'file entries: 7.'), output)
+
   # TODO: add tests for SetMode
   # TODO: add tests for SetSourceInformation
   # TODO: add tests for SetStorageFileInformation
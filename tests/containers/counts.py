@@ -24,6 +24,22 @@ class EventLabelCountTest(shared_test_lib.BaseTestCase):
     self.assertEqual(attribute_names, expected_attribute_names)
 
 
+class IncrementalExtractionCountTest(shared_test_lib.BaseTestCase):
+  """Tests for the incremental extraction count attribute container."""
+
+  def testGetAttributeNames(self):
+    """Tests the GetAttributeNames function."""
+    attribute_container = counts.IncrementalExtractionCount()
+
+    expected_attribute_names = [
+        'number_of_parsed_file_entries',
+        'number_of_skipped_file_entries',
+        'session_identifier']
+
+    attribute_names = sorted(attribute_container.GetAttributeNames())
+    self.assertEqual(attribute_names, expected_attribute_names)
+
+
 class ParserCountTest(shared_test_lib.BaseTestCase):
   """Tests for the parser count attribute container."""
 
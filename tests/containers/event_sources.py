@@ -39,5 +39,36 @@ class FileEntryEventSourceTest(shared_test_lib.BaseTestCase):
     self.assertEqual(attribute_names, expected_attribute_names)
 
 
+class FileEntryFingerprintTest(shared_test_lib.BaseTestCase):
+  """Tests for the file entry fingerprint attribute container."""
+
+  def testGetAttributeNames(self):
+    """Tests the GetAttributeNames function."""
+    attribute_container = event_sources.FileEntryFingerprint()
+
+    expected_attribute_names = [
+        'inode', 'modification_time', 'path_spec', 'sha256_hash', 'size']
+
+    attribute_names = sorted(attribute_container.GetAttributeNames())
+
+    self.assertEqual(attribute_names, expected_attribute_names)
+
+
+class RecordRangeEventSourceTest(shared_test_lib.BaseTestCase):
+  """Tests for the record range event source attribute container."""
+
+  def testGetAttributeNames(self):
+    """Tests the GetAttributeNames function."""
+    attribute_container = event_sources.RecordRangeEventSource()
+
+    expected_attribute_names = [
+        'data_type', 'file_entry_type', 'first_record_index',
+        'number_of_records', 'parser_name', 'path_spec']
+
+    attribute_names = sorted(attribute_container.GetAttributeNames())
+
+    self.assertEqual(attribute_names, expected_attribute_names)
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -59,7 +59,30 @@ class EventValuesHelperTest(shared_test_lib.BaseTestCase):
     content_identifier = events.CalculateEventValuesHash(
         event_data, event_data_stream)
 
-    self.assertEqual(content_identifier, '31aac7b1f8c1446f4b638c0dc5f92981')
+    self.assertEqual(content_identifier, 15161606570362876673)
+
+    event_data_stream_values_string = events.GetEventDataStreamValuesString(
+        event_data_stream)
+    content_identifier = events.CalculateEventValuesHash(
+        event_data, None,
+        event_data_stream_values_string=event_data_stream_values_string)
+
+    self.assertEqual(content_identifier, 15161606570362876673)
+
+    with self.assertRaises(RuntimeError):
+      event_data.attribute4 = {'key': 'value'}
+      events.CalculateEventValuesHash(event_data, event_data_stream)
+
+  def testGetEventDataStreamValuesString(self):
+    """Tests the GetEventDataStreamValuesString function."""
+    event_data_stream = events.EventDataStream()
+    event_data_stream.attribute1 = 'ATTR1'
+    event_data_stream.attribute2 = 99
+
+    event_data_stream_values_string = events.GetEventDataStreamValuesString(
+        event_data_stream)
+    self.assertEqual(
+        event_data_stream_values_string, 'attribute1: ATTR1, attribute2: 99')
 
 
 class EventDataTest(shared_test_lib.BaseTestCase):
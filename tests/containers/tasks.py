@@ -45,6 +45,21 @@ class TaskTest(shared_test_lib.BaseTestCase):
     self.assertTrue(task.has_retry)
     self.assertFalse(retry_task.has_retry)
     self.assertEqual(retry_task.path_spec, task.path_spec)
+    self.assertIsNone(retry_task.path_specs)
+
+    task.path_specs = ['test_path_spec1', 'test_path_spec2']
+
+    retry_task = task.CreateRetryTask()
+    self.assertEqual(retry_task.path_specs, task.path_specs)
+
+    task.first_record_index = 1000
+    task.number_of_records = 500
+    task.parser_name = 'winevtx'
+
+    retry_task = task.CreateRetryTask()
+    self.assertEqual(retry_task.first_record_index, 1000)
+    self.assertEqual(retry_task.number_of_records, 500)
+    self.assertEqual(retry_task.parser_name, 'winevtx')
 
   def testUpdateProcessingTime(self):
     """Tests the UpdateProcessingTime function."""
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the data stream spool file-like object."""
+
+import io
+import os
+import unittest
+
+from plaso.engine import data_stream_spool
+
+from tests import test_lib as shared_test_lib
+
+
+class DataStreamSpoolTest(shared_test_lib.BaseTestCase):
+  """Tests for the data stream spool file-like object."""
+
+  _TEST_DATA = b'First line\nSecond line\nThird line\n'
+
+  def testOpenClose(self):
+    """Tests the Open and close functions."""
+    spool = data_stream_spool.DataStreamSpool(1024)
+    self.assertFalse(spool.in_memory)
+
+    spool.Open(io.BytesIO(self._TEST_DATA))
+    self.assertTrue(spool.in_memory)
+
+    with self.assertRaises(IOError):
+      spool.Open(io.BytesIO(self._TEST_DATA))
+
+    spool.close()
+    self.assertFalse(spool.in_memory)
+
+    with self.assertRaises(IOError):
+      spool.get_size()
+
+  def testOpenWithTemporaryFile(self):
+    """Tests the Open function with content exceeding the in-memory size."""
+    with shared_test_lib.TempDirectory() as temporary_directory:
+      spool = data_stream_spool.DataStreamSpool(
+          8, temporary_directory=temporary_directory)
+      spool.Open(io.BytesIO(self._TEST_DATA))
+
+      try:
+        self.assertFalse(spool.in_memory)
+        self.assertEqual(spool.get_size(), len(self._TEST_DATA))
+        self.assertEqual(spool.read(), self._TEST_DATA)
+
+      finally:
+        spool.close()
+
+  def testRead(self):
+    """Tests the read and readline functions."""
+    spool = data_stream_spool.DataStreamSpool(1024)
+    spool.Open(io.BytesIO(self._TEST_DATA))
+
+    try:
+      self.assertEqual(spool.get_size(), len(self._TEST_DATA))
+
+      self.assertEqual(spool.read(5), b'First')
+      self.assertEqual(spool.readline(), b' line\n')
+      self.assertEqual(spool.readline(size=6), b'Second')
+      self.assertEqual(spool.read(), b' line\nThird line\n')
+      self.assertEqual(spool.read(), b'')
+
+      with self.assertRaises(IOError):
+        spool.read(-1)
+
+    finally:
+      spool.close()
+
+  def testSeek(self):
+    """Tests the seek, get_offset and tell functions."""
+    spool = data_stream_spool.DataStreamSpool(1024)
+    spool.Open(io.BytesIO(self._TEST_DATA))
+
+    try:
+      spool.seek(11, os.SEEK_SET)
+      self.assertEqual(spool.get_offset(), 11)
+      self.assertEqual(spool.read(6), b'Second')
+
+      spool.seek(-6, os.SEEK_CUR)
+      self.assertEqual(spool.tell(), 11)
+
+      spool.seek(-11, os.SEEK_END)
+      self.assertEqual(spool.read(), b'Third line\n')
+
+      # Seeking beyond the end of the data is allowed.
+      spool.seek(1024, os.SEEK_SET)
+      self.assertEqual(spool.read(), b'')
+
+      with self.assertRaises(IOError):
+        spool.seek(-1, os.SEEK_SET)
+
+      with self.assertRaises(IOError):
+        spool.seek(0, 99)
+
+    finally:
+      spool.close()
+
+
+if __name__ == '__main__':
+  unittest.main()
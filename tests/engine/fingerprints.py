@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the file entry fingerprints for incremental extraction."""
+
+import hashlib
+import os
+import unittest
+
+from unittest import mock
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import resolver as path_spec_resolver
+
+from plaso.containers import events
+from plaso.engine import fingerprints
+from plaso.storage.fake import writer as fake_writer
+
+from tests import test_lib as shared_test_lib
+
+
+class FileEntryFingerprinterTest(shared_test_lib.BaseTestCase):
+  """Tests for the file entry fingerprinter."""
+
+  def _OpenFileEntry(self, path):
+    """Opens a file entry.
+
+    Args:
+      path (str): path of the file entry.
+
+    Returns:
+      dfvfs.FileEntry: file entry.
+    """
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=path)
+    return path_spec_resolver.Resolver.OpenFileEntry(path_spec)
+
+  def _SetDigest(self, fingerprinter, file_entry):
+    """Sets the digest of a pending fingerprint as the extraction worker would.
+
+    Args:
+      fingerprinter (FileEntryFingerprinter): file entry fingerprinter.
+      file_entry (dfvfs.FileEntry): file entry.
+    """
+    file_object = file_entry.GetFileObject()
+    event_data_stream = events.EventDataStream()
+    event_data_stream.path_spec = file_entry.path_spec
+    event_data_stream.sha256_hash = hashlib.sha256(
+        file_object.read()).hexdigest()
+
+    fingerprinter.SetDigest(event_data_stream)
+
+  def testCheckFileEntry(self):
+    """Tests the CheckFileEntry and ReadFingerprints functions."""
+    with shared_test_lib.TempDirectory() as temporary_directory:
+      test_path = os.path.join(temporary_directory, 'test.txt')
+      with open(test_path, 'wb') as file_object:
+        file_object.write(b'First version\n')
+
+      storage_writer = fake_writer.FakeStorageWriter()
+      storage_writer.Open()
+
+      try:
+        fingerprinter = fingerprints.FileEntryFingerprinter()
+        fingerprinter.ReadFingerprints(storage_writer)
+
+        file_entry = self._OpenFileEntry(temporary_directory)
+        self.assertFalse(fingerprinter.CheckFileEntry(file_entry))
+
+        file_entry = self._OpenFileEntry(test_path)
+        self.assertFalse(fingerprinter.CheckFileEntry(file_entry))
+
+        # The fingerprint is only recorded once the file entry was parsed.
+        number_of_fingerprints = storage_writer.GetNumberOfAttributeContainers(
+            'file_entry_fingerprint')
+        self.assertEqual(number_of_fingerprints, 0)
+
+        fingerprinter.RecordFingerprint(storage_writer, file_entry.path_spec)
+
+        self.assertEqual(fingerprinter.number_of_parsed_file_entries, 1)
+        self.assertEqual(fingerprinter.number_of_skipped_file_entries, 0)
+
+        number_of_fingerprints = storage_writer.GetNumberOfAttributeContainers(
+            'file_entry_fingerprint')
+        self.assertEqual(number_of_fingerprints, 1)
+
+        # A subsequent session skips the unchanged file entry.
+        fingerprinter = fingerprints.FileEntryFingerprinter()
+        fingerprinter.ReadFingerprints(storage_writer)
+
+        file_entry = self._OpenFileEntry(test_path)
+        self.assertTrue(fingerprinter.CheckFileEntry(file_entry))
+
+        self.assertEqual(fingerprinter.number_of_parsed_file_entries, 0)
+        self.assertEqual(fingerprinter.number_of_skipped_file_entries, 1)
+
+        # A subsequent session parses the changed file entry.
+        with open(test_path, 'ab') as file_object:
+          file_object.write(b'Second version\n')
+
+        fingerprinter = fingerprints.FileEntryFingerprinter()
+        fingerprinter.ReadFingerprints(storage_writer)
+
+        file_entry = self._OpenFileEntry(test_path)
+        self.assertFalse(fingerprinter.CheckFileEntry(file_entry))
+
+        fingerprinter.RecordFingerprint(storage_writer, file_entry.path_spec)
+
+        self.assertEqual(fingerprinter.number_of_parsed_file_entries, 1)
+        self.assertEqual(fingerprinter.number_of_skipped_file_entries, 0)
+
+        number_of_fingerprints = storage_writer.GetNumberOfAttributeContainers(
+            'file_entry_fingerprint')
+        self.assertEqual(number_of_fingerprints, 2)
+
+      finally:
+        storage_writer.Close()
+
+  def testCheckFileEntryWithDigest(self):
+    """Tests the CheckFileEntry function with a digest."""
+    with shared_test_lib.TempDirectory() as temporary_directory:
+      test_path = os.path.join(temporary_directory, 'test.txt')
+      with open(test_path, 'wb') as file_object:
+        file_object.write(b'First version\n')
+
+      stat_object = os.stat(test_path)
+
+      storage_writer = fake_writer.FakeStorageWriter()
+      storage_writer.Open()
+
+      try:
+        fingerprinter = fingerprints.FileEntryFingerprinter(
+            calculate_digest=True)
+
+        file_entry = self._OpenFileEntry(test_path)
+        self.assertFalse(fingerprinter.CheckFileEntry(file_entry))
+
+        self._SetDigest(fingerprinter, file_entry)
+        fingerprinter.RecordFingerprint(storage_writer, file_entry.path_spec)
+
+        fingerprint = storage_writer.GetAttributeContainerByIndex(
+            'file_entry_fingerprint', 0)
+        self.assertEqual(fingerprint.sha256_hash, (
+            '946580ea4f385eeff8a9c6a0350635c64d5ee2c867227f0f0d706ac746160c79'))
+
+        # The digest is only calculated when the size, modification time and
+        # inode number are unchanged.
+        with open(test_path, 'ab') as file_object:
+          file_object.write(b'Appended\n')
+
+        fingerprinter = fingerprints.FileEntryFingerprinter(
+            calculate_digest=True)
+        fingerprinter.ReadFingerprints(storage_writer)
+
+        file_entry = self._OpenFileEntry(test_path)
+        with mock.patch.object(
+            fingerprinter, '_CalculateDigest') as calculate_digest:
+          self.assertFalse(fingerprinter.CheckFileEntry(file_entry))
+          calculate_digest.assert_not_called()
+
+        with open(test_path, 'wb') as file_object:
+          file_object.write(b'First version\n')
+
+        os.utime(test_path, ns=(
+            stat_object.st_atime_ns, stat_object.st_mtime_ns))
+
+        # Change the content without changing the size and modification time.
+        with open(test_path, 'wb') as file_object:
+          file_object.write(b'Other version\n')
+
+        os.utime(test_path, ns=(
+            stat_object.st_atime_ns, stat_object.st_mtime_ns))
+
+        fingerprinter = fingerprints.FileEntryFingerprinter(
+            calculate_digest=True)
+        fingerprinter.ReadFingerprints(storage_writer)
+
+        file_entry = self._OpenFileEntry(test_path)
+        self.assertFalse(fingerprinter.CheckFileEntry(file_entry))
+
+        # Without a digest the change of content is not detected.
+        fingerprinter = fingerprints.FileEntryFingerprinter()
+        fingerprinter.ReadFingerprints(storage_writer)
+
+        file_entry = self._OpenFileEntry(test_path)
+        self.assertTrue(fingerprinter.CheckFileEntry(file_entry))
+
+      finally:
+        storage_writer.Close()
+
+  def testDiscardFingerprint(self):
+    """Tests the DiscardFingerprint function."""
+    with shared_test_lib.TempDirectory() as temporary_directory:
+      test_path = os.path.join(temporary_directory, 'test.txt')
+      with open(test_path, 'wb') as file_object:
+        file_object.write(b'First version\n')
+
+      storage_writer = fake_writer.FakeStorageWriter()
+      storage_writer.Open()
+
+      try:
+        fingerprinter = fingerprints.FileEntryFingerprinter()
+
+        file_entry = self._OpenFileEntry(test_path)
+        self.assertFalse(fingerprinter.CheckFileEntry(file_entry))
+
+        # The fingerprint of a file entry that failed to parse is not recorded.
+        fingerprinter.DiscardFingerprint(file_entry.path_spec)
+        fingerprinter.RecordFingerprint(storage_writer, file_entry.path_spec)
+
+        self.assertEqual(fingerprinter.number_of_parsed_file_entries, 0)
+
+        number_of_fingerprints = storage_writer.GetNumberOfAttributeContainers(
+            'file_entry_fingerprint')
+        self.assertEqual(number_of_fingerprints, 0)
+
+        # A subsequent session parses the file entry again.
+        fingerprinter = fingerprints.FileEntryFingerprinter()
+        fingerprinter.ReadFingerprints(storage_writer)
+
+        file_entry = self._OpenFileEntry(test_path)
+        self.assertFalse(fingerprinter.CheckFileEntry(file_entry))
+
+      finally:
+        storage_writer.Close()
+
+  def testSetDigest(self):
+    """Tests the SetDigest function."""
+    with shared_test_lib.TempDirectory() as temporary_directory:
+      test_path = os.path.join(temporary_directory, 'test.txt')
+      with open(test_path, 'wb') as file_object:
+        file_object.write(b'First version\n')
+
+      storage_writer = fake_writer.FakeStorageWriter()
+      storage_writer.Open()
+
+      try:
+        # The digest is ignored when the fingerprint does not include one.
+        fingerprinter = fingerprints.FileEntryFingerprinter()
+
+        file_entry = self._OpenFileEntry(test_path)
+        self.assertFalse(fingerprinter.CheckFileEntry(file_entry))
+
+        self._SetDigest(fingerprinter, file_entry)
+        fingerprinter.RecordFingerprint(storage_writer, file_entry.path_spec)
+
+        fingerprint = storage_writer.GetAttributeContainerByIndex(
+            'file_entry_fingerprint', 0)
+        self.assertIsNone(fingerprint.sha256_hash)
+
+        # Without an event data stream hash the fingerprint has no digest.
+        fingerprinter = fingerprints.FileEntryFingerprinter(
+            calculate_digest=True)
+
+        file_entry = self._OpenFileEntry(test_path)
+        self.assertFalse(fingerprinter.CheckFileEntry(file_entry))
+
+        fingerprinter.RecordFingerprint(storage_writer, file_entry.path_spec)
+
+        fingerprint = storage_writer.GetAttributeContainerByIndex(
+            'file_entry_fingerprint', 1)
+        self.assertIsNone(fingerprint.sha256_hash)
+
+      finally:
+        storage_writer.Close()
+
+  def testRecordFingerprintWithRecordRanges(self):
+    """Tests the RecordFingerprint function with record ranges."""
+    with shared_test_lib.TempDirectory() as temporary_directory:
+      test_path = os.path.join(temporary_directory, 'test.txt')
+      with open(test_path, 'wb') as file_object:
+        file_object.write(b'First version\n')
+
+      storage_writer = fake_writer.FakeStorageWriter()
+      storage_writer.Open()
+
+      try:
+        fingerprinter = fingerprints.FileEntryFingerprinter()
+
+        file_entry = self._OpenFileEntry(test_path)
+        self.assertFalse(fingerprinter.CheckFileEntry(file_entry))
+
+        fingerprinter.AddPendingRecordRange(file_entry.path_spec)
+        fingerprinter.AddPendingRecordRange(file_entry.path_spec)
+
+        # The fingerprint is recorded once the file entry and all its record
+        # ranges were parsed.
+        for _ in range(3):
+          number_of_fingerprints = (
+              storage_writer.GetNumberOfAttributeContainers(
+                  'file_entry_fingerprint'))
+          self.assertEqual(number_of_fingerprints, 0)
+
+          fingerprinter.RecordFingerprint(storage_writer, file_entry.path_spec)
+
+        number_of_fingerprints = storage_writer.GetNumberOfAttributeContainers(
+            'file_entry_fingerprint')
+        self.assertEqual(number_of_fingerprints, 1)
+        self.assertEqual(fingerprinter.number_of_parsed_file_entries, 1)
+
+      finally:
+        storage_writer.Close()
+
+
+if __name__ == '__main__':
+  unittest.main()
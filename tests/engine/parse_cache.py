@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the content-addressed cache of parse results."""
+
+import os
+import unittest
+
+from acstore.containers import interface as containers_interface
+
+from dfdatetime import posix_time as dfdatetime_posix_time
+
+from plaso.containers import events
+from plaso.engine import parse_cache
+
+from tests import test_lib as shared_test_lib
+
+
+class ParseCacheTest(shared_test_lib.BaseTestCase):
+  """Tests for the content-addressed cache of parse results."""
+
+  # pylint: disable=protected-access
+
+  def _CreateTestEventData(self):
+    """Creates event data for testing.
+
+    Returns:
+      EventData: event data.
+    """
+    event_data = events.EventData(data_type='test:event')
+    event_data._parser_chain = 'test_parser'
+    event_data.body = 'Test message'
+    event_data.written_time = dfdatetime_posix_time.PosixTime(
+        timestamp=1621839644)
+
+    event_data_stream_identifier = (
+        containers_interface.AttributeContainerIdentifier(
+            name='event_data_stream', sequence_number=1))
+    event_data.SetEventDataStreamIdentifier(event_data_stream_identifier)
+
+    return event_data
+
+  def testOpenClose(self):
+    """Tests the Open and Close functions."""
+    test_cache = parse_cache.ParseCache()
+
+    with shared_test_lib.TempDirectory() as temporary_directory:
+      test_path = os.path.join(temporary_directory, 'parse_cache.db')
+      test_cache.Open(test_path)
+
+      self.assertTrue(os.path.isfile(test_path))
+
+      with self.assertRaises(IOError):
+        test_cache.Open(test_path)
+
+      test_cache.Close()
+
+      with self.assertRaises(IOError):
+        test_cache.Close()
+
+      test_path = os.path.join(temporary_directory, 'bogus', 'parse_cache.db')
+      with self.assertRaises(IOError):
+        test_cache.Open(test_path)
+
+  def testGetAndWriteParseResult(self):
+    """Tests the GetParseResult and WriteParseResult functions."""
+    test_cache = parse_cache.ParseCache()
+
+    with self.assertRaises(IOError):
+      test_cache.GetParseResult('test')
+
+    with shared_test_lib.TempDirectory() as temporary_directory:
+      test_path = os.path.join(temporary_directory, 'parse_cache.db')
+      test_cache.Open(test_path)
+
+      try:
+        event_data, parse_time = test_cache.GetParseResult('test')
+        self.assertIsNone(event_data)
+        self.assertIsNone(parse_time)
+
+        test_cache.WriteParseResult(
+            'test', [self._CreateTestEventData()], 1.5)
+        test_cache.WriteParseResult('empty', [], 0.5)
+
+        # A parse result that is already stored is not overwritten.
+        test_cache.WriteParseResult('test', [], 2.5)
+
+      finally:
+        test_cache.Close()
+
+      # Read the parse results with a new connection, as another worker
+      # process would.
+      test_cache.Open(test_path)
+
+      try:
+        event_data, parse_time = test_cache.GetParseResult('test')
+        self.assertEqual(len(event_data), 1)
+        self.assertEqual(parse_time, 1.5)
+
+        self.assertEqual(event_data[0].data_type, 'test:event')
+        self.assertEqual(event_data[0].body, 'Test message')
+        self.assertEqual(event_data[0]._parser_chain, 'test_parser')
+        self.assertIsNone(event_data[0].GetEventDataStreamIdentifier())
+        self.assertEqual(
+            event_data[0].written_time.timestamp, 1621839644)
+
+        event_data, parse_time = test_cache.GetParseResult('empty')
+        self.assertEqual(event_data, [])
+        self.assertEqual(parse_time, 0.5)
+
+      finally:
+        test_cache.Close()
+
+
+if __name__ == '__main__':
+  unittest.main()
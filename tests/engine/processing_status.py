@@ -85,6 +85,26 @@ class ProcessingStatusTest(unittest.TestCase):
         'test', 'Idle', 12345, 2000000, 'test process',
         0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
 
+  def testUpdateIncrementalExtractionStatus(self):
+    """Tests the UpdateIncrementalExtractionStatus function."""
+    incremental_extraction_status = (
+        processing_status.IncrementalExtractionStatus())
+
+    status = processing_status.ProcessingStatus()
+    status.UpdateIncrementalExtractionStatus(incremental_extraction_status)
+
+    self.assertEqual(
+        status.incremental_extraction_status, incremental_extraction_status)
+
+  def testUpdateParseCacheStatus(self):
+    """Tests the UpdateParseCacheStatus function."""
+    parse_cache_status = processing_status.ParseCacheStatus()
+
+    status = processing_status.ProcessingStatus()
+    status.UpdateParseCacheStatus(parse_cache_status)
+
+    self.assertEqual(status.parse_cache_status, parse_cache_status)
+
   def testUpdateTasksStatus(self):
     """Tests the UpdateTasksStatus function."""
     task_status = processing_status.TasksStatus()
@@ -100,6 +120,25 @@ class ProcessingStatusTest(unittest.TestCase):
         0, 0, 0, 0, 0, 0, 0, 0, 0)
 
 
+class IncrementalExtractionStatusTest(unittest.TestCase):
+  """Tests the incremental extraction status."""
+
+  def testInitialization(self):
+    """Tests the __init__ function."""
+    incremental_extraction_status = (
+        processing_status.IncrementalExtractionStatus())
+    self.assertIsNotNone(incremental_extraction_status)
+
+
+class ParseCacheStatusTest(unittest.TestCase):
+  """Tests the parse cache status."""
+
+  def testInitialization(self):
+    """Tests the __init__ function."""
+    parse_cache_status = processing_status.ParseCacheStatus()
+    self.assertIsNotNone(parse_cache_status)
+
+
 class TasksStatusTest(unittest.TestCase):
   """Tests the task status."""
 
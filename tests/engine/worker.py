@@ -3,11 +3,16 @@
 """Tests the event extraction worker."""
 
 import collections
+import os
+import shutil
 import unittest
 
+from unittest import mock
+
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.resolver import context
 from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import resolver as path_spec_resolver
 
 from plaso.containers import events
 from plaso.containers import sessions
@@ -25,6 +30,48 @@ class EventExtractionWorkerTest(shared_test_lib.BaseTestCase):
 
   # pylint: disable=protected-access
 
+  def _ExtractContentWithParseCache(self, configuration, path):
+    """Extracts the content of a file using the parse cache.
+
+    Args:
+      configuration (ExtractionConfiguration): extraction configuration.
+      path (str): path of the file.
+
+    Returns:
+      tuple[list[EventData], EventExtractionWorker]: event data extracted
+          from the file and the extraction worker.
+    """
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=path)
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(path_spec)
+
+    extraction_worker = worker.EventExtractionWorker()
+    extraction_worker.SetExtractionConfiguration(configuration)
+
+    parser_mediator = parsers_mediator.ParserMediator(
+        resolver_context=context.Context())
+
+    storage_writer = fake_writer.FakeStorageWriter()
+    parser_mediator.SetStorageWriter(storage_writer)
+
+    storage_writer.Open()
+
+    try:
+      parser_mediator.SetFileEntry(file_entry)
+      parser_mediator.ProduceEventDataStream(events.EventDataStream())
+
+      extraction_worker._ExtractContentFromDataStream(
+          parser_mediator, file_entry, '')
+
+      event_data_list = list(storage_writer.GetAttributeContainers(
+          'event_data'))
+
+    finally:
+      storage_writer.Close()
+      extraction_worker.CloseParseCache()
+
+    return event_data_list, extraction_worker
+
   def _GetEventDataOfEvent(self, storage_writer, event):
     """Retrieves the event data of an event.
 
@@ -229,6 +276,59 @@ class EventExtractionWorkerTest(shared_test_lib.BaseTestCase):
     event_attribute = getattr(event_data_stream, 'test_result', None)
     self.assertEqual(event_attribute, 'is_vegetable')
 
+  def testAnalyzeFileObjectWithFilePath(self):
+    """Tests the _AnalyzeFileObject function with a file path."""
+    yara_rule_path = self._GetTestFilePath(['rules.yara'])
+    self._SkipIfPathNotExists(yara_rule_path)
+
+    with open(yara_rule_path, 'r', encoding='utf-8') as file_object:
+      rule_string = file_object.read()
+
+    extraction_worker = worker.EventExtractionWorker()
+    extraction_worker._SetYaraRules(rule_string, window_size=16)
+
+    # A Yara analyzer with a smaller size limit than the size of the test
+    # file matches the file by path instead of in windows.
+    yara_analyzer = extraction_worker._analyzers[0]
+    yara_analyzer.SIZE_LIMIT = 16
+
+    file_entry = self._GetTestFileEntry(['test_pe.exe'])
+    file_object = file_entry.GetFileObject()
+
+    event_data_stream = events.EventDataStream()
+    extraction_worker._AnalyzeFileObject(
+        file_object, 'test_pe.exe', event_data_stream,
+        file_path=file_entry.path_spec.location)
+
+    self.assertEqual(event_data_stream.yara_match, ['PEfileBasic', 'PEfile'])
+
+  def testAnalyzeFileObjectWithLargeWindow(self):
+    """Tests the _AnalyzeFileObject function with a large Yara window."""
+    yara_rule_path = self._GetTestFilePath(['rules.yara'])
+    self._SkipIfPathNotExists(yara_rule_path)
+
+    with open(yara_rule_path, 'r', encoding='utf-8') as file_object:
+      rule_string = file_object.read()
+
+    extraction_worker = worker.EventExtractionWorker()
+    extraction_worker._SetYaraRules(rule_string, window_size=64)
+
+    # The data is read in blocks of the window size when the window size is
+    # larger than the size limit of the Yara analyzer.
+    yara_analyzer = extraction_worker._analyzers[0]
+    yara_analyzer.SIZE_LIMIT = 16
+
+    file_entry = self._GetTestFileEntry(['test_pe.exe'])
+    file_object = file_entry.GetFileObject()
+
+    event_data_stream = events.EventDataStream()
+    with mock.patch.object(
+        yara_analyzer, 'Analyze', wraps=yara_analyzer.Analyze) as analyze:
+      extraction_worker._AnalyzeFileObject(
+          file_object, 'test_pe.exe', event_data_stream)
+
+      self.assertEqual(len(analyze.call_args_list[0].args[0]), 64)
+
   def testCanSkipDataStream(self):
     """Tests the _CanSkipDataStream function."""
     extraction_worker = worker.EventExtractionWorker()
@@ -281,6 +381,155 @@ class EventExtractionWorkerTest(shared_test_lib.BaseTestCase):
 
     # TODO: check results in storage writer
 
+  def testExtractContentFromDataStreamWithParseCache(self):
+    """Tests the _ExtractContentFromDataStreamWithParseCache function."""
+    with shared_test_lib.TempDirectory() as temporary_directory:
+      configuration = configurations.ExtractionConfiguration()
+      configuration.parse_cache_path = os.path.join(
+          temporary_directory, 'parse_cache.db')
+
+      file_entry = self._GetTestFileEntry(['setupapi.dev.log'])
+
+      event_values_hashes = []
+      for _ in range(2):
+        extraction_worker = worker.EventExtractionWorker()
+        extraction_worker.SetExtractionConfiguration(configuration)
+
+        parser_mediator = parsers_mediator.ParserMediator(
+            resolver_context=context.Context())
+
+        storage_writer = fake_writer.FakeStorageWriter()
+        parser_mediator.SetStorageWriter(storage_writer)
+
+        storage_writer.Open()
+
+        try:
+          parser_mediator.SetFileEntry(file_entry)
+          parser_mediator.ProduceEventDataStream(events.EventDataStream())
+
+          extraction_worker._ExtractContentFromDataStream(
+              parser_mediator, file_entry, '')
+
+          event_values_hashes.append(sorted([
+              event_data._event_values_hash
+              for event_data in storage_writer.GetAttributeContainers(
+                  'event_data')]))
+
+        finally:
+          storage_writer.Close()
+          extraction_worker.CloseParseCache()
+
+      self.assertEqual(extraction_worker.number_of_parse_cache_hits, 1)
+      self.assertEqual(extraction_worker.number_of_parse_cache_misses, 0)
+
+      self.assertEqual(len(event_values_hashes[0]), 194)
+      self.assertEqual(event_values_hashes[0], event_values_hashes[1])
+
+  def testExtractContentFromDataStreamWithParseCacheAndPath(self):
+    """Tests the parse cache with the same file in different locations."""
+    test_file_path = self._GetTestFilePath(['example.lnk'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    with shared_test_lib.TempDirectory() as temporary_directory:
+      configuration = configurations.ExtractionConfiguration()
+      configuration.parse_cache_path = os.path.join(
+          temporary_directory, 'parse_cache.db')
+
+      origins = []
+      for directory_name in ('first', 'second'):
+        directory_path = os.path.join(temporary_directory, directory_name)
+        os.mkdir(directory_path)
+
+        copied_file_path = os.path.join(directory_path, 'example.lnk')
+        shutil.copyfile(test_file_path, copied_file_path)
+
+        event_data_list, extraction_worker = (
+            self._ExtractContentWithParseCache(
+                configuration, copied_file_path))
+
+        origins.append(set(
+            event_data.origin for event_data in event_data_list
+            if getattr(event_data, 'origin', None)))
+
+        self.assertEqual(extraction_worker.number_of_parse_cache_hits, 0)
+
+      # The event data must contain the location of the file it was extracted
+      # from and not that of an identical file in another location.
+      self.assertEqual(len(origins[0]), 1)
+      self.assertIn(os.path.join('first', 'example.lnk'), origins[0].pop())
+      self.assertEqual(len(origins[1]), 1)
+      self.assertIn(os.path.join('second', 'example.lnk'), origins[1].pop())
+
+  def testExtractContentFromDataStreamWithParseCacheAndSiblings(self):
+    """Tests the parse cache with a OneDrive log with different siblings."""
+    test_file_path = self._GetTestFilePath([
+        'SyncEngine-2022-11-24.2341.10688.1.odlgz'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    test_string_map_path = self._GetTestFilePath(['ObfuscationStringMap.txt'])
+    self._SkipIfPathNotExists(test_string_map_path)
+
+    with shared_test_lib.TempDirectory() as temporary_directory:
+      configuration = configurations.ExtractionConfiguration()
+      configuration.parse_cache_path = os.path.join(
+          temporary_directory, 'parse_cache.db')
+
+      decoded_parameters = []
+      for directory_name in ('first', 'second'):
+        directory_path = os.path.join(temporary_directory, directory_name)
+        os.mkdir(directory_path)
+
+        copied_file_path = os.path.join(
+            directory_path, 'SyncEngine-2022-11-24.2341.10688.1.odlgz')
+        shutil.copyfile(test_file_path, copied_file_path)
+
+        # Only the second log has a string map to de-obfuscate its strings.
+        if directory_name == 'second':
+          shutil.copyfile(test_string_map_path, os.path.join(
+              directory_path, 'ObfuscationStringMap.txt'))
+
+        event_data_list, extraction_worker = (
+            self._ExtractContentWithParseCache(
+                configuration, copied_file_path))
+
+        decoded_parameters.append(sorted(
+            repr(getattr(event_data, 'decoded_parameters', None))
+            for event_data in event_data_list))
+
+        self.assertEqual(extraction_worker.number_of_parse_cache_hits, 0)
+        self.assertEqual(extraction_worker.number_of_parse_cache_misses, 0)
+
+      self.assertEqual(len(decoded_parameters[0]), 3038)
+      self.assertNotEqual(decoded_parameters[0], decoded_parameters[1])
+
+  def testExtractContentFromDataStreamWithParseCacheAndSpotlight(self):
+    """Tests the parse cache with an Apple Spotlight store database."""
+    test_file_path = self._GetTestFilePath(['859631-store.db'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    with shared_test_lib.TempDirectory() as temporary_directory:
+      configuration = configurations.ExtractionConfiguration()
+      configuration.parse_cache_path = os.path.join(
+          temporary_directory, 'parse_cache.db')
+
+      for directory_name in ('first', 'second'):
+        directory_path = os.path.join(temporary_directory, directory_name)
+        os.mkdir(directory_path)
+
+        copied_file_path = os.path.join(directory_path, 'store.db')
+        shutil.copyfile(test_file_path, copied_file_path)
+
+        event_data_list, extraction_worker = (
+            self._ExtractContentWithParseCache(
+                configuration, copied_file_path))
+
+        self.assertNotEqual(event_data_list, [])
+
+        # The results of the spotlight_storedb parser depend on the sibling
+        # dbStr map files and are never stored in the parse cache.
+        self.assertEqual(extraction_worker.number_of_parse_cache_hits, 0)
+        self.assertEqual(extraction_worker.number_of_parse_cache_misses, 0)
+
   def testExtractMetadataFromFileEntry(self):
     """Tests the _ExtractMetadataFromFileEntry function."""
     session = sessions.Session()
@@ -349,6 +598,31 @@ class EventExtractionWorkerTest(shared_test_lib.BaseTestCase):
 
     storage_writer.Close()
 
+  def testGetParseCacheLookupKey(self):
+    """Tests the _GetParseCacheLookupKey function."""
+    parser_mediator = parsers_mediator.ParserMediator(
+        resolver_context=context.Context())
+
+    extraction_worker = worker.EventExtractionWorker()
+
+    file_entry = self._GetTestFileEntry(['setupapi.dev.log'])
+    lookup_key = extraction_worker._GetParseCacheLookupKey(
+        parser_mediator, file_entry, '')
+    self.assertIsNotNone(lookup_key)
+    self.assertEqual(len(lookup_key), 32)
+
+    other_file_entry = self._GetTestFileEntry(['setupapi.setup.log'])
+    other_lookup_key = extraction_worker._GetParseCacheLookupKey(
+        parser_mediator, other_file_entry, '')
+    self.assertNotEqual(other_lookup_key, lookup_key)
+
+    extraction_worker = worker.EventExtractionWorker(
+        parser_filter_expression='setupapi')
+
+    other_lookup_key = extraction_worker._GetParseCacheLookupKey(
+        parser_mediator, file_entry, '')
+    self.assertNotEqual(other_lookup_key, lookup_key)
+
   def testIsMetadataFile(self):
     """Tests the _IsMetadataFile function."""
     extraction_worker = worker.EventExtractionWorker()
@@ -358,6 +632,38 @@ class EventExtractionWorkerTest(shared_test_lib.BaseTestCase):
     result = extraction_worker._IsMetadataFile(file_entry)
     self.assertFalse(result)
 
+  def testOpenDataStreamSpool(self):
+    """Tests the _OpenDataStreamSpool function."""
+    parser_mediator = parsers_mediator.ParserMediator(
+        resolver_context=context.Context())
+
+    file_entry = self._GetTestFileEntry(['setupapi.dev.log'])
+
+    extraction_worker = worker.EventExtractionWorker()
+
+    spool = extraction_worker._OpenDataStreamSpool(
+        parser_mediator, file_entry, '')
+    self.assertIsNone(spool)
+
+    configuration = configurations.ExtractionConfiguration()
+    configuration.spool_data_streams = True
+    extraction_worker.SetExtractionConfiguration(configuration)
+
+    spool = extraction_worker._OpenDataStreamSpool(
+        parser_mediator, file_entry, '')
+    self.assertIsNotNone(spool)
+
+    try:
+      file_object = file_entry.GetFileObject()
+      self.assertEqual(spool.get_size(), file_object.get_size())
+      self.assertTrue(spool.in_memory)
+
+      file_object.seek(0, os.SEEK_SET)
+      self.assertEqual(spool.read(), file_object.read())
+
+    finally:
+      spool.close()
+
   # TODO: add tests for _ProcessArchiveTypes
   # TODO: add tests for _ProcessCompressedStreamTypes
   # TODO: add tests for _ProcessDirectory
@@ -652,6 +958,105 @@ class EventExtractionWorkerTest(shared_test_lib.BaseTestCase):
     self._TestProcessPathSpec(
         storage_writer, path_spec, expected_event_data_counts)
 
+  def testProcessPathSpecWithAnalyzerThreads(self):
+    """Tests the ProcessPathSpec function with analyzer threads."""
+    path_spec = self._GetTestFilePathSpec(['syslog', 'syslog'])
+
+    results = []
+    for number_of_analyzer_threads in (0, 2):
+      configuration = configurations.ExtractionConfiguration()
+      configuration.hasher_names_string = 'md5,sha256'
+      configuration.number_of_analyzer_threads = number_of_analyzer_threads
+
+      extraction_worker = worker.EventExtractionWorker()
+      extraction_worker.SetExtractionConfiguration(configuration)
+
+      parser_mediator = parsers_mediator.ParserMediator(
+          resolver_context=context.Context())
+
+      storage_writer = fake_writer.FakeStorageWriter()
+      parser_mediator.SetStorageWriter(storage_writer)
+
+      storage_writer.Open()
+
+      try:
+        extraction_worker.ProcessPathSpec(parser_mediator, path_spec)
+
+        event_data_streams = list(storage_writer.GetAttributeContainers(
+            'event_data_stream'))
+        self.assertEqual(len(event_data_streams), 1)
+
+        event_values_hashes = sorted([
+            event_data._event_values_hash
+            for event_data in storage_writer.GetAttributeContainers(
+                'event_data')])
+
+        results.append((
+            event_data_streams[0].md5_hash, event_data_streams[0].sha256_hash,
+            event_values_hashes))
+
+      finally:
+        storage_writer.Close()
+        extraction_worker.StopAnalyzerThreads()
+
+    self.assertEqual(results[0][0], 'd030a79ce39cc74c54188529e829d968')
+    self.assertEqual(len(results[0][2]), 17)
+    self.assertEqual(results[1], results[0])
+
+  def testProcessPathSpecWithDataStreamSpool(self):
+    """Tests the ProcessPathSpec function with data stream spooling."""
+    configuration = configurations.ExtractionConfiguration()
+    configuration.archive_types_string = 'tar,zip'
+    configuration.spool_data_streams = True
+
+    extraction_worker = worker.EventExtractionWorker()
+    extraction_worker.SetExtractionConfiguration(configuration)
+
+    path_spec = self._GetTestFilePathSpec(['syslog.tgz'])
+    storage_writer = fake_writer.FakeStorageWriter()
+
+    expected_event_data_counts = {
+        'fs:stat': 3,
+        'syslog:cron:task_run': 3,
+        'syslog:line': 9}
+
+    self._TestProcessPathSpec(
+        storage_writer, path_spec, expected_event_data_counts,
+        extraction_worker=extraction_worker)
+
+  def testProcessRecordRange(self):
+    """Tests the ProcessRecordRange function."""
+    path_spec = self._GetTestFilePathSpec(['System.evtx'])
+    storage_writer = fake_writer.FakeStorageWriter()
+
+    resolver_context = context.Context()
+    parser_mediator = parsers_mediator.ParserMediator(
+        resolver_context=resolver_context)
+    parser_mediator.SetStorageWriter(storage_writer)
+
+    configuration = configurations.ExtractionConfiguration()
+
+    extraction_worker = worker.EventExtractionWorker()
+    extraction_worker.SetExtractionConfiguration(configuration)
+
+    storage_writer.Open()
+
+    try:
+      extraction_worker.ProcessRecordRange(
+          parser_mediator, path_spec, 'winevtx', 1203, 401)
+
+      expected_event_data_counts = {
+          'windows:evtx:record': 398}
+
+      self.CheckEventDataCounts(storage_writer, expected_event_data_counts)
+
+      number_of_event_data_streams = (
+          storage_writer.GetNumberOfAttributeContainers('event_data_stream'))
+      self.assertEqual(number_of_event_data_streams, 1)
+
+    finally:
+      storage_writer.Close()
+
   # TODO: add tests for SetExtractionConfiguration
   # TODO: add tests for SetAnalyzersProfiler
   # TODO: add tests for SetProcessingProfiler
@@ -43,6 +43,31 @@ class EventObjectFilterTest(test_lib.FilterTestCase):
       test_filter.CompileFilter(
           'some_stuff is "random" and other_stuff ')
 
+  def testGetStorageFilterValues(self):
+    """Tests the GetStorageFilterValues function."""
+    test_filter = event_filter.EventObjectFilter()
+
+    time_range, data_types = test_filter.GetStorageFilterValues()
+    self.assertIsNone(time_range)
+    self.assertIsNone(data_types)
+
+    test_filter.CompileFilter((
+        'timestamp >= DATETIME("2020-12-23T15:00:00") and '
+        'data_type is "fs:stat" and filename contains "issue"'))
+
+    time_range, data_types = test_filter.GetStorageFilterValues()
+    self.assertIsNotNone(time_range)
+    self.assertEqual(time_range.start_timestamp, 1608735600000000)
+    self.assertEqual(time_range.end_timestamp, (1 << 63) - 1)
+    self.assertEqual(data_types, ['fs:stat'])
+
+    test_filter.CompileFilter(
+        'data_type is not "fs:stat" or filename contains "issue"')
+
+    time_range, data_types = test_filter.GetStorageFilterValues()
+    self.assertIsNone(time_range)
+    self.assertIsNone(data_types)
+
   def testMatch(self):
     """Tests the Match function."""
     test_filter = event_filter.EventObjectFilter()
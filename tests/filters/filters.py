@@ -6,6 +6,7 @@ import unittest
 
 from plaso.containers import events
 from plaso.filters import filters
+from plaso.filters import value_types
 from plaso.lib import definitions
 
 from tests import test_lib as shared_test_lib
@@ -87,6 +88,46 @@ class AndFilterTest(shared_test_lib.BaseTestCase):
        'timestamp': 5134324321,
        'timestamp_desc': definitions.TIME_DESCRIPTION_UNKNOWN}]
 
+  def testCompileMatchFunction(self):
+    """Tests the CompileMatchFunction function."""
+    event, event_data, _ = containers_test_lib.CreateEventFromValues(
+        self._TEST_EVENTS[0])
+
+    false_filter_object = FalseFilter()
+    true_filter_object = TrueFilter()
+
+    filter_object = filters.AndFilter(arguments=[
+        true_filter_object, true_filter_object])
+
+    match_function = filter_object.CompileMatchFunction()
+    result = match_function(event, event_data, None, None)
+    self.assertTrue(result)
+
+    filter_object = filters.AndFilter(arguments=[
+        false_filter_object, true_filter_object])
+
+    match_function = filter_object.CompileMatchFunction()
+    result = match_function(event, event_data, None, None)
+    self.assertFalse(result)
+
+  def testGetStorageFilterValues(self):
+    """Tests the GetStorageFilterValues function."""
+    filter_object = filters.AndFilter(arguments=[
+        filters.GreaterEqualOperator(arguments=[
+            'timestamp', value_types.DateTimeValueType(1000)]),
+        filters.LessThanOperator(arguments=[
+            'timestamp', value_types.DateTimeValueType(2000)]),
+        filters.InSet(arguments=['data_type', ['test:event', 'test:other']]),
+        filters.EqualsOperator(arguments=['data_type', 'test:event'])])
+
+    storage_filter_values = filter_object.GetStorageFilterValues()
+    self.assertEqual(storage_filter_values, (1000, 1999, set(['test:event'])))
+
+    filter_object = filters.AndFilter(arguments=[TrueFilter()])
+
+    storage_filter_values = filter_object.GetStorageFilterValues()
+    self.assertEqual(storage_filter_values, (None, None, None))
+
   def testMatches(self):
     """Tests the Matches function."""
     event, event_data, _ = containers_test_lib.CreateEventFromValues(
@@ -117,6 +158,54 @@ class OrFilterTest(shared_test_lib.BaseTestCase):
        'timestamp': 5134324321,
        'timestamp_desc': definitions.TIME_DESCRIPTION_UNKNOWN}]
 
+  def testCompileMatchFunction(self):
+    """Tests the CompileMatchFunction function."""
+    event, event_data, _ = containers_test_lib.CreateEventFromValues(
+        self._TEST_EVENTS[0])
+
+    false_filter_object = FalseFilter()
+    true_filter_object = TrueFilter()
+
+    filter_object = filters.OrFilter(arguments=[
+        false_filter_object, true_filter_object])
+
+    match_function = filter_object.CompileMatchFunction()
+    result = match_function(event, event_data, None, None)
+    self.assertTrue(result)
+
+    filter_object = filters.OrFilter(arguments=[
+        false_filter_object, false_filter_object])
+
+    match_function = filter_object.CompileMatchFunction()
+    result = match_function(event, event_data, None, None)
+    self.assertFalse(result)
+
+  def testGetStorageFilterValues(self):
+    """Tests the GetStorageFilterValues function."""
+    filter_object = filters.OrFilter(arguments=[
+        filters.EqualsOperator(arguments=[
+            'timestamp', value_types.DateTimeValueType(1000)]),
+        filters.EqualsOperator(arguments=[
+            'timestamp', value_types.DateTimeValueType(2000)])])
+
+    storage_filter_values = filter_object.GetStorageFilterValues()
+    self.assertEqual(storage_filter_values, (1000, 2000, None))
+
+    filter_object = filters.OrFilter(arguments=[
+        filters.EqualsOperator(arguments=['data_type', 'test:event']),
+        filters.EqualsOperator(arguments=['data_type', 'test:other'])])
+
+    storage_filter_values = filter_object.GetStorageFilterValues()
+    self.assertEqual(storage_filter_values, (
+        None, None, set(['test:event', 'test:other'])))
+
+    filter_object = filters.OrFilter(arguments=[
+        filters.EqualsOperator(arguments=['data_type', 'test:event']),
+        TrueFilter()])
+
+    storage_filter_values = filter_object.GetStorageFilterValues()
+    self.assertEqual(storage_filter_values, (None, None, None))
+
   def testMatches(self):
     """Tests the Matches function."""
     event, event_data, _ = containers_test_lib.CreateEventFromValues(
@@ -183,6 +272,59 @@ class GenericBinaryOperatorTest(shared_test_lib.BaseTestCase):
     filter_object = filters.GenericBinaryOperator(arguments=['test_value', 1])
     self.assertIsNotNone(filter_object)
 
+  def testCompileGetValueFunction(self):
+    """Tests the _CompileGetValueFunction function."""
+    event, event_data, _ = containers_test_lib.CreateEventFromValues(
+        self._TEST_EVENTS[0])
+
+    event_data_stream = events.EventDataStream()
+    event_data_stream.md5_hash = 'e3b0c44298fc1c149afbf4c8996fb924'
+
+    event_tag = events.EventTag()
+    event_tag.AddLabel('browser_search')
+
+    filter_object = filters.GenericBinaryOperator(arguments=['test_value', 1])
+    get_value_function = filter_object._CompileGetValueFunction()
+
+    test_value = get_value_function(
+        event, event_data, event_data_stream, event_tag)
+    self.assertEqual(test_value, 1)
+
+    filter_object = filters.GenericBinaryOperator(arguments=['timestamp', 1])
+    get_value_function = filter_object._CompileGetValueFunction()
+
+    test_value = get_value_function(
+        event, event_data, event_data_stream, event_tag)
+    self.assertIsNotNone(test_value)
+    self.assertEqual(test_value.timestamp, 5134324321)
+
+    filter_object = filters.GenericBinaryOperator(arguments=['md5_hash', 1])
+    get_value_function = filter_object._CompileGetValueFunction()
+
+    test_value = get_value_function(
+        event, event_data, event_data_stream, event_tag)
+    self.assertEqual(test_value, 'e3b0c44298fc1c149afbf4c8996fb924')
+
+    filter_object = filters.GenericBinaryOperator(arguments=['tag', 1])
+    get_value_function = filter_object._CompileGetValueFunction()
+
+    test_value = get_value_function(
+        event, event_data, event_data_stream, event_tag)
+    self.assertEqual(test_value, ['browser_search'])
+
+  def testGetFilterTimestamp(self):
+    """Tests the _GetFilterTimestamp function."""
+    filter_object = filters.GenericBinaryOperator(arguments=[
+        'timestamp', value_types.DateTimeValueType(5134324321)])
+
+    filter_timestamp = filter_object._GetFilterTimestamp()
+    self.assertEqual(filter_timestamp, 5134324321)
+
+    filter_object = filters.GenericBinaryOperator(arguments=['timestamp', 1])
+
+    filter_timestamp = filter_object._GetFilterTimestamp()
+    self.assertIsNone(filter_timestamp)
+
   def testGetValue(self):
     """Tests the _GetValue function."""
     event, event_data, _ = containers_test_lib.CreateEventFromValues(
@@ -208,6 +350,69 @@ class GenericBinaryOperatorTest(shared_test_lib.BaseTestCase):
 
   # TODO: add tests for FlipBool function
 
+  def testCompileMatchFunction(self):
+    """Tests the CompileMatchFunction function."""
+    event, event_data, _ = containers_test_lib.CreateEventFromValues(
+        self._TEST_EVENTS[0])
+
+    test_filters = [
+        filters.EqualsOperator(arguments=['test_value', 1]),
+        filters.NotEqualsOperator(arguments=['test_value', 1]),
+        filters.EqualsOperator(arguments=[
+            'timestamp', value_types.DateTimeValueType(5134324321)]),
+        filters.LessThanOperator(arguments=[
+            'timestamp', value_types.DateTimeValueType(5134324321)]),
+        filters.GreaterEqualOperator(arguments=[
+            'timestamp', value_types.DateTimeValueType(5134324321)]),
+        filters.Contains(arguments=['data_type', 'EVENT']),
+        filters.Regexp(arguments=['data_type', '^test:']),
+        filters.RegexpInsensitive(arguments=['data_type', '^TEST:'])]
+
+    negated_filter_object = filters.EqualsOperator(arguments=[
+        'timestamp', value_types.DateTimeValueType(5134324321)])
+    negated_filter_object.FlipBool()
+    test_filters.append(negated_filter_object)
+
+    for filter_object in test_filters:
+      match_function = filter_object.CompileMatchFunction()
+
+      expected_result = filter_object.Matches(event, event_data, None, None)
+      result = match_function(event, event_data, None, None)
+      self.assertEqual(result, expected_result)
+
+    event.timestamp = None
+
+    for filter_object in test_filters:
+      match_function = filter_object.CompileMatchFunction()
+
+      expected_result = filter_object.Matches(event, event_data, None, None)
+      result = match_function(event, event_data, None, None)
+      self.assertEqual(result, expected_result)
+
+
+  def testGetStorageFilterValues(self):
+    """Tests the GetStorageFilterValues function."""
+    filter_object = filters.EqualsOperator(arguments=[
+        'timestamp', value_types.DateTimeValueType(5134324321)])
+
+    storage_filter_values = filter_object.GetStorageFilterValues()
+    self.assertEqual(storage_filter_values, (5134324321, 5134324321, None))
+
+    filter_object.FlipBool()
+
+    storage_filter_values = filter_object.GetStorageFilterValues()
+    self.assertEqual(storage_filter_values, (None, None, None))
+
+    filter_object = filters.EqualsOperator(arguments=[
+        'data_type', 'test:event'])
+
+    storage_filter_values = filter_object.GetStorageFilterValues()
+    self.assertEqual(storage_filter_values, (None, None, set(['test:event'])))
+
+    filter_object = filters.Regexp(arguments=['data_type', 'test:.*'])
+
+    storage_filter_values = filter_object.GetStorageFilterValues()
+    self.assertEqual(storage_filter_values, (None, None, None))
 
 class EqualsOperatorTest(shared_test_lib.BaseTestCase):
   """Tests the equals operator."""
@@ -319,8 +524,44 @@ class GreaterEqualOperatorTest(shared_test_lib.BaseTestCase):
 
 # TODO: add tests for Contains
 # TODO: add tests for InSet
-# TODO: add tests for Regexp
-# TODO: add tests for RegexpInsensitive
+
+
+class RegexpTest(shared_test_lib.BaseTestCase):
+  """Tests the regular expression operator."""
+
+  # pylint: disable=protected-access
+
+  def testCompareValue(self):
+    """Tests the _CompareValue function."""
+    filter_object = filters.Regexp(arguments=['first', '^te.t$'])
+
+    result = filter_object._CompareValue('test', None)
+    self.assertTrue(result)
+
+    result = filter_object._CompareValue('TEST', None)
+    self.assertFalse(result)
+
+    result = filter_object._CompareValue(b'test', None)
+    self.assertTrue(result)
+
+    with self.assertRaises(ValueError):
+      filters.Regexp(arguments=['first', '[bogus'])
+
+
+class RegexpInsensitiveTest(shared_test_lib.BaseTestCase):
+  """Tests the case insensitive regular expression operator."""
+
+  # pylint: disable=protected-access
+
+  def testCompareValue(self):
+    """Tests the _CompareValue function."""
+    filter_object = filters.RegexpInsensitive(arguments=['first', '^te.t$'])
+
+    result = filter_object._CompareValue('TEST', None)
+    self.assertTrue(result)
+
+    result = filter_object._CompareValue('other', None)
+    self.assertFalse(result)
 
 
 if __name__ == "__main__":
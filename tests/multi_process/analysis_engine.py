@@ -3,14 +3,17 @@
 """Tests for the task-based multi-process processing analysis engine."""
 
 import os
+import pickle
 import shutil
 import unittest
 
 from plaso.analysis import tagging
+from plaso.containers import events
 from plaso.containers import sessions
 from plaso.engine import configurations
 from plaso.lib import definitions
 from plaso.multi_process import analysis_engine
+from plaso.multi_process import zeromq_queue
 from plaso.storage import factory as storage_factory
 
 from tests import test_lib as shared_test_lib
@@ -72,6 +75,50 @@ class AnalysisEngineMultiProcessEngineTest(test_lib.MultiProcessingTestCase):
     self.assertEqual(events_counter['Events processed'], 38)
 
   # TODO: add test for _CheckStatusAnalysisProcess.
+
+  def testPushEventBatch(self):
+    """Tests the _PushEventBatch function."""
+    test_engine = analysis_engine.AnalysisMultiProcessEngine()
+
+    pull_queues = []
+    for index in range(2):
+      push_queue = zeromq_queue.ZeroMQPushBindQueue(
+          name='test push queue {0:d}'.format(index), delay_open=False,
+          linger_seconds=1)
+      pull_queue = zeromq_queue.ZeroMQPullConnectQueue(
+          name='test pull queue {0:d}'.format(index), delay_open=False,
+          port=push_queue.port, linger_seconds=1)
+
+      test_engine._event_queues['test{0:d}'.format(index)] = push_queue
+      pull_queues.append(pull_queue)
+
+    event_data = events.EventData(data_type='test:event')
+    event_batch = [
+        (events.EventObject(), event_data, None),
+        (events.EventObject(), event_data, None)]
+
+    try:
+      test_engine._PushEventBatch(event_batch)
+
+      serialized_event_batches = [
+          pull_queue.PopItem() for pull_queue in pull_queues]
+
+    finally:
+      for event_queue in test_engine._event_queues.values():
+        event_queue.Close()
+      for pull_queue in pull_queues:
+        pull_queue.Close()
+
+    self.assertEqual(
+        serialized_event_batches[0], serialized_event_batches[1])
+
+    event_batch = pickle.loads(serialized_event_batches[0])
+    self.assertEqual(len(event_batch), 2)
+
+    _, event_data, event_data_stream = event_batch[0]
+    self.assertEqual(event_data.data_type, 'test:event')
+    self.assertIsNone(event_data_stream)
+
   # TODO: add test for _StartAnalysisProcesses.
   # TODO: add test for _StatusUpdateThreadMain.
   # TODO: add test for _StopAnalysisProcesses.
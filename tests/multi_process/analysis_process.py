@@ -3,10 +3,12 @@
 """Tests for the multi-processing analysis process."""
 
 import os
+import pickle
 import time
 import unittest
 
 from plaso.analysis import interface as analysis_interface
+from plaso.containers import events
 from plaso.engine import configurations
 from plaso.multi_process import analysis_process
 from plaso.multi_process import plaso_queue
@@ -120,6 +122,30 @@ class AnalysisProcessTest(test_lib.MultiProcessingTestCase):
 
   # TODO: add test for _ProcessEvent.
 
+  def testProcessEventBatch(self):
+    """Tests the _ProcessEventBatch function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      configuration = configurations.ProcessingConfiguration()
+      configuration.task_storage_path = temp_directory
+
+      test_process = analysis_process.AnalysisProcess(
+          None, TestAnalysisPlugin(), configuration, [], name='TestAnalysis')
+
+      event_data = events.EventData(data_type='test:event')
+      event_batch = [
+          (events.EventObject(), event_data, None),
+          (events.EventObject(), event_data, None),
+          (events.EventObject(), event_data, None)]
+
+      serialized_event_batch = pickle.dumps(event_batch)
+
+      test_process._ProcessEventBatch(None, serialized_event_batch)
+      self.assertEqual(test_process._number_of_consumed_events, 3)
+
+      test_process._abort = True
+      test_process._ProcessEventBatch(None, serialized_event_batch)
+      self.assertEqual(test_process._number_of_consumed_events, 3)
+
   def testSignalAbort(self):
     """Tests the SignalAbort function."""
     with shared_test_lib.TempDirectory() as temp_directory:
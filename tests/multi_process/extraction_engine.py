@@ -4,30 +4,123 @@
 
 import collections
 import os
+import shutil
 import unittest
 
+from unittest import mock
+
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import resolver as path_spec_resolver
 
+from plaso.containers import event_sources
+from plaso.containers import events
 from plaso.containers import sessions
 from plaso.lib import definitions
 from plaso.engine import configurations
+from plaso.engine import fingerprints
 from plaso.multi_process import extraction_engine
+from plaso.storage.fake import fake_store
+from plaso.storage.fake import writer as fake_writer
 from plaso.storage.sqlite import writer as sqlite_writer
 
 from tests import test_lib as shared_test_lib
 
 
+class _FailingFakeStore(fake_store.FakeStore):
+  """Fake store that fails to read event data."""
+
+  def GetAttributeContainers(self, container_type, filter_expression=None):
+    """Retrieves a specific type of attribute containers.
+
+    Args:
+      container_type (str): attribute container type.
+      filter_expression (Optional[str]): expression to filter the resulting
+          attribute containers by.
+
+    Yields:
+      AttributeContainer: attribute container.
+
+    Raises:
+      IOError: if the attribute container type is event data.
+    """
+    if container_type == events.EventData.CONTAINER_TYPE:
+      raise IOError('Unable to read event data.')
+
+    yield from super(_FailingFakeStore, self).GetAttributeContainers(
+        container_type, filter_expression=filter_expression)
+
+
+class EventSourceHeapTest(shared_test_lib.BaseTestCase):
+  """Tests for the event source heap."""
+
+  # pylint: disable=protected-access
+
+  def _CreateEventSource(self, location, file_entry_type):
+    """Creates an event source for testing.
+
+    Args:
+      location (str): location of the event source.
+      file_entry_type (str): dfVFS file entry type.
+
+    Returns:
+      EventSource: event source.
+    """
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=location)
+    return event_sources.FileEntryEventSource(
+        file_entry_type=file_entry_type, path_spec=path_spec)
+
+  def testPushAndPopEventSource(self):
+    """Tests the PushEventSource and PopEventSource functions."""
+    event_source_heap = extraction_engine._EventSourceHeap()
+
+    self.assertEqual(event_source_heap.PeekEventSource(), (None, 0))
+    self.assertEqual(event_source_heap.PopEventSource(), (None, 0))
+
+    event_source_heap.PushEventSource(self._CreateEventSource(
+        '/small', dfvfs_definitions.FILE_ENTRY_TYPE_FILE), data_size=10)
+    event_source_heap.PushEventSource(self._CreateEventSource(
+        '/large', dfvfs_definitions.FILE_ENTRY_TYPE_FILE), data_size=1000)
+    event_source_heap.PushEventSource(self._CreateEventSource(
+        '/directory', dfvfs_definitions.FILE_ENTRY_TYPE_DIRECTORY))
+    event_source_heap.PushEventSource(self._CreateEventSource(
+        '/medium', dfvfs_definitions.FILE_ENTRY_TYPE_FILE), data_size=100)
+
+    self.assertEqual(event_source_heap.number_of_event_sources, 4)
+    self.assertEqual(event_source_heap.data_size, 1110)
+
+    event_source, data_size = event_source_heap.PeekEventSource()
+    self.assertEqual(event_source.path_spec.location, '/directory')
+    self.assertEqual(data_size, 0)
+
+    locations = []
+    data_sizes = []
+    event_source, data_size = event_source_heap.PopEventSource()
+    while event_source:
+      locations.append(event_source.path_spec.location)
+      data_sizes.append(data_size)
+      event_source, data_size = event_source_heap.PopEventSource()
+
+    self.assertEqual(locations, ['/directory', '/large', '/medium', '/small'])
+    self.assertEqual(data_sizes, [0, 1000, 100, 10])
+
+    self.assertEqual(event_source_heap.number_of_event_sources, 0)
+    self.assertEqual(event_source_heap.data_size, 0)
+
+
 class ExtractionMultiProcessEngineTest(shared_test_lib.BaseTestCase):
   """Tests for the task-based multi-process extraction engine."""
 
-  def testProcessSource(self):
-    """Tests the PreprocessSource and ProcessSource functions."""
+  def _ProcessSource(self, test_engine):
+    """Processes the test image with the filestat parser.
+
+    Args:
+      test_engine (ExtractionMultiProcessEngine): extraction engine.
+    """
     test_artifacts_path = shared_test_lib.GetTestFilePath(['artifacts'])
     self._SkipIfPathNotExists(test_artifacts_path)
 
-    test_engine = extraction_engine.ExtractionMultiProcessEngine(
-        maximum_number_of_tasks=100)
     test_engine.BuildArtifactsRegistry(test_artifacts_path, None)
 
     test_file_path = self._GetTestFilePath(['ímynd.dd'])
@@ -92,6 +185,219 @@ class ExtractionMultiProcessEngineTest(shared_test_lib.BaseTestCase):
         'total': 15})
     self.assertEqual(parsers_counter, expected_parsers_counter)
 
+  def _MergeTaskStorageWithFingerprint(self, task_store):
+    """Merges a task store of a task that processed a new file entry.
+
+    Args:
+      task_store (FakeStore): task store to merge.
+
+    Returns:
+      tuple[list[FileEntryFingerprint], int]: file entry fingerprints and
+          number of extraction warnings in the session storage.
+    """
+    # pylint: disable=protected-access
+    test_file_path = self._GetTestFilePath(['dpkg.log'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(path_spec)
+
+    test_engine = extraction_engine.ExtractionMultiProcessEngine(
+        maximum_number_of_tasks=100)
+    test_engine._event_data_timeliner = mock.MagicMock()
+    test_engine._fingerprinter = fingerprints.FileEntryFingerprinter(
+        calculate_digest=True)
+    test_engine._task_storage_format = definitions.STORAGE_FORMAT_SQLITE
+
+    self.assertFalse(test_engine._fingerprinter.CheckFileEntry(file_entry))
+
+    session = sessions.Session()
+
+    task = test_engine._task_manager.CreateTask(session.identifier)
+    task.path_spec = path_spec
+    task.storage_file_size = 1000
+    test_engine._task_manager.UpdateTaskAsPendingMerge(task)
+
+    event_data_stream = events.EventDataStream()
+    event_data_stream.path_spec = path_spec
+    event_data_stream.sha256_hash = (
+        '2e7c3f6a7f4dd5c1d2a9cbcbfd2c1c6b4c5a2b4e8b5c26c2d2f1f0a9c1b2e3d4')
+
+    task_store.Open()
+    task_store.AddAttributeContainer(event_data_stream)
+    task_store.AddAttributeContainer(events.EventData())
+
+    storage_writer = fake_writer.FakeStorageWriter()
+    storage_writer.Open()
+
+    try:
+      with mock.patch.object(
+          test_engine, '_GetMergeTaskStorage', return_value=task_store), (
+              mock.patch.object(
+                  test_engine, '_GetProcessedTaskIdentifiers',
+                  return_value=[])), (
+              mock.patch.object(test_engine, '_RemoveMergeTaskStorage')):
+        test_engine._MergeTaskStorage(storage_writer, session.identifier)
+        while test_engine._merge_task:
+          test_engine._MergeTaskStorage(storage_writer, session.identifier)
+
+      file_entry_fingerprints = list(storage_writer.GetAttributeContainers(
+          'file_entry_fingerprint'))
+      number_of_warnings = storage_writer.GetNumberOfAttributeContainers(
+          'extraction_warning')
+
+    finally:
+      storage_writer.Close()
+
+    return file_entry_fingerprints, number_of_warnings
+
+  def testMergeTaskStorageWithFingerprint(self):
+    """Tests the _MergeTaskStorage function with a file entry fingerprint."""
+    file_entry_fingerprints, number_of_warnings = (
+        self._MergeTaskStorageWithFingerprint(fake_store.FakeStore()))
+
+    self.assertEqual(len(file_entry_fingerprints), 1)
+    self.assertEqual(number_of_warnings, 0)
+
+    # The digest is taken from the merged event data stream.
+    self.assertEqual(file_entry_fingerprints[0].sha256_hash, (
+        '2e7c3f6a7f4dd5c1d2a9cbcbfd2c1c6b4c5a2b4e8b5c26c2d2f1f0a9c1b2e3d4'))
+
+  def testMergeTaskStorageWithFailedMerge(self):
+    """Tests the _MergeTaskStorage function with a failed merge."""
+    file_entry_fingerprints, number_of_warnings = (
+        self._MergeTaskStorageWithFingerprint(_FailingFakeStore()))
+
+    # The fingerprint of a file entry of a failed task is not recorded.
+    self.assertEqual(len(file_entry_fingerprints), 0)
+    self.assertEqual(number_of_warnings, 1)
+
+  def testPushEventSource(self):
+    """Tests the _PushEventSource function."""
+    # pylint: disable=protected-access
+    test_file_path = self._GetTestFilePath(['dpkg.log'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    test_engine = extraction_engine.ExtractionMultiProcessEngine(
+        maximum_number_of_tasks=100)
+
+    event_source_heap = extraction_engine._EventSourceHeap()
+
+    storage_writer = fake_writer.FakeStorageWriter()
+    storage_writer.Open()
+
+    try:
+      path_spec = path_spec_factory.Factory.NewPathSpec(
+          dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+      event_source = event_sources.FileEntryEventSource(
+          file_entry_type=dfvfs_definitions.FILE_ENTRY_TYPE_FILE,
+          path_spec=path_spec)
+      test_engine._PushEventSource(
+          storage_writer, event_source_heap, event_source)
+
+      path_spec = path_spec_factory.Factory.NewPathSpec(
+          dfvfs_definitions.TYPE_INDICATOR_OS,
+          location=os.path.join(os.path.dirname(test_file_path), 'bogus'))
+      event_source = event_sources.FileEntryEventSource(
+          file_entry_type=dfvfs_definitions.FILE_ENTRY_TYPE_FILE,
+          path_spec=path_spec)
+      test_engine._PushEventSource(
+          storage_writer, event_source_heap, event_source)
+
+      number_of_warnings = storage_writer.GetNumberOfAttributeContainers(
+          'extraction_warning')
+
+    finally:
+      storage_writer.Close()
+
+    # The event source of a file entry that cannot be opened is not pushed.
+    self.assertEqual(event_source_heap.number_of_event_sources, 1)
+    self.assertEqual(event_source_heap.data_size, 223)
+    self.assertEqual(number_of_warnings, 1)
+    self.assertEqual(test_engine._number_of_consumed_sources, 1)
+
+  def testProcessSource(self):
+    """Tests the PreprocessSource and ProcessSource functions."""
+    test_engine = extraction_engine.ExtractionMultiProcessEngine(
+        maximum_number_of_tasks=100)
+
+    self._ProcessSource(test_engine)
+
+  def testProcessSourceWithTaskBatches(self):
+    """Tests the ProcessSource function with batch tasks."""
+    test_engine = extraction_engine.ExtractionMultiProcessEngine(
+        maximum_number_of_tasks=100, task_batch_size=10)
+
+    self._ProcessSource(test_engine)
+
+  def testProcessSourceWithRecordRanges(self):
+    """Tests the ProcessSource function with record ranges."""
+    test_artifacts_path = shared_test_lib.GetTestFilePath(['artifacts'])
+    self._SkipIfPathNotExists(test_artifacts_path)
+
+    test_file_path = self._GetTestFilePath(['System.evtx'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    test_engine = extraction_engine.ExtractionMultiProcessEngine(
+        maximum_number_of_tasks=100)
+    test_engine.BuildArtifactsRegistry(test_artifacts_path, None)
+
+    session = sessions.Session()
+
+    processing_configuration = configurations.ProcessingConfiguration()
+    processing_configuration.data_location = shared_test_lib.DATA_PATH
+    processing_configuration.extraction.hasher_names_string = 'sha256'
+    processing_configuration.extraction.record_range_data_size = 256 * 1024
+    processing_configuration.parser_filter_expression = 'winevtx'
+    processing_configuration.task_storage_format = (
+        definitions.STORAGE_FORMAT_SQLITE)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      source_path = os.path.join(temp_directory, 'source')
+      os.mkdir(source_path)
+      shutil.copyfile(
+          test_file_path, os.path.join(source_path, 'System.evtx'))
+
+      source_path_spec = path_spec_factory.Factory.NewPathSpec(
+          dfvfs_definitions.TYPE_INDICATOR_OS, location=source_path)
+
+      temp_file = os.path.join(temp_directory, 'storage.plaso')
+      storage_writer = sqlite_writer.SQLiteStorageWriter()
+      storage_writer.Open(path=temp_file)
+
+      try:
+        system_configurations = test_engine.PreprocessSource(
+            [source_path_spec], storage_writer)
+
+        processing_status = test_engine.ProcessSourceMulti(
+            storage_writer, session.identifier, processing_configuration,
+            system_configurations, [source_path_spec],
+            storage_file_path=temp_directory)
+
+        event_data_streams = list(storage_writer.GetAttributeContainers(
+            'event_data_stream'))
+        event_data_stream_identifiers = set(
+            event_data.GetEventDataStreamIdentifier().CopyToString()
+            for event_data in storage_writer.GetAttributeContainers(
+                'event_data'))
+        number_of_event_data = storage_writer.GetNumberOfAttributeContainers(
+            'event_data')
+
+      finally:
+        storage_writer.Close()
+
+    self.assertFalse(processing_status.aborted)
+
+    self.assertEqual(number_of_event_data, 1601)
+
+    # The event data of all record ranges share the event data stream of
+    # the data stream as a whole.
+    self.assertEqual(len(event_data_streams), 1)
+    self.assertIsNotNone(event_data_streams[0].sha256_hash)
+    self.assertEqual(event_data_stream_identifiers, set([
+        event_data_streams[0].GetIdentifier().CopyToString()]))
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -6,6 +6,7 @@ import unittest
 
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.path import factory as path_spec_factory
+from dfvfs.path import fake_path_spec
 
 from plaso.containers import sessions
 from plaso.containers import tasks
@@ -146,6 +147,32 @@ class WorkerProcessTest(test_lib.MultiProcessingTestCase):
       task = tasks.Task(session_identifier=session.identifier)
       test_process._ProcessTask(task)
 
+  def testProcessTaskWithBatchTask(self):
+    """Tests the _ProcessTask function with a batch task."""
+    session = sessions.Session()
+    with shared_test_lib.TempDirectory() as temp_directory:
+      configuration = configurations.ProcessingConfiguration()
+      configuration.task_storage_path = temp_directory
+      configuration.task_storage_format = definitions.STORAGE_FORMAT_SQLITE
+
+      test_process = extraction_process.ExtractionWorkerProcess(
+          None, configuration, [], [], None, name='TestWorker')
+      test_process._extraction_worker = TestEventExtractionWorker()
+
+      task_storage_writer = self._CreateStorageWriter()
+      test_process._parser_mediator = self._CreateParserMediator(
+          task_storage_writer)
+
+      task = tasks.Task(session_identifier=session.identifier)
+      task.path_specs = [
+          fake_path_spec.FakePathSpec(location='/file1'),
+          fake_path_spec.FakePathSpec(location='/file2')]
+      task.path_spec = task.path_specs[0]
+
+      test_process._ProcessTask(task)
+
+      self.assertEqual(test_process._number_of_consumed_sources, 2)
+
   def testStartAndStopProfiling(self):
     """Tests the _StartProfiling and _StopProfiling functions."""
     with shared_test_lib.TempDirectory() as temp_directory:
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the classes to assist in merging attribute containers of tasks."""
+
+import unittest
+
+from acstore.containers import interface as containers_interface
+
+from plaso.containers import events
+from plaso.multi_process import merge_helpers
+from plaso.storage.fake import fake_store
+
+from tests import test_lib as shared_test_lib
+
+
+class _FailingFakeStore(fake_store.FakeStore):
+  """Fake store that fails to read event data."""
+
+  def GetAttributeContainers(self, container_type, filter_expression=None):
+    """Retrieves a specific type of attribute containers.
+
+    Args:
+      container_type (str): attribute container type.
+      filter_expression (Optional[str]): expression to filter the resulting
+          attribute containers by.
+
+    Yields:
+      AttributeContainer: attribute container.
+
+    Raises:
+      IOError: if the attribute container type is event data.
+    """
+    if container_type == events.EventData.CONTAINER_TYPE:
+      raise IOError('Unable to read event data.')
+
+    yield from super(_FailingFakeStore, self).GetAttributeContainers(
+        container_type, filter_expression=filter_expression)
+
+
+class ExtractionTaskMergeHelperTest(shared_test_lib.BaseTestCase):
+  """Tests for the helper for merging attribute containers of a task."""
+
+  def _CreateTaskStore(self, task_store_class=fake_store.FakeStore):
+    """Creates a task store with event data streams and event data.
+
+    Args:
+      task_store_class (Optional[type]): class of the task store.
+
+    Returns:
+      FakeStore: task store.
+    """
+    task_store = task_store_class()
+    task_store.Open()
+
+    for _ in range(3):
+      task_store.AddAttributeContainer(events.EventDataStream())
+
+    for _ in range(2):
+      task_store.AddAttributeContainer(events.EventData())
+
+    return task_store
+
+  def testGetAttributeContainers(self):
+    """Tests the GetAttributeContainers function."""
+    task_store = self._CreateTaskStore()
+
+    merge_helper = merge_helpers.ExtractionTaskMergeHelper(
+        task_store, 'task')
+
+    containers = merge_helper.GetAttributeContainers(
+        maximum_number_of_containers=2)
+    self.assertEqual(len(containers), 2)
+    self.assertEqual(containers[0].CONTAINER_TYPE, 'event_data_stream')
+
+    containers = merge_helper.GetAttributeContainers()
+    self.assertEqual(len(containers), 1)
+    self.assertEqual(containers[0].CONTAINER_TYPE, 'event_data_stream')
+
+    containers = merge_helper.GetAttributeContainers()
+    self.assertEqual(len(containers), 2)
+    self.assertEqual(containers[0].CONTAINER_TYPE, 'event_data')
+
+    containers = merge_helper.GetAttributeContainers()
+    self.assertEqual(len(containers), 0)
+    self.assertTrue(merge_helper.fully_merged)
+
+  def testGetAttributeContainersWithReadError(self):
+    """Tests the GetAttributeContainers function with a read error."""
+    task_store = self._CreateTaskStore(task_store_class=_FailingFakeStore)
+
+    merge_helper = merge_helpers.ExtractionTaskMergeHelper(
+        task_store, 'task')
+
+    with self.assertRaises(IOError):
+      merge_helper.GetAttributeContainers()
+
+    self.assertFalse(merge_helper.fully_merged)
+
+  def testGetAttributeContainerIdentifier(self):
+    """Tests the GetAttributeContainerIdentifier function."""
+    merge_helper = merge_helpers.ExtractionTaskMergeHelper(None, 'task')
+
+    task_identifiers = [
+        containers_interface.AttributeContainerIdentifier(
+            name='event_data_stream', sequence_number=sequence_number)
+        for sequence_number in (1, 2, 3, 5)]
+    identifiers = [
+        containers_interface.AttributeContainerIdentifier(
+            name='event_data_stream', sequence_number=sequence_number)
+        for sequence_number in (11, 12, 20, 21)]
+
+    merge_helper.SetAttributeContainerIdentifiers(task_identifiers, identifiers)
+
+    expected_sequence_numbers = [(1, 11), (2, 12), (3, 20), (5, 21)]
+    for task_sequence_number, expected_sequence_number in (
+        expected_sequence_numbers):
+      task_identifier = containers_interface.AttributeContainerIdentifier(
+          name='event_data_stream', sequence_number=task_sequence_number)
+      identifier = merge_helper.GetAttributeContainerIdentifier(
+          task_identifier)
+      self.assertIsNotNone(identifier)
+      self.assertEqual(identifier.name, 'event_data_stream')
+      self.assertEqual(identifier.sequence_number, expected_sequence_number)
+
+    for task_sequence_number in (0, 4, 6):
+      task_identifier = containers_interface.AttributeContainerIdentifier(
+          name='event_data_stream', sequence_number=task_sequence_number)
+      identifier = merge_helper.GetAttributeContainerIdentifier(
+          task_identifier)
+      self.assertIsNone(identifier)
+
+    task_identifier = containers_interface.AttributeContainerIdentifier(
+        name='windows_eventlog_message_file', sequence_number=1)
+    identifier = merge_helper.GetAttributeContainerIdentifier(task_identifier)
+    self.assertIsNone(identifier)
+
+
+if __name__ == '__main__':
+  unittest.main()
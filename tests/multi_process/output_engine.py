@@ -7,6 +7,7 @@ import os
 import unittest
 
 from plaso.engine import configurations
+from plaso.filters import event_filter
 from plaso.lib import definitions
 from plaso.multi_process import output_engine
 from plaso.output import dynamic
@@ -162,6 +163,19 @@ class PsortEventHeapTest(test_lib.MultiProcessingTestCase):
     event_heap.PushEvent(event, event_data, event_data_stream)
 
     self.assertEqual(len(event_heap._heap), 1)
+    self.assertIsInstance(event_heap._heap[0][0], int)
+
+    # Test with an event values hash stored by an older version of plaso.
+    event, event_data, event_data_stream = (
+        containers_test_lib.CreateEventFromValues(self._TEST_EVENTS[1]))
+    event_data._event_values_hash = '31aac7b1f8c1446f4b638c0dc5f92981'
+    event_heap.PushEvent(event, event_data, event_data_stream)
+
+    self.assertEqual(len(event_heap._heap), 2)
+
+    event_values_hashes = sorted(
+        heap_values[0] for heap_values in event_heap._heap)
+    self.assertIn(0x31aac7b1f8c1446f4b638c0dc5f92981, event_values_hashes)
 
 
 class OutputAndFormattingMultiProcessEngineTest(
@@ -306,6 +320,37 @@ class OutputAndFormattingMultiProcessEngineTest(
 
   # TODO: add test for _FlushExportBuffer.
 
+  def testInternalExportEventsWithEventFilter(self):
+    """Tests the _ExportEvents function with an event filter."""
+    formatters_directory_path = self._GetDataFilePath(['formatters'])
+
+    output_module = TestOutputModule()
+
+    test_engine = output_engine.OutputAndFormattingMultiProcessEngine()
+
+    test_filter = event_filter.EventObjectFilter()
+    test_filter.CompileFilter(
+        'timestamp > "5134324321" and data_type is "test:event"')
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'storage.plaso')
+      self._CreateTestStorageFile(temp_file)
+
+      storage_reader = (
+          storage_factory.StorageFactory.CreateStorageReaderForFile(temp_file))
+
+      output_mediator_object = output_mediator.OutputMediator(
+          storage_reader, data_location=shared_test_lib.TEST_DATA_PATH)
+      output_mediator_object.ReadMessageFormattersFromDirectory(
+          formatters_directory_path)
+
+      test_engine._ExportEvents(
+          storage_reader, output_module, deduplicate_events=False,
+          event_filter=test_filter)
+
+    self.assertEqual(len(output_module.events), 10)
+    self.assertEqual(test_engine._events_status.number_of_filtered_events, 7)
+
   def testExportEvents(self):
     """Tests the ExportEvents function."""
     test_file_path = self._GetTestFilePath(['psort_test.plaso'])
@@ -343,6 +388,43 @@ class OutputAndFormattingMultiProcessEngineTest(
         'repeated')
     self.assertEqual(lines[14], expected_line)
 
+  def testExportEventsWithWorkerProcesses(self):
+    """Tests the ExportEvents function with output formatting processes."""
+    test_file_path = self._GetTestFilePath(['psort_test.plaso'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    configuration = configurations.ProcessingConfiguration()
+    configuration.data_location = shared_test_lib.DATA_PATH
+    configuration.preferred_language = 'en-US'
+
+    outputs = []
+    for number_of_worker_processes in (0, 2):
+      test_file_object = io.StringIO()
+
+      storage_reader = (
+          storage_factory.StorageFactory.CreateStorageReaderForFile(
+              test_file_path))
+
+      output_module = dynamic.DynamicOutputModule()
+      output_module._file_object = test_file_object
+
+      test_engine = output_engine.OutputAndFormattingMultiProcessEngine()
+      test_engine._FORMATTING_BATCH_SIZE = 4
+
+      test_engine.ExportEvents(
+          storage_reader, output_module, configuration,
+          number_of_worker_processes=number_of_worker_processes,
+          storage_file_path=test_file_path)
+
+      storage_reader.Close()
+
+      outputs.append(test_file_object.getvalue())
+
+    lines = outputs[1].split('\n')
+    self.assertEqual(len(lines), 22)
+
+    self.assertEqual(outputs[1], outputs[0])
+
 
 if __name__ == '__main__':
   unittest.main()
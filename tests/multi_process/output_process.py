@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the multi-processing output formatting process."""
+
+import unittest
+
+from plaso.engine import configurations
+from plaso.multi_process import output_process
+from plaso.output import dynamic
+from plaso.output import l2t_csv
+from plaso.storage import factory as storage_factory
+
+from tests import test_lib as shared_test_lib
+from tests.multi_process import test_lib
+
+
+class OutputFunctionsTest(test_lib.MultiProcessingTestCase):
+  """Tests the output formatting functions."""
+
+  def testFormatOutputEntries(self):
+    """Tests the FormatOutputEntries function."""
+    test_file_path = self._GetTestFilePath(['psort_test.plaso'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    configuration = configurations.ProcessingConfiguration()
+    configuration.data_location = shared_test_lib.DATA_PATH
+
+    storage_reader = storage_factory.StorageFactory.CreateStorageReaderForFile(
+        test_file_path)
+
+    try:
+      output_mediator = output_process.CreateOutputMediator(
+          storage_reader, configuration)
+
+      output_entries = []
+      for event in storage_reader.GetSortedEvents():
+        event_data_identifier = event.GetEventDataIdentifier()
+        event_data = storage_reader.GetAttributeContainerByIdentifier(
+            'event_data', event_data_identifier)
+
+        output_entries.append((False, [(event, event_data, None, None)]))
+        if len(output_entries) == 2:
+          break
+
+      output_entries.append((True, [
+          output_entries[0][1][0], output_entries[1][1][0]]))
+
+      output_module = dynamic.DynamicOutputModule()
+      formatted_entries = output_process.FormatOutputEntries(
+          output_module, output_mediator, output_entries)
+
+      self.assertEqual(len(formatted_entries), 3)
+
+      is_macb_group, field_values = formatted_entries[0]
+      self.assertFalse(is_macb_group)
+      self.assertIsInstance(field_values, dict)
+
+      is_macb_group, field_values = formatted_entries[2]
+      self.assertTrue(is_macb_group)
+      self.assertEqual(len(field_values), 2)
+
+      output_module = l2t_csv.L2TCSVOutputModule()
+      formatted_entries = output_process.FormatOutputEntries(
+          output_module, output_mediator, output_entries[2:])
+
+      is_macb_group, field_values = formatted_entries[0]
+      self.assertTrue(is_macb_group)
+      self.assertEqual(len(field_values), 1)
+
+    finally:
+      storage_reader.Close()
+
+
+class OutputFormattingProcessTest(test_lib.MultiProcessingTestCase):
+  """Tests the multi-processing output formatting process."""
+
+  # pylint: disable=protected-access
+
+  def testInitialization(self):
+    """Tests the initialization."""
+    configuration = configurations.ProcessingConfiguration()
+
+    test_process = output_process.OutputFormattingProcess(
+        None, None, None, configuration, None, name='TestFormatter')
+    self.assertIsNotNone(test_process)
+
+  def testGetStatus(self):
+    """Tests the _GetStatus function."""
+    configuration = configurations.ProcessingConfiguration()
+
+    test_process = output_process.OutputFormattingProcess(
+        None, None, None, configuration, None, name='TestFormatter')
+    status_attributes = test_process._GetStatus()
+
+    self.assertIsNotNone(status_attributes)
+    self.assertEqual(status_attributes['identifier'], 'TestFormatter')
+    self.assertEqual(status_attributes['number_of_consumed_events'], 0)
+
+  def testSignalAbort(self):
+    """Tests the SignalAbort function."""
+    configuration = configurations.ProcessingConfiguration()
+
+    test_process = output_process.OutputFormattingProcess(
+        None, None, None, configuration, None, name='TestFormatter')
+    test_process.SignalAbort()
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -334,6 +334,39 @@ class TaskManagerTest(shared_test_lib.BaseTestCase):
 
     self.assertEqual(manager._total_number_of_tasks, 2)
 
+  def testCreateRetryTaskWithBatchTask(self):
+    """Tests the CreateRetryTask function with a batch task."""
+    manager = task_manager.TaskManager()
+    task = manager.CreateTask(self._TEST_SESSION_IDENTIFIER)
+    task.path_spec = 'test_path_spec1'
+    task.path_specs = ['test_path_spec1', 'test_path_spec2']
+
+    manager._AbandonQueuedTasks()
+
+    self.assertEqual(len(manager._tasks_abandoned), 1)
+    self.assertTrue(manager._HasTasksPendingRetry())
+
+    retry_task = manager.CreateRetryTask()
+    self.assertIsNotNone(retry_task)
+    self.assertEqual(retry_task.path_spec, 'test_path_spec1')
+    self.assertIsNone(retry_task.path_specs)
+
+    self.assertTrue(task.has_retry)
+    self.assertTrue(manager._HasTasksPendingRetry())
+
+    retry_task = manager.CreateRetryTask()
+    self.assertIsNotNone(retry_task)
+    self.assertEqual(retry_task.path_spec, 'test_path_spec2')
+    self.assertIsNone(retry_task.path_specs)
+
+    self.assertFalse(manager._HasTasksPendingRetry())
+
+    retry_task = manager.CreateRetryTask()
+    self.assertIsNone(retry_task)
+
+    self.assertEqual(len(manager._tasks_queued), 2)
+    self.assertEqual(manager._total_number_of_tasks, 3)
+
   def testCreateTask(self):
     """Tests the CreateTask function."""
     manager = task_manager.TaskManager()
@@ -10,22 +10,6 @@ from plaso.multi_process import zeromq_queue
 from tests import test_lib as shared_test_lib
 
 
-class ZeroMQPullBindQueue(zeromq_queue.ZeroMQPullQueue):
-  """A Plaso queue backed by a ZeroMQ PULL socket that binds to a port.
-
-  This queue may only be used to pop items, not to push.
-  """
-  SOCKET_CONNECTION_TYPE = zeromq_queue.ZeroMQQueue.SOCKET_CONNECTION_BIND
-
-
-class ZeroMQPushConnectQueue(zeromq_queue.ZeroMQPushQueue):
-  """A Plaso queue backed by a ZeroMQ PUSH socket that connects to a port.
-
-  This queue may only be used to push items, not to pop.
-  """
-  SOCKET_CONNECTION_TYPE = zeromq_queue.ZeroMQQueue.SOCKET_CONNECTION_CONNECT
-
-
 class ZeroMQRequestBindQueue(zeromq_queue.ZeroMQRequestQueue):
   """A Plaso queue backed by a ZeroMQ REQ socket that binds to a port.
 
@@ -48,7 +32,7 @@ class ZeroMQQueuesTest(shared_test_lib.BaseTestCase):
   # pylint: disable=protected-access
 
   _QUEUE_CLASSES = frozenset([
-      zeromq_queue.ZeroMQPushBindQueue, ZeroMQPullBindQueue,
+      zeromq_queue.ZeroMQPushBindQueue, zeromq_queue.ZeroMQPullBindQueue,
       ZeroMQRequestBindQueue])
 
   def _testItemTransferred(self, push_queue, pop_queue):
@@ -78,9 +62,9 @@ class ZeroMQQueuesTest(shared_test_lib.BaseTestCase):
     self._testItemTransferred(push_queue, pull_queue)
     push_queue.Close()
     pull_queue.Close()
-    pull_queue = ZeroMQPullBindQueue(
+    pull_queue = zeromq_queue.ZeroMQPullBindQueue(
         name='pushpull_pullbind', delay_open=False, linger_seconds=1)
-    push_queue = ZeroMQPushConnectQueue(
+    push_queue = zeromq_queue.ZeroMQPushConnectQueue(
         name='pushpull_pushconnect', delay_open=False, port=pull_queue.port,
         linger_seconds=1)
     self._testItemTransferred(push_queue, pull_queue)
@@ -5,6 +5,8 @@
 import platform
 import unittest
 
+from acstore.containers import interface as containers_interface
+
 from dfdatetime import posix_time as dfdatetime_posix_time
 from dfdatetime import semantic_time as dfdatetime_semantic_time
 
@@ -277,6 +279,40 @@ class FieldFormattingHelperTest(test_lib.OutputModuleTestCase):
         'for user root)')
     self.assertEqual(message_string, expected_message_string)
 
+  def testFormatMessageWithFormattingCache(self):
+    """Tests the _FormatMessage function with the formatting cache."""
+    output_mediator = self._CreateOutputMediator()
+
+    formatters_directory_path = self._GetTestFilePath(['formatters'])
+    output_mediator.ReadMessageFormattersFromDirectory(
+        formatters_directory_path)
+
+    test_helper = formatting_helper.FieldFormattingHelper()
+
+    event, event_data, event_data_stream = (
+        containers_test_lib.CreateEventFromValues(self._TEST_EVENTS[0]))
+    event_data.SetIdentifier(containers_interface.AttributeContainerIdentifier(
+        name='event_data', sequence_number=1))
+
+    expected_message_string = (
+        'Reporter <CRON> PID: 8442 (pam_unix(cron:session): session closed '
+        'for user root)')
+
+    message_string = test_helper._FormatMessage(
+        output_mediator, event, event_data, event_data_stream)
+    self.assertEqual(message_string, expected_message_string)
+
+    message_string = test_helper._FormatMessage(
+        output_mediator, event, event_data, event_data_stream)
+    self.assertEqual(message_string, expected_message_string)
+
+    message_short_string = test_helper._FormatMessageShort(
+        output_mediator, event, event_data, event_data_stream)
+    self.assertEqual(message_short_string, expected_message_string)
+
+    self.assertEqual(output_mediator.number_of_formatting_cache_hits, 2)
+    self.assertEqual(output_mediator.number_of_formatting_cache_misses, 1)
+
   def testFormatMessageShort(self):
     """Tests the _FormatMessageShort function."""
     output_mediator = self._CreateOutputMediator()
@@ -4,7 +4,10 @@
 
 import unittest
 
+from acstore.containers import interface as containers_interface
+
 from plaso.containers import artifacts
+from plaso.containers import events
 from plaso.lib import definitions
 from plaso.storage.fake import writer as fake_writer
 from plaso.output import mediator
@@ -51,6 +54,51 @@ class OutputMediatorTest(test_lib.OutputModuleTestCase):
 
   # TODO: add tests for GetDisplayNameForPathSpec
 
+  def testCacheFormattedEventValues(self):
+    """Tests the CacheFormattedEventValues function."""
+    output_mediator = mediator.OutputMediator(None)
+    output_mediator._MAXIMUM_NUMBER_OF_CACHED_FORMATTED_EVENT_VALUES = 2
+
+    event_data_list = []
+    for sequence_number in range(1, 4):
+      event_data = events.EventData(data_type='test:event')
+      event_data_identifier = containers_interface.AttributeContainerIdentifier(
+          name='event_data', sequence_number=sequence_number)
+      event_data.SetIdentifier(event_data_identifier)
+      event_data_list.append(event_data)
+
+    output_mediator.CacheFormattedEventValues(event_data_list[0], 'values1')
+    output_mediator.CacheFormattedEventValues(event_data_list[1], 'values2')
+    self.assertEqual(len(output_mediator._formatting_cache), 2)
+
+    # Retrieving the first values makes the second values least recently used.
+    formatted_event_values = output_mediator.GetCachedFormattedEventValues(
+        event_data_list[0])
+    self.assertEqual(formatted_event_values, 'values1')
+
+    output_mediator.CacheFormattedEventValues(event_data_list[2], 'values3')
+    self.assertEqual(len(output_mediator._formatting_cache), 2)
+
+    formatted_event_values = output_mediator.GetCachedFormattedEventValues(
+        event_data_list[1])
+    self.assertIsNone(formatted_event_values)
+
+    formatted_event_values = output_mediator.GetCachedFormattedEventValues(
+        event_data_list[2])
+    self.assertEqual(formatted_event_values, 'values3')
+
+    # Event data without an identifier is not cached.
+    event_data = events.EventData(data_type='test:event')
+    output_mediator.CacheFormattedEventValues(event_data, 'values4')
+    self.assertEqual(len(output_mediator._formatting_cache), 2)
+
+    formatted_event_values = output_mediator.GetCachedFormattedEventValues(
+        event_data)
+    self.assertIsNone(formatted_event_values)
+
+    self.assertEqual(output_mediator.number_of_formatting_cache_hits, 2)
+    self.assertEqual(output_mediator.number_of_formatting_cache_misses, 2)
+
   def testGetHostname(self):
     """Tests the GetHostname function."""
     system_configuration = artifacts.SystemConfigurationArtifact()
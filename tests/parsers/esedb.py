@@ -82,5 +82,22 @@ class ESEDBParserTest(test_lib.ParserTestCase):
     self.assertEqual(test_warning.message, expected_message)
 
 
+  def testParseByRecordRanges(self):
+    """Tests the Parse function with record ranges."""
+    parser = esedb.ESEDBParser()
+    storage_writer = self._ParseFile(['Catalog1.edb'], parser)
+
+    expected_event_data_values = self._GetSortedEventDataValues(storage_writer)
+
+    # Note that the tables of the database are split into record ranges and
+    # that the test file only contains a single table that is parsed.
+    storage_writer, number_of_record_ranges = self._ParseFileByRecordRanges(
+        ['Catalog1.edb'], parser, 256 * 1024)
+
+    self.assertEqual(number_of_record_ranges, 1)
+
+    event_data_values = self._GetSortedEventDataValues(storage_writer)
+    self.assertEqual(event_data_values, expected_event_data_values)
+
 if __name__ == '__main__':
   unittest.main()
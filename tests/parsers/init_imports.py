@@ -6,6 +6,8 @@ import glob
 import os
 import unittest
 
+from plaso.parsers import manifest
+
 from tests import test_lib
 
 
@@ -18,14 +20,32 @@ class ParserImportTest(test_lib.ImportCheckTestCase):
       'interface.py',
       'logger.py',
       'manager.py',
+      'manifest.py',
       'mediator.py',
       'plugins.py',
       'presets.py'])
 
-  def testParsersImported(self):
-    """Tests that all parsers are imported."""
-    self._AssertFilesImportedInInit(
-        test_lib.PARSERS_PATH, self._IGNORABLE_FILES)
+  # Modules that only define base classes and do not register a parser.
+  _BASE_CLASS_FILES = frozenset([
+      'dsv_parser.py'])
+
+  def testParsersInManifest(self):
+    """Tests that all parsers are defined in the parsers manifest."""
+    module_names = set()
+    for parser_module_names in manifest.PARSER_MODULES.values():
+      module_names.update(parser_module_names)
+
+    for filename in os.listdir(test_lib.PARSERS_PATH):
+      if (filename in self._IGNORABLE_FILES or
+          filename in self._BASE_CLASS_FILES):
+        continue
+      if self._FILENAME_REGEXP.search(filename):
+        module_name, _, _ = filename.partition('.')
+        module_name = 'plaso.parsers.{0:s}'.format(module_name)
+
+        self.assertIn(
+            module_name, module_names,
+            '{0:s} not defined in parsers manifest'.format(module_name))
 
   def testPluginsImported(self):
     """Tests that all plugins are imported."""
@@ -152,6 +152,21 @@ class ParsersManagerTest(shared_test_lib.BaseTestCase):
 
     self.assertIn('winreg', parsers_names)
 
+  def testGetNamesWithParseCacheSupport(self):
+    """Tests the GetNamesWithParseCacheSupport function."""
+    parsers_names = manager.ParsersManager.GetNamesWithParseCacheSupport()
+
+    self.assertIn('text', parsers_names)
+    self.assertIn('syslog', parsers_names)
+    self.assertIn('winevtx', parsers_names)
+
+    # Parsers of which the results depend on more than the content and name
+    # of the data stream must not support the parse cache.
+    self.assertNotIn('lnk', parsers_names)
+    self.assertNotIn('onedrive_log', parsers_names)
+    self.assertNotIn('spotlight_storedb', parsers_names)
+    self.assertNotIn('sqlite', parsers_names)
+
   def testGetParserPluginsInformation(self):
     """Tests the GetParserPluginsInformation function."""
     plugins_information = manager.ParsersManager.GetParserPluginsInformation()
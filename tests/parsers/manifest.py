@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the parsers manifest."""
+
+import importlib
+import unittest
+
+from plaso.parsers import manager
+from plaso.parsers import manifest
+
+from tests import test_lib as shared_test_lib
+
+
+class ParsersManifestTest(shared_test_lib.BaseTestCase):
+  """Tests for the parsers manifest."""
+
+  # pylint: disable=protected-access
+
+  def testParserModules(self):
+    """Tests that the modules in the manifest register the parsers."""
+    for parser_name, module_names in manifest.PARSER_MODULES.items():
+      for module_name in module_names:
+        importlib.import_module(module_name)
+
+      parser_class = manager.ParsersManager._parser_classes.get(
+          parser_name, None)
+      self.assertIsNotNone(parser_class, parser_name)
+      self.assertEqual(parser_class.__module__, module_names[0])
+
+      if parser_class.SupportsPlugins():
+        for _, plugin_class in parser_class.GetPlugins():
+          package_name, _, _ = plugin_class.__module__.rpartition('.')
+          self.assertIn(package_name, module_names[1:])
+
+  def testRegisteredParsers(self):
+    """Tests that all registered parsers are defined in the manifest."""
+    manager.ParsersManager._ImportParserModules()
+
+    for parser_name in manager.ParsersManager._parser_classes.keys():
+      self.assertIn(parser_name, manifest.PARSER_MODULES)
+
+
+if __name__ == '__main__':
+  unittest.main()
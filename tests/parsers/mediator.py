@@ -131,6 +131,56 @@ class ParsersMediatorTest(test_lib.ParserTestCase):
 
     # TODO: improve test coverage.
 
+  def testGetRecordRange(self):
+    """Tests the GetRecordRange function."""
+    test_file_path = self._GetTestFilePath(['System.evtx'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    parser_mediator = mediator.ParserMediator()
+
+    storage_writer = fake_writer.FakeStorageWriter()
+    parser_mediator.SetStorageWriter(storage_writer)
+
+    storage_writer.Open()
+
+    os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(os_path_spec)
+    parser_mediator.SetFileEntry(file_entry)
+
+    parser_mediator.AppendToParserChain('winevtx')
+
+    record_range = parser_mediator.GetRecordRange(1601)
+    self.assertEqual(record_range, (0, 1601))
+
+    number_of_event_sources = storage_writer.GetNumberOfAttributeContainers(
+        'record_range_event_source')
+    self.assertEqual(number_of_event_sources, 0)
+
+    parser_mediator.SetRecordRangeDataSize(256 * 1024)
+
+    record_range = parser_mediator.GetRecordRange(1601)
+    self.assertEqual(record_range, (0, 401))
+
+    event_sources = list(storage_writer.GetAttributeContainers(
+        'record_range_event_source'))
+    self.assertEqual(len(event_sources), 3)
+
+    self.assertEqual(event_sources[2].first_record_index, 1203)
+    self.assertEqual(event_sources[2].number_of_records, 398)
+    self.assertEqual(event_sources[2].parser_name, 'winevtx')
+    self.assertEqual(event_sources[2].path_spec, os_path_spec)
+
+    parser_mediator.SetRecordRange(1203, 401)
+
+    record_range = parser_mediator.GetRecordRange(1601)
+    self.assertEqual(record_range, (1203, 398))
+
+    parser_mediator.SetRecordRange(None, None)
+
+    record_range = parser_mediator.GetRecordRange(1)
+    self.assertEqual(record_range, (0, 1))
+
   # TODO: add tests for GetParserChain.
   # TODO: add tests for GetRelativePathForPathSpec.
   # TODO: add tests for PopFromParserChain.
@@ -233,6 +283,99 @@ class ParsersMediatorTest(test_lib.ParserTestCase):
 
     parser_mediator.SetStorageWriter(None)
 
+  def testStartAndStopDeferringEventData(self):
+    """Tests the Start and StopDeferringEventData functions."""
+    parser_mediator = mediator.ParserMediator()
+
+    storage_writer = fake_writer.FakeStorageWriter()
+    parser_mediator.SetStorageWriter(storage_writer)
+
+    storage_writer.Open()
+
+    event_data_stream = events.EventDataStream()
+    parser_mediator.ProduceEventDataStream(event_data_stream)
+
+    parser_mediator.StartDeferringEventData()
+
+    event_data = events.EventData()
+    event_data._parser_chain = 'test_parser'
+    event_data.data_type = 'test'
+
+    parser_mediator.ProduceEventData(event_data)
+    self.assertEqual(parser_mediator.number_of_produced_event_data, 1)
+
+    # A parser can produce another event data stream while deferring.
+    other_event_data_stream = events.EventDataStream()
+    parser_mediator.ProduceEventDataStream(other_event_data_stream)
+
+    other_event_data = events.EventData()
+    other_event_data._parser_chain = 'test_parser'
+    other_event_data.data_type = 'test'
+
+    parser_mediator.ProduceEventData(other_event_data)
+
+    number_of_event_data = storage_writer.GetNumberOfAttributeContainers(
+        'event_data')
+    self.assertEqual(number_of_event_data, 0)
+
+    event_data_stream.md5_hash = 'd41d8cd98f00b204e9800998ecf8427e'
+
+    parser_mediator.StopDeferringEventData()
+
+    number_of_event_data = storage_writer.GetNumberOfAttributeContainers(
+        'event_data')
+    self.assertEqual(number_of_event_data, 2)
+
+    expected_event_values_hash = events.CalculateEventValuesHash(
+        event_data, event_data_stream)
+    self.assertEqual(
+        event_data._event_values_hash, expected_event_values_hash)
+
+    expected_event_values_hash = events.CalculateEventValuesHash(
+        other_event_data, other_event_data_stream)
+    self.assertEqual(
+        other_event_data._event_values_hash, expected_event_values_hash)
+
+    event_data_stream = storage_writer.GetAttributeContainerByIdentifier(
+        'event_data_stream', event_data_stream.GetIdentifier())
+    self.assertEqual(
+        event_data_stream.md5_hash, 'd41d8cd98f00b204e9800998ecf8427e')
+
+  def testStartAndStopRecordingAttributeContainers(self):
+    """Tests the Start and StopRecordingAttributeContainers functions."""
+    parser_mediator = mediator.ParserMediator()
+
+    storage_writer = fake_writer.FakeStorageWriter()
+    parser_mediator.SetStorageWriter(storage_writer)
+
+    storage_writer.Open()
+
+    event_data = events.EventData()
+    event_data._parser_chain = 'test_parser'
+    event_data.data_type = 'test'
+
+    parser_mediator.ProduceEventData(event_data)
+
+    parser_mediator.StartRecordingAttributeContainers()
+
+    event_data = events.EventData()
+    event_data._parser_chain = 'test_parser'
+    event_data.data_type = 'test'
+
+    parser_mediator.ProduceEventData(event_data)
+    parser_mediator.ProduceExtractionWarning('test')
+
+    attribute_containers = parser_mediator.StopRecordingAttributeContainers()
+    self.assertEqual(len(attribute_containers), 2)
+    self.assertEqual(attribute_containers[0].CONTAINER_TYPE, 'event_data')
+    self.assertEqual(
+        attribute_containers[1].CONTAINER_TYPE, 'extraction_warning')
+
+    parser_mediator.ProduceExtractionWarning('test')
+
+    attribute_containers = parser_mediator.StopRecordingAttributeContainers()
+    self.assertEqual(attribute_containers, [])
+
   def testSignalAbort(self):
     """Tests the SignalAbort function."""
     parser_mediator = mediator.ParserMediator()
@@ -97,6 +97,25 @@ class NTFSMFTParserTest(test_lib.ParserTestCase):
     event_data = storage_writer.GetAttributeContainerByIndex('event_data', 920)
     self.CheckEventData(event_data, expected_event_values)
 
+  def testParseFileByRecordRanges(self):
+    """Tests the Parse function on a $MFT file with record ranges."""
+    parser = ntfs.NTFSMFTParser()
+    storage_writer = self._ParseFile(['MFT'], parser)
+
+    expected_event_data_values = self._GetSortedEventDataValues(storage_writer)
+
+    storage_writer, number_of_record_ranges = self._ParseFileByRecordRanges(
+        ['MFT'], parser, 1024 * 1024)
+
+    self.assertGreater(number_of_record_ranges, 1)
+
+    number_of_event_data = storage_writer.GetNumberOfAttributeContainers(
+        'event_data')
+    self.assertEqual(number_of_event_data, 31642)
+
+    event_data_values = self._GetSortedEventDataValues(storage_writer)
+    self.assertEqual(event_data_values, expected_event_data_values)
+
   def testParseImage(self):
     """Tests the Parse function on a storage media image."""
     parser = ntfs.NTFSMFTParser()
@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 """Tests for the SQLite database parser."""
 
+import os
 import unittest
 
 from plaso.parsers import sqlite
@@ -14,6 +15,8 @@ from tests.parsers import test_lib
 class SQLiteDatabaseTest(test_lib.ParserTestCase):
   """Tests for the SQLite database."""
 
+  # pylint: disable=protected-access
+
   # TODO: add tests for tables property
   # TODO: add tests for _CopyFileObjectToTemporaryFile
   # TODO: add tests for Open and Close
@@ -38,6 +41,62 @@ class SQLiteDatabaseTest(test_lib.ParserTestCase):
       database.Open(database_file_object)
       database.Close()
 
+  def testOpenCloseInMemory(self):
+    """Tests the Open and Close functions from memory."""
+    database_file_path = self._GetTestFilePath(['wal_database.db'])
+    self._SkipIfPathNotExists(database_file_path)
+
+    database = sqlite.SQLiteDatabase('wal_database.db')
+    with open(database_file_path, 'rb') as database_file_object:
+      database.Open(database_file_object)
+
+    try:
+      self.assertEqual(database._temp_db_file_path, '')
+      self.assertIn('MyTable', database.tables)
+
+    finally:
+      database.Close()
+
+  def testOpenCloseWithPath(self):
+    """Tests the Open and Close functions with a path."""
+    database_file_path = self._GetTestFilePath(['wal_database.db'])
+    self._SkipIfPathNotExists(database_file_path)
+
+    database = sqlite.SQLiteDatabase('wal_database.db')
+    with open(database_file_path, 'rb') as database_file_object:
+      database.Open(database_file_object, path=database_file_path)
+
+      try:
+        self.assertEqual(database._temp_db_file_path, '')
+        self.assertIn('MyTable', database.tables)
+
+        # The database is opened immutable, which does not create a shared
+        # memory file next to the database.
+        self.assertFalse(os.path.exists(
+            '{0:s}-shm'.format(database_file_path)))
+
+      finally:
+        database.Close()
+
+  def testOpenCloseWithTemporaryCopy(self):
+    """Tests the Open and Close functions with a temporary copy."""
+    database_file_path = self._GetTestFilePath(['wal_database.db'])
+    self._SkipIfPathNotExists(database_file_path)
+
+    database = sqlite.SQLiteDatabase('wal_database.db')
+    database._MAXIMUM_IN_MEMORY_SIZE = 0
+
+    with open(database_file_path, 'rb') as database_file_object:
+      database.Open(database_file_object)
+
+    temporary_file_path = database._temp_db_file_path
+    self.assertNotEqual(temporary_file_path, '')
+    self.assertTrue(os.path.exists(temporary_file_path))
+
+    database.Close()
+
+    self.assertFalse(os.path.exists(temporary_file_path))
+
   def testQueryOnDatabaseWithWAL(self):
     """Tests the Query function on a database with a WAL file."""
     database_file_path = self._GetTestFilePath(['wal_database.db'])
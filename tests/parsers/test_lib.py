@@ -83,6 +83,35 @@ class ParserTestCase(shared_test_lib.BaseTestCase):
     return storage_writer.GetAttributeContainerByIdentifier(
         events.EventData.CONTAINER_TYPE, event_data_identifier)
 
+  def _GetSortedEventDataValues(self, storage_writer):
+    """Retrieves the sorted attribute values of the event data.
+
+    Args:
+      storage_writer (FakeStorageWriter): storage writer.
+
+    Returns:
+      list[list[tuple[str, object]]]: attribute names and values of the event
+          data, where date and time values are represented as strings, sorted.
+    """
+    event_data_values = []
+    for event_data in storage_writer.GetAttributeContainers(
+        events.EventData.CONTAINER_TYPE):
+      attribute_values = []
+      for attribute_name, attribute_value in sorted(
+          event_data.GetAttributes()):
+        if attribute_name in (
+            '_event_data_stream_identifier', '_event_values_hash'):
+          continue
+
+        if isinstance(attribute_value, dfdatetime_interface.DateTimeValues):
+          attribute_value = attribute_value.CopyToDateTimeString()
+
+        attribute_values.append((attribute_name, attribute_value))
+
+      event_data_values.append(attribute_values)
+
+    return sorted(event_data_values, key=repr)
+
   def _ParseFile(self, path_segments, parser, registry_find_specs=None):
     """Parses a file with a parser and writes results to a storage writer.
 
@@ -151,6 +180,62 @@ class ParserTestCase(shared_test_lib.BaseTestCase):
 
     return storage_writer
 
+  def _ParseFileByRecordRanges(
+      self, path_segments, parser, record_range_data_size):
+    """Parses a file with a parser in record ranges.
+
+    The file is split into record ranges by parsing it with a record range
+    data size, after which the record ranges are parsed one by one, as if
+    these were parsed by separate worker processes.
+
+    Args:
+      path_segments (list[str]): path segments inside the test data directory.
+      parser (FileObjectParser): parser that supports record ranges.
+      record_range_data_size (int): approximate size of the data, in bytes,
+          of a record range.
+
+    Returns:
+      tuple[FakeStorageWriter, int]: storage writer and number of record
+          ranges.
+
+    Raises:
+      SkipTest: if the path inside the test data directory does not exist and
+          the test should be skipped.
+    """
+    test_file_path = self._GetTestFilePath(path_segments)
+    self._SkipIfPathNotExists(test_file_path)
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+
+    parser_mediator = parsers_mediator.ParserMediator()
+    parser_mediator.SetRecordRangeDataSize(record_range_data_size)
+
+    storage_writer = self._CreateStorageWriter()
+    parser_mediator.SetStorageWriter(storage_writer)
+
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(path_spec)
+    parser_mediator.SetFileEntry(file_entry)
+
+    event_data_stream = events.EventDataStream()
+    event_data_stream.path_spec = file_entry.path_spec
+
+    parser_mediator.ProduceEventDataStream(event_data_stream)
+
+    parser.Parse(parser_mediator, file_entry.GetFileObject())
+
+    record_ranges = list(storage_writer.GetAttributeContainers(
+        'record_range_event_source'))
+
+    for record_range in record_ranges:
+      parser_mediator.SetRecordRange(
+          record_range.first_record_index, record_range.number_of_records)
+      parser.Parse(parser_mediator, file_entry.GetFileObject())
+
+    parser_mediator.SetRecordRange(None, None)
+
+    return storage_writer, len(record_ranges) + 1
+
   def CheckEventData(self, event_data, expected_event_values):
     """Asserts that event data matches the expected values.
 
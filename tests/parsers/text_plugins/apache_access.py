@@ -113,6 +113,46 @@ class ApacheAccessLogTextPluginTest(test_lib.TextPluginTestCase):
     self.assertEqual(test_warning.message, expected_message)
     self.assertEqual(test_warning.parser_chain, 'text/apache_access')
 
+  def testProcessWithoutFastPath(self):
+    """Tests the Process function without the fast path."""
+    plugin = apache_access.ApacheAccessLogTextPlugin()
+    plugin._fast_path_enabled = False  # pylint: disable=protected-access
+
+    storage_writer = self._ParseTextFileWithPlugin(
+        ['apache_access.log'], plugin)
+
+    number_of_event_data = storage_writer.GetNumberOfAttributeContainers(
+        'event_data')
+    self.assertEqual(number_of_event_data, 14)
+
+    number_of_warnings = storage_writer.GetNumberOfAttributeContainers(
+        'extraction_warning')
+    self.assertEqual(number_of_warnings, 1)
+
+    number_of_warnings = storage_writer.GetNumberOfAttributeContainers(
+        'recovery_warning')
+    self.assertEqual(number_of_warnings, 0)
+
+    # Test vhost_combined log format event.
+    expected_event_values = {
+        'data_type': 'apache:access_log:entry',
+        'http_request': 'GET /wp-content/themes/darkmode/evil.php HTTP/1.1',
+        'http_request_referer': None,
+        'http_request_user_agent': (
+            'Mozilla/5.0 (Windows NT 7.1) AppleWebKit/534.30 (KHTML, like '
+            'Gecko) Chrome/12.0.742.112 Safari/534.30'),
+        'http_response_code': 200,
+        'http_response_bytes': 1063,
+        'ip_address': '192.168.0.2',
+        'port_number': 443,
+        'recorded_time': '2018-01-13T19:31:17+00:00',
+        'remote_name': None,
+        'server_name': 'plaso.log2timeline.net',
+        'user_name': None}
+
+    event_data = storage_writer.GetAttributeContainerByIndex('event_data', 8)
+    self.CheckEventData(event_data, expected_event_values)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -186,6 +186,40 @@ class WinIISTextPluginTest(test_lib.TextPluginTestCase):
         'recovery_warning')
     self.assertEqual(number_of_warnings, 0)
 
+  def testProcessWithoutFastPath(self):
+    """Tests the Process function without the fast path."""
+    plugin = iis.WinIISTextPlugin()
+    plugin._fast_path_enabled = False  # pylint: disable=protected-access
+
+    storage_writer = self._ParseTextFileWithPlugin(['iis6.log'], plugin)
+
+    number_of_event_data = storage_writer.GetNumberOfAttributeContainers(
+        'event_data')
+    self.assertEqual(number_of_event_data, 12)
+
+    number_of_warnings = storage_writer.GetNumberOfAttributeContainers(
+        'extraction_warning')
+    self.assertEqual(number_of_warnings, 0)
+
+    number_of_warnings = storage_writer.GetNumberOfAttributeContainers(
+        'recovery_warning')
+    self.assertEqual(number_of_warnings, 0)
+
+    expected_event_values = {
+        'data_type': 'iis:log:line',
+        'dest_ip': '10.10.10.100',
+        'dest_port': 80,
+        'http_method': 'GET',
+        'http_status': 200,
+        'last_written_time': '2013-07-30T00:00:00+00:00',
+        'requested_uri_stem': '/some/image/path/something.jpg',
+        'source_ip': '10.10.10.100',
+        'user_agent': (
+            'Mozilla/4.0+(compatible;+Win32;+WinHttp.WinHttpRequest.5)')}
+
+    event_data = storage_writer.GetAttributeContainerByIndex('event_data', 0)
+    self.CheckEventData(event_data, expected_event_values)
+
 
 if __name__ == '__main__':
   unittest.main()
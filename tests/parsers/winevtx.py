@@ -130,6 +130,25 @@ class WinEvtxParserTest(test_lib.ParserTestCase):
     event_data = storage_writer.GetAttributeContainerByIndex('event_data', 178)
     self.CheckEventData(event_data, expected_event_values)
 
+  def testParseByRecordRanges(self):
+    """Tests the Parse function with record ranges."""
+    parser = winevtx.WinEvtxParser()
+    storage_writer = self._ParseFile(['System.evtx'], parser)
+
+    expected_event_data_values = self._GetSortedEventDataValues(storage_writer)
+
+    storage_writer, number_of_record_ranges = self._ParseFileByRecordRanges(
+        ['System.evtx'], parser, 256 * 1024)
+
+    self.assertEqual(number_of_record_ranges, 4)
+
+    number_of_event_data = storage_writer.GetNumberOfAttributeContainers(
+        'event_data')
+    self.assertEqual(number_of_event_data, 1601)
+
+    event_data_values = self._GetSortedEventDataValues(storage_writer)
+    self.assertEqual(event_data_values, expected_event_data_values)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -11,16 +11,119 @@ from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.path import factory as path_spec_factory
 from dfvfs.resolver import resolver as path_spec_resolver
 
+from dfwinreg import definitions as dfwinreg_definitions
+from dfwinreg import fake as dfwinreg_fake
+
 from plaso.containers import events
 from plaso.engine import artifact_filters
 from plaso.parsers import mediator as parsers_mediator
 from plaso.parsers import winreg_parser
 # Register all plugins.
 from plaso.parsers import winreg_plugins  # pylint: disable=unused-import
+from plaso.parsers.winreg_plugins import interface as winreg_interface
 
 from tests.parsers import test_lib
 
 
+class TestWindowsRegistryPlugin(winreg_interface.WindowsRegistryPlugin):
+  """Windows Registry plugin for testing."""
+
+  def __init__(self, name, registry_key_filters):
+    """Initializes a Windows Registry plugin for testing.
+
+    Args:
+      name (str): name of the plugin.
+      registry_key_filters (list[BaseWindowsRegistryKeyFilter]): filters.
+    """
+    super(TestWindowsRegistryPlugin, self).__init__()
+    self.FILTERS = frozenset(registry_key_filters)
+    self.NAME = name
+
+  def ExtractEvents(self, parser_mediator, registry_key, **kwargs):
+    """Extracts events from a Windows Registry key.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfVFS.
+      registry_key (dfwinreg.WinRegistryKey): Windows Registry key.
+    """
+    return
+
+
+class WindowsRegistryPluginsIndexTest(test_lib.ParserTestCase):
+  """Tests for the Windows Registry plugins index."""
+
+  def _GetCandidatePluginNames(self, plugins_index, registry_key):
+    """Retrieves the names of the candidate plugins of a key.
+
+    Args:
+      plugins_index (WindowsRegistryPluginsIndex): plugins index.
+      registry_key (dfwinreg.WinRegistryKey): Windows Registry key.
+
+    Returns:
+      list[str]: names of the candidate plugins.
+    """
+    return [
+        plugin.NAME
+        for plugin, _ in plugins_index.GetCandidateFilters(registry_key)]
+
+  def testAddPlugin(self):
+    """Tests the AddPlugin function."""
+    plugins_index = winreg_parser.WindowsRegistryPluginsIndex()
+    self.assertEqual(plugins_index.number_of_plugins, 0)
+
+    plugin = TestWindowsRegistryPlugin('test', [
+        winreg_interface.WindowsRegistryKeyWithValuesFilter(['Start'])])
+    plugins_index.AddPlugin(plugin)
+    self.assertEqual(plugins_index.number_of_plugins, 1)
+
+  def testGetCandidateFilters(self):
+    """Tests the GetCandidateFilters function."""
+    plugins_index = winreg_parser.WindowsRegistryPluginsIndex()
+
+    plugins_index.AddPlugin(TestWindowsRegistryPlugin('values', [
+        winreg_interface.WindowsRegistryKeyWithValuesFilter([
+            'Start', 'Type'])]))
+    plugins_index.AddPlugin(TestWindowsRegistryPlugin('prefix', [
+        winreg_interface.WindowsRegistryKeyPathPrefixFilter(
+            'HKEY_LOCAL_MACHINE\\System')]))
+    plugins_index.AddPlugin(TestWindowsRegistryPlugin('suffix', [
+        winreg_interface.WindowsRegistryKeyPathSuffixFilter(
+            'Services\\Test')]))
+    plugins_index.AddPlugin(TestWindowsRegistryPlugin('key_path', [
+        winreg_interface.WindowsRegistryKeyPathFilter(
+            'HKEY_LOCAL_MACHINE\\System\\Select')]))
+
+    registry_key = dfwinreg_fake.FakeWinRegistryKey(
+        'Select', key_path_prefix='HKEY_LOCAL_MACHINE\\Software',
+        relative_key_path='Select')
+
+    plugin_names = self._GetCandidatePluginNames(plugins_index, registry_key)
+    self.assertEqual(plugin_names, [])
+
+    registry_key = dfwinreg_fake.FakeWinRegistryKey(
+        'Test', key_path_prefix='HKEY_LOCAL_MACHINE\\System',
+        relative_key_path='CurrentControlSet\\Services\\Test')
+
+    plugin_names = self._GetCandidatePluginNames(plugins_index, registry_key)
+    self.assertEqual(plugin_names, ['prefix', 'suffix'])
+
+    registry_value = dfwinreg_fake.FakeWinRegistryValue(
+        'Type', data_type=dfwinreg_definitions.REG_DWORD)
+    registry_key.AddValue(registry_value)
+
+    # The filter is indexed by the value name "Start".
+    plugin_names = self._GetCandidatePluginNames(plugins_index, registry_key)
+    self.assertEqual(plugin_names, ['prefix', 'suffix'])
+
+    registry_value = dfwinreg_fake.FakeWinRegistryValue(
+        'Start', data_type=dfwinreg_definitions.REG_DWORD)
+    registry_key.AddValue(registry_value)
+
+    plugin_names = self._GetCandidatePluginNames(plugins_index, registry_key)
+    self.assertEqual(plugin_names, ['values', 'prefix', 'suffix'])
+
+
 class WinRegistryParserTest(test_lib.ParserTestCase):
   """Tests for the Windows Registry file parser."""
 
@@ -86,6 +86,12 @@ class WindowsRegistryKeyPathPrefixFilterTest(test_lib.RegistryPluginTestCase):
         'HKEY_LOCAL_MACHINE\\System')
     self.assertEqual(path_filter.key_paths, [])
 
+  def testKeyPathPrefix(self):
+    """Tests the key_path_prefix property."""
+    path_filter = interface.WindowsRegistryKeyPathPrefixFilter(
+        'HKEY_LOCAL_MACHINE\\System')
+    self.assertEqual(path_filter.key_path_prefix, 'HKEY_LOCAL_MACHINE\\System')
+
   def testMatch(self):
     """Tests the Match function."""
     path_filter = interface.WindowsRegistryKeyPathPrefixFilter(
@@ -128,6 +134,12 @@ class WindowsRegistryKeyPathSuffixFilterTest(test_lib.RegistryPluginTestCase):
         'Windows\\Explorer')
     self.assertEqual(path_filter.key_paths, [])
 
+  def testKeyPathSuffix(self):
+    """Tests the key_path_suffix property."""
+    path_filter = interface.WindowsRegistryKeyPathSuffixFilter(
+        'Windows\\Explorer')
+    self.assertEqual(path_filter.key_path_suffix, 'Windows\\Explorer')
+
   def testMatch(self):
     """Tests the Match function."""
     path_filter = interface.WindowsRegistryKeyPathSuffixFilter(
@@ -196,6 +208,12 @@ class WindowsRegistryKeyWithValuesFilterTest(test_lib.RegistryPluginTestCase):
     result = path_filter.Match(registry_key)
     self.assertTrue(result)
 
+  def testValueNames(self):
+    """Tests the value_names property."""
+    path_filter = interface.WindowsRegistryKeyWithValuesFilter(
+        ('a', 'MRUList'))
+    self.assertEqual(path_filter.value_names, frozenset(['a', 'MRUList']))
+
 
 class WindowsRegistryPluginTest(test_lib.RegistryPluginTestCase):
   """Tests for the Windows Registry plugin interface."""
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the serializer object implementation using MessagePack."""
+
+import collections
+import unittest
+import uuid
+
+from acstore.containers import interface as containers_interface
+
+from dfdatetime import interface as dfdatetime_interface
+from dfdatetime import posix_time as dfdatetime_posix_time
+from dfdatetime import time_elements as dfdatetime_time_elements
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import fake_path_spec
+from dfvfs.path import factory as path_spec_factory
+
+import plaso
+
+from plaso.containers import event_sources
+from plaso.containers import events
+from plaso.containers import reports
+from plaso.containers import sessions
+from plaso.containers import tasks
+from plaso.lib import definitions
+from plaso.serializer import json_serializer
+from plaso.serializer import msgpack_serializer
+from plaso.storage.sqlite import sqlite_file
+
+from tests import test_lib as shared_test_lib
+
+
+class MessagePackAttributeContainerSerializerTest(
+    shared_test_lib.BaseTestCase):
+  """Tests for the MessagePack attribute container serializer object."""
+
+  # pylint: disable=protected-access
+
+  def _GetComparableDict(self, attribute_container):
+    """Retrieves a comparable dictionary of an attribute container.
+
+    Args:
+      attribute_container (AttributeContainer): attribute container.
+
+    Returns:
+      dict[str, object]: attribute values, where attribute container
+          identifiers and date and time values are converted to strings.
+    """
+    comparable_dict = {}
+    for attribute_name, attribute_value in (
+        attribute_container.CopyToDict().items()):
+      if isinstance(
+          attribute_value, containers_interface.AttributeContainerIdentifier):
+        attribute_value = attribute_value.CopyToString()
+
+      elif isinstance(attribute_value, dfdatetime_interface.DateTimeValues):
+        attribute_value = attribute_value.CopyToDateTimeStringISO8601()
+
+      comparable_dict[attribute_name] = attribute_value
+
+    return comparable_dict
+
+  def _TestReadAndWriteSerialized(self, expected_attribute_container):
+    """Tests ReadSerialized and WriteSerialized against the JSON serializer.
+
+    Args:
+      expected_attribute_container (AttributeContainer): attribute container.
+
+    Returns:
+      AttributeContainer: attribute container read from the MessagePack
+          serialized form.
+    """
+    serialized_data = (
+        msgpack_serializer.MessagePackAttributeContainerSerializer
+        .WriteSerialized(expected_attribute_container))
+
+    self.assertIsNotNone(serialized_data)
+    self.assertIsInstance(serialized_data, bytes)
+
+    attribute_container = (
+        msgpack_serializer.MessagePackAttributeContainerSerializer
+        .ReadSerialized(serialized_data))
+
+    self.assertIsNotNone(attribute_container)
+    self.assertIsInstance(
+        attribute_container, type(expected_attribute_container))
+
+    json_string = (
+        json_serializer.JSONAttributeContainerSerializer.WriteSerialized(
+            expected_attribute_container))
+    json_attribute_container = (
+        json_serializer.JSONAttributeContainerSerializer.ReadSerialized(
+            json_string))
+
+    self.assertEqual(
+        self._GetComparableDict(attribute_container),
+        self._GetComparableDict(json_attribute_container))
+
+    return attribute_container
+
+  def testReadAndWriteSerializedAnalysisReport(self):
+    """Test ReadSerialized and WriteSerialized of AnalysisReport."""
+    expected_analysis_report = reports.AnalysisReport(
+        plugin_name='chrome_extension_test', text='Report text.')
+    expected_analysis_report.time_compiled = 1431978243000000
+
+    analysis_report = self._TestReadAndWriteSerialized(
+        expected_analysis_report)
+
+    self.assertEqual(analysis_report.plugin_name, 'chrome_extension_test')
+
+  def testReadAndWriteSerializedEventData(self):
+    """Test ReadSerialized and WriteSerialized of EventData."""
+    expected_event_data = events.EventData()
+    expected_event_data._event_data_stream_identifier = 'event_data_stream.1'
+    expected_event_data._ignored = 'Not serialized'
+    expected_event_data._parser_chain = 'test_parser'
+    expected_event_data.data_type = 'test:event2'
+
+    expected_event_data.a_tuple = ('some item', [234, 52, 15])
+    expected_event_data.date_time = dfdatetime_time_elements.TimeElements(
+        time_elements_tuple=(2021, 5, 24, 6, 40, 44))
+    expected_event_data.empty_string = ''
+    expected_event_data.float = -122.082203542683
+    expected_event_data.integer = 34
+    expected_event_data.large_integer = 1 << 80
+    expected_event_data.my_list = ['asf', 4234, 2, 54, 'asf']
+    expected_event_data.negative_integer = -(1 << 70)
+    expected_event_data.null_value = None
+    expected_event_data.string = 'Normal string'
+    expected_event_data.unicode_string = 'And I am a unicorn.'
+    expected_event_data.zero_integer = 0
+
+    event_data = self._TestReadAndWriteSerialized(expected_event_data)
+
+    self.assertEqual(event_data.a_tuple, ('some item', [234, 52, 15]))
+    self.assertEqual(event_data.large_integer, 1 << 80)
+    self.assertEqual(event_data.negative_integer, -(1 << 70))
+
+    self.assertIsInstance(
+        event_data.date_time, dfdatetime_time_elements.TimeElements)
+    self.assertEqual(
+        event_data.date_time.CopyToDateTimeString(), '2021-05-24 06:40:44')
+
+  def testReadAndWriteSerializedEventDataWithIdentifier(self):
+    """Test ReadSerialized and WriteSerialized of EventData with identifier."""
+    event_data_stream_identifier = (
+        containers_interface.AttributeContainerIdentifier(
+            name='event_data_stream', sequence_number=5))
+
+    expected_event_data = events.EventData(data_type='test:event')
+    expected_event_data.SetEventDataStreamIdentifier(
+        event_data_stream_identifier)
+
+    serialized_data = (
+        msgpack_serializer.MessagePackAttributeContainerSerializer
+        .WriteSerialized(expected_event_data))
+
+    event_data = (
+        msgpack_serializer.MessagePackAttributeContainerSerializer
+        .ReadSerialized(serialized_data))
+
+    identifier = event_data.GetEventDataStreamIdentifier()
+    self.assertIsInstance(
+        identifier, containers_interface.AttributeContainerIdentifier)
+    self.assertEqual(identifier.CopyToString(), 'event_data_stream.5')
+
+  def testReadAndWriteSerializedEventDataStream(self):
+    """Test ReadSerialized and WriteSerialized of EventDataStream."""
+    test_file_path = self._GetTestFilePath(['ímynd.dd'])
+
+    volume_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    test_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_TSK, location='/',
+        parent=volume_path_spec)
+
+    expected_event_data_stream = events.EventDataStream()
+    expected_event_data_stream.md5_hash = 'e3df0d2abd2c27fbdadfb41a47442520'
+    expected_event_data_stream.path_spec = test_path_spec
+
+    event_data_stream = self._TestReadAndWriteSerialized(
+        expected_event_data_stream)
+
+    self.assertEqual(event_data_stream.path_spec, test_path_spec)
+
+  def testReadAndWriteSerializedEventObject(self):
+    """Test ReadSerialized and WriteSerialized of EventObject."""
+    test_date_time = dfdatetime_posix_time.PosixTime(timestamp=1621839644)
+
+    expected_event = events.EventObject()
+    expected_event._event_data_identifier = (
+        containers_interface.AttributeContainerIdentifier(
+            name='event_data', sequence_number=1))
+    expected_event.date_time = test_date_time
+    expected_event.timestamp = 1621839644
+    expected_event.timestamp_desc = definitions.TIME_DESCRIPTION_MODIFICATION
+
+    event = self._TestReadAndWriteSerialized(expected_event)
+
+    self.assertIsInstance(event.date_time, dfdatetime_posix_time.PosixTime)
+
+  def testReadAndWriteSerializedEventSource(self):
+    """Test ReadSerialized and WriteSerialized of EventSource."""
+    test_path_spec = fake_path_spec.FakePathSpec(location='/opt/plaso.txt')
+
+    expected_event_source = event_sources.EventSource(path_spec=test_path_spec)
+
+    event_source = self._TestReadAndWriteSerialized(expected_event_source)
+
+    self.assertEqual(event_source.path_spec, test_path_spec)
+
+  def testReadAndWriteSerializedEventTag(self):
+    """Test ReadSerialized and WriteSerialized of EventTag."""
+    expected_event_tag = events.EventTag()
+    expected_event_tag._event_identifier = (
+        containers_interface.AttributeContainerIdentifier(
+            name='event', sequence_number=1))
+    expected_event_tag.AddLabels(['Malware', 'Common'])
+
+    event_tag = self._TestReadAndWriteSerialized(expected_event_tag)
+
+    self.assertEqual(event_tag.labels, ['Malware', 'Common'])
+
+  def testReadAndWriteSerializedSession(self):
+    """Test ReadSerialized and WriteSerialized of Session."""
+    expected_session = sessions.Session()
+    expected_session.product_name = 'plaso'
+    expected_session.product_version = plaso.__version__
+
+    session = self._TestReadAndWriteSerialized(expected_session)
+
+    self.assertEqual(session.identifier, expected_session.identifier)
+
+  def testReadAndWriteSerializedTask(self):
+    """Test ReadSerialized and WriteSerialized of Task."""
+    session_identifier = '{0:s}'.format(uuid.uuid4().hex)
+
+    expected_task = tasks.Task(session_identifier=session_identifier)
+
+    task = self._TestReadAndWriteSerialized(expected_task)
+
+    self.assertEqual(task.session_identifier, session_identifier)
+
+  def testReadAndWriteSerializedValues(self):
+    """Test ReadSerialized and WriteSerialized of values without JSON type."""
+    expected_event_data = events.EventData(data_type='test:event')
+    expected_event_data.bytes_value = b'\x00\x01\xff'
+    expected_event_data.counter = collections.Counter({'a': 1, 'b': 2})
+
+    serialized_data = (
+        msgpack_serializer.MessagePackAttributeContainerSerializer
+        .WriteSerialized(expected_event_data))
+
+    event_data = (
+        msgpack_serializer.MessagePackAttributeContainerSerializer
+        .ReadSerialized(serialized_data))
+
+    self.assertEqual(event_data.bytes_value, b'\x00\x01\xff')
+    self.assertIsInstance(event_data.counter, collections.Counter)
+    self.assertEqual(event_data.counter, collections.Counter({'a': 1, 'b': 2}))
+
+  def testReadAndWriteSerializedStorageFile(self):
+    """Test ReadSerialized and WriteSerialized of a storage file."""
+    test_file_path = self._GetTestFilePath(['psort_test.plaso'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    test_store = sqlite_file.SQLiteStorageFile()
+    test_store.Open(path=test_file_path)
+
+    try:
+      for container_type in ('event_data', 'session_completion'):
+        for container in test_store.GetAttributeContainers(container_type):
+          if container_type == 'event_data':
+            # The JSON serializer does not serialize the event data stream
+            # identifier, this is done by the storage file.
+            container.SetEventDataStreamIdentifier(None)
+
+          self._TestReadAndWriteSerialized(container)
+
+    finally:
+      test_store.Close()
+
+  def testReadSerialized(self):
+    """Test ReadSerialized with unsupported data."""
+    attribute_container = (
+        msgpack_serializer.MessagePackAttributeContainerSerializer
+        .ReadSerialized(b''))
+    self.assertIsNone(attribute_container)
+
+    with self.assertRaises(TypeError):
+      msgpack_serializer.MessagePackAttributeContainerSerializer.ReadSerialized(
+          b'\x01')
+
+    with self.assertRaises(ValueError):
+      msgpack_serializer.MessagePackAttributeContainerSerializer.ReadSerialized(
+          b'\xc7\x01\x7f\x00')
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -3,6 +3,8 @@
 """Tests the single process processing engine."""
 
 import collections
+import os
+import shutil
 import unittest
 
 from dfvfs.lib import definitions as dfvfs_definitions
@@ -12,6 +14,7 @@ from dfvfs.resolver import context
 from plaso.engine import configurations
 from plaso.single_process import extraction_engine
 from plaso.storage.fake import writer as fake_writer
+from plaso.storage.sqlite import writer as sqlite_writer
 
 from tests import test_lib as shared_test_lib
 
@@ -21,6 +24,52 @@ class SingleProcessEngineTest(shared_test_lib.BaseTestCase):
 
   # pylint: disable=protected-access
 
+  def _ProcessSourceWithIncrementalExtraction(self, storage_path, path):
+    """Processes a source with incremental extraction.
+
+    Args:
+      storage_path (str): path of the storage file.
+      path (str): path of the source.
+
+    Returns:
+      tuple[IncrementalExtractionStatus, int]: status information about
+          incremental extraction and number of event data in the storage file.
+    """
+    test_artifacts_path = self._GetTestFilePath(['artifacts'])
+
+    test_engine = extraction_engine.SingleProcessEngine()
+    test_engine.BuildArtifactsRegistry(test_artifacts_path, None)
+    resolver_context = context.Context()
+
+    source_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=path)
+
+    processing_configuration = configurations.ProcessingConfiguration()
+    processing_configuration.data_location = shared_test_lib.DATA_PATH
+    processing_configuration.extraction.hasher_names_string = 'sha256'
+    processing_configuration.incremental_extraction = True
+    processing_configuration.incremental_extraction_digest = True
+    processing_configuration.parser_filter_expression = 'text/dpkg'
+
+    storage_writer = sqlite_writer.SQLiteStorageWriter()
+    storage_writer.Open(path=storage_path)
+
+    try:
+      processing_status = test_engine.ProcessSource(
+          storage_writer, resolver_context, processing_configuration, [],
+          [source_path_spec])
+
+      number_of_event_data = storage_writer.GetNumberOfAttributeContainers(
+          'event_data')
+
+    finally:
+      storage_writer.Close()
+
+    self.assertFalse(processing_status.aborted)
+
+    return (
+        processing_status.incremental_extraction_status, number_of_event_data)
+
   def testProcessSource(self):
     """Tests the PreprocessSource and ProcessSource functions."""
     test_artifacts_path = self._GetTestFilePath(['artifacts'])
@@ -81,6 +130,58 @@ class SingleProcessEngineTest(shared_test_lib.BaseTestCase):
         'total': 15})
     self.assertEqual(parsers_counter, expected_parsers_counter)
 
+  def testProcessSourceWithIncrementalExtraction(self):
+    """Tests the ProcessSource function with incremental extraction."""
+    test_artifacts_path = self._GetTestFilePath(['artifacts'])
+    self._SkipIfPathNotExists(test_artifacts_path)
+
+    test_file_path = self._GetTestFilePath(['dpkg.log'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    with shared_test_lib.TempDirectory() as temporary_directory:
+      path = os.path.join(temporary_directory, 'dpkg.log')
+      shutil.copyfile(test_file_path, path)
+
+      storage_path = os.path.join(temporary_directory, 'storage.plaso')
+
+      status, number_of_event_data = (
+          self._ProcessSourceWithIncrementalExtraction(storage_path, path))
+      self.assertEqual(status.number_of_parsed_file_entries, 1)
+      self.assertEqual(number_of_event_data, 4)
+
+      # The digest is taken from the event data stream.
+      storage_writer = sqlite_writer.SQLiteStorageWriter()
+      storage_writer.Open(path=storage_path)
+
+      try:
+        fingerprint = storage_writer.GetAttributeContainerByIndex(
+            'file_entry_fingerprint', 0)
+        event_data_stream = storage_writer.GetAttributeContainerByIndex(
+            'event_data_stream', 0)
+
+      finally:
+        storage_writer.Close()
+
+      self.assertIsNotNone(fingerprint.sha256_hash)
+      self.assertEqual(fingerprint.sha256_hash, event_data_stream.sha256_hash)
+
+      # The unchanged file entry is skipped.
+      status, number_of_event_data = (
+          self._ProcessSourceWithIncrementalExtraction(storage_path, path))
+      self.assertEqual(status.number_of_parsed_file_entries, 0)
+      self.assertEqual(status.number_of_skipped_file_entries, 1)
+      self.assertEqual(number_of_event_data, 4)
+
+      # The changed file entry is parsed again and the event data of the
+      # previous session is kept, hence the appended log file is stored twice.
+      with open(path, 'ab') as file_object:
+        file_object.write(b'\n2016-08-09 04:58:14 startup archives unpack')
+
+      status, number_of_event_data = (
+          self._ProcessSourceWithIncrementalExtraction(storage_path, path))
+      self.assertEqual(status.number_of_parsed_file_entries, 1)
+      self.assertEqual(number_of_event_data, 4 + 5)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -7,9 +7,11 @@ import unittest
 from acstore.containers import interface as containers_interface
 
 from plaso.containers import event_sources
+from plaso.containers import events
 from plaso.storage import reader
 from plaso.storage.fake import fake_store
 
+from tests.containers import test_lib as containers_test_lib
 from tests.storage import test_lib
 
 
@@ -125,6 +127,57 @@ class StorageReaderTest(test_lib.StorageTestCase):
   # TODO: add tests for GetSessions
   # TODO: add tests for GetSortedEvents
 
+  def testGetSortedEventsWithData(self):
+    """Tests the GetSortedEventsWithData function."""
+    test_reader = reader.StorageReader()
+    test_reader._store = fake_store.FakeStore()
+    test_reader._store.Open()
+
+    try:
+      test_events = []
+      for event, event_data, event_data_stream in (
+          containers_test_lib.CreateEventsFromValues(self._TEST_EVENTS)):
+        test_reader._store.AddAttributeContainer(event_data_stream)
+
+        event_data.SetEventDataStreamIdentifier(
+            event_data_stream.GetIdentifier())
+        test_reader._store.AddAttributeContainer(event_data)
+
+        event.SetEventDataIdentifier(event_data.GetIdentifier())
+        test_reader._store.AddAttributeContainer(event)
+
+        test_events.append(event)
+
+      event_tag = events.EventTag()
+      event_tag.SetEventIdentifier(test_events[0].GetIdentifier())
+      event_tag.AddLabel('Malware')
+      test_reader._store.AddAttributeContainer(event_tag)
+
+      test_values = list(test_reader.GetSortedEventsWithData(batch_size=3))
+      self.assertEqual(len(test_values), 4)
+
+      timestamps = [event.timestamp for event, _, _, _ in test_values]
+      self.assertEqual(timestamps, sorted(timestamps))
+
+      number_of_event_tags = 0
+      for event, event_data, event_data_stream, event_tag in test_values:
+        self.assertIsNotNone(event_data)
+        self.assertIsNotNone(event_data_stream)
+
+        event_data_identifier = event.GetEventDataIdentifier()
+        self.assertEqual(
+            event_data.GetIdentifier().CopyToString(),
+            event_data_identifier.CopyToString())
+
+        if event_tag:
+          self.assertEqual(event_tag.labels, ['Malware'])
+          number_of_event_tags += 1
+
+      self.assertEqual(number_of_event_tags, 1)
+
+    finally:
+      test_reader._store.Close()
+
   def testHasAttributeContainers(self):
     """Tests the HasAttributeContainers function."""
     test_reader = reader.StorageReader()
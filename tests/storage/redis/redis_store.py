@@ -92,6 +92,77 @@ class RedisAttributeContainerStoreTest(test_lib.StorageTestCase):
   # TODO: add tests for _RaiseIfNotWritable
   # TODO: add tests for _SetClientName
 
+  def testFlushWrites(self):
+    """Tests the _FlushWrites function."""
+    redis_client = self._CreateRedisClient()
+
+    session = sessions.Session()
+    task = tasks.Task(session_identifier=session.identifier)
+
+    test_store = redis_store.RedisAttributeContainerStore()
+    test_store.Open(
+        redis_client=redis_client, session_identifier=session.identifier,
+        task_identifier=task.identifier, write_batch_size=3)
+
+    try:
+      redis_hash_name = test_store._GetRedisHashName(
+          events.EventDataStream.CONTAINER_TYPE)
+
+      test_store.AddAttributeContainer(events.EventDataStream())
+      test_store.AddAttributeContainer(events.EventDataStream())
+
+      self.assertEqual(test_store._number_of_buffered_writes, 2)
+      self.assertEqual(redis_client.hlen(redis_hash_name), 0)
+
+      # The third write reaches the write batch size.
+      test_store.AddAttributeContainer(events.EventDataStream())
+
+      self.assertEqual(test_store._number_of_buffered_writes, 0)
+      self.assertEqual(redis_client.hlen(redis_hash_name), 3)
+
+      test_store.AddAttributeContainer(events.EventDataStream())
+      self.assertEqual(redis_client.hlen(redis_hash_name), 3)
+
+      test_store._FlushWrites()
+
+      self.assertEqual(test_store._number_of_buffered_writes, 0)
+      self.assertEqual(redis_client.hlen(redis_hash_name), 4)
+
+    finally:
+      test_store.Close()
+
+      self._RemoveSessionData(redis_client, session.identifier)
+
+  def testGetSerializedAttributeContainers(self):
+    """Tests the _GetSerializedAttributeContainers function."""
+    redis_client = self._CreateRedisClient()
+
+    session = sessions.Session()
+    task = tasks.Task(session_identifier=session.identifier)
+
+    test_store = redis_store.RedisAttributeContainerStore()
+    test_store._READ_BATCH_SIZE = 2
+    test_store.Open(
+        redis_client=redis_client, session_identifier=session.identifier,
+        task_identifier=task.identifier)
+
+    try:
+      for _ in range(5):
+        test_store.AddAttributeContainer(events.EventDataStream())
+
+      test_store._FlushWrites()
+
+      sequence_numbers = [
+          identifier.sequence_number
+          for identifier, _ in test_store._GetSerializedAttributeContainers(
+              events.EventDataStream.CONTAINER_TYPE)]
+      self.assertEqual(sequence_numbers, [1, 2, 3, 4, 5])
+
+    finally:
+      test_store.Close()
+
+      self._RemoveSessionData(redis_client, session.identifier)
+
   def testWriteExistingAttributeContainer(self):
     """Tests the _WriteExistingAttributeContainer function."""
     redis_client = self._CreateRedisClient()
@@ -256,6 +327,37 @@ class RedisAttributeContainerStoreTest(test_lib.StorageTestCase):
 
       self._RemoveSessionData(redis_client, session.identifier)
 
+  def testGetAttributeContainersByIndexes(self):
+    """Tests the GetAttributeContainersByIndexes function."""
+    redis_client = self._CreateRedisClient()
+
+    session = sessions.Session()
+    task = tasks.Task(session_identifier=session.identifier)
+
+    test_store = redis_store.RedisAttributeContainerStore()
+    test_store.Open(
+        redis_client=redis_client, session_identifier=task.session_identifier,
+        task_identifier=task.identifier)
+
+    try:
+      for md5_hash in (
+          '8f0bf95a7959baad9666b21a7feed79d',
+          'f6e8f5e8e1b2fd0b5e3e8a55d5e43d8c'):
+        event_data_stream = events.EventDataStream()
+        event_data_stream.md5_hash = md5_hash
+        test_store.AddAttributeContainer(event_data_stream)
+
+      containers_per_index = test_store.GetAttributeContainersByIndexes(
+          events.EventDataStream.CONTAINER_TYPE, [1, 5])
+      self.assertEqual(list(containers_per_index.keys()), [1])
+      self.assertEqual(
+          containers_per_index[1].md5_hash, 'f6e8f5e8e1b2fd0b5e3e8a55d5e43d8c')
+
+    finally:
+      test_store.Close()
+
+      self._RemoveSessionData(redis_client, session.identifier)
+
   def testGetAttributeContainers(self):
     """Tests the GetAttributeContainers method."""
     redis_client = self._CreateRedisClient()
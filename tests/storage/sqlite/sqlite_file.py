@@ -3,10 +3,12 @@
 """Tests for the SQLite-based storage."""
 
 import os
+import shutil
 import unittest
 
 from plaso.containers import events
 from plaso.lib import definitions
+from plaso.storage import time_range
 from plaso.storage.sqlite import sqlite_file
 
 from tests import test_lib as shared_test_lib
@@ -90,6 +92,106 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
       with self.assertRaises(IOError):
         test_store._CheckStorageMetadata(metadata_values)
 
+      metadata_values = {
+          'compression_format': definitions.COMPRESSION_FORMAT_ZLIB,
+          'format_version': '{0:d}'.format(test_store._FORMAT_VERSION),
+          'serialization_format': definitions.SERIALIZER_FORMAT_MSGPACK}
+      test_store._CheckStorageMetadata(metadata_values)
+
+      self.assertEqual(
+          metadata_values['serialization_format'],
+          definitions.SERIALIZER_FORMAT_MSGPACK)
+
+      metadata_values['serialization_format'] = 'bogus'
+      with self.assertRaises(IOError):
+        test_store._CheckStorageMetadata(metadata_values)
+
+      metadata_values['serialization_format'] = (
+          definitions.SERIALIZER_FORMAT_JSON)
+      for compression_format in (
+          definitions.COMPRESSION_FORMAT_LZ4,
+          definitions.COMPRESSION_FORMAT_ZSTD):
+        metadata_values['compression_format'] = compression_format
+        metadata_values['format_version'] = '{0:d}'.format(
+            test_store._FORMAT_VERSION)
+        test_store._CheckStorageMetadata(metadata_values)
+
+  def testCompressSerializedData(self):
+    """Tests the _CompressSerializedData function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      for compression_format in (
+          definitions.COMPRESSION_FORMAT_LZ4,
+          definitions.COMPRESSION_FORMAT_ZLIB,
+          definitions.COMPRESSION_FORMAT_ZSTD):
+        test_path = os.path.join(
+            temp_directory, f'plaso-{compression_format:s}.sqlite')
+        test_store = sqlite_file.SQLiteStorageFile()
+        test_store.compression_format = compression_format
+        test_store.Open(path=test_path, read_only=False)
+
+        try:
+          compressed_data = test_store._CompressSerializedData(
+              'event_data', b'test data' * 16)
+          self.assertIsInstance(compressed_data, bytes)
+          self.assertLess(len(compressed_data), 144)
+
+          serialized_data = test_store._DecompressSerializedData(
+              'event_data', compressed_data)
+          self.assertEqual(serialized_data, b'test data' * 16)
+
+          with self.assertRaises(IOError):
+            test_store._DecompressSerializedData('event_data', b'bogus')
+
+        finally:
+          test_store.Close()
+
+  def testCompressSerializedDataWithZstdDictionary(self):
+    """Tests the _CompressSerializedData function with a zstd dictionary."""
+    test_samples = [
+        f'{{"data_type": "test:event", "value": {index:d}}}'.encode('utf-8')
+        for index in range(500)]
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.compression_format = definitions.COMPRESSION_FORMAT_ZSTD
+      test_store._ZSTD_DICTIONARY_NUMBER_OF_SAMPLES = 100
+      test_store._ZSTD_DICTIONARY_SIZE = 1024
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        compressed_data = [
+            test_store._CompressSerializedData('event_data', sample)
+            for sample in test_samples]
+
+        self.assertIn('event_data', test_store._zstd_decompressors)
+        self.assertLess(len(compressed_data[-1]), len(compressed_data[0]))
+
+        serialized_data = [
+            test_store._DecompressSerializedData('event_data', data)
+            for data in compressed_data]
+        self.assertEqual(serialized_data, test_samples)
+
+        with self.assertRaises(IOError):
+          test_store._DecompressSerializedData('event', compressed_data[-1])
+
+      finally:
+        test_store.Close()
+
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path)
+
+      try:
+        self.assertIn('event_data', test_store._zstd_decompressors)
+
+        serialized_data = [
+            test_store._DecompressSerializedData('event_data', data)
+            for data in compressed_data]
+        self.assertEqual(serialized_data, test_samples)
+
+      finally:
+        test_store.Close()
+
   def testCreateAttributeContainerTable(self):
     """Tests the _CreateAttributeContainerTable function."""
     event_data_stream = events.EventDataStream()
@@ -196,7 +298,32 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
   # TODO: add tests for _RaiseIfNotReadable
   # TODO: add tests for _RaiseIfNotWritable
   # TODO: add tests for _ReadAndCheckStorageMetadata
-  # TODO: add tests for _SerializeAttributeContainer
+
+  def testSerializeAttributeContainer(self):
+    """Tests the _SerializeAttributeContainer function."""
+    event_data = events.EventData(data_type='test:event')
+    event_data.value = 'test'
+
+    test_store = sqlite_file.SQLiteStorageFile()
+
+    for serialization_format in (
+        definitions.SERIALIZER_FORMAT_JSON,
+        definitions.SERIALIZER_FORMAT_MSGPACK):
+      test_store.serialization_format = serialization_format
+
+      serialized_data = test_store._SerializeAttributeContainer(event_data)
+      self.assertIsInstance(serialized_data, bytes)
+
+      container = test_store._DeserializeAttributeContainer(
+          'event_data', serialized_data)
+      self.assertIsInstance(container, events.EventData)
+      self.assertEqual(container.data_type, 'test:event')
+      self.assertEqual(container.value, 'test')
+
+    event_data.value = object()
+    with self.assertRaises(IOError):
+      test_store._SerializeAttributeContainer(event_data)
+
   # TODO: add tests for _UpdateEventAfterDeserialize
   # TODO: add tests for _UpdateEventBeforeSerialize
   # TODO: add tests for _UpdateEventDataAfterDeserialize
@@ -286,6 +413,58 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
       with self.assertRaises(IOError):
         test_store.AddAttributeContainer(event_data_stream)
 
+  def testAddAttributeContainers(self):
+    """Tests the AddAttributeContainers function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        event_data_stream = events.EventDataStream()
+        test_store.AddAttributeContainer(event_data_stream)
+
+        event_data_streams = []
+        for md5_hash in ('8f0bf95a7959baad9666b21a7feed79d', None):
+          event_data_stream = events.EventDataStream()
+          event_data_stream.md5_hash = md5_hash
+          event_data_streams.append(event_data_stream)
+
+        test_store.AddAttributeContainers(event_data_streams)
+
+        number_of_containers = test_store.GetNumberOfAttributeContainers(
+            'event_data_stream')
+        self.assertEqual(number_of_containers, 3)
+
+        identifier = event_data_streams[0].GetIdentifier()
+        self.assertEqual(identifier.sequence_number, 2)
+
+        container = test_store.GetAttributeContainerByIndex(
+            'event_data_stream', 1)
+        self.assertEqual(
+            container.md5_hash, '8f0bf95a7959baad9666b21a7feed79d')
+
+        event_data = events.EventData()
+        event_data.parser = 'test_parser'
+
+        test_store.AddAttributeContainers([event_data])
+
+        # Clear the cache to read the event data from the storage file.
+        test_store._attribute_container_cache.clear()
+
+        container = test_store.GetAttributeContainerByIndex('event_data', 0)
+        self.assertEqual(container.parser, 'test_parser')
+
+        with self.assertRaises(IOError):
+          test_store.AddAttributeContainers([
+              events.EventDataStream(), events.EventData()])
+
+      finally:
+        test_store.Close()
+
+      with self.assertRaises(IOError):
+        test_store.AddAttributeContainers([event_data_stream])
+
   # TODO: add tests for CheckSupportedFormat
 
   def testGetAttributeContainers(self):
@@ -380,6 +559,35 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
       finally:
         test_store.Close()
 
+  def testGetAttributeContainersByIndexes(self):
+    """Tests the GetAttributeContainersByIndexes function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        containers = test_store.GetAttributeContainersByIndexes(
+            events.EventDataStream.CONTAINER_TYPE, [0])
+        self.assertEqual(containers, {})
+
+        for _ in range(3):
+          event_data_stream = events.EventDataStream()
+          test_store.AddAttributeContainer(event_data_stream)
+
+        # Make sure the containers are read from the database.
+        test_store._attribute_container_cache.clear()
+
+        containers = test_store.GetAttributeContainersByIndexes(
+            events.EventDataStream.CONTAINER_TYPE, [0, 2, 99])
+        self.assertEqual(sorted(containers.keys()), [0, 2])
+
+        identifier = containers[2].GetIdentifier()
+        self.assertEqual(identifier.sequence_number, 3)
+
+      finally:
+        test_store.Close()
+
   def testGetNumberOfAttributeContainers(self):
     """Tests the GetNumberOfAttributeContainers function."""
     event_data_stream = events.EventDataStream()
@@ -436,10 +644,94 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
         test_events = list(test_store.GetSortedEvents())
         self.assertEqual(len(test_events), 4)
 
+        timestamps = [event.timestamp for event in test_events]
+        self.assertEqual(timestamps, sorted(timestamps))
+
+        test_events = list(test_store.GetSortedEvents(
+            data_types=['text:entry']))
+        self.assertEqual(len(test_events), 1)
+
+        test_events = list(test_store.GetSortedEvents(
+            parser_chains=['test_parser']))
+        self.assertEqual(len(test_events), 4)
+
+        test_events = list(test_store.GetSortedEvents(
+            data_types=['windows:registry:key_value'], parser_chains=['bogus']))
+        self.assertEqual(len(test_events), 0)
+
       finally:
         test_store.Close()
 
-    # TODO: add test with time range.
+  def testGetSortedEventsWithTimeRange(self):
+    """Tests the GetSortedEvents function with a time range."""
+    test_events_values = list(self._TEST_EVENTS)
+    test_events_values.append({
+        '_parser_chain': 'test_parser',
+        'data_type': 'test:event',
+        'timestamp': '1969-12-31 23:59:59',
+        'timestamp_desc': definitions.TIME_DESCRIPTION_WRITTEN})
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        for event, event_data, event_data_stream in (
+            containers_test_lib.CreateEventsFromValues(test_events_values)):
+          test_store.AddAttributeContainer(event_data_stream)
+
+          event_data.SetEventDataStreamIdentifier(
+              event_data_stream.GetIdentifier())
+          test_store.AddAttributeContainer(event_data)
+
+          event.SetEventDataIdentifier(event_data.GetIdentifier())
+          test_store.AddAttributeContainer(event)
+
+      finally:
+        test_store.Close()
+
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path)
+
+      try:
+        test_events = list(test_store.GetSortedEvents())
+        self.assertEqual(len(test_events), 5)
+
+        # A start timestamp of 0 (the epoch) is a lower bound.
+        test_time_range = time_range.TimeRange(0, 2**62)
+        test_events = list(test_store.GetSortedEvents(
+            time_range=test_time_range))
+        self.assertEqual(len(test_events), 4)
+
+        test_time_range = time_range.TimeRange(-2**62, 0)
+        test_events = list(test_store.GetSortedEvents(
+            time_range=test_time_range))
+        self.assertEqual(len(test_events), 1)
+
+      finally:
+        test_store.Close()
+
+  def testGetSortedEventsWithoutEventIndex(self):
+    """Tests the GetSortedEvents function without an event index."""
+    test_file_path = self._GetTestFilePath(['psort_test.plaso'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    test_store = sqlite_file.SQLiteStorageFile()
+    test_store.Open(path=test_file_path)
+
+    try:
+      self.assertFalse(test_store._HasEventIndex())
+
+      test_events = list(test_store.GetSortedEvents())
+      self.assertEqual(len(test_events), 38)
+
+      test_events = list(test_store.GetSortedEvents(
+          data_types=['syslog:line']))
+      self.assertEqual(len(test_events), 26)
+
+    finally:
+      test_store.Close()
 
   def testHasAttributeContainers(self):
     """Tests the HasAttributeContainers function."""
@@ -498,6 +790,38 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
       finally:
         test_store.Close()
 
+  def testUpgradeEventIndex(self):
+    """Tests upgrading a storage file without an event index."""
+    test_file_path = self._GetTestFilePath(['psort_test.plaso'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'psort_test.plaso')
+      shutil.copyfile(test_file_path, test_path)
+
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path, read_only=False)
+      test_store.Close()
+
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path)
+
+      try:
+        self.assertEqual(
+            test_store.format_version,
+            sqlite_file.SQLiteStorageFile._FORMAT_VERSION)
+        self.assertTrue(test_store._HasEventIndex())
+
+        test_events = list(test_store.GetSortedEvents())
+        self.assertEqual(len(test_events), 38)
+
+        test_events = list(test_store.GetSortedEvents(
+            data_types=['syslog:line']))
+        self.assertEqual(len(test_events), 26)
+
+      finally:
+        test_store.Close()
+
   def testVersionCompatibility(self):
     """Tests the version compatibility methods."""
     with shared_test_lib.TempDirectory() as temp_directory:
@@ -148,6 +148,26 @@ class SQLiteStorageWriterTest(test_lib.StorageTestCase):
 
     # TODO: add test with time range.
 
+  def testGetSortedEventsWithTaskStorage(self):
+    """Tests the GetSortedEvents function with a task storage file."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      storage_writer = sqlite_writer.SQLiteStorageWriter(
+          storage_type=definitions.STORAGE_TYPE_TASK)
+      storage_writer.Open(path=test_path)
+
+      try:
+        self._AddTestEvents(storage_writer)
+
+        # The event index is not maintained for a task storage file.
+        self.assertFalse(storage_writer._store._HasTable('event_index'))
+
+        test_events = list(storage_writer.GetSortedEvents())
+        self.assertEqual(len(test_events), 4)
+
+      finally:
+        storage_writer.Close()
+
   def testOpenClose(self):
     """Tests the Open and Close functions."""
     with shared_test_lib.TempDirectory() as temp_directory:
@@ -174,6 +194,77 @@ class SQLiteStorageWriterTest(test_lib.StorageTestCase):
       with self.assertRaises(IOError):
         storage_writer.Close()
 
+  def testOpenWithCompressionFormat(self):
+    """Tests the Open function with a compression format."""
+    event_data = events.EventData(data_type='test:event')
+    event_data.value = 'test'
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      storage_writer = sqlite_writer.SQLiteStorageWriter()
+      storage_writer.Open(
+          path=test_path, compression_format=definitions.COMPRESSION_FORMAT_LZ4)
+
+      try:
+        storage_writer.AddAttributeContainer(event_data)
+      finally:
+        storage_writer.Close()
+
+      # The compression format of an existing storage file is preserved.
+      storage_writer.Open(
+          path=test_path,
+          compression_format=definitions.COMPRESSION_FORMAT_ZLIB)
+
+      try:
+        self.assertEqual(
+            storage_writer._store.compression_format,
+            definitions.COMPRESSION_FORMAT_LZ4)
+
+        storage_writer._store._attribute_container_cache.clear()
+
+        container = storage_writer.GetAttributeContainerByIndex(
+            'event_data', 0)
+        self.assertEqual(container.value, 'test')
+
+      finally:
+        storage_writer.Close()
+
+  def testOpenWithSerializationFormat(self):
+    """Tests the Open function with a serialization format."""
+    event_data = events.EventData(data_type='test:event')
+    event_data.value = 'test'
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      storage_writer = sqlite_writer.SQLiteStorageWriter()
+      storage_writer.Open(
+          path=test_path,
+          serialization_format=definitions.SERIALIZER_FORMAT_MSGPACK)
+
+      try:
+        storage_writer.AddAttributeContainer(event_data)
+      finally:
+        storage_writer.Close()
+
+      # The serialization format of an existing storage file is preserved.
+      storage_writer.Open(
+          path=test_path,
+          serialization_format=definitions.SERIALIZER_FORMAT_JSON)
+
+      try:
+        self.assertEqual(
+            storage_writer._store.serialization_format,
+            definitions.SERIALIZER_FORMAT_MSGPACK)
+
+        storage_writer._store._attribute_container_cache.clear()
+
+        container = storage_writer.GetAttributeContainerByIndex(
+            'event_data', 0)
+        self.assertEqual(container.value, 'test')
+
+      finally:
+        storage_writer.Close()
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Script to benchmark the multi-process analysis engine.
+
+The benchmark measures the time it takes to analyze the events in a Plaso
+storage file with 1, 4 and 8 analysis plugins, which are each run in
+a separate analysis process. Run it from the root of the source tree to
+benchmark the test Plaso storage file or pass the path of another, typically
+larger, Plaso storage file, for example:
+
+PYTHONPATH=. python utils/benchmark_analysis_engine.py timeline.plaso
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from plaso.analysis import interface as analysis_interface
+from plaso.containers import reports
+from plaso.containers import sessions
+from plaso.engine import configurations
+from plaso.lib import definitions
+from plaso.multi_process import analysis_engine
+from plaso.storage import factory as storage_factory
+
+
+class BenchmarkAnalysisPlugin(analysis_interface.AnalysisPlugin):
+  """Analysis plugin that counts the events it examined."""
+
+  def __init__(self, name):
+    """Initializes an analysis plugin that counts the events it examined.
+
+    Args:
+      name (str): name of the analysis plugin, which must be unique per
+          analysis process.
+    """
+    super(BenchmarkAnalysisPlugin, self).__init__()
+    self._number_of_events = 0
+    self.NAME = name  # pylint: disable=invalid-name
+
+  def CompileReport(self, mediator):
+    """Compiles an analysis report.
+
+    Args:
+      mediator (AnalysisMediator): mediates interactions between analysis
+          plugins and other components, such as storage and dfVFS.
+
+    Returns:
+      AnalysisReport: analysis report.
+    """
+    return reports.AnalysisReport(
+        plugin_name=self.NAME,
+        text=f'Number of events: {self._number_of_events:d}')
+
+  # pylint: disable=unused-argument
+  def ExamineEvent(self, mediator, event, event_data, event_data_stream):
+    """Analyzes an event.
+
+    Args:
+      mediator (AnalysisMediator): mediates interactions between analysis
+          plugins and other components, such as storage and dfVFS.
+      event (EventObject): event.
+      event_data (EventData): event data.
+      event_data_stream (EventDataStream): event data stream.
+    """
+    self._number_of_events += 1
+
+
+def BenchmarkAnalysisEngine(path, number_of_plugins):
+  """Benchmarks the multi-process analysis engine.
+
+  Args:
+    path (str): path of the Plaso storage file.
+    number_of_plugins (int): number of analysis plugins.
+
+  Returns:
+    dict[str, object]: benchmark results.
+  """
+  analysis_plugins = {}
+  for index in range(number_of_plugins):
+    analysis_plugin = BenchmarkAnalysisPlugin(f'benchmark{index:d}')
+    analysis_plugins[analysis_plugin.NAME] = analysis_plugin
+
+  configuration = configurations.ProcessingConfiguration()
+  session = sessions.Session()
+  test_engine = analysis_engine.AnalysisMultiProcessEngine()
+
+  with tempfile.TemporaryDirectory() as temporary_directory:
+    storage_file_path = os.path.join(temporary_directory, 'storage.plaso')
+    shutil.copyfile(path, storage_file_path)
+
+    storage_writer = storage_factory.StorageFactory.CreateStorageWriter(
+        definitions.DEFAULT_STORAGE_FORMAT)
+    storage_writer.Open(path=storage_file_path)
+
+    try:
+      analysis_time = time.perf_counter()
+
+      test_engine.AnalyzeEvents(
+          session, storage_writer, '', analysis_plugins, configuration,
+          storage_file_path=temporary_directory)
+
+      analysis_time = time.perf_counter() - analysis_time
+
+      number_of_reports = storage_writer.GetNumberOfAttributeContainers(
+          'analysis_report')
+
+    finally:
+      storage_writer.Close()
+
+  # pylint: disable=protected-access
+  number_of_events = test_engine._number_of_consumed_events
+
+  return {
+      'events_per_second': number_of_events / analysis_time,
+      'number_of_events': number_of_events,
+      'number_of_reports': number_of_reports,
+      'seconds': analysis_time}
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmark the multi-process analysis engine.'))
+
+  argument_parser.add_argument(
+      'storage_file', nargs='?', action='store', metavar='PATH',
+      default=os.path.join('test_data', 'psort_test.plaso'), help=(
+          'path of the Plaso storage file, where the default is '
+          'test_data/psort_test.plaso.'))
+
+  options = argument_parser.parse_args()
+
+  path = options.storage_file
+  if not os.path.isfile(path):
+    print(f'No such file: {path:s}')
+    return False
+
+  print('Plugins\tEvents\t\tSeconds\t\tEvents per second')
+
+  for number_of_plugins in (1, 4, 8):
+    results = BenchmarkAnalysisEngine(path, number_of_plugins)
+
+    print((f'{number_of_plugins:d}\t{results["number_of_events"]:d}\t\t'
+           f'{results["seconds"]:.3f}\t\t'
+           f'{results["events_per_second"]:.0f}'))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Script to benchmark the event filter.
+
+The benchmark compares matching events with the compiled match function of
+an event filter against matching them with the filter tree, and reading the
+events of a Plaso storage file, as psort does, with and without passing the
+storage filter values of the event filter to the storage. By default it
+generates a storage file with synthetic events. Run it from the root of the
+source tree, for example:
+
+PYTHONPATH=. python utils/benchmark_event_filter.py --number_of_events 100000
+
+or pass the path of a Plaso storage file and a filter expression, for example:
+
+PYTHONPATH=. python utils/benchmark_event_filter.py \
+    --filter 'data_type is "syslog:line"' timeline.plaso
+
+Note that the storage can only skip events of a storage file that has an event
+index, which storage files of older format versions do not have.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from plaso.containers import events
+from plaso.filters import event_filter
+from plaso.storage import factory as storage_factory
+from plaso.storage.sqlite import writer as sqlite_writer
+
+
+_DEFAULT_FILTER_EXPRESSION = (
+    'data_type is "benchmark:event:1" and '
+    'timestamp >= DATETIME("2020-10-01T00:00:00") and body contains "error"')
+
+_NUMBER_OF_DATA_TYPES = 4
+
+# Timestamp of 2020-01-01 00:00:00 in number of microseconds since
+# January 1, 1970, 00:00:00 UTC.
+_FIRST_TIMESTAMP = 1577836800000000
+
+# Number of microseconds in the year 2020 over which the synthetic events are
+# spread.
+_TIMESTAMP_RANGE = 366 * 24 * 60 * 60 * 1000 * 1000
+
+
+def _CreateStorageFile(path, number_of_events):
+  """Creates a Plaso storage file with synthetic events.
+
+  Args:
+    path (str): path of the Plaso storage file.
+    number_of_events (int): number of events.
+  """
+  timestamp_interval = _TIMESTAMP_RANGE // number_of_events
+
+  storage_writer = sqlite_writer.SQLiteStorageWriter()
+  storage_writer.Open(path=path)
+
+  try:
+    for index in range(number_of_events):
+      data_type_index = index % _NUMBER_OF_DATA_TYPES
+
+      event_data = events.EventData(
+          data_type=f'benchmark:event:{data_type_index:d}')
+      if index % 10 == 1:
+        event_data.body = f'Event: {index:d} reported an error.'
+      else:
+        event_data.body = f'Event: {index:d} completed successfully.'
+
+      storage_writer.AddAttributeContainer(event_data)
+
+      event = events.EventObject()
+      event.timestamp = _FIRST_TIMESTAMP + (index * timestamp_interval)
+      event.timestamp_desc = 'Benchmark Time'
+      event.SetEventDataIdentifier(event_data.GetIdentifier())
+
+      storage_writer.AddAttributeContainer(event)
+
+  finally:
+    storage_writer.Close()
+
+
+def BenchmarkMatch(test_filter, events_with_data):
+  """Benchmarks matching events with the compiled function and filter tree.
+
+  Args:
+    test_filter (EventObjectFilter): event filter.
+    events_with_data (list[tuple]): events with their event data, event data
+        stream and event tag.
+
+  Returns:
+    dict[str, object]: benchmark results.
+  """
+  # pylint: disable=protected-access
+  filter_tree = test_filter._event_filter
+
+  compiled_time = time.perf_counter()
+
+  number_of_compiled_matches = 0
+  for event, event_data, event_data_stream, event_tag in events_with_data:
+    if test_filter.Match(event, event_data, event_data_stream, event_tag):
+      number_of_compiled_matches += 1
+
+  compiled_time = time.perf_counter() - compiled_time
+
+  filter_tree_time = time.perf_counter()
+
+  number_of_filter_tree_matches = 0
+  for event, event_data, event_data_stream, event_tag in events_with_data:
+    if filter_tree.Matches(event, event_data, event_data_stream, event_tag):
+      number_of_filter_tree_matches += 1
+
+  filter_tree_time = time.perf_counter() - filter_tree_time
+
+  return {
+      'compiled_seconds': compiled_time,
+      'filter_tree_seconds': filter_tree_time,
+      'number_of_compiled_matches': number_of_compiled_matches,
+      'number_of_filter_tree_matches': number_of_filter_tree_matches}
+
+
+def BenchmarkStorage(test_filter, path, use_storage_filter):
+  """Benchmarks reading and matching the events of a Plaso storage file.
+
+  Args:
+    test_filter (EventObjectFilter): event filter.
+    path (str): path of the Plaso storage file.
+    use_storage_filter (bool): True if the storage filter values of the event
+        filter should be passed to the storage.
+
+  Returns:
+    dict[str, object]: benchmark results.
+  """
+  time_range = None
+  data_types = None
+  if use_storage_filter:
+    time_range, data_types = test_filter.GetStorageFilterValues()
+
+  storage_reader = storage_factory.StorageFactory.CreateStorageReaderForFile(
+      path)
+
+  try:
+    read_time = time.perf_counter()
+
+    number_of_matches = 0
+    number_of_read_events = 0
+    for event, event_data, event_data_stream, event_tag in (
+        storage_reader.GetSortedEventsWithData(
+            time_range=time_range, data_types=data_types)):
+      number_of_read_events += 1
+
+      if test_filter.Match(event, event_data, event_data_stream, event_tag):
+        number_of_matches += 1
+
+    read_time = time.perf_counter() - read_time
+
+  finally:
+    storage_reader.Close()
+
+  return {
+      'number_of_matches': number_of_matches,
+      'number_of_read_events': number_of_read_events,
+      'seconds': read_time}
+
+
+def ReadEventsWithData(path):
+  """Reads the events of a Plaso storage file with their related containers.
+
+  Args:
+    path (str): path of the Plaso storage file.
+
+  Returns:
+    list[tuple]: events with their event data, event data stream and event
+        tag.
+  """
+  storage_reader = storage_factory.StorageFactory.CreateStorageReaderForFile(
+      path)
+
+  try:
+    return list(storage_reader.GetSortedEventsWithData())
+
+  finally:
+    storage_reader.Close()
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmark the event filter.'))
+
+  argument_parser.add_argument(
+      '--filter', dest='filter', action='store', metavar='EXPRESSION',
+      default=_DEFAULT_FILTER_EXPRESSION, help=(
+          'event filter expression, where the default matches part of the '
+          'synthetic events.'))
+
+  argument_parser.add_argument(
+      '--number_of_events', '--number-of-events', dest='number_of_events',
+      type=int, action='store', metavar='NUMBER', default=100000, help=(
+          'number of synthetic events, where the default is 100000.'))
+
+  argument_parser.add_argument(
+      'storage_file', nargs='?', action='store', metavar='PATH',
+      default=None, help=(
+          'path of the Plaso storage file, where the default is a storage '
+          'file with synthetic events.'))
+
+  options = argument_parser.parse_args()
+
+  if options.storage_file and not os.path.isfile(options.storage_file):
+    print(f'No such file: {options.storage_file:s}')
+    return False
+
+  if options.number_of_events <= 0:
+    print('Number of events must be larger than 0.')
+    return False
+
+  test_filter = event_filter.EventObjectFilter()
+  test_filter.CompileFilter(options.filter)
+
+  with tempfile.TemporaryDirectory() as temporary_directory:
+    path = options.storage_file
+    if not path:
+      path = os.path.join(temporary_directory, 'storage.plaso')
+      _CreateStorageFile(path, options.number_of_events)
+
+    events_with_data = ReadEventsWithData(path)
+    number_of_events = len(events_with_data)
+
+    results = BenchmarkMatch(test_filter, events_with_data)
+
+    print('Match\t\tEvents\t\tMatches\t\tSeconds\t\tEvents per second')
+
+    for name, matches_key, seconds_key in (
+        ('compiled', 'number_of_compiled_matches', 'compiled_seconds'),
+        ('filter tree', 'number_of_filter_tree_matches',
+         'filter_tree_seconds')):
+      seconds = results[seconds_key]
+      print((f'{name:s}\t{number_of_events:d}\t\t'
+             f'{results[matches_key]:d}\t\t{seconds:.3f}\t\t'
+             f'{number_of_events / seconds:.0f}'))
+
+    print('')
+    print('Storage\t\tRead events\tMatches\t\tSeconds')
+
+    for name, use_storage_filter in (
+        ('pushdown', True), ('no pushdown', False)):
+      results = BenchmarkStorage(test_filter, path, use_storage_filter)
+
+      print((f'{name:s}\t{results["number_of_read_events"]:d}\t\t'
+             f'{results["number_of_matches"]:d}\t\t'
+             f'{results["seconds"]:.3f}'))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Script to benchmark the hashers.
+
+The benchmark measures the throughput of every registered hasher on synthetic
+data of increasing size. Run it from the root of the source tree, for
+example to run the benchmark with sizes from 1 MiB up to 1 GiB:
+
+PYTHONPATH=. python utils/benchmark_hashers.py --maximum_size 1024
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from plaso.analyzers import hashers  # pylint: disable=unused-import
+from plaso.analyzers.hashers import manager
+
+
+_BLOCK_SIZE = 1024 * 1024
+
+
+def BenchmarkHasher(name, size, block_size=_BLOCK_SIZE):
+  """Benchmarks a hasher.
+
+  The synthetic data consists of a random block that is passed to the hasher
+  repeatedly, so that generating the data does not affect the measurement.
+
+  Args:
+    name (str): name of the hasher.
+    size (int): size of the synthetic data, in bytes.
+    block_size (Optional[int]): size of the blocks of data passed to Update,
+        in bytes.
+
+  Returns:
+    dict[str, object]: benchmark results.
+  """
+  data = os.urandom(min(size, block_size))
+
+  hasher = manager.HashersManager.GetHasher(name)
+
+  hash_time = time.perf_counter()
+
+  remaining_size = size
+  while remaining_size > 0:
+    if remaining_size < len(data):
+      hasher.Update(data[:remaining_size])
+    else:
+      hasher.Update(data)
+    remaining_size -= len(data)
+
+  digest = hasher.GetStringDigest()
+
+  hash_time = time.perf_counter() - hash_time
+
+  return {
+      'digest': digest,
+      'megabytes_per_second': (size / _BLOCK_SIZE) / hash_time}
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmark the hashers.'))
+
+  argument_parser.add_argument(
+      '--maximum_size', '--maximum-size', dest='maximum_size', type=int,
+      action='store', metavar='SIZE', default=1024, help=(
+          'largest size of the synthetic data in MiB, where the default '
+          'is 1024.'))
+
+  options = argument_parser.parse_args()
+
+  if options.maximum_size < 1:
+    print(f'Unsupported maximum size: {options.maximum_size:d}')
+    return False
+
+  sizes = []
+  size = 1
+  while size <= options.maximum_size:
+    sizes.append(size)
+    size *= 4
+
+  hasher_names = sorted(manager.HashersManager.GetHasherNames())
+
+  print('Hasher\t\t' + '\t'.join(f'{size:d} MiB (MB/s)' for size in sizes))
+
+  for name in hasher_names:
+    megabytes_per_second = []
+    for size in sizes:
+      results = BenchmarkHasher(name, size * _BLOCK_SIZE)
+      megabytes_per_second.append(
+          f'{results["megabytes_per_second"]:.1f}')
+
+    print(f'{name:s}\t\t' + '\t\t'.join(megabytes_per_second))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
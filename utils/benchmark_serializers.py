@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Script to benchmark the attribute container serializers.
+
+The benchmark compares the encode and decode throughput and the serialized
+size of the JSON and MessagePack serializers, using the event data of
+a storage file. Run it from the root of the source tree, for example:
+
+PYTHONPATH=. python utils/benchmark_serializers.py
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import zlib
+
+from plaso.serializer import json_serializer
+from plaso.serializer import msgpack_serializer
+from plaso.storage.sqlite import sqlite_file
+
+
+def _DecodeJSON(serialized_data):
+  """Decodes an attribute container with the JSON serializer.
+
+  Args:
+    serialized_data (bytes): serialized attribute container.
+
+  Returns:
+    AttributeContainer: attribute container.
+  """
+  return json_serializer.JSONAttributeContainerSerializer.ReadSerialized(
+      serialized_data.decode('utf-8'))
+
+
+def _EncodeJSON(attribute_container):
+  """Encodes an attribute container with the JSON serializer.
+
+  Args:
+    attribute_container (AttributeContainer): attribute container.
+
+  Returns:
+    bytes: serialized attribute container.
+  """
+  json_dict = (
+      json_serializer.JSONAttributeContainerSerializer.WriteSerializedDict(
+          attribute_container))
+  return json.dumps(json_dict).encode('utf-8')
+
+
+SERIALIZERS = {
+    'json': (_EncodeJSON, _DecodeJSON),
+    'msgpack': (
+        msgpack_serializer.MessagePackAttributeContainerSerializer
+        .WriteSerialized,
+        msgpack_serializer.MessagePackAttributeContainerSerializer
+        .ReadSerialized)}
+
+
+def BenchmarkSerializer(name, attribute_containers, number_of_iterations=1):
+  """Benchmarks a serializer.
+
+  Args:
+    name (str): name of the serializer.
+    attribute_containers (list[AttributeContainer]): attribute containers.
+    number_of_iterations (Optional[int]): number of times the attribute
+        containers are encoded and decoded.
+
+  Returns:
+    dict[str, object]: benchmark results.
+  """
+  encode_function, decode_function = SERIALIZERS[name]
+
+  encode_time = time.perf_counter()
+  for _ in range(number_of_iterations):
+    serialized_data = [
+        encode_function(attribute_container)
+        for attribute_container in attribute_containers]
+  encode_time = time.perf_counter() - encode_time
+
+  decode_time = time.perf_counter()
+  for _ in range(number_of_iterations):
+    for data in serialized_data:
+      decode_function(data)
+  decode_time = time.perf_counter() - decode_time
+
+  number_of_containers = len(attribute_containers) * number_of_iterations
+
+  return {
+      'compressed_size': sum(len(zlib.compress(data))
+                             for data in serialized_data),
+      'decode_per_second': number_of_containers / decode_time,
+      'encode_per_second': number_of_containers / encode_time,
+      'size': sum(len(data) for data in serialized_data)}
+
+
+def ReadEventData(path):
+  """Reads the event data from a storage file.
+
+  Args:
+    path (str): path of the storage file.
+
+  Returns:
+    list[EventData]: event data.
+  """
+  storage_file = sqlite_file.SQLiteStorageFile()
+  storage_file.Open(path=path)
+
+  try:
+    event_data = list(storage_file.GetAttributeContainers('event_data'))
+  finally:
+    storage_file.Close()
+
+  for attribute_container in event_data:
+    # The event data stream identifier is serialized by the storage file.
+    attribute_container.SetEventDataStreamIdentifier(None)
+
+  return event_data
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmark the attribute container serializers.'))
+
+  argument_parser.add_argument(
+      'storage_file', nargs='?', action='store', metavar='PATH',
+      default=os.path.join('test_data', 'psort_test.plaso'), help=(
+          'path of the storage file to read the event data from, where '
+          'the default is test_data/psort_test.plaso.'))
+
+  options = argument_parser.parse_args()
+
+  if not os.path.isfile(options.storage_file):
+    print(f'No such file: {options.storage_file:s}')
+    return False
+
+  event_data = ReadEventData(options.storage_file)
+
+  print(f'Number of event data: {len(event_data):d}')
+  print((
+      'Serializer\tEncode (/s)\tDecode (/s)\tSize (bytes)\t'
+      'Compressed size (bytes)'))
+
+  for name in sorted(SERIALIZERS.keys()):
+    results = BenchmarkSerializer(name, event_data, number_of_iterations=20)
+    print((
+        f'{name:s}\t\t{results["encode_per_second"]:.0f}\t\t'
+        f'{results["decode_per_second"]:.0f}\t\t{results["size"]:d}\t\t'
+        f'{results["compressed_size"]:d}'))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
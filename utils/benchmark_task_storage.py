@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Script to benchmark the task storage formats.
+
+The benchmark compares writing and reading attribute containers with the
+SQLite and Redis task storage formats. It uses the Redis server listening on
+localhost when available and a fake Redis server otherwise. Run it from the
+root of the source tree, for example:
+
+PYTHONPATH=. python utils/benchmark_task_storage.py \
+    --number_of_containers 100000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+try:
+  # pylint: disable=ungrouped-imports
+  import fakeredis
+  import redis
+  from plaso.storage.redis import redis_store
+  from plaso.storage.redis import reader as redis_reader
+  from plaso.storage.redis import writer as redis_writer
+except ModuleNotFoundError:
+  redis = None
+
+from plaso.containers import events
+from plaso.containers import sessions
+from plaso.containers import tasks
+from plaso.lib import definitions
+from plaso.storage.sqlite import reader as sqlite_reader
+from plaso.storage.sqlite import writer as sqlite_writer
+
+
+def _CreateEventData(index):
+  """Creates event data for the benchmark.
+
+  Args:
+    index (int): index of the event data.
+
+  Returns:
+    EventData: event data.
+  """
+  event_data = events.EventData(data_type='test:event')
+  event_data.parser = 'test_parser'
+  event_data.text = f'Event data: {index:d} of the task storage benchmark.'
+  return event_data
+
+
+def _CreateRedisClient():
+  """Creates a Redis client.
+
+  Returns:
+    Redis: a Redis client connected to the Redis server listening on
+        localhost or a fake Redis client if no server is available.
+  """
+  try:
+    redis_client = redis.from_url(
+        redis_store.RedisAttributeContainerStore.DEFAULT_REDIS_URL,
+        socket_timeout=60)
+    redis_client.ping()
+  except redis.exceptions.ConnectionError:
+    redis_client = fakeredis.FakeStrictRedis()
+
+  return redis_client
+
+
+def BenchmarkRedisTaskStorage(
+    number_of_containers, redis_client, write_batch_size=None):
+  """Benchmarks the Redis task storage.
+
+  Args:
+    number_of_containers (int): number of attribute containers to write and
+        read.
+    redis_client (Redis): Redis client.
+    write_batch_size (Optional[int]): number of write commands that are
+        buffered before they are sent to the Redis server, where None
+        represents the default.
+
+  Returns:
+    dict[str, object]: benchmark results.
+  """
+  session = sessions.Session()
+  task = tasks.Task(session_identifier=session.identifier)
+
+  try:
+    storage_writer = redis_writer.RedisStorageWriter(
+        storage_type=definitions.STORAGE_TYPE_TASK)
+
+    write_time = time.perf_counter()
+
+    storage_writer.Open(
+        redis_client=redis_client, session_identifier=session.identifier,
+        task_identifier=task.identifier, write_batch_size=write_batch_size)
+
+    for index in range(number_of_containers):
+      storage_writer.AddAttributeContainer(_CreateEventData(index))
+
+    storage_writer.Close()
+
+    write_time = time.perf_counter() - write_time
+
+    read_time = time.perf_counter()
+
+    storage_reader = redis_reader.RedisStorageReader(
+        session.identifier, task.identifier, redis_client=redis_client)
+
+    number_of_read_containers = 0
+    for _ in storage_reader.GetAttributeContainers('event_data'):
+      number_of_read_containers += 1
+
+    storage_reader.Close()
+
+    read_time = time.perf_counter() - read_time
+
+  finally:
+    for redis_hash_name in redis_client.keys(f'{session.identifier:s}-*'):
+      redis_client.delete(redis_hash_name)
+
+  return {
+      'number_of_read_containers': number_of_read_containers,
+      'read_time': read_time,
+      'write_time': write_time}
+
+
+def BenchmarkSQLiteTaskStorage(number_of_containers, path):
+  """Benchmarks the SQLite task storage.
+
+  Args:
+    number_of_containers (int): number of attribute containers to write and
+        read.
+    path (str): path of the task storage file.
+
+  Returns:
+    dict[str, object]: benchmark results.
+  """
+  storage_writer = sqlite_writer.SQLiteStorageWriter(
+      storage_type=definitions.STORAGE_TYPE_TASK)
+
+  write_time = time.perf_counter()
+
+  storage_writer.Open(path=path)
+
+  for index in range(number_of_containers):
+    storage_writer.AddAttributeContainer(_CreateEventData(index))
+
+  storage_writer.Close()
+
+  write_time = time.perf_counter() - write_time
+
+  read_time = time.perf_counter()
+
+  storage_reader = sqlite_reader.SQLiteStorageReader(path)
+
+  number_of_read_containers = 0
+  for _ in storage_reader.GetAttributeContainers('event_data'):
+    number_of_read_containers += 1
+
+  storage_reader.Close()
+
+  read_time = time.perf_counter() - read_time
+
+  return {
+      'number_of_read_containers': number_of_read_containers,
+      'read_time': read_time,
+      'write_time': write_time}
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmark the task storage formats.'))
+
+  argument_parser.add_argument(
+      '--number_of_containers', '--number-of-containers',
+      dest='number_of_containers', type=int, action='store', metavar='NUMBER',
+      default=10000, help=(
+          'number of attribute containers to write and read, where '
+          'the default is 10000.'))
+
+  options = argument_parser.parse_args()
+
+  number_of_containers = options.number_of_containers
+  if number_of_containers < 1:
+    print(('Unsupported number of attribute containers: '
+           f'{number_of_containers:d}'))
+    return False
+
+  print('Task storage\t\tWrite (s)\tRead (s)')
+
+  with tempfile.TemporaryDirectory() as temporary_directory:
+    path = os.path.join(temporary_directory, 'task.sqlite')
+    results = BenchmarkSQLiteTaskStorage(number_of_containers, path)
+
+  print((f'sqlite\t\t\t{results["write_time"]:.3f}\t\t'
+         f'{results["read_time"]:.3f}'))
+
+  if not redis:
+    print('Redis support missing.')
+    return True
+
+  redis_client = _CreateRedisClient()
+
+  for write_batch_size in (1, None):
+    results = BenchmarkRedisTaskStorage(
+        number_of_containers, redis_client, write_batch_size=write_batch_size)
+
+    write_batch_size = (
+        write_batch_size or redis_store.RedisAttributeContainerStore
+        .DEFAULT_WRITE_BATCH_SIZE)
+
+    print((f'redis (batch: {write_batch_size:d})\t'
+           f'{results["write_time"]:.3f}\t\t{results["read_time"]:.3f}'))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Script to benchmark the fast path of text parser plugins.
+
+The benchmark measures the number of lines per second the text parser plugins
+parse with only the pyparsing grammar and with the fast path regular
+expression. The lines of the test log files are repeated to obtain
+a measurable parse time. Run it from the root of the source tree to benchmark
+the test log files or pass the name of a text parser plugin and the path of
+another, typically larger, log file, for example:
+
+PYTHONPATH=. python utils/benchmark_text_plugins.py apache_access access.log
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from dfvfs.file_io import fake_file_io
+from dfvfs.path import fake_path_spec
+from dfvfs.resolver import context as dfvfs_context
+
+from plaso.parsers import mediator as parsers_mediator
+from plaso.parsers import text_parser
+from plaso.parsers.text_plugins import apache_access
+from plaso.parsers.text_plugins import iis
+from plaso.storage.fake import writer as fake_writer
+
+
+PLUGINS = {
+    'apache_access': apache_access.ApacheAccessLogTextPlugin,
+    'winiis': iis.WinIISTextPlugin}
+
+TEST_FILES = [
+    ('apache_access', 'apache_access.log'),
+    ('winiis', 'iis6.log'),
+    ('winiis', 'iis_without_date.log')]
+
+
+def _ReadLogData(path, number_of_copies):
+  """Reads the data of a log file and repeats its lines.
+
+  Comment lines, that start with "#", are only included once at the start of
+  the data, so that header lines are not repeated.
+
+  Args:
+    path (str): path of the log file.
+    number_of_copies (int): number of times the other lines are repeated.
+
+  Returns:
+    bytes: data of the log file.
+  """
+  with open(path, 'rb') as file_object:
+    lines = file_object.read().splitlines(keepends=True)
+
+  if lines and not lines[-1].endswith(b'\n'):
+    lines[-1] = b''.join([lines[-1], b'\n'])
+
+  comment_lines = [line for line in lines if line.startswith(b'#')]
+  other_lines = [line for line in lines if not line.startswith(b'#')]
+
+  return b''.join(comment_lines + other_lines * number_of_copies)
+
+
+def BenchmarkPlugin(
+    plugin_name, path, fast_path_enabled=True, number_of_copies=1):
+  """Benchmarks a text parser plugin.
+
+  Args:
+    plugin_name (str): name of the text parser plugin.
+    path (str): path of the log file.
+    fast_path_enabled (Optional[bool]): True if the fast path regular
+        expression should be used.
+    number_of_copies (Optional[int]): number of times the lines of the log
+        file are repeated.
+
+  Returns:
+    dict[str, object]: benchmark results.
+  """
+  data = _ReadLogData(path, number_of_copies)
+
+  plugin = PLUGINS[plugin_name]()
+  # pylint: disable=protected-access
+  plugin._fast_path_enabled = fast_path_enabled
+
+  resolver_context = dfvfs_context.Context()
+  path_spec = fake_path_spec.FakePathSpec(
+      location='/{0:s}'.format(os.path.basename(path)))
+  file_object = fake_file_io.FakeFile(resolver_context, path_spec, data)
+  file_object.Open()
+
+  storage_writer = fake_writer.FakeStorageWriter()
+  storage_writer.Open()
+
+  try:
+    parser_mediator = parsers_mediator.ParserMediator()
+    parser_mediator.SetStorageWriter(storage_writer)
+    parser_mediator.AppendToParserChain('text')
+
+    encoding = plugin.ENCODING or parser_mediator.GetCodePage()
+    text_reader = text_parser.EncodedTextReader(file_object, encoding=encoding)
+    text_reader.ReadLines()
+
+    if not plugin.CheckRequiredFormat(parser_mediator, text_reader):
+      raise ValueError('Unsupported log file: {0:s}'.format(path))
+
+    parse_time = time.perf_counter()
+    plugin.UpdateChainAndProcess(parser_mediator, file_object=file_object)
+    parse_time = time.perf_counter() - parse_time
+
+    number_of_event_data = storage_writer.GetNumberOfAttributeContainers(
+        'event_data')
+
+  finally:
+    storage_writer.Close()
+
+  number_of_lines = data.count(b'\n')
+
+  return {
+      'lines_per_second': number_of_lines / parse_time,
+      'number_of_event_data': number_of_event_data,
+      'number_of_lines': number_of_lines,
+      'seconds': parse_time}
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmark the fast path of text parser plugins.'))
+
+  argument_parser.add_argument(
+      'plugin', nargs='?', action='store', metavar='PLUGIN',
+      choices=sorted(PLUGINS.keys()), help='name of the text parser plugin.')
+
+  argument_parser.add_argument(
+      'path', nargs='?', action='store', metavar='PATH', help=(
+          'path of the log file, where the default are the test log files '
+          'in test_data with their lines repeated.'))
+
+  options = argument_parser.parse_args()
+
+  if options.plugin and options.path:
+    test_files = [(options.plugin, options.path, 1)]
+
+  elif not options.plugin and not options.path:
+    test_files = [
+        (plugin_name, os.path.join('test_data', filename), 300)
+        for plugin_name, filename in TEST_FILES]
+
+  else:
+    print('Both the name of a text parser plugin and a path are required.')
+    print('')
+    argument_parser.print_help()
+    return False
+
+  print('Plugin\t\tFile\t\t\tLines\t\tPyparsing\tFast path\t(lines/s)')
+
+  for plugin_name, path, number_of_copies in test_files:
+    if not os.path.isfile(path):
+      print(f'No such file: {path:s}')
+      return False
+
+    pyparsing_results = BenchmarkPlugin(
+        plugin_name, path, fast_path_enabled=False,
+        number_of_copies=number_of_copies)
+    fast_path_results = BenchmarkPlugin(
+        plugin_name, path, fast_path_enabled=True,
+        number_of_copies=number_of_copies)
+
+    print((f'{plugin_name:s}\t{os.path.basename(path):s}\t\t'
+           f'{fast_path_results["number_of_lines"]:d}\t\t'
+           f'{pyparsing_results["lines_per_second"]:.0f}\t\t'
+           f'{fast_path_results["lines_per_second"]:.0f}'))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Script to benchmark the startup time of the command line tools.
+
+The benchmark measures the time it takes to run every command line tool with
+--help, which is dominated by importing the modules the tool depends on. Run
+it from the root of the source tree, for example to run every tool 10 times:
+
+python utils/benchmark_tools_startup.py --number_of_iterations 10
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+
+_SOURCE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TOOL_NAMES = [
+    'image_export',
+    'log2timeline',
+    'pinfo',
+    'psort',
+    'psteal']
+
+
+def BenchmarkToolStartup(name, arguments=None, number_of_iterations=1):
+  """Benchmarks the startup time of a command line tool.
+
+  Args:
+    name (str): name of the tool, such as "log2timeline".
+    arguments (Optional[list[str]]): command line arguments, where None
+        represents --help.
+    number_of_iterations (Optional[int]): number of times the tool is run.
+
+  Returns:
+    dict[str, object]: benchmark results.
+
+  Raises:
+    RuntimeError: if the tool does not exit successfully.
+  """
+  script_path = os.path.join(_SOURCE_PATH, 'plaso', 'scripts', f'{name:s}.py')
+  command = [sys.executable, script_path]
+  command.extend(arguments or ['--help'])
+
+  environment = dict(os.environ)
+  environment['PYTHONPATH'] = _SOURCE_PATH
+
+  startup_times = []
+  for _ in range(number_of_iterations):
+    startup_time = time.perf_counter()
+
+    result = subprocess.run(
+        command, check=False, env=environment, stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL)
+
+    startup_times.append(time.perf_counter() - startup_time)
+
+    if result.returncode != 0:
+      raise RuntimeError(
+          f'{name:s} exited with return code: {result.returncode:d}')
+
+  return {
+      'maximum_seconds': max(startup_times),
+      'minimum_seconds': min(startup_times)}
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmark the startup time of the command line tools.'))
+
+  argument_parser.add_argument(
+      '--number_of_iterations', '--number-of-iterations',
+      dest='number_of_iterations', type=int, action='store', metavar='NUMBER',
+      default=5, help=(
+          'number of times every tool is run, where the default is 5.'))
+
+  options = argument_parser.parse_args()
+
+  if options.number_of_iterations < 1:
+    print(('Unsupported number of iterations: '
+           f'{options.number_of_iterations:d}'))
+    return False
+
+  print('Tool\t\tMinimum (s)\tMaximum (s)')
+
+  for name in TOOL_NAMES:
+    results = BenchmarkToolStartup(
+        name, number_of_iterations=options.number_of_iterations)
+
+    print((f'{name:s}\t{results["minimum_seconds"]:.3f}\t\t'
+           f'{results["maximum_seconds"]:.3f}'))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Script to benchmark the Windows Registry parser.
+
+The benchmark measures the time it takes to parse Windows Registry files with
+all the Windows Registry plugins enabled. Run it from the root of the source
+tree to benchmark the test Windows Registry files or pass the paths of other,
+typically larger, Windows Registry files, for example:
+
+PYTHONPATH=. python utils/benchmark_winreg_parser.py SOFTWARE NTUSER.DAT
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import resolver as path_spec_resolver
+
+from plaso.containers import events
+from plaso.parsers import mediator as parsers_mediator
+from plaso.parsers import winreg_parser
+# Register all plugins.
+from plaso.parsers import winreg_plugins  # pylint: disable=unused-import
+from plaso.storage.fake import writer as fake_writer
+
+
+TEST_FILE_NAMES = [
+    'NTUSER-CCLEANER.DAT',
+    'NTUSER-RunTests.DAT',
+    'NTUSER-WIN7.DAT',
+    'NTUSER.DAT',
+    'SAM',
+    'SOFTWARE',
+    'SYSTEM']
+
+
+def BenchmarkParser(path, number_of_iterations=1):
+  """Benchmarks the Windows Registry parser.
+
+  Args:
+    path (str): path of the Windows Registry file.
+    number_of_iterations (Optional[int]): number of times the Windows Registry
+        file is parsed.
+
+  Returns:
+    dict[str, object]: benchmark results.
+  """
+  path_spec = path_spec_factory.Factory.NewPathSpec(
+      dfvfs_definitions.TYPE_INDICATOR_OS, location=path)
+  file_entry = path_spec_resolver.Resolver.OpenFileEntry(path_spec)
+
+  parser = winreg_parser.WinRegistryParser()
+  parser.EnablePlugins(parser.ALL_PLUGINS)
+
+  number_of_event_data = 0
+  parse_time = 0.0
+
+  for _ in range(number_of_iterations):
+    storage_writer = fake_writer.FakeStorageWriter()
+    storage_writer.Open()
+
+    try:
+      parser_mediator = parsers_mediator.ParserMediator()
+      parser_mediator.SetStorageWriter(storage_writer)
+      parser_mediator.SetFileEntry(file_entry)
+
+      event_data_stream = events.EventDataStream()
+      event_data_stream.path_spec = file_entry.path_spec
+
+      parser_mediator.ProduceEventDataStream(event_data_stream)
+
+      file_object = file_entry.GetFileObject()
+
+      start_time = time.perf_counter()
+      parser.Parse(parser_mediator, file_object)
+      parse_time += time.perf_counter() - start_time
+
+      number_of_event_data = storage_writer.GetNumberOfAttributeContainers(
+          'event_data')
+
+    finally:
+      storage_writer.Close()
+
+  return {
+      'number_of_event_data': number_of_event_data,
+      'seconds': parse_time / number_of_iterations}
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmark the Windows Registry parser.'))
+
+  argument_parser.add_argument(
+      'paths', nargs='*', action='store', metavar='PATH', help=(
+          'paths of the Windows Registry files, where the default are '
+          'the test Windows Registry files in test_data.'))
+
+  options = argument_parser.parse_args()
+
+  paths = options.paths or [
+      os.path.join('test_data', filename) for filename in TEST_FILE_NAMES]
+
+  print('File\t\t\tEvent data\tSeconds')
+
+  for path in paths:
+    if not os.path.isfile(path):
+      continue
+
+    results = BenchmarkParser(path, number_of_iterations=3)
+
+    print((f'{os.path.basename(path):s}\t\t'
+           f'{results["number_of_event_data"]:d}\t\t'
+           f'{results["seconds"]:.3f}'))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
@@ -0,0 +1,112 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Script to generate the parsers manifest.
+
+The parsers manifest maps the name of a parser to the modules that need to be
+imported to register the parser and its plugins. It allows the parsers manager
+to only import the parsers selected by a parser filter expression.
+
+Run it from the root of the source tree to update the manifest:
+
+PYTHONPATH=. python utils/generate_parsers_manifest.py \\
+    plaso/parsers/manifest.py
+"""
+
+import argparse
+import importlib
+import pkgutil
+import sys
+
+import plaso.parsers
+
+from plaso.parsers import manager as parsers_manager
+
+
+_FILE_HEADER = '''\
+# -*- coding: utf-8 -*-
+"""The parsers manifest.
+
+The parsers manifest maps the name of a parser to the modules that need to be
+imported to register the parser and its plugins.
+
+This file is generated by utils/generate_parsers_manifest.py, do not edit.
+"""
+
+PARSER_MODULES = {'''
+
+
+def GetParserModules():
+  """Retrieves the modules that register the parsers and their plugins.
+
+  Returns:
+    dict[str, tuple[str]]: names of the modules that need to be imported to
+        register the parser and its plugins, per parser name.
+  """
+  for module_information in pkgutil.iter_modules(path=plaso.parsers.__path__):
+    importlib.import_module(f'plaso.parsers.{module_information.name:s}')
+
+  parser_modules = {}
+  # pylint: disable=protected-access
+  for parser_name, parser_class in (
+      parsers_manager.ParsersManager._parser_classes.items()):
+    module_names = [parser_class.__module__]
+
+    if parser_class.SupportsPlugins():
+      for _, plugin_class in parser_class.GetPlugins():
+        package_name, _, _ = plugin_class.__module__.rpartition('.')
+        if package_name not in module_names:
+          module_names.append(package_name)
+
+    parser_modules[parser_name] = tuple(module_names)
+
+  return parser_modules
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Generate the parsers manifest.'))
+
+  argument_parser.add_argument(
+      'output', nargs='?', action='store', metavar='PATH', default=None,
+      help='path of the output file, where the default is stdout.')
+
+  options = argument_parser.parse_args()
+
+  parser_modules = GetParserModules()
+
+  lines = [_FILE_HEADER]
+  for parser_name, module_names in sorted(parser_modules.items()):
+    if len(module_names) == 1:
+      lines.append(f'    \'{parser_name:s}\': (\'{module_names[0]:s}\', ),')
+    else:
+      lines.append(f'    \'{parser_name:s}\': (')
+      for index, module_name in enumerate(module_names):
+        if index == len(module_names) - 1:
+          lines.append(f'        \'{module_name:s}\'),')
+        else:
+          lines.append(f'        \'{module_name:s}\',')
+
+  lines[-1] = ''.join([lines[-1][:-1], '}'])
+
+  output_text = '\n'.join(lines)
+
+  if not options.output:
+    print(output_text)
+  else:
+    with open(options.output, 'w', encoding='utf-8') as file_object:
+      file_object.write(output_text)
+      file_object.write('\n')
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)